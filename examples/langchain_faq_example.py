@@ -148,8 +148,7 @@ def compare_faq_approaches():
     # Add data using direct approach
     print("\n3️⃣ Adding Data with Direct Qdrant...")
     faqs = direct_vdb.load_data_from_jsonl(faq_file)
-    points = direct_vdb.prepare_points(faqs)
-    direct_vdb.insert_data(points)
+    direct_vdb.ingest_properties(faqs)
     
     # Add data using LangChain
     print("\n4️⃣ Adding Data with LangChain...")
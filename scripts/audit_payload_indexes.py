@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Audit payload indexes in the Premiere Suites Qdrant collections
+
+Reports filterable fields (from the collection payload schemas and any extra
+fields passed on the command line) that have no payload index, i.e. filters
+that force Qdrant into a full scan. With --fix the missing indexes are created.
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+from dotenv import load_dotenv
+from qdrant_client import QdrantClient
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.vector_db.schema import get_collection_schema, find_unindexed_fields
+
+# Load environment variables
+load_dotenv()
+
+def get_client() -> QdrantClient:
+    """Connect to Qdrant Cloud if configured, otherwise to local Qdrant."""
+    qdrant_url = os.getenv("QDRANT_URL")
+    qdrant_api_key = os.getenv("QDRANT_API_KEY")
+    if qdrant_url and qdrant_api_key:
+        return QdrantClient(url=qdrant_url, api_key=qdrant_api_key)
+    return QdrantClient(host="localhost", port=6333)
+
+def audit_collection(client: QdrantClient, collection_name: str, prefixes, extra_fields, fix: bool) -> int:
+    """Audit one collection and return the number of unindexed fields."""
+    print(f"\n📂 {collection_name}")
+
+    try:
+        info = client.get_collection(collection_name)
+    except Exception as e:
+        print(f"  ❌ Cannot read collection: {e}")
+        return 0
+
+    indexed = set((info.payload_schema or {}).keys())
+    schema = get_collection_schema(collection_name)
+
+    expected = {}
+    for prefix in prefixes:
+        for field_name, field_schema in schema.items():
+            expected[f"{prefix}{field_name}"] = field_schema
+    for field_name in extra_fields:
+        expected.setdefault(field_name, None)
+
+    missing = find_unindexed_fields(expected.keys(), indexed)
+    for field_name in sorted(expected):
+        status = "❌ no index (full scan)" if field_name in missing else "✅ indexed"
+        print(f"  {field_name}: {status}")
+
+    if fix:
+        for field_name in missing:
+            field_schema = expected[field_name]
+            if field_schema is None:
+                print(f"  ⚠️  Skipping '{field_name}': not in the payload schema, type unknown")
+                continue
+            client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=field_schema
+            )
+            print(f"  🔧 Created {field_schema.value} index on '{field_name}'")
+
+    return len(missing)
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Report filters that run without a payload index")
+    parser.add_argument("--collections", nargs="+",
+                        default=["premiere_suites_properties", "premiere_suites_faqs"],
+                        help="Collections to audit")
+    parser.add_argument("--fields", nargs="*", default=[],
+                        help="Additional payload keys used in filters")
+    parser.add_argument("--langchain", action="store_true",
+                        help="Also check metadata.* keys used by the LangChain integrations")
+    parser.add_argument("--fix", action="store_true",
+                        help="Create missing indexes declared in the payload schema")
+
+    args = parser.parse_args()
+
+    print("🔍 Auditing payload indexes...")
+    client = get_client()
+    prefixes = ["", "metadata."] if args.langchain else [""]
+
+    unindexed = 0
+    for collection_name in args.collections:
+        unindexed += audit_collection(client, collection_name, prefixes, args.fields, args.fix)
+
+    if unindexed and not args.fix:
+        print(f"\n⚠️  {unindexed} filterable field(s) have no index. Re-run with --fix to create them.")
+        return 1
+
+    print("\n✅ Audit complete")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
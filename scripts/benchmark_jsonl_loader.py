@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared JSONL loader
+
+Writes a synthetic data file of the requested size in the scraper's format
+(metadata and summary header, then property and FAQ records built from the
+real data files when present) and times:
+
+- the previous per-loader approach (text mode, json.loads every line, then
+  filter on "type")
+- services.jsonl_loader with the decoder it picked (orjson, msgspec or json)
+- services.jsonl_loader streaming only the FAQ records
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from services.jsonl_loader import DECODER_NAME, iter_faqs, load_by_type
+
+PROPERTY_FILE = Path("data/processed/premiere_suites_data.jsonl")
+FAQ_FILE = Path("data/processed/premiere_suites_faq_data.jsonl")
+
+SAMPLE_PROPERTY = {
+    "type": "property", "id": "prop_0001", "property_name": "Sample Suites", "city": "Toronto",
+    "rating": 4.5, "room_type": "1 Bedroom", "amenities": ["WiFi", "Parking", "Gym"],
+    "description": "Furnished suite close to downtown with a full kitchen.", "pet_friendly": True,
+    "bedrooms": 1, "building_type": "Apartment", "suite_features": ["Kitchen", "Laundry"],
+    "source_url": "https://premieresuites.com/", "image_url": "", "price_range": None,
+    "location_details": None, "pageContent": "Sample Suites in Toronto. Furnished suite close to downtown."
+}
+SAMPLE_FAQ = {
+    "type": "faq", "id": "faq_001", "question": "Is parking included?",
+    "answer": "Parking is available at most buildings for an additional fee.", "category": "Amenities",
+    "tags": ["parking"], "source_url": "https://premieresuites.com/faq/", "content": "Q: Is parking included?"
+}
+
+def sample_records():
+    """Property and FAQ records to replicate (real ones when the data files exist)."""
+    records = []
+    for path in (PROPERTY_FILE, FAQ_FILE):
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                records.extend(r for r in map(json.loads, filter(str.strip, f)) if r.get("type") in ("property", "faq"))
+    return records or [SAMPLE_PROPERTY, SAMPLE_FAQ]
+
+def write_synthetic_file(path, size_mb):
+    """Write records until the file reaches size_mb megabytes."""
+    lines = [json.dumps(record, ensure_ascii=False) + "\n" for record in sample_records()]
+    target = size_mb * 1024 * 1024
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "metadata", "generated_on": "synthetic", "format": "jsonl"}) + "\n")
+        f.write(json.dumps({"type": "summary", "cities_covered": 0}) + "\n")
+        while written < target:
+            for line in lines:
+                f.write(line)
+                written += len(line)
+    return os.path.getsize(path)
+
+def baseline_load(path):
+    """The loop each loader used to implement."""
+    grouped = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            data = json.loads(line)
+            grouped.setdefault(data.get("type"), []).append(data)
+    return grouped
+
+def count_by_type(grouped):
+    """Records per type, dropping the records so runs do not share a heap."""
+    return {record_type: len(records) for record_type, records in grouped.items() if records}
+
+def measure(label, func, size):
+    """Time one run and print MB/s."""
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"   {label:<36} {elapsed:7.2f}s  {size / 1024 / 1024 / elapsed:8.1f} MB/s")
+    return result
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark the shared JSONL loader")
+    parser.add_argument("--size-mb", type=int, default=300, help="Size of the synthetic file")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic file")
+
+    args = parser.parse_args()
+
+    handle, path = tempfile.mkstemp(suffix=".jsonl")
+    os.close(handle)
+    try:
+        print(f"📝 Writing a {args.size_mb} MB synthetic data file...")
+        size = write_synthetic_file(path, args.size_mb)
+
+        print(f"⏱️  Loading {size / 1024 / 1024:.0f} MB")
+        baseline = count_by_type(measure("json.loads per line (previous)", lambda: baseline_load(path), size))
+        counts = count_by_type(measure(f"load_by_type ({DECODER_NAME})", lambda: load_by_type(path), size))
+        faqs = measure(f"iter_faqs only ({DECODER_NAME})", lambda: sum(1 for _ in iter_faqs(path)), size)
+
+        if counts != baseline:
+            print(f"❌ Record counts differ from the baseline: {counts}")
+            return 1
+        if faqs != counts.get("faq", 0):
+            print(f"❌ iter_faqs returned {faqs} records, expected {counts.get('faq', 0)}")
+            return 1
+
+        print(f"✅ Records per type: {counts}")
+        return 0
+    finally:
+        if args.keep:
+            print(f"💾 Synthetic file kept at {path}")
+        else:
+            os.remove(path)
+
+if __name__ == "__main__":
+    exit(main())
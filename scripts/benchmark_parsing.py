@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark the concierge answer parsers
+
+Runs every message of a corpus through the arrival date, stay length and
+budget parsers, one call per message and through the batch API, and reports
+messages per second. The corpus can be concierge logs (JSONL with "text"),
+lead exports (JSONL with arrival_raw / length_raw / budget_raw) or plain text
+with one message per line; without files a built-in sample of typical
+answers is used.
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from concierge.parsing import (
+    parse_arrival_date, parse_arrival_dates, parse_budget, parse_budgets,
+    parse_length_nights, parse_lengths_nights
+)
+
+SAMPLE_MESSAGES = [
+    "25/12/2025", "12-25-2025", "03.04.2025", "1/9/2026", "31/31/2025", "next week",
+    "3 months", "10 nights", "2m", "6 Months", "about 45 nights", "not sure yet",
+    "$2,500 per month", "150 nightly", "1800", "CAD 3,200/mo", "around 90 a night", "flexible",
+]
+
+def load_corpus(paths):
+    """Messages from JSONL logs / lead exports or plain text files."""
+    messages = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if path.endswith((".jsonl", ".ndjson")):
+                    record = json.loads(line)
+                    for field in ("text", "arrival_raw", "length_raw", "budget_raw"):
+                        if record.get(field):
+                            messages.append(str(record[field]))
+                else:
+                    messages.append(line)
+    return messages
+
+def measure(label, func, count):
+    """Time one pass and print the throughput."""
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed > 0 else 0
+    print(f"   {label:<28} {elapsed:8.3f}s  {rate:>14,.0f} msg/s")
+    return elapsed
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark the concierge answer parsers")
+    parser.add_argument("corpus", nargs="*", help="Message files (.jsonl logs or lead exports, or .txt)")
+    parser.add_argument("--size", type=int, default=1000000,
+                        help="Messages to parse (the corpus is repeated or truncated to this size)")
+
+    args = parser.parse_args()
+
+    try:
+        corpus = load_corpus(args.corpus) if args.corpus else list(SAMPLE_MESSAGES)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load corpus: {e}")
+        return 1
+    if not corpus:
+        print("❌ Corpus is empty")
+        return 1
+
+    messages = (corpus * (args.size // len(corpus) + 1))[:args.size]
+    print(f"📊 {len(messages):,} messages ({len(set(corpus)):,} distinct in the corpus)")
+
+    print("⏱️  One call per message")
+    single = measure("arrival dates", lambda: [parse_arrival_date(m) for m in messages], len(messages))
+    single += measure("stay lengths", lambda: [parse_length_nights(m) for m in messages], len(messages))
+    single += measure("budgets", lambda: [parse_budget(m) for m in messages], len(messages))
+
+    print("⏱️  Batch API")
+    batch = measure("arrival dates", lambda: parse_arrival_dates(messages), len(messages))
+    batch += measure("stay lengths", lambda: parse_lengths_nights(messages), len(messages))
+    batch += measure("budgets", lambda: parse_budgets(messages), len(messages))
+
+    lengths = parse_lengths_nights(corpus)
+    single_results = [
+        (parse_arrival_date(m), parse_length_nights(m), parse_budget(m, n)) for m, n in zip(corpus, lengths)
+    ]
+    batch_results = list(zip(parse_arrival_dates(corpus), lengths, parse_budgets(corpus, lengths)))
+    mismatches = sum(s != b for s, b in zip(single_results, batch_results))
+    if mismatches:
+        print(f"❌ Batch and single-message results differ for {mismatches} messages")
+        return 1
+
+    print(f"✅ Batch API speed-up: {single / batch:.1f}x" if batch > 0 else "✅ Done")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark the columnar bulk upload
+
+Uploads random embeddings with property-like payloads twice and reports time
+and peak Python memory per 10k points for:
+
+- the previous path (one PointStruct per point, vector converted with
+  embeddings[i].tolist(), then upsert in batches)
+- vector_db.bulk_upload.upload_columns (ids, float32 matrix and payloads
+  handed to the client's columnar uploader)
+
+By default the points go over REST to a sink server started in this process,
+which reads and discards every request, so the numbers are the client-side
+cost of building and sending the points. Use --url for a real Qdrant server
+or --local for the in-memory local mode (which keeps every point in the
+process, so its memory numbers include the stored collection). Peak memory is
+measured with tracemalloc in a separate run from the timing, so the timings
+are not slowed down by tracing.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.metadata import version
+from pathlib import Path
+
+import numpy as np
+from dotenv import load_dotenv
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from vector_db.bulk_upload import upload_columns
+
+# Load environment variables
+load_dotenv()
+
+COLLECTION_NAME = "benchmark_bulk_upload"
+
+class SinkHandler(BaseHTTPRequestHandler):
+    """Accepts any Qdrant request, discards the body and reports success."""
+
+    def _reply(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path == "/":
+            # Report the client's own version so the compatibility check passes
+            body = {"title": "qdrant - vector search engine", "version": version("qdrant-client")}
+        else:
+            body = {"result": {"operation_id": 0, "status": "completed"}, "status": "ok", "time": 0.0}
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_PUT = do_POST = do_DELETE = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+def start_sink_server():
+    """Run a sink server on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def make_columns(count, dimension, seed=7):
+    """Random unit vectors with small property payloads."""
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((count, dimension), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    cities = ["Toronto", "Vancouver", "Calgary", "Ottawa", "Montreal"]
+    payloads = [
+        {"property_name": f"Suite {i}", "city": cities[i % len(cities)], "rating": 3.5 + (i % 4) * 0.5,
+         "amenities": ["WiFi", "Gym"], "pet_friendly": bool(i % 2)}
+        for i in range(count)
+    ]
+    return list(range(count)), vectors, payloads
+
+def pointstruct_upload(client, ids, vectors, payloads, batch_size):
+    """The previous path: a PointStruct with a list vector per point."""
+    points = [
+        PointStruct(id=point_id, vector=vectors[i].tolist(), payload=payloads[i])
+        for i, point_id in enumerate(ids)
+    ]
+    for start in range(0, len(points), batch_size):
+        client.upsert(collection_name=COLLECTION_NAME, points=points[start:start + batch_size], wait=True)
+
+def columnar_upload(client, ids, vectors, payloads, batch_size):
+    """The columnar path."""
+    upload_columns(client, COLLECTION_NAME, ids, vectors, payloads, batch_size=batch_size)
+
+def reset_collection(client, dimension):
+    """Start every run from an empty collection."""
+    if client.collection_exists(COLLECTION_NAME):
+        client.delete_collection(COLLECTION_NAME)
+    client.create_collection(
+        collection_name=COLLECTION_NAME,
+        vectors_config=VectorParams(size=dimension, distance=Distance.COSINE)
+    )
+
+def measure(label, upload, client, columns, batch_size, sink):
+    """Time one upload, then trace the peak memory of a second one."""
+    ids, vectors, _ = columns
+    per_10k = 10000 / len(ids)
+
+    if not sink:
+        reset_collection(client, vectors.shape[1])
+    started = time.perf_counter()
+    upload(client, *columns, batch_size)
+    elapsed = time.perf_counter() - started
+
+    if not sink:
+        reset_collection(client, vectors.shape[1])
+    tracemalloc.start()
+    upload(client, *columns, batch_size)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"   {label:<32} {elapsed * per_10k:7.3f}s / 10k   {peak * per_10k / 1024 / 1024:8.1f} MB peak / 10k")
+    return len(ids) if sink else client.count(COLLECTION_NAME, exact=True).count
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark the columnar bulk upload")
+    parser.add_argument("--points", type=int, default=20000, help="Number of points to upload")
+    parser.add_argument("--dimension", type=int, default=384, help="Vector size (384 for all-MiniLM-L6-v2)")
+    parser.add_argument("--batch-size", type=int, default=256, help="Points per request")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Upload to this Qdrant server")
+    target.add_argument("--local", action="store_true", help="Upload to an in-memory local Qdrant")
+
+    args = parser.parse_args()
+
+    sink = None
+    if args.url:
+        print(f"☁️  Uploading to {args.url}")
+        client = QdrantClient(url=args.url, api_key=os.getenv("QDRANT_API_KEY"))
+    elif args.local:
+        print("🏠 Uploading to an in-memory local Qdrant")
+        client = QdrantClient(":memory:")
+    else:
+        sink = start_sink_server()
+        print("🕳️  Uploading to a local sink server (client-side cost only)")
+        client = QdrantClient(host="127.0.0.1", port=sink.server_address[1], https=False)
+
+    columns = make_columns(args.points, args.dimension)
+    print(f"⏱️  {args.points} points x {args.dimension} dims, batches of {args.batch_size}")
+
+    try:
+        counts = [
+            measure("PointStruct + tolist (previous)", pointstruct_upload, client, columns, args.batch_size, sink),
+            measure("upload_columns (float32 matrix)", columnar_upload, client, columns, args.batch_size, sink),
+        ]
+    finally:
+        if sink:
+            sink.shutdown()
+        elif client.collection_exists(COLLECTION_NAME):
+            client.delete_collection(COLLECTION_NAME)
+
+    if any(count != args.points for count in counts):
+        print(f"❌ Expected {args.points} points per run, got {counts}")
+        return 1
+
+    print(f"✅ Both paths uploaded {args.points} points")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
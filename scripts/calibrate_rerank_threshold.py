@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Calibrate the concierge's cross-encoder rerank threshold
+
+Reranks the FAQ candidates of labelled concierge messages (JSONL lines with
+"text" and the "faq_id" that answers them, null when no FAQ does), picks the
+lowest cross-encoder score at which reranked answers reach the target
+precision, and reports on a held-out split how many messages that threshold
+answers locally and how accurately. Set the result as
+CONCIERGE_RERANK_THRESHOLD for the concierge server.
+"""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+
+import numpy as np
+from dotenv import load_dotenv
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+from vector_db.reranker import DEFAULT_RERANK_MODEL, CrossEncoderReranker
+from vector_db.semantic_cache import CachedFAQAnswerer
+
+# Load environment variables
+load_dotenv()
+
+def load_labelled_queries(path):
+    """(text, faq_id) pairs from a JSONL file; lines without a "faq_id" key are skipped."""
+    examples = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("text") and "faq_id" in record:
+                examples.append((record["text"], record["faq_id"]))
+    return examples
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Calibrate the FAQ rerank threshold")
+    parser.add_argument("--queries", nargs="+", required=True,
+                        help="Labelled JSONL files ({\"text\": ..., \"faq_id\": id or null})")
+    parser.add_argument("--model", default=os.getenv("CONCIERGE_RERANK_MODEL", DEFAULT_RERANK_MODEL),
+                        help="Cross-encoder to calibrate")
+    parser.add_argument("--collection", default=os.getenv("FAQ_COLLECTION", "premiere_suites_faqs"),
+                        help="FAQ collection")
+    parser.add_argument("--target-precision", type=float, default=0.95,
+                        help="Share of reranked answers that must be correct")
+    parser.add_argument("--test-split", type=float, default=0.3,
+                        help="Fraction of messages held out for evaluation")
+
+    args = parser.parse_args()
+
+    examples = []
+    for path in args.queries:
+        loaded = load_labelled_queries(path)
+        print(f"📄 {path}: {len(loaded)} labelled messages")
+        examples.extend(loaded)
+
+    if len(examples) < 4:
+        print("❌ Not enough labelled messages to calibrate on")
+        return 1
+
+    qdrant_url = os.getenv("QDRANT_URL")
+    qdrant_api_key = os.getenv("QDRANT_API_KEY")
+    vdb = PremiereSuitesVectorDB(
+        qdrant_url=qdrant_url,
+        qdrant_api_key=qdrant_api_key,
+        collection_name=args.collection,
+        use_cloud=bool(qdrant_url and qdrant_api_key)
+    )
+    print(f"🤖 Reranking with {args.model}")
+    answerer = CachedFAQAnswerer(vdb, reranker=CrossEncoderReranker(args.model))
+
+    rng = np.random.default_rng(42)
+    order = rng.permutation(len(examples))
+    n_test = int(len(examples) * args.test_split)
+    test = [examples[i] for i in order[:n_test]]
+    calibration = [examples[i] for i in order[n_test:]]
+
+    texts, faq_ids = zip(*calibration)
+    threshold = answerer.calibrate_rerank_threshold(texts, faq_ids, target_precision=args.target_precision)
+    print(f"📏 Rerank threshold: {threshold:.4f}")
+
+    if test:
+        answered = correct = 0
+        for text, faq_id in test:
+            top, _ = answerer.reranked_top(text, vdb.generate_query_embedding(text))
+            if top is not None and top["rerank_score"] >= threshold:
+                answered += 1
+                correct += faq_id is not None and top["faq_id"] == faq_id
+        print(f"🧪 Held-out messages: {len(test)}")
+        print(f"   Answered by the reranker: {answered / len(test):.1%}")
+        if answered:
+            print(f"   Precision: {correct / answered:.1%}")
+
+    print(f"✅ Set CONCIERGE_RERANK_THRESHOLD={threshold:.4f}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
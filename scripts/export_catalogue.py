@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Export the property and FAQ catalogues to Parquet / Arrow
+
+Converts the JSONL data files into columnar catalogues (list columns for
+amenities, suite_features and tags), optionally with an embedding column
+computed with EMBEDDING_MODEL, and prints the catalogue statistics computed
+from the columns.
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from services.columnar_catalogue import catalogue_stats, records_to_table, write_catalogue
+from services.jsonl_loader import load_records
+
+# Load environment variables
+load_dotenv()
+
+def embedding_text(record, record_type):
+    """The text the collections embed for a record."""
+    text = record.get("text_chunk") or ""
+    if text.strip():
+        return text
+    if record_type == "property":
+        return record.get("pageContent") or record.get("description") or ""
+    return record.get("content") or f"Q: {record.get('question', '')}\nA: {record.get('answer', '')}"
+
+def embed(records, record_type, model_name):
+    """Embed the records with a sentence-transformer model."""
+    from vector_db.qdrant_setup import load_embedding_model
+
+    model, use_openai, _ = load_embedding_model(model_name)
+    if use_openai:
+        raise ValueError("Precomputed catalogue embeddings need a sentence-transformer model")
+    texts = [embedding_text(record, record_type) for record in records]
+    return model.encode(texts, batch_size=64, show_progress_bar=len(texts) > 1000)
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Export the catalogues to Parquet / Arrow")
+    parser.add_argument("--properties", default="data/processed/premiere_suites_data.jsonl")
+    parser.add_argument("--faqs", default="data/processed/premiere_suites_faq_data.jsonl")
+    parser.add_argument("--output-dir", default="data/exports")
+    parser.add_argument("--format", choices=["parquet", "arrow"], default="parquet",
+                        help="parquet (compressed) or arrow (uncompressed, zero-copy memory mapping)")
+    parser.add_argument("--embeddings", action="store_true", help="Add an embedding column")
+
+    args = parser.parse_args()
+
+    model_name = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+    Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+
+    for record_type, source in (("property", args.properties), ("faq", args.faqs)):
+        if not Path(source).exists():
+            print(f"⚠️  Skipping {record_type} catalogue, {source} not found")
+            continue
+
+        records = load_records(source, record_type)
+        embeddings = None
+        if args.embeddings:
+            print(f"🤖 Embedding {len(records)} {record_type} records with {model_name}")
+            try:
+                embeddings = embed(records, record_type, model_name)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return 1
+
+        output = Path(args.output_dir) / f"{Path(source).stem}.{args.format}"
+        table = records_to_table(records, record_type, embeddings, model_name if args.embeddings else None)
+        write_catalogue(table, str(output))
+
+        print(f"✅ {record_type}: {table.num_rows} rows -> {output} ({output.stat().st_size / 1024:.1f} KB)")
+        for key, value in catalogue_stats(table, top=5).items():
+            if isinstance(value, list):
+                value = ", ".join(f"{item['value']} ({item['count']})" for item in value)
+            print(f"   {key}: {value}")
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Run a bulk payload migration on a Premiere Suites Qdrant collection
+
+Scrolls every point in the collection, applies one of the migrations in
+vector_db.payload_migrations and writes the payload diff in batches. Use
+--dry-run to review what would change first, and --checkpoint to make a long
+migration resumable.
+"""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+
+from dotenv import load_dotenv
+from qdrant_client import QdrantClient
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from vector_db.payload_migrations import (
+    DEFAULT_BATCH_SIZE, DEFAULT_PAGE_SIZE, MIGRATIONS, run_migration
+)
+
+# Load environment variables
+load_dotenv()
+
+def get_client(local: bool = False) -> QdrantClient:
+    """Connect to Qdrant Cloud if configured, otherwise to local Qdrant."""
+    qdrant_url = os.getenv("QDRANT_URL")
+    qdrant_api_key = os.getenv("QDRANT_API_KEY")
+    if qdrant_url and qdrant_api_key and not local:
+        return QdrantClient(url=qdrant_url, api_key=qdrant_api_key)
+    return QdrantClient(host="localhost", port=6333)
+
+def print_report(report):
+    """Print counts, per-key changes and sample diffs of a migration."""
+    action = "Would change" if report["dry_run"] else "Changed"
+    print(f"\n📊 {report['migration']} on {report['collection']}"
+          f"{' (dry run)' if report['dry_run'] else ''}{' (resumed)' if report['resumed'] else ''}")
+    print(f"   Scanned: {report['scanned']}  {action}: {report['changed']}  Written: {report['written']}")
+    for key, count in sorted(report["keys_set"].items()):
+        print(f"   set    {key}: {count} points")
+    for key, count in sorted(report["keys_deleted"].items()):
+        print(f"   delete {key}: {count} points")
+    for sample in report["samples"]:
+        print(f"\n   🔎 Point {sample['id']}")
+        for key, values in sample["set"].items():
+            print(f"      {key}: {str(values['old'])[:60]!r} -> {str(values['new'])[:60]!r}")
+        for key in sample["deleted"]:
+            print(f"      {key}: deleted")
+    if report["points_per_second"]:
+        print(f"\n   ⏱️  {report['seconds']:.2f}s ({report['points_per_second']:.0f} points/s)")
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Apply a payload migration to every point in a collection")
+    parser.add_argument("migration", choices=sorted(MIGRATIONS), help="Migration to run")
+    parser.add_argument("--collection", default="premiere_suites_faqs", help="Collection to migrate")
+    parser.add_argument("--dry-run", action="store_true", help="Report the diff without writing")
+    parser.add_argument("--checkpoint", help="JSON file to save progress to and resume from")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="Points per scroll request")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Points per update request")
+    parser.add_argument("--concurrency", type=int, default=4, help="Update requests in flight")
+    parser.add_argument("--samples", type=int, default=5, help="Point diffs to show")
+    parser.add_argument("--local", action="store_true", help="Force the local Qdrant instance")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    args = parser.parse_args()
+
+    try:
+        report = run_migration(
+            get_client(args.local),
+            args.collection,
+            MIGRATIONS[args.migration],
+            migration_name=args.migration,
+            dry_run=args.dry_run,
+            page_size=args.page_size,
+            batch_size=args.batch_size,
+            max_concurrency=args.concurrency,
+            checkpoint_path=args.checkpoint,
+            sample_size=args.samples
+        )
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        if args.checkpoint:
+            print(f"   Re-run with --checkpoint {args.checkpoint} to resume")
+        return 1
+
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        print_report(report)
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
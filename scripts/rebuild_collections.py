@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Rebuild the Premiere Suites Qdrant Collections
+
+Single rebuild command for the property and FAQ collections, replacing the
+recreate_collections_* scripts. Both collections are rebuilt at the same time
+with one embedding model load and the same payload layout
+(see vector_db.rebuild). Use --incremental to update only new, changed and
+removed records instead of recreating the collections.
+
+Works with a local Qdrant (Docker) or Qdrant Cloud (QDRANT_URL and
+QDRANT_API_KEY).
+"""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+from vector_db.embedding_store import open_embedding_store
+from vector_db.embedding_stage import EmbeddingStage
+from vector_db.rebuild import (
+    DEFAULT_FAQ_FILE, DEFAULT_PROPERTY_FILE, FAQ_COLLECTION, PROPERTY_COLLECTION, rebuild_collections
+)
+
+# Load environment variables
+load_dotenv()
+
+def print_report(report):
+    """Print point counts and per-stage throughput for one collection."""
+    print(f"\n📊 {report['collection']} ({report['mode']})")
+    print(f"   Records: {report['records']}  Points: {report['points']}")
+    print(f"   Upserted: {report['upserted']}  Payload updates: {report['payload_updated']}  "
+          f"Unchanged: {report['unchanged']}  Deleted: {report['deleted']}")
+    for name, stage in report["stages"].items():
+        rate = f"{stage['items_per_second']:.0f}/s" if stage["items_per_second"] else "-"
+        print(f"   {name:<8} {stage['items']:>7} items  {stage['seconds']:8.2f}s  {rate:>10}")
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Rebuild the property and FAQ collections")
+    parser.add_argument("--collections", nargs="+", choices=["properties", "faqs"],
+                        default=["properties", "faqs"], help="Collections to rebuild (default: both)")
+    parser.add_argument("--properties-file", default=DEFAULT_PROPERTY_FILE)
+    parser.add_argument("--faqs-file", default=DEFAULT_FAQ_FILE)
+    parser.add_argument("--property-collection", default=PROPERTY_COLLECTION)
+    parser.add_argument("--faq-collection", default=FAQ_COLLECTION)
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only write new, changed and removed records instead of recreating")
+    parser.add_argument("--sequential", action="store_true", help="Rebuild one collection at a time")
+    parser.add_argument("--batch-size", type=int, default=256, help="Points per upload request")
+    parser.add_argument("--parallel", type=int, default=1, help="Upload workers per collection")
+    parser.add_argument("--embedding-batch-size", type=int, default=64, help="Texts per model forward pass")
+    parser.add_argument("--hybrid", action="store_true",
+                        help="Also store BM25 sparse vectors for hybrid search (requires a full rebuild)")
+    parser.add_argument("--facet-vectors", action="store_true",
+                        help="Also store name, amenities and description vectors per property (requires a full rebuild)")
+    parser.add_argument("--json", action="store_true", help="Print the reports as JSON")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--cloud", action="store_true", help="Force Qdrant Cloud")
+    target.add_argument("--local", action="store_true", help="Force the local Qdrant instance")
+
+    args = parser.parse_args()
+
+    qdrant_url = os.getenv("QDRANT_URL")
+    qdrant_api_key = os.getenv("QDRANT_API_KEY")
+    use_cloud = args.cloud or (not args.local and bool(qdrant_url and qdrant_api_key))
+    model_name = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+
+    sources = {
+        "properties": ("property", args.property_collection, args.properties_file),
+        "faqs": ("faq", args.faq_collection, args.faqs_file),
+    }
+    for name in args.collections:
+        if not Path(sources[name][2]).exists():
+            print(f"❌ Data file not found: {sources[name][2]}")
+            return 1
+
+    print(f"{'☁️  Using Qdrant Cloud' if use_cloud else '🏠 Using local Qdrant'}")
+    print(f"🔤 Loading embedding model {model_name}...")
+
+    try:
+        # One store and one model load shared by every collection
+        store = open_embedding_store(model_name)
+        stage = EmbeddingStage(model_name, batch_size=args.embedding_batch_size, embedding_store=store)
+        targets = []
+        for name in args.collections:
+            record_type, collection_name, file_path = sources[name]
+            vdb = PremiereSuitesVectorDB(
+                qdrant_url=qdrant_url,
+                qdrant_api_key=qdrant_api_key,
+                collection_name=collection_name,
+                embedding_model=model_name,
+                use_cloud=use_cloud,
+                embedding_store=store,
+                hybrid=args.hybrid or None,
+                facet_vectors=(args.facet_vectors or None) if record_type == "property" else False
+            )
+            targets.append((vdb, record_type, file_path))
+
+        mode = "Incrementally updating" if args.incremental else "Rebuilding"
+        print(f"🔄 {mode} {', '.join(vdb.collection_name for vdb, _, _ in targets)}")
+        reports = rebuild_collections(targets, stage, incremental=args.incremental,
+                                      concurrent=not args.sequential,
+                                      batch_size=args.batch_size, parallel=args.parallel)
+    except Exception as e:
+        print(f"\n❌ Error during rebuild: {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps({"reports": reports, "embedding": stage.metrics()}, indent=2))
+    else:
+        for report in reports:
+            print_report(report)
+        print(f"\n🔤 Model loaded in {stage.load_seconds:.2f}s")
+        print("\n🎉 Collections rebuilt successfully!")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Re-score historical concierge leads
+
+Applies the concierge Lead Filter rules to a whole lead table (CSV, JSONL or
+Parquet) in vectorised batches, e.g. after the budget or stay-length
+thresholds change, and writes the qualified flag and reason for every lead.
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from concierge.engine import MIN_MONTHLY_BUDGET, MIN_NIGHTLY_BUDGET, MIN_STAY_NIGHTS
+from concierge.lead_scoring import rescore_file
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Re-score concierge leads in bulk")
+    parser.add_argument("input", help="Lead table (.csv, .jsonl or .parquet)")
+    parser.add_argument("output", help="Where to write the scored leads (.csv, .jsonl or .parquet)")
+    parser.add_argument("--min-monthly-budget", type=float, default=MIN_MONTHLY_BUDGET)
+    parser.add_argument("--min-nightly-budget", type=float, default=MIN_NIGHTLY_BUDGET)
+    parser.add_argument("--min-stay-nights", type=int, default=MIN_STAY_NIGHTS)
+    parser.add_argument("--chunk-size", type=int, default=100000, help="Leads per batch")
+
+    args = parser.parse_args()
+
+    print(f"📊 Re-scoring leads from {args.input}")
+    started = time.perf_counter()
+    try:
+        totals = rescore_file(
+            args.input, args.output, chunk_size=args.chunk_size,
+            min_monthly_budget=args.min_monthly_budget,
+            min_nightly_budget=args.min_nightly_budget,
+            min_stay_nights=args.min_stay_nights
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    elapsed = time.perf_counter() - started
+    rate = totals["total"] / elapsed if elapsed > 0 else 0
+    print(f"✅ {totals['total']} leads in {elapsed:.2f}s ({rate:,.0f} leads/s)")
+    print(f"   Qualified: {totals['qualified']}")
+    print(f"   Disqualified: {totals['disqualified']}")
+    print(f"💾 Results written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -129,7 +129,7 @@ def show_manual_instructions():
     print("     export QDRANT_API_KEY=your-api-key")
     
     print("\n💡 After starting Qdrant, run:")
-    print("   python recreate_collections_langchain.py")
+    print("   python scripts/rebuild_collections.py")
 
 def main():
     """Main function to start Qdrant."""
@@ -139,7 +139,7 @@ def main():
     # Check if Qdrant is already running
     if check_qdrant_running():
         print("\n🎉 Qdrant is ready! You can now run:")
-        print("   python recreate_collections_langchain.py")
+        print("   python scripts/rebuild_collections.py")
         return 0
     
     # Check Docker availability
@@ -150,7 +150,7 @@ def main():
         if start_qdrant_docker():
             print("\n🎉 Qdrant started successfully!")
             print("💡 You can now run:")
-            print("   python recreate_collections_langchain.py")
+            print("   python scripts/rebuild_collections.py")
             return 0
         else:
             print("\n⚠️  Failed to start Qdrant with Docker.")
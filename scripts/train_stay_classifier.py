@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Train the concierge's local "Related-to-stay" classifier
+
+Fits StayClassifier centroids on labelled concierge logs (JSONL lines with
+"text" and a boolean "related"), reports on a held-out split how many messages
+would be decided locally and how accurately, and saves the model for the
+concierge server (STAY_CLASSIFIER_PATH).
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+import numpy as np
+from dotenv import load_dotenv
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from concierge.classifier import SEED_EXAMPLES, StayClassifier, load_labelled_logs
+from vector_db.qdrant_setup import load_embedding_model
+
+# Load environment variables
+load_dotenv()
+
+class SentenceEmbedder:
+    """Embeds with the same model the concierge uses for the FAQ collection."""
+
+    def __init__(self, model_name: str):
+        self.model, use_openai, _ = load_embedding_model(model_name)
+        if use_openai:
+            raise ValueError("Train the local classifier with a sentence-transformer model")
+
+    def generate_query_embeddings(self, texts):
+        return self.model.encode(texts, batch_size=64, show_progress_bar=len(texts) > 1000)
+
+    def generate_query_embedding(self, text):
+        return self.model.encode([text])[0]
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Train the local related-to-stay classifier")
+    parser.add_argument("--logs", nargs="+", default=[],
+                        help="Labelled JSONL files ({\"text\": ..., \"related\": true|false})")
+    parser.add_argument("--output", default="models/stay_classifier.npz",
+                        help="Where to save the trained classifier")
+    parser.add_argument("--target-accuracy", type=float, default=0.97,
+                        help="Accuracy local decisions must reach; lower means fewer LLM escalations")
+    parser.add_argument("--test-split", type=float, default=0.2,
+                        help="Fraction of messages held out for evaluation")
+    parser.add_argument("--no-seed", action="store_true",
+                        help="Do not add the built-in seed examples")
+
+    args = parser.parse_args()
+
+    examples = [] if args.no_seed else list(SEED_EXAMPLES)
+    for path in args.logs:
+        loaded = load_labelled_logs(path)
+        print(f"📄 {path}: {len(loaded)} labelled messages")
+        examples.extend(loaded)
+
+    if len(examples) < 4:
+        print("❌ Not enough labelled messages to train on")
+        return 1
+
+    model_name = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+    print(f"🤖 Embedding with {model_name}")
+    embedder = SentenceEmbedder(model_name)
+
+    rng = np.random.default_rng(42)
+    order = rng.permutation(len(examples))
+    n_test = int(len(examples) * args.test_split)
+    test = [examples[i] for i in order[:n_test]]
+    train = [examples[i] for i in order[n_test:]]
+
+    texts, labels = zip(*train)
+    classifier = StayClassifier(embedder).fit(texts, labels, target_accuracy=args.target_accuracy)
+    print(f"📏 Confidence threshold: {classifier.threshold:.3f}")
+
+    if test:
+        test_texts, test_labels = zip(*test)
+        margins = classifier.margins(np.asarray(embedder.generate_query_embeddings(list(test_texts)), dtype=np.float32))
+        local = np.abs(margins) >= classifier.threshold
+        correct = (margins > 0) == np.asarray(test_labels, dtype=bool)
+        print(f"🧪 Held-out messages: {len(test)}")
+        print(f"   Decided locally: {local.mean():.1%}")
+        if local.any():
+            print(f"   Local accuracy: {correct[local].mean():.1%}")
+        print(f"   Escalated to the LLM: {(~local).mean():.1%}")
+
+        # Refit on everything for the saved model, keeping the calibrated threshold
+        all_texts, all_labels = zip(*examples)
+        classifier.fit(all_texts, all_labels, target_accuracy=None)
+
+    classifier.save(args.output)
+    print(f"✅ Saved classifier to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
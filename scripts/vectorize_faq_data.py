@@ -5,18 +5,19 @@ FAQ Data Vectorization Script
 This script vectorizes the Premiere Suites FAQ data and stores it in a Qdrant vector database.
 """
 
-import json
 import logging
 import os
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
+import numpy as np
 
 # Add the project root to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.vector_db.qdrant_setup import PremiereSuitesVectorDB
+from src.services.jsonl_loader import load_records
 
 # Load environment variables from .env file
 load_dotenv()
@@ -35,25 +36,8 @@ def load_faq_data(file_path: str = "data/processed/premiere_suites_faq_data.json
     Returns:
         List of FAQ dictionaries
     """
-    faqs = []
-    
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                try:
-                    data = json.loads(line)
-                    if data.get("type") == "faq":
-                        faqs.append(data)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Error parsing line {line_num}: {e}")
-                    continue
-                    
-        logger.info(f"Loaded {len(faqs)} FAQ entries from {file_path}")
-        return faqs
+        return load_records(file_path, "faq")
         
     except FileNotFoundError:
         logger.error(f"FAQ data file not found: {file_path}")
@@ -62,18 +46,17 @@ def load_faq_data(file_path: str = "data/processed/premiere_suites_faq_data.json
         logger.error(f"Error loading FAQ data: {e}")
         raise
 
-def prepare_faq_points(faqs: List[Dict[str, Any]], vdb: PremiereSuitesVectorDB) -> List[Any]:
+def prepare_faq_columns(faqs: List[Dict[str, Any]], vdb: PremiereSuitesVectorDB) -> Tuple[List[int], np.ndarray, List[Dict[str, Any]]]:
     """
-    Prepare FAQ data for insertion into Qdrant.
+    Prepare FAQ data as columns for a bulk upload into Qdrant.
     
     Args:
         faqs: List of FAQ dictionaries
         vdb: Vector database instance to use for embeddings
         
     Returns:
-        List of PointStruct objects
+        Tuple of (point ids, float32 embedding matrix, payloads)
     """
-    from qdrant_client.models import PointStruct
     from datetime import datetime
     
     # Extract text chunks for embedding
@@ -91,10 +74,11 @@ def prepare_faq_points(faqs: List[Dict[str, Any]], vdb: PremiereSuitesVectorDB)
     
     # Generate embeddings using the provided vector database instance
     logger.info("Generating embeddings for FAQ data...")
-    embeddings = vdb.generate_embeddings(texts)
+    embeddings = np.ascontiguousarray(vdb.generate_embeddings(texts), dtype=np.float32)
     
-    # Create points
-    points = []
+    # Collect ids and payloads; the vectors stay one matrix
+    ids = []
+    payloads = []
     for i, faq in enumerate(faqs):
         # Ensure we have a proper ID - convert string IDs to integers
         faq_id = faq.get("id")
@@ -139,28 +123,43 @@ def prepare_faq_points(faqs: List[Dict[str, Any]], vdb: PremiereSuitesVectorDB)
             "ingested_at": datetime.now().isoformat()
         }
         
-        point = PointStruct(
-            id=faq_id,
-            vector=embeddings[i].tolist(),
-            payload={
-                "content": page_content,  # This is the key field for retrieval
-                "metadata": metadata,
-                "id": faq_id,
-                # Also include individual fields for backward compatibility
-                "faq_id": faq_id,
-                "question": faq.get("question", ""),
-                "answer": faq.get("answer", ""),
-                "category": faq.get("category", ""),
-                "tags": faq.get("tags", []),
-                "source_url": faq.get("source_url", ""),
-                "content": page_content,  # Include content in payload
-                "ingested_at": datetime.now().isoformat()
-            }
-        )
-        points.append(point)
+        ids.append(faq_id)
+        payloads.append({
+            "content": page_content,  # This is the key field for retrieval
+            "metadata": metadata,
+            "id": faq_id,
+            # Also include individual fields for backward compatibility
+            "faq_id": faq_id,
+            "question": faq.get("question", ""),
+            "answer": faq.get("answer", ""),
+            "category": faq.get("category", ""),
+            "tags": faq.get("tags", []),
+            "source_url": faq.get("source_url", ""),
+            "content": page_content,  # Include content in payload
+            "ingested_at": datetime.now().isoformat()
+        })
+    
+    logger.info(f"Prepared {len(ids)} FAQ points for upload")
+    return ids, embeddings, payloads
+
+def prepare_faq_points(faqs: List[Dict[str, Any]], vdb: PremiereSuitesVectorDB) -> List[Any]:
+    """
+    Prepare FAQ data for insertion into Qdrant as PointStruct objects.
+    
+    Args:
+        faqs: List of FAQ dictionaries
+        vdb: Vector database instance to use for embeddings
+        
+    Returns:
+        List of PointStruct objects
+    """
+    from qdrant_client.models import PointStruct
     
-    logger.info(f"Prepared {len(points)} FAQ points for insertion")
-    return points
+    ids, embeddings, payloads = prepare_faq_columns(faqs, vdb)
+    return [
+        PointStruct(id=faq_id, vector=vector, payload=payload)
+        for faq_id, vector, payload in zip(ids, embeddings.tolist(), payloads)
+    ]
 
 def vectorize_faq_data(collection_name: str = "premiere_suites_faqs",
                       recreate_collection: bool = False,
@@ -224,13 +223,13 @@ def vectorize_faq_data(collection_name: str = "premiere_suites_faqs",
             logger.error("No FAQ data found to vectorize")
             return
         
-        # Prepare points for insertion
+        # Prepare ids, embeddings and payloads for a bulk upload
         logger.info("Preparing FAQ data for vectorization...")
-        points = prepare_faq_points(faqs, vdb)
+        ids, embeddings, payloads = prepare_faq_columns(faqs, vdb)
         
         # Insert data into vector database
         logger.info("Inserting FAQ data into vector database...")
-        vdb.insert_data(points, batch_size=50)
+        vdb.upload_vectors(ids, embeddings, payloads)
         
         # Get collection info
         info = vdb.get_collection_info()
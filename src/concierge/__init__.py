@@ -0,0 +1,10 @@
+# Concierge Module
+from .engine import ConciergeEngine, OpenAIStayClassifier
+from .classifier import StayClassifier
+from .state import ConversationState, Lead
+from .sessions import InMemorySessionStore, SQLiteSessionStore, RedisSessionStore, create_session_store
+
+__all__ = [
+    'ConciergeEngine', 'OpenAIStayClassifier', 'StayClassifier', 'ConversationState', 'Lead',
+    'InMemorySessionStore', 'SQLiteSessionStore', 'RedisSessionStore', 'create_session_store'
+]
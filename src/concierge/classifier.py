@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Local "Related-to-stay" Classifier
+
+Fast path for the concierge's related-to-stay decision. Messages are embedded
+with the same sentence-transformer model as the FAQ collection and compared
+with two class centroids (related / unrelated) learned from labelled
+concierge logs. When the centroid margin is confident the decision is made
+in-process; ambiguous messages are escalated to the fallback classifier
+(normally the gpt-4o-mini classifier), so only a fraction of turns pay for an
+external, rate-limited call.
+
+The confidence threshold is calibrated at fit time: it is the smallest margin
+at which local decisions on the training logs still reach the target accuracy.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Small built-in training set so the classifier works before any logs are labelled
+SEED_EXAMPLES = [
+    ("Do you have availability in Toronto next month?", True),
+    ("Can I bring my dog?", True),
+    ("Is parking included with the suite?", True),
+    ("What is the minimum length of stay?", True),
+    ("Do the apartments have a washer and dryer?", True),
+    ("Can I extend my booking by two weeks?", True),
+    ("Is there a gym in the building?", True),
+    ("How do I get the keys on arrival?", True),
+    ("Are utilities and wifi included in the rent?", True),
+    ("Can my company pay the invoice directly?", True),
+    ("What's the weather like today?", False),
+    ("Who won the hockey game last night?", False),
+    ("Can you write me a poem?", False),
+    ("What is the capital of France?", False),
+    ("Tell me a joke", False),
+    ("How do I reset my iPhone?", False),
+    ("What's a good recipe for pasta?", False),
+    ("Translate hello into Spanish", False),
+    ("What is 12 times 7?", False),
+    ("Recommend a good movie to watch", False),
+]
+
+class StayClassifier:
+    """Nearest-centroid classifier on embeddings with LLM escalation for ambiguous messages."""
+
+    def __init__(self, embedder: Any, fallback: Optional[Callable[[str], bool]] = None,
+                 threshold: float = 0.05):
+        """
+        Args:
+            embedder: Object with generate_query_embeddings(texts) and
+                generate_query_embedding(text), e.g. PremiereSuitesVectorDB
+            fallback: Classifier for ambiguous messages (e.g. OpenAIStayClassifier);
+                without one, ambiguous messages take the closer centroid
+            threshold: Minimum centroid margin for a local decision
+        """
+        self.embedder = embedder
+        self.fallback = fallback
+        self.threshold = threshold
+        self.centroids: Optional[np.ndarray] = None
+        self.local_decisions = 0
+        self.escalations = 0
+
+    def fit(self, texts: Sequence[str], labels: Sequence[bool],
+            target_accuracy: Optional[float] = 0.97,
+            min_threshold: float = 0.05) -> "StayClassifier":
+        """
+        Learn the class centroids from labelled messages.
+
+        Args:
+            texts: Messages
+            labels: True for messages related to a stay
+            target_accuracy: Calibrate the threshold so that confident training
+                decisions reach this accuracy (None keeps the current threshold)
+            min_threshold: Lower bound for the calibrated threshold, so messages
+                close to both centroids are always escalated
+
+        Returns:
+            self
+        """
+        labels = np.asarray(labels, dtype=bool)
+        if len(texts) != len(labels):
+            raise ValueError("texts and labels must have the same length")
+        if labels.all() or not labels.any():
+            raise ValueError("Training data needs both related and unrelated examples")
+
+        vectors = self._normalize(np.asarray(self.embedder.generate_query_embeddings(list(texts)), dtype=np.float32))
+        centroids = np.stack([vectors[~labels].mean(axis=0), vectors[labels].mean(axis=0)])
+        self.centroids = self._normalize(centroids)
+
+        if target_accuracy is not None:
+            self.threshold = max(min_threshold, self._calibrate(self.margins(vectors), labels, target_accuracy))
+        logger.info(f"Fitted stay classifier on {len(labels)} messages "
+                    f"({int(labels.sum())} related), threshold {self.threshold:.3f}")
+        return self
+
+    def margins(self, vectors: np.ndarray) -> np.ndarray:
+        """Cosine similarity to the related centroid minus similarity to the unrelated one."""
+        if self.centroids is None:
+            raise ValueError("StayClassifier has not been fitted")
+        scores = self._normalize(np.atleast_2d(vectors)) @ self.centroids.T
+        return scores[:, 1] - scores[:, 0]
+
+    def margin(self, text: str) -> float:
+        """Centroid margin for one message (positive leans related)."""
+        vector = np.asarray(self.embedder.generate_query_embedding(text), dtype=np.float32)
+        return float(self.margins(vector)[0])
+
+    def predict_local(self, text: str) -> Optional[bool]:
+        """Local decision for a message, or None if it is ambiguous."""
+        margin = self.margin(text)
+        if abs(margin) < self.threshold:
+            return None
+        return margin > 0
+
+    def __call__(self, text: str) -> bool:
+        """Whether a message is related to staying with Premiere Suites."""
+        margin = self.margin(text)
+        if abs(margin) >= self.threshold or self.fallback is None:
+            self.local_decisions += 1
+            return margin > 0
+
+        self.escalations += 1
+        return bool(self.fallback(text))
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.local_decisions + self.escalations
+        return {
+            "local_decisions": self.local_decisions,
+            "escalations": self.escalations,
+            "local_rate": round(self.local_decisions / total, 4) if total else 0.0,
+            "threshold": self.threshold,
+        }
+
+    def save(self, path: str) -> None:
+        """Save the centroids and threshold to an .npz file."""
+        if self.centroids is None:
+            raise ValueError("StayClassifier has not been fitted")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, centroids=self.centroids, threshold=np.float32(self.threshold))
+
+    @classmethod
+    def load(cls, path: str, embedder: Any, fallback: Optional[Callable[[str], bool]] = None) -> "StayClassifier":
+        """Load a classifier saved with save()."""
+        data = np.load(path)
+        classifier = cls(embedder, fallback, threshold=float(data["threshold"]))
+        classifier.centroids = data["centroids"]
+        return classifier
+
+    @staticmethod
+    def _calibrate(margins: np.ndarray, labels: np.ndarray, target_accuracy: float) -> float:
+        """
+        Margin threshold that keeps the most training messages local while the
+        local decisions still reach target_accuracy. The threshold sits halfway
+        to the next, less confident message.
+        """
+        magnitudes = np.abs(margins)
+        order = np.argsort(-magnitudes, kind="stable")
+        correct = (margins[order] > 0) == labels[order]
+        accuracy = np.cumsum(correct) / np.arange(1, len(correct) + 1)
+
+        confident = np.nonzero(accuracy >= target_accuracy)[0]
+        if len(confident) == 0:
+            return float("inf")
+        last = confident[-1]
+        if last + 1 == len(order):
+            return 0.0
+        return float((magnitudes[order[last]] + magnitudes[order[last + 1]]) / 2)
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+def load_labelled_logs(path: str) -> List[tuple]:
+    """
+    Read labelled concierge messages from JSONL.
+
+    Each line needs "text" and a boolean "related" (lines without a label are skipped).
+
+    Returns:
+        List of (text, related) pairs
+    """
+    examples = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("text") and isinstance(record.get("related"), bool):
+                examples.append((record["text"], record["related"]))
+    return examples
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Premiere Suites Concierge Engine
+
+Native Python implementation of the concierge state machine that the
+"Premier Suites Concierge v1 (Hardened)" n8n workflow runs as Function nodes:
+
+- Sanitize Input and Session Flood Gate
+- Router (FAQ_MODE / QUALIFY_MODE)
+- FAQ path: knowledge base answer, else the "related to stay" classifier
+- Qualification path: Question Picker, Date Normalizer (UK/US),
+  Length & Budget Parser and Lead Filter
+- Tone Wrapper
+
+One call to ConciergeEngine.handle() processes one chat turn, so the webhook
+can call the engine directly instead of walking the workflow node by node.
+"""
+
+import re
+import math
+import logging
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from services.rate_limit import RateLimitExceeded, TokenBucket, get_bucket
+from .parsing import parse_arrival_date, parse_budget, parse_length_nights
+from .state import FAQ_MODE, QUALIFY_MODE, ConversationState, Lead, decode_state, encode_state
+from .sessions import InMemorySessionStore, SessionStore
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+STAGE_ORDER = [
+    "ask_name", "ask_email", "ask_city", "ask_arrival", "ask_length",
+    "ask_bedrooms", "ask_pets", "ask_parking", "ask_budget", "ask_phone", "done"
+]
+
+QUESTIONS = {
+    "ask_name": "May I have your name?",
+    "ask_email": "What’s your email address?",
+    "ask_city": "Which city would you like to stay in?",
+    "ask_arrival": "What’s your expected arrival date? (DD/MM/YYYY or MM/DD/YYYY)",
+    "ask_length": "How long is your stay (number of nights or months)?",
+    "ask_bedrooms": "How many bedrooms do you need?",
+    "ask_pets": "Are you bringing any pets? (Yes/No)",
+    "ask_parking": "Do you need parking? (Yes/No)",
+    "ask_budget": "What’s your budget (nightly or monthly)?",
+    "ask_phone": "If you’d like a call, please share your phone number (optional).",
+}
+
+# Replies used when an answer to the current question is not usable
+REPROMPTS = {
+    "ask_email": "Please provide a valid email address (e.g., name@example.com).",
+    "ask_arrival": "Sorry, I couldn’t read that date. Please use DD/MM/YYYY or MM/DD/YYYY.",
+    "ask_length": "How long is your stay? (Please enter a number of nights or months, e.g. 3 months)",
+    "ask_bedrooms": "How many bedrooms do you need? (Please enter a number like 1, 2, 3…)",
+    "ask_pets": "Are you bringing any pets? (Yes/No)",
+    "ask_parking": "Do you need parking? (Yes/No)",
+    "ask_budget": "What’s your budget? (Please include an amount, e.g. 2500 monthly)",
+}
+
+DONE_REPLY = "thank you for providing all the information, one of the sales team member would be touch shortly"
+FLOOD_REPLY = "You’re sending messages very quickly—please wait a moment and try again."
+FAQ_FOLLOW_UP_REPLY = "I don’t have that in my current FAQ. Would you like a member of our team to follow up?"
+DONT_KNOW_REPLY = "I’m sorry, I don’t know."
+KB_ERROR_REPLY = "I can’t access the knowledge base right now. Would you like a team member to follow up?"
+ERROR_REPLY = "Sorry, something went wrong. Please try again."
+
+DATE_PICKER_ACTION = {"type": "open_date_picker", "minDate": "today", "maxDate": "+18m", "locale": "en-GB"}
+
+# Lead Filter thresholds
+MIN_MONTHLY_BUDGET = 1500
+MIN_NIGHTLY_BUDGET = 80
+MIN_STAY_NIGHTS = 7
+
+_TAGS = re.compile(r"<[^>]*>")
+_WHITESPACE = re.compile(r"\s+")
+_ZERO_WIDTH = re.compile(r"[\u200B-\u200D\uFEFF]")
+_EMAIL = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+_YES_NO = re.compile(r"^(y(es)?|n(o)?)$", re.IGNORECASE)
+_BOOKING_INTENT = re.compile(
+    r"\b(book|long\s*stay|availability|monthly|serviced\s*apartment|move\s*in|suite|apartment)\b",
+    re.IGNORECASE
+)
+_LEADING_INT = re.compile(r"^\s*([+-]?\d+)")
+_STARTS_WITH_LETTER = re.compile(r"^[A-Za-z]")
+
+def sanitize_text(raw: Any, max_length: int = 1000) -> str:
+    """Strip markup, collapse whitespace, truncate and NFKC-normalise a message."""
+    text = _WHITESPACE.sub(" ", _TAGS.sub("", str(raw if raw is not None else ""))).strip()
+    text = text[:max_length]
+    return _ZERO_WIDTH.sub("", unicodedata.normalize("NFKC", text))
+
+def has_booking_intent(text: str) -> bool:
+    """Whether a message should switch the conversation into QUALIFY_MODE."""
+    return bool(_BOOKING_INTENT.search(text))
+
+def qualify_lead(lead: Lead) -> List[str]:
+    """
+    Apply the Lead Filter rules.
+
+    Returns:
+        Disqualification reasons (empty if the lead qualifies)
+    """
+    issues = []
+    if lead.budget_type == "monthly" and lead.budget_value is not None and lead.budget_value < MIN_MONTHLY_BUDGET:
+        issues.append("your monthly budget is below our minimum")
+    if lead.budget_type == "nightly" and lead.budget_value is not None and lead.budget_value < MIN_NIGHTLY_BUDGET:
+        issues.append("your nightly budget is below our minimum")
+    if lead.length_nights and lead.length_nights <= MIN_STAY_NIGHTS:
+        issues.append("your stay is shorter than our minimum required length")
+    return issues
+
+def join_reasons(issues: List[str]) -> str:
+    """Join disqualification reasons into one phrase ("a, b and c")."""
+    return issues[0] if len(issues) == 1 else ", ".join(issues[:-1]) + " and " + issues[-1]
+
+def disqualified_reply(reason: str) -> str:
+    return (
+        f"I’m really sorry, but I can see that {reason}.\n"
+        "Our suites are designed for longer stays with higher budgets.\n"
+        "For shorter or lower-budget trips, you may find better options on platforms like Airbnb or Booking.com.\n"
+        "Thank you so much for considering Premier Suites."
+    )
+
+def apply_tone(reply: str, mode: str, verbatim: bool = False) -> str:
+    """Tone Wrapper: prefix conversational replies with "Thanks!" (FAQ answers stay verbatim)."""
+    reply = _WHITESPACE.sub(" ", reply or "").strip()
+    if mode == FAQ_MODE and verbatim:
+        return reply
+    if reply.startswith("thank you for providing") or not _STARTS_WITH_LETTER.match(reply):
+        return reply
+    return "Thanks! " + reply
+
+class ConciergeEngine:
+    """Runs concierge chat turns against a pluggable session store."""
+
+    def __init__(self, faq_answerer: Optional[Any] = None,
+                 classifier: Optional[Callable[[str], bool]] = None,
+                 store: Optional[SessionStore] = None,
+                 flood_window: float = 15.0, flood_max_messages: int = 5,
+                 knowledge_base_limit: Optional[TokenBucket] = None,
+                 upstream_max_wait: float = 0.5):
+        """
+        Args:
+            faq_answerer: Object with answer(query) returning a dict with an
+                "answer" key or None, e.g. vector_db.semantic_cache.CachedFAQAnswerer
+            classifier: Callable deciding whether an unanswered question is
+                related to staying with Premiere Suites (StayClassifier or
+                OpenAIStayClassifier); it may raise RateLimitExceeded
+            store: Session store (defaults to an InMemorySessionStore)
+            flood_window: Seconds over which a session may send flood_max_messages
+            flood_max_messages: Per-session burst; the session budget refills at
+                flood_max_messages per flood_window
+            knowledge_base_limit: Budget for FAQ lookups (defaults to the shared "qdrant" bucket)
+            upstream_max_wait: Seconds a turn may wait for a knowledge base token
+                before replying that the service is busy
+        """
+        self.faq_answerer = faq_answerer
+        self.classifier = classifier
+        self.store = store if store is not None else InMemorySessionStore()
+        self.flood_window = flood_window
+        self.flood_max_messages = flood_max_messages
+        self.knowledge_base_limit = knowledge_base_limit or get_bucket("qdrant")
+        self.upstream_max_wait = upstream_max_wait
+
+    def handle(self, text: Any, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Process one chat turn.
+
+        Args:
+            text: Raw user message
+            session_id: Conversation identifier ("anon" if missing)
+
+        Returns:
+            Dictionary with the reply, mode and session_id, plus optional
+            action, verbatim, rate_limited or kb_error keys
+        """
+        session_id = session_id or "anon"
+        try:
+            text = sanitize_text(text)
+            # The flood gate and the state transition are one atomic update of
+            # the session record, re-run if another worker changed it first;
+            # the upstream FAQ lookup and classifier run once, after it
+            result, mode = self.store.update(session_id, lambda record: self._transition(record, text, session_id))
+            if mode is None:
+                return dict(result, session_id=session_id)
+            if result is None:
+                result = self._answer_faq(text)
+
+            if result.get("action") is None:
+                result["reply"] = apply_tone(result["reply"], mode, result.get("verbatim", False))
+            result.update(mode=mode, session_id=session_id)
+            return result
+        except Exception as e:
+            logger.error(f"sid={session_id} Concierge turn failed: {e}")
+            return {"reply": ERROR_REPLY, "session_id": session_id, "error": True}
+
+    def _transition(self, record: Dict[str, Any], text: str,
+                    session_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Flood gate, router and qualification step against a session record,
+        updating the record in place. Makes no upstream calls, so it is safe
+        to re-run.
+
+        Returns:
+            (reply, mode): mode None for a flood reply, reply None when the
+            FAQ path still has to answer
+        """
+        if self._is_flooding(record):
+            return {"reply": FLOOD_REPLY, "rate_limited": True}, None
+
+        state = decode_state(record.get("state"))
+        was_qualifying = state.mode == QUALIFY_MODE
+        state.mode = QUALIFY_MODE if (was_qualifying or has_booking_intent(text)) else FAQ_MODE
+        logger.debug(f"sid={session_id} Router set mode {state.mode}")
+
+        result = self._qualify(state, text, capture=was_qualifying) if state.mode == QUALIFY_MODE else None
+        record["state"] = encode_state(state)
+        return result, state.mode
+
+    def get_state(self, session_id: str) -> Optional[ConversationState]:
+        record = self.store.get(session_id)
+        return decode_state(record.get("state")) if record else None
+
+    def reset(self, session_id: str) -> None:
+        self.store.delete(session_id)
+
+    def _answer_faq(self, text: str) -> Dict[str, Any]:
+        """FAQ path: knowledge base answer, then the related-to-stay classifier."""
+        if self.faq_answerer is not None:
+            try:
+                self.knowledge_base_limit.acquire(timeout=self.upstream_max_wait)
+            except RateLimitExceeded as e:
+                return self._rate_limited_reply(e.retry_after)
+            try:
+                answer = self.faq_answerer.answer(text)
+            except Exception as e:
+                logger.error(f"Knowledge base lookup failed: {e}")
+                return {"reply": KB_ERROR_REPLY, "kb_error": True}
+            if answer and answer.get("answer"):
+                return {"reply": answer["answer"], "verbatim": True}
+
+        if self.classifier is None:
+            return {"reply": DONT_KNOW_REPLY}
+        try:
+            related = self.classifier(text)
+        except RateLimitExceeded as e:
+            return self._rate_limited_reply(e.retry_after)
+        except Exception as e:
+            logger.error(f"Related-to-stay classifier failed: {e}")
+            related = False
+        return {"reply": FAQ_FOLLOW_UP_REPLY if related else DONT_KNOW_REPLY}
+
+    def _qualify(self, state: ConversationState, text: str, capture: bool = True) -> Dict[str, Any]:
+        """
+        Qualification path: capture the answer to the current question, parse
+        it, apply the Lead Filter and pick the next question.
+
+        Args:
+            state: Session state (updated in place)
+            text: Sanitised message
+            capture: Whether the message answers the current question; False
+                for the message that switched the session into QUALIFY_MODE
+        """
+        if state.stage == "done":
+            return {"reply": DONE_REPLY if state.qualified else disqualified_reply(state.reason)}
+
+        if capture:
+            reprompt = self._capture(state, text)
+            if reprompt is not None:
+                return {"reply": reprompt}
+
+        issues = qualify_lead(state.lead)
+        if issues:
+            state.stage = "done"
+            state.qualified = False
+            state.reason = join_reasons(issues)
+            logger.info(f"Lead disqualified: {state.reason}")
+            return {"reply": disqualified_reply(state.reason)}
+
+        previous = state.stage
+        state.stage = self._next_stage(state)
+        logger.debug(f"Stage advance {previous} -> {state.stage}")
+
+        if state.stage == "done":
+            logger.info(f"Lead qualified: city={state.lead.city} arrival={state.lead.arrival_iso} "
+                        f"length_nights={state.lead.length_nights}")
+            return {"reply": DONE_REPLY}
+        if state.stage == "ask_arrival":
+            return {"reply": "Please pick your arrival date.", "action": dict(DATE_PICKER_ACTION)}
+        return {"reply": QUESTIONS[state.stage]}
+
+    def _capture(self, state: ConversationState, text: str) -> Optional[str]:
+        """
+        Store the answer to the current question on the lead.
+
+        Returns:
+            A re-prompt if the answer is not usable, otherwise None
+        """
+        lead = state.lead
+        stage = state.stage
+
+        if stage == "ask_name":
+            if text and text.lower() != "start":
+                lead.name = text
+        elif stage == "ask_email":
+            if not _EMAIL.match(text):
+                return REPROMPTS[stage]
+            lead.email = text
+        elif stage == "ask_city":
+            if text:
+                lead.city = text
+        elif stage == "ask_arrival":
+            lead.arrival_raw = text
+            lead.arrival_iso = parse_arrival_date(text) or ""
+            if not lead.arrival_iso:
+                return REPROMPTS[stage]
+        elif stage == "ask_length":
+            lead.length_raw = text
+            lead.length_nights = parse_length_nights(text)
+            if not lead.length_nights:
+                return REPROMPTS[stage]
+        elif stage == "ask_bedrooms":
+            match = _LEADING_INT.match(text)
+            bedrooms = int(match.group(1)) if match else 0
+            if not 0 < bedrooms <= 6:
+                return REPROMPTS[stage]
+            lead.bedrooms = bedrooms
+        elif stage in ("ask_pets", "ask_parking"):
+            if not _YES_NO.match(text):
+                return REPROMPTS[stage]
+            setattr(lead, "pets" if stage == "ask_pets" else "parking", text[:1].lower() == "y")
+        elif stage == "ask_budget":
+            lead.budget_raw = text
+            budget = parse_budget(text, lead.length_nights)
+            if budget is None:
+                return REPROMPTS[stage]
+            lead.budget_value = budget["budget_value"]
+            lead.budget_type = budget["budget_type"]
+        elif stage == "ask_phone":
+            if text:
+                lead.phone = text
+        return None
+
+    def _next_stage(self, state: ConversationState) -> str:
+        """Advance past the current question once its lead field is filled."""
+        lead = state.lead
+        filled = {
+            "ask_name": bool(lead.name),
+            "ask_email": bool(lead.email),
+            "ask_city": bool(lead.city),
+            "ask_arrival": bool(lead.arrival_iso),
+            "ask_length": bool(lead.length_nights),
+            "ask_bedrooms": isinstance(lead.bedrooms, int),
+            "ask_pets": isinstance(lead.pets, bool),
+            "ask_parking": isinstance(lead.parking, bool),
+            "ask_budget": bool(lead.budget_value) and bool(lead.budget_type),
+            "ask_phone": True,
+        }
+        current = state.stage if state.stage in STAGE_ORDER else "ask_name"
+        if filled.get(current):
+            return STAGE_ORDER[STAGE_ORDER.index(current) + 1]
+        return current
+
+    def _is_flooding(self, record: Dict[str, Any]) -> bool:
+        """
+        Session Flood Gate as a per-session token bucket.
+
+        The bucket state lives in the session record (updated in place), so the
+        budget holds across processes sharing a session store.
+        """
+        bucket = TokenBucket.from_state(
+            record.get("flood"),
+            rate=self.flood_max_messages / self.flood_window,
+            capacity=self.flood_max_messages,
+            name="session"
+        )
+        allowed = bucket.try_acquire()
+        record["flood"] = bucket.state()
+        return not allowed
+
+    def _rate_limited_reply(self, retry_after: float) -> Dict[str, Any]:
+        return {
+            "reply": f"We’re receiving a high number of requests. Please try again in {max(1, math.ceil(retry_after))} seconds.",
+            "rate_limited": True,
+        }
+
+class OpenAIStayClassifier:
+    """
+    The workflow's "Related-to-stay" classifier as a callable (gpt-4o-mini, yes/no).
+
+    Calls draw from the shared "classifier" budget and raise RateLimitExceeded
+    when no token frees up within max_wait seconds.
+    """
+
+    SYSTEM_PROMPT = (
+        "You are a classifier. Is the user's last question related to staying at serviced "
+        "apartments (booking, availability, rooms, policies)? Reply ONLY \"yes\" or \"no\"."
+    )
+
+    def __init__(self, model: str = "gpt-4o-mini", rate_limit: Optional[TokenBucket] = None,
+                 max_wait: float = 0.5):
+        self.model = model
+        self.rate_limit = rate_limit or get_bucket("classifier")
+        self.max_wait = max_wait
+
+    def __call__(self, text: str) -> bool:
+        import openai
+
+        self.rate_limit.acquire(timeout=self.max_wait)
+
+        response = openai.chat.completions.create(
+            model=self.model,
+            temperature=0,
+            messages=[
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": f"User question: {text}"},
+            ]
+        )
+        content = response.choices[0].message.content or ""
+        return "yes" in content.strip().lower()
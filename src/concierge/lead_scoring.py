@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Bulk Lead Qualification
+
+Vectorised version of the concierge's Length & Budget Parser and Lead Filter
+for re-scoring lead tables (CRM exports, session store dumps) when thresholds
+change. A lead is disqualified when:
+
+- its monthly budget is below MIN_MONTHLY_BUDGET
+- its nightly budget is below MIN_NIGHTLY_BUDGET
+- its stay is MIN_STAY_NIGHTS nights or shorter
+
+Missing length_nights / budget_value / budget_type values are parsed from the
+raw answers (length_raw, budget_raw) with the concierge.parsing patterns. Input
+files are processed in chunks and each chunk is written out in one call.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import numpy as np
+import pandas as pd
+
+from .engine import MIN_MONTHLY_BUDGET, MIN_NIGHTLY_BUDGET, MIN_STAY_NIGHTS, join_reasons
+from .parsing import LENGTH_PATTERN, MONTHLY_PATTERN, NIGHTLY_PATTERN, NOT_NUMBER_PATTERN, NIGHTS_PER_MONTH
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+REASONS = [
+    "your monthly budget is below our minimum",
+    "your nightly budget is below our minimum",
+    "your stay is shorter than our minimum required length",
+]
+
+def _reason_table():
+    """Reason text for every combination of the three rule failures, indexed by bitmask."""
+    table = []
+    for code in range(2 ** len(REASONS)):
+        issues = [reason for bit, reason in enumerate(REASONS) if code & (1 << bit)]
+        table.append(join_reasons(issues) if issues else "")
+    return np.array(table, dtype=object)
+
+_REASON_TABLE = _reason_table()
+
+def _column(leads: pd.DataFrame, name: str, numeric: bool = False) -> pd.Series:
+    """A column of the lead table, or an empty one if the table does not have it."""
+    if name in leads.columns:
+        return leads[name]
+    if numeric:
+        return pd.Series(np.nan, index=leads.index, dtype="float64")
+    return pd.Series(None, index=leads.index, dtype="object")
+
+def parse_lengths(raw: pd.Series) -> pd.Series:
+    """Stay lengths in nights from raw answers ("3 months" -> 90), NaN when there is no number."""
+    parts = raw.fillna("").astype(str).str.lower().str.extract(LENGTH_PATTERN)
+    value = pd.to_numeric(parts[0], errors="coerce")
+    unit = parts[1].fillna("nights")
+    monthly = unit.str.startswith("month") | (unit == "m")
+    return value.where(~monthly, value * NIGHTS_PER_MONTH).astype("float64")
+
+def parse_budgets(raw: pd.Series, length_nights: pd.Series) -> pd.DataFrame:
+    """
+    Budget values and types from raw answers.
+
+    Returns:
+        DataFrame with budget_value (NaN without a number) and budget_type
+    """
+    lowered = raw.fillna("").astype(str).str.lower()
+    value = pd.to_numeric(lowered.str.replace(NOT_NUMBER_PATTERN, "", regex=True), errors="coerce")
+
+    by_length = np.where(length_nights.fillna(0).to_numpy() >= NIGHTS_PER_MONTH, "monthly", "nightly")
+    budget_type = np.select(
+        [lowered.str.contains(MONTHLY_PATTERN).to_numpy(), lowered.str.contains(NIGHTLY_PATTERN).to_numpy()],
+        ["monthly", "nightly"],
+        default=by_length
+    )
+    budget_type = np.where(value.isna().to_numpy(), "", budget_type)
+    return pd.DataFrame({"budget_value": value, "budget_type": budget_type}, index=raw.index)
+
+def score_leads(leads: pd.DataFrame,
+                min_monthly_budget: float = MIN_MONTHLY_BUDGET,
+                min_nightly_budget: float = MIN_NIGHTLY_BUDGET,
+                min_stay_nights: int = MIN_STAY_NIGHTS) -> pd.DataFrame:
+    """
+    Qualify a table of leads.
+
+    Args:
+        leads: Lead rows with any of length_nights, budget_value, budget_type,
+            length_raw and budget_raw (other columns are passed through)
+        min_monthly_budget: Monthly budgets below this are disqualified
+        min_nightly_budget: Nightly budgets below this are disqualified
+        min_stay_nights: Stays of this many nights or fewer are disqualified
+
+    Returns:
+        Copy of leads with length_nights, budget_value and budget_type filled
+        in, plus qualified and reason columns
+    """
+    scored = leads.copy()
+
+    length = pd.to_numeric(_column(scored, "length_nights", numeric=True), errors="coerce")
+    missing = length.isna() | (length == 0)
+    if missing.any():
+        length = length.where(~missing, parse_lengths(_column(scored, "length_raw")))
+    scored["length_nights"] = length
+
+    value = pd.to_numeric(_column(scored, "budget_value", numeric=True), errors="coerce")
+    budget_type = _column(scored, "budget_type").fillna("").astype(str)
+    missing = value.isna() | (value == 0) | (budget_type == "")
+    if missing.any():
+        parsed = parse_budgets(_column(scored, "budget_raw"), length)
+        value = value.where(~missing, parsed["budget_value"])
+        budget_type = budget_type.where(~missing, parsed["budget_type"])
+    scored["budget_value"] = value
+    scored["budget_type"] = budget_type
+
+    value_array = value.to_numpy(dtype="float64")
+    type_array = budget_type.to_numpy()
+    length_array = length.to_numpy(dtype="float64")
+    with np.errstate(invalid="ignore"):
+        low_monthly = (type_array == "monthly") & (value_array < min_monthly_budget)
+        low_nightly = (type_array == "nightly") & (value_array < min_nightly_budget)
+        short_stay = (length_array > 0) & (length_array <= min_stay_nights)
+
+    codes = low_monthly.astype(np.int8) | (low_nightly.astype(np.int8) << 1) | (short_stay.astype(np.int8) << 2)
+    scored["qualified"] = codes == 0
+    scored["reason"] = _REASON_TABLE[codes]
+    return scored
+
+def read_leads(path: str, chunk_size: int = 100000) -> Iterator[pd.DataFrame]:
+    """Read a CSV, JSONL/NDJSON or Parquet lead table in chunks."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        yield from pd.read_csv(path, chunksize=chunk_size)
+    elif suffix in (".jsonl", ".ndjson"):
+        yield from pd.read_json(path, lines=True, chunksize=chunk_size)
+    elif suffix == ".parquet":
+        yield pd.read_parquet(path)
+    else:
+        raise ValueError(f"Unsupported lead file format: {suffix}")
+
+def write_leads(leads: pd.DataFrame, path: str, append: bool = False) -> None:
+    """Write scored leads in one call (CSV and JSONL can be appended to)."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        leads.to_csv(path, mode="a" if append else "w", header=not append, index=False)
+    elif suffix in (".jsonl", ".ndjson"):
+        with open(path, "a" if append else "w", encoding="utf-8") as f:
+            payload = leads.to_json(orient="records", lines=True, force_ascii=False)
+            f.write(payload if payload.endswith("\n") else payload + "\n")
+    elif suffix == ".parquet":
+        if append:
+            raise ValueError("Parquet output cannot be appended to; use a single chunk")
+        leads.to_parquet(path, index=False)
+    else:
+        raise ValueError(f"Unsupported lead file format: {suffix}")
+
+def rescore_file(input_path: str, output_path: str, chunk_size: int = 100000,
+                 **thresholds: Any) -> Dict[str, int]:
+    """
+    Re-score every lead in a file and write the results.
+
+    Args:
+        input_path: CSV, JSONL or Parquet lead table
+        output_path: Where to write the scored table (same formats)
+        chunk_size: Leads processed per batch
+        **thresholds: Overrides for score_leads thresholds
+
+    Returns:
+        Dictionary with total, qualified and disqualified counts
+    """
+    totals = {"total": 0, "qualified": 0, "disqualified": 0}
+    chunks = read_leads(input_path, chunk_size)
+
+    if Path(output_path).suffix.lower() == ".parquet":
+        chunks = iter([pd.concat(list(chunks), ignore_index=True)])
+
+    for i, chunk in enumerate(chunks):
+        scored = score_leads(chunk, **thresholds)
+        write_leads(scored, output_path, append=i > 0)
+
+        qualified = int(scored["qualified"].sum())
+        totals["total"] += len(scored)
+        totals["qualified"] += qualified
+        totals["disqualified"] += len(scored) - qualified
+
+    logger.info(f"Re-scored {totals['total']} leads: {totals['qualified']} qualified, "
+                f"{totals['disqualified']} disqualified")
+    return totals
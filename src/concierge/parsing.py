@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Concierge Answer Parsing
+
+Python port of the "Date Normalizer (UK/US)" and "Length & Budget Parser"
+n8n nodes. Turns free-text arrival dates, stay lengths and budgets into
+normalised values:
+
+- arrival dates: DD/MM/YYYY or MM/DD/YYYY ("/", "." or "-") -> "YYYY-MM-DD"
+- stay lengths: "10 nights", "3 months", "2m" -> nights (a month is 30)
+- budgets: "$2,500 per month" -> {"budget_value": 2500.0, "budget_type": "monthly"}
+
+All patterns are compiled once at import. The batch functions parse each
+distinct answer only once, which is where most of the time goes on message
+logs (answers like "3 months" repeat constantly). The pattern strings are
+public so vectorised callers (pandas .str methods) apply the same grammar.
+"""
+
+import re
+import logging
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DATE_PATTERN = r"^\s*(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})\s*$"
+LENGTH_PATTERN = r"(\d+)\s*(night|nights|month|months|m)?"
+NOT_NUMBER_PATTERN = r"[^\d.]"
+MONTHLY_PATTERN = r"(?:month|monthly|mo)"
+NIGHTLY_PATTERN = r"(?:night|nightly)"
+
+NIGHTS_PER_MONTH = 30
+
+_DATE = re.compile(DATE_PATTERN)
+_LENGTH = re.compile(LENGTH_PATTERN, re.IGNORECASE)
+_NOT_NUMBER = re.compile(NOT_NUMBER_PATTERN)
+_MONTHLY = re.compile(MONTHLY_PATTERN, re.IGNORECASE)
+_NIGHTLY = re.compile(NIGHTLY_PATTERN, re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
+def _iso_date(first: int, second: int, year: int) -> Optional[str]:
+    """UK reading of a date if it is valid, else the US reading, else None."""
+    for day, month in ((first, second), (second, first)):
+        try:
+            return date(year, month, day).isoformat()
+        except ValueError:
+            continue
+    return None
+
+def parse_arrival_date(text: str) -> Optional[str]:
+    """
+    Parse a DD/MM/YYYY or MM/DD/YYYY date (".", "-" or "/" separated).
+
+    UK order is tried first; US order is used when the UK reading is not a
+    valid calendar date.
+
+    Returns:
+        ISO date string (YYYY-MM-DD), or None if the text is not a valid date
+    """
+    if not text:
+        return None
+    match = _DATE.match(text)
+    if not match:
+        return None
+    first, second, year = match.groups()
+    return _iso_date(int(first), int(second), int(year))
+
+def parse_length_nights(text: str) -> Optional[int]:
+    """Parse a stay length ("10 nights", "3 months", "2m") into nights; a month counts as 30."""
+    match = _LENGTH.search(text or "")
+    if not match:
+        return None
+    value = int(match.group(1))
+    unit = (match.group(2) or "nights").lower()
+    return value * NIGHTS_PER_MONTH if unit.startswith("month") or unit == "m" else value
+
+def parse_budget(text: str, length_nights: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Parse a budget into a value and a type ("monthly" or "nightly").
+
+    Without an explicit period the type follows the stay length: 30 nights or
+    more is monthly, anything shorter is nightly.
+
+    Returns:
+        Dictionary with budget_value and budget_type, or None without a number
+    """
+    text = text or ""
+    try:
+        value = float(_NOT_NUMBER.sub("", text))
+    except ValueError:
+        return None
+
+    if _MONTHLY.search(text):
+        budget_type = "monthly"
+    elif _NIGHTLY.search(text):
+        budget_type = "nightly"
+    else:
+        budget_type = "monthly" if (length_nights or 0) >= NIGHTS_PER_MONTH else "nightly"
+    return {"budget_value": value, "budget_type": budget_type}
+
+def parse_arrival_dates(texts: Iterable[str]) -> List[Optional[str]]:
+    """Batch parse_arrival_date: one ISO date (or None) per text."""
+    seen: Dict[str, Optional[str]] = {}
+    results = []
+    for text in texts:
+        if text not in seen:
+            seen[text] = parse_arrival_date(text)
+        results.append(seen[text])
+    return results
+
+def parse_lengths_nights(texts: Iterable[str]) -> List[Optional[int]]:
+    """Batch parse_length_nights: nights (or None) per text."""
+    seen: Dict[str, Optional[int]] = {}
+    results = []
+    for text in texts:
+        if text not in seen:
+            seen[text] = parse_length_nights(text)
+        results.append(seen[text])
+    return results
+
+def parse_budgets(texts: Iterable[str],
+                  length_nights: Optional[Iterable[Optional[int]]] = None) -> List[Optional[Dict[str, Any]]]:
+    """
+    Batch parse_budget.
+
+    Args:
+        texts: Budget answers
+        length_nights: Stay length per answer (same order), used when an
+            answer has no explicit period
+
+    Returns:
+        One budget dictionary (or None) per text; dictionaries are not shared
+        between rows, so callers may modify them
+    """
+    texts = list(texts)
+    lengths = list(length_nights) if length_nights is not None else [None] * len(texts)
+    if len(lengths) != len(texts):
+        raise ValueError(f"Got {len(texts)} budgets but {len(lengths)} stay lengths")
+
+    seen: Dict[Any, Optional[Dict[str, Any]]] = {}
+    results = []
+    for text, nights in zip(texts, lengths):
+        # Only whether the stay is a month or longer affects the result
+        key = (text, (nights or 0) >= NIGHTS_PER_MONTH)
+        if key not in seen:
+            seen[key] = parse_budget(text, nights)
+        parsed = seen[key]
+        results.append(dict(parsed) if parsed is not None else None)
+    return results
+
+def parse_answers(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Parse raw qualification answers for many leads at once.
+
+    Args:
+        records: Dictionaries with any of arrival_raw, length_raw and budget_raw
+
+    Returns:
+        One dictionary per record with arrival_iso, length_nights,
+        budget_value and budget_type (None / "" where an answer did not parse)
+    """
+    records = list(records)
+    arrivals = parse_arrival_dates(record.get("arrival_raw") or "" for record in records)
+    lengths = parse_lengths_nights(record.get("length_raw") or "" for record in records)
+    budgets = parse_budgets((record.get("budget_raw") or "" for record in records), lengths)
+
+    parsed = []
+    for arrival, nights, budget in zip(arrivals, lengths, budgets):
+        parsed.append({
+            "arrival_iso": arrival or "",
+            "length_nights": nights,
+            "budget_value": budget["budget_value"] if budget else None,
+            "budget_type": budget["budget_type"] if budget else ""
+        })
+    logger.debug(f"Parsed answers for {len(parsed)} leads")
+    return parsed
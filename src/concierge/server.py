@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Concierge Webhook Server
+
+Serves ConciergeEngine over HTTP so the chat widget (or a single n8n webhook
+node) can post a message and get the reply in one call.
+
+Endpoints:
+    POST /concierge  {"text": "...", "sessionId": "..."}
+    GET  /health
+"""
+
+import os
+import asyncio
+import logging
+from typing import Optional
+
+from aiohttp import web
+
+from .engine import ConciergeEngine, OpenAIStayClassifier
+from .classifier import SEED_EXAMPLES, StayClassifier
+from .sessions import create_session_store
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def create_app(engine: ConciergeEngine) -> web.Application:
+    """Build the aiohttp application around a concierge engine."""
+
+    async def concierge(request: web.Request) -> web.Response:
+        """Run one chat turn."""
+        try:
+            data = await request.json()
+        except Exception:
+            return web.json_response({'error': 'Invalid JSON body'}, status=400)
+
+        data = data or {}
+        session_id = data.get('sessionId') or data.get('userId')
+        # The knowledge base and classifier calls block, keep them off the event loop
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, engine.handle, data.get('text', ''), session_id
+        )
+        return web.json_response(result)
+
+    async def health(request: web.Request) -> web.Response:
+        """Health check endpoint."""
+        return web.json_response({'status': 'healthy', 'sessions': len(engine.store)})
+
+    app = web.Application()
+    app.router.add_post('/concierge', concierge)
+    app.router.add_get('/health', health)
+    return app
+
+def build_engine(faq_collection: Optional[str] = None) -> ConciergeEngine:
+    """
+    Create an engine backed by the FAQ collection and the local stay
+    classifier (escalating to the LLM classifier when an OpenAI key is set).
+    STAY_CLASSIFIER_PATH points at a model from scripts/train_stay_classifier.py.
+    CONCIERGE_SESSION_STORE selects the session store
+    (redis://..., sqlite:///path.db, or in-memory when unset).
+    CONCIERGE_RERANK_MODEL enables cross-encoder reranking of the FAQ
+    candidates (e.g. cross-encoder/ms-marco-MiniLM-L-6-v2), and
+    CONCIERGE_RERANK_THRESHOLD sets its confidence threshold as calibrated by
+    scripts/calibrate_rerank_threshold.py.
+    """
+    from vector_db.qdrant_setup import SERVICE_EXACT_SEARCH_MAX_POINTS, PremiereSuitesVectorDB
+    from vector_db.semantic_cache import CachedFAQAnswerer
+
+    qdrant_url = os.getenv("QDRANT_URL")
+    qdrant_api_key = os.getenv("QDRANT_API_KEY")
+    vdb = PremiereSuitesVectorDB(
+        qdrant_url=qdrant_url,
+        qdrant_api_key=qdrant_api_key,
+        collection_name=faq_collection or os.getenv("FAQ_COLLECTION", "premiere_suites_faqs"),
+        use_cloud=bool(qdrant_url and qdrant_api_key),
+        # The FAQ collection is small enough to answer in-process
+        exact_search_max_points=int(os.getenv("EXACT_SEARCH_MAX_POINTS", SERVICE_EXACT_SEARCH_MAX_POINTS))
+    )
+    llm_classifier = OpenAIStayClassifier() if os.getenv("OPENAI_API_KEY") else None
+    if llm_classifier is None:
+        logger.warning("OPENAI_API_KEY not set, ambiguous questions will be classified locally")
+
+    # Local classifier first; only ambiguous messages reach the LLM
+    classifier_path = os.getenv("STAY_CLASSIFIER_PATH", "models/stay_classifier.npz")
+    if os.path.exists(classifier_path):
+        classifier = StayClassifier.load(classifier_path, vdb, fallback=llm_classifier)
+    else:
+        logger.info(f"No trained stay classifier at {classifier_path}, fitting on the seed examples")
+        texts, labels = zip(*SEED_EXAMPLES)
+        classifier = StayClassifier(vdb, fallback=llm_classifier).fit(texts, labels, target_accuracy=1.0)
+
+    store = create_session_store(
+        os.getenv("CONCIERGE_SESSION_STORE"),
+        ttl=float(os.getenv("CONCIERGE_SESSION_TTL", 24 * 3600))
+    )
+    # Optional reranker, so borderline FAQ matches are decided locally
+    reranker = None
+    rerank_model = os.getenv("CONCIERGE_RERANK_MODEL")
+    if rerank_model:
+        from vector_db.reranker import CrossEncoderReranker
+        reranker = CrossEncoderReranker(rerank_model)
+
+    faq_answerer = CachedFAQAnswerer(vdb, reranker=reranker)
+    rerank_threshold = os.getenv("CONCIERGE_RERANK_THRESHOLD")
+    if rerank_threshold:
+        faq_answerer.rerank_threshold = float(rerank_threshold)
+    elif reranker is not None:
+        logger.warning("CONCIERGE_RERANK_THRESHOLD not set, using the uncalibrated default "
+                       f"{faq_answerer.rerank_threshold}")
+    return ConciergeEngine(faq_answerer=faq_answerer, classifier=classifier, store=store)
+
+def main():
+    """Run the concierge webhook server."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # python-dotenv not installed, continue without it
+
+    port = int(os.environ.get('PORT', 5002))
+    web.run_app(create_app(build_engine()), host='0.0.0.0', port=port)
+
+if __name__ == '__main__':
+    main()
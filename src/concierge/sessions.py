@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Concierge Session Stores
+
+The n8n workflow keeps every conversation in workflow static data, which grows
+without bound, is lost on restart and cannot be shared between workers. A
+SessionStore holds one compact record per session with a TTL instead:
+
+- InMemorySessionStore: single process, LRU-bounded
+- SQLiteSessionStore: survives restarts, shared by processes on one host
+- RedisSessionStore: shared by every worker, through any client exposing
+  get / set(px=...) / delete / pipeline (redis-py or a compatible fake)
+
+Records are small dictionaries serialised as compact JSON; the engine keeps
+the conversation in them in the compact form from concierge.state.
+
+Workers sharing a store can receive messages for the same session at the
+same time, so the engine changes records only through update(), an atomic
+read-modify-write: the write is a compare-and-set against the record that
+was read, and the change is re-applied to the newer record when another
+worker wrote first.
+"""
+
+import json
+import math
+import time
+import sqlite3
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    from redis.exceptions import WatchError
+except ImportError:
+    # redis-py is optional; compatible clients raise this one
+    class WatchError(Exception):
+        """A watched key changed before the transaction executed."""
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION_TTL = 24 * 3600
+
+# Attempts update() makes before giving up on a session that keeps changing
+MAX_UPDATE_ATTEMPTS = 20
+
+def dumps(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+class SessionStore(ABC):
+    """Interface for session record storage with per-record expiry."""
+
+    def __init__(self, ttl: Optional[float] = DEFAULT_SESSION_TTL):
+        """
+        Args:
+            ttl: Seconds a session survives without activity (None for no expiry)
+        """
+        self.ttl = ttl
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Record for a session, or None if missing or expired."""
+        value = self._load(session_id)
+        return json.loads(value) if value is not None else None
+
+    @abstractmethod
+    def set(self, session_id: str, record: Dict[str, Any]) -> None:
+        """Store a session record and restart its TTL."""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Remove a session record."""
+
+    def update(self, session_id: str, change: Callable[[Dict[str, Any]], Any]) -> Any:
+        """
+        Atomically read, change and write a session record.
+
+        Args:
+            session_id: Session to update
+            change: Function that modifies the record ({} for a new session) in
+                place; it runs again on the newer record if another writer
+                changed the session in between, so it must not call out to
+                other services
+
+        Returns:
+            The return value of change
+
+        Raises:
+            RuntimeError: If the session kept changing for MAX_UPDATE_ATTEMPTS attempts
+        """
+        for _ in range(MAX_UPDATE_ATTEMPTS):
+            current = self._load(session_id)
+            record = json.loads(current) if current is not None else {}
+            result = change(record)
+            if self._swap(session_id, current, dumps(record)):
+                return result
+            logger.debug(f"sid={session_id} Session changed during update, retrying")
+        raise RuntimeError(f"Session {session_id} kept changing during update")
+
+    def evict_expired(self) -> int:
+        """Remove expired records; returns how many were removed."""
+        return 0
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of live sessions."""
+
+    @abstractmethod
+    def _load(self, session_id: str) -> Optional[str]:
+        """Serialised record for a session, or None if missing or expired."""
+
+    @abstractmethod
+    def _swap(self, session_id: str, expected: Optional[str], value: str) -> bool:
+        """
+        Write a serialised record if the stored one is still `expected`
+        (None: missing or expired) and restart its TTL.
+
+        Returns:
+            Whether the record was written
+        """
+
+class InMemorySessionStore(SessionStore):
+    """Process-local store; the least recently used sessions go first when full."""
+
+    def __init__(self, ttl: Optional[float] = DEFAULT_SESSION_TTL, max_sessions: int = 100000):
+        super().__init__(ttl)
+        self.max_sessions = max_sessions
+        self._records: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load(self, session_id: str) -> Optional[str]:
+        with self._lock:
+            return self._live(session_id)
+
+    def _live(self, session_id: str) -> Optional[str]:
+        """Serialised record if present and unexpired (call with the lock held)."""
+        entry = self._records.get(session_id)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._records[session_id]
+            return None
+        self._records.move_to_end(session_id)
+        return entry[1]
+
+    def set(self, session_id: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._write(session_id, dumps(record))
+
+    def _swap(self, session_id: str, expected: Optional[str], value: str) -> bool:
+        with self._lock:
+            if self._live(session_id) != expected:
+                return False
+            self._write(session_id, value)
+            return True
+
+    def _write(self, session_id: str, value: str) -> None:
+        """Store a serialised record, evicting the least recently used (call with the lock held)."""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        self._records[session_id] = (expires, value)
+        self._records.move_to_end(session_id)
+        while len(self._records) > self.max_sessions:
+            self._records.popitem(last=False)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._records.pop(session_id, None)
+
+    def evict_expired(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            expired = [sid for sid, (expires, _) in self._records.items() if expires <= now]
+            for sid in expired:
+                del self._records[sid]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite-backed store in WAL mode, safe to share between local processes."""
+
+    def __init__(self, path: str = "concierge_sessions.db", ttl: Optional[float] = DEFAULT_SESSION_TTL,
+                 evict_every: int = 1000):
+        """
+        Args:
+            path: Database file (":memory:" for a private in-memory database)
+            ttl: Seconds a session survives without activity (None for no expiry)
+            evict_every: Purge expired rows after this many writes
+        """
+        super().__init__(ttl)
+        self.path = path
+        self.evict_every = evict_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, record TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires)")
+
+    def _load(self, session_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record FROM sessions WHERE session_id = ? AND expires > ?",
+                (session_id, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, session_id: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._write(session_id, dumps(record))
+            evict = self._count_write()
+        if evict:
+            self.evict_expired()
+
+    def _swap(self, session_id: str, expected: Optional[str], value: str) -> bool:
+        with self._lock:
+            # BEGIN IMMEDIATE takes the database write lock, so no other
+            # process can write between the check and the write
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT record FROM sessions WHERE session_id = ? AND expires > ?",
+                    (session_id, time.time())
+                ).fetchone()
+                swapped = (row[0] if row else None) == expected
+                if swapped:
+                    self._write(session_id, value)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            evict = swapped and self._count_write()
+        if evict:
+            self.evict_expired()
+        return swapped
+
+    def _write(self, session_id: str, value: str) -> None:
+        expires = time.time() + self.ttl if self.ttl is not None else float("inf")
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sessions (session_id, record, expires) VALUES (?, ?, ?)",
+            (session_id, value, expires)
+        )
+
+    def _count_write(self) -> bool:
+        """Count a write; True when expired rows are due to be purged."""
+        self._writes += 1
+        return self._writes % self.evict_every == 0
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def evict_expired(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM sessions WHERE expires <= ?", (time.time(),))
+        if cursor.rowcount:
+            logger.info(f"Evicted {cursor.rowcount} expired concierge sessions")
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM sessions WHERE expires > ?", (time.time(),)
+            ).fetchone()[0]
+
+class RedisSessionStore(SessionStore):
+    """Store on a Redis-compatible client; expiry is delegated to Redis (SET ... PX)."""
+
+    def __init__(self, client: Any, ttl: Optional[float] = DEFAULT_SESSION_TTL,
+                 prefix: str = "concierge:session:"):
+        """
+        Args:
+            client: Object with get(key), set(key, value, px=milliseconds), delete(key),
+                scan_iter(match=pattern) and pipeline() supporting WATCH, e.g. redis.Redis
+            ttl: Seconds a session survives without activity (None for no expiry)
+            prefix: Key prefix for session records
+        """
+        super().__init__(ttl)
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisSessionStore":
+        import redis
+
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def _load(self, session_id: str) -> Optional[str]:
+        return self._decode(self.client.get(self.prefix + session_id))
+
+    def set(self, session_id: str, record: Dict[str, Any]) -> None:
+        self.client.set(self.prefix + session_id, dumps(record), px=self._ttl_ms())
+
+    def _swap(self, session_id: str, expected: Optional[str], value: str) -> bool:
+        key = self.prefix + session_id
+        with self.client.pipeline() as pipe:
+            try:
+                # WATCH makes EXEC fail if another client writes the key meanwhile
+                pipe.watch(key)
+                if self._decode(pipe.get(key)) != expected:
+                    pipe.unwatch()
+                    return False
+                pipe.multi()
+                pipe.set(key, value, px=self._ttl_ms())
+                pipe.execute()
+                return True
+            except WatchError:
+                return False
+
+    def _ttl_ms(self) -> Optional[int]:
+        """TTL in milliseconds, at least 1 (Redis rejects an expiry of 0)."""
+        return max(1, math.ceil(self.ttl * 1000)) if self.ttl is not None else None
+
+    @staticmethod
+    def _decode(value: Any) -> Optional[str]:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def delete(self, session_id: str) -> None:
+        self.client.delete(self.prefix + session_id)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=self.prefix + "*"))
+
+def create_session_store(url: Optional[str] = None, ttl: Optional[float] = DEFAULT_SESSION_TTL) -> SessionStore:
+    """
+    Build a store from a URL: "redis://..." / "rediss://...", "sqlite:///path.db",
+    or None / "memory://" for the in-memory store.
+    """
+    if not url or url.startswith("memory://"):
+        return InMemorySessionStore(ttl=ttl)
+    if url.startswith(("redis://", "rediss://")):
+        return RedisSessionStore.from_url(url, ttl=ttl)
+    if url.startswith("sqlite:///"):
+        return SQLiteSessionStore(url[len("sqlite:///"):], ttl=ttl)
+    raise ValueError(f"Unsupported session store URL: {url}")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Concierge Conversation State
+
+Lead and ConversationState follow the lead schema of the n8n concierge
+workflow. encode_state / decode_state give the compact form kept in session
+stores: default-valued fields are left out, so a new conversation is "{}".
+"""
+
+from dataclasses import dataclass, field, fields, asdict
+from typing import Any, Dict, Optional
+
+FAQ_MODE = "FAQ_MODE"
+QUALIFY_MODE = "QUALIFY_MODE"
+
+@dataclass
+class Lead:
+    """Lead details captured by the qualification flow (same schema as the workflow)."""
+    name: str = ""
+    email: str = ""
+    city: str = ""
+    arrival_iso: str = ""
+    length_nights: Optional[int] = None
+    bedrooms: Optional[int] = None
+    pets: Optional[bool] = None
+    parking: Optional[bool] = None
+    budget_type: str = ""
+    budget_value: Optional[float] = None
+    phone: str = ""
+    arrival_raw: str = ""
+    length_raw: str = ""
+    budget_raw: str = ""
+
+@dataclass
+class ConversationState:
+    """Per-session concierge state."""
+    mode: str = FAQ_MODE
+    stage: str = "ask_name"
+    lead: Lead = field(default_factory=Lead)
+    qualified: bool = True
+    reason: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConversationState":
+        data = dict(data)
+        data["lead"] = Lead(**data.get("lead", {}))
+        return cls(**data)
+
+
+_STATE_DEFAULTS = {f.name: f.default for f in fields(ConversationState) if f.name != "lead"}
+_LEAD_DEFAULTS = {f.name: f.default for f in fields(Lead)}
+
+def encode_state(state: ConversationState) -> Dict[str, Any]:
+    """ConversationState as a dictionary without default-valued fields."""
+    data = {name: getattr(state, name) for name, default in _STATE_DEFAULTS.items()
+            if getattr(state, name) != default}
+    lead = {name: getattr(state.lead, name) for name, default in _LEAD_DEFAULTS.items()
+            if getattr(state.lead, name) != default}
+    if lead:
+        data["lead"] = lead
+    return data
+
+def decode_state(data: Optional[Dict[str, Any]]) -> ConversationState:
+    """Inverse of encode_state (an empty or missing record is a new conversation)."""
+    data = dict(data or {})
+    lead = Lead(**data.pop("lead", {}))
+    return ConversationState(lead=lead, **data)
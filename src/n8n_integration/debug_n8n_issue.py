@@ -63,9 +63,8 @@ def test_exact_n8n_configuration():
         for config in configurations:
             print(f"\n   Testing: {config['description']}")
             try:
-                results = vdb.client.search(
-                    collection_name=vdb.collection_name,
-                    query_vector=vdb.generate_query_embedding(test_query),
+                results = vdb.dense_query(
+                    vdb.generate_query_embedding(test_query),
                     limit=config["top_k"],
                     score_threshold=config["score_threshold"]
                 )
@@ -83,9 +82,8 @@ def test_exact_n8n_configuration():
         # Test with empty query
         print("\n4. Testing with empty query...")
         try:
-            results = vdb.client.search(
-                collection_name=vdb.collection_name,
-                query_vector=vdb.generate_query_embedding(""),
+            results = vdb.dense_query(
+                vdb.generate_query_embedding(""),
                 limit=5,
                 score_threshold=0.3
             )
@@ -96,9 +94,8 @@ def test_exact_n8n_configuration():
         # Test with very short query
         print("\n5. Testing with short query...")
         try:
-            results = vdb.client.search(
-                collection_name=vdb.collection_name,
-                query_vector=vdb.generate_query_embedding("Alliance"),
+            results = vdb.dense_query(
+                vdb.generate_query_embedding("Alliance"),
                 limit=5,
                 score_threshold=0.3
             )
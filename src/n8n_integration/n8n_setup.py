@@ -99,16 +99,11 @@ def create_n8n_workflows():
                     }
                 },
                 {
-                    "id": "qdrant_search",
+                    "id": "search_gateway",
                     "type": "n8n-nodes-base.httpRequest",
                     "position": [460, 300],
                     "parameters": {
-                        "url": "={{ $env.QDRANT_URL }}/collections/premiere_suites_properties/points/search",
-                        "authentication": "httpHeaderAuth",
-                        "httpHeaderAuth": {
-                            "name": "api-key",
-                            "value": "={{ $env.QDRANT_API_KEY }}"
-                        },
+                        "url": "={{ $env.SEARCH_GATEWAY_URL }}/search",
                         "method": "POST",
                         "sendHeaders": True,
                         "headerParameters": {
@@ -123,16 +118,16 @@ def create_n8n_workflows():
                         "bodyParameters": {
                             "parameters": [
                                 {
-                                    "name": "vector",
-                                    "value": "={{ $json.query_vector }}"
+                                    "name": "query",
+                                    "value": "={{ $json.query }}"
                                 },
                                 {
-                                    "name": "limit",
-                                    "value": "={{ $json.limit || 10 }}"
+                                    "name": "collection",
+                                    "value": "properties"
                                 },
                                 {
-                                    "name": "with_payload",
-                                    "value": "true"
+                                    "name": "limit",
+                                    "value": "={{ $json.limit || 10 }}"
                                 }
                             ]
                         }
@@ -147,11 +142,11 @@ def create_n8n_workflows():
                             "string": [
                                 {
                                     "name": "results",
-                                    "value": "={{ $json.result }}"
+                                    "value": "={{ $json.results }}"
                                 },
                                 {
                                     "name": "total_found",
-                                    "value": "={{ $json.result.length }}"
+                                    "value": "={{ $json.total_found }}"
                                 },
                                 {
                                     "name": "query",
@@ -178,14 +173,14 @@ def create_n8n_workflows():
                     "main": [
                         [
                             {
-                                "node": "Qdrant Search",
+                                "node": "Search Gateway",
                                 "type": "main",
                                 "index": 0
                             }
                         ]
                     ]
                 },
-                "Qdrant Search": {
+                "Search Gateway": {
                     "main": [
                         [
                             {
@@ -232,7 +227,7 @@ def create_n8n_workflows():
                             "string": [
                                 {
                                     "name": "filter",
-                                    "value": "={{ $json.city ? { must: [{ key: 'city', match: { value: $json.city } }] } : {} }}"
+                                    "value": "={{ $json.city ? { city: $json.city } : {} }}"
                                 }
                             ]
                         },
@@ -240,16 +235,11 @@ def create_n8n_workflows():
                     }
                 },
                 {
-                    "id": "qdrant_search",
+                    "id": "search_gateway",
                     "type": "n8n-nodes-base.httpRequest",
                     "position": [680, 300],
                     "parameters": {
-                        "url": "={{ $env.QDRANT_URL }}/collections/premiere_suites_properties/points/search",
-                        "authentication": "httpHeaderAuth",
-                        "httpHeaderAuth": {
-                            "name": "api-key",
-                            "value": "={{ $env.QDRANT_API_KEY }}"
-                        },
+                        "url": "={{ $env.SEARCH_GATEWAY_URL }}/search",
                         "method": "POST",
                         "sendHeaders": True,
                         "headerParameters": {
@@ -264,20 +254,20 @@ def create_n8n_workflows():
                         "bodyParameters": {
                             "parameters": [
                                 {
-                                    "name": "vector",
-                                    "value": "={{ $json.query_vector }}"
+                                    "name": "query",
+                                    "value": "={{ $('Webhook').item.json.query }}"
+                                },
+                                {
+                                    "name": "collection",
+                                    "value": "properties"
                                 },
                                 {
                                     "name": "limit",
-                                    "value": "={{ $json.limit || 10 }}"
+                                    "value": "={{ $('Webhook').item.json.limit || 10 }}"
                                 },
                                 {
                                     "name": "filter",
                                     "value": "={{ $json.filter }}"
-                                },
-                                {
-                                    "name": "with_payload",
-                                    "value": "true"
                                 }
                             ]
                         }
@@ -310,14 +300,14 @@ def create_n8n_workflows():
                     "main": [
                         [
                             {
-                                "node": "Qdrant Search",
+                                "node": "Search Gateway",
                                 "type": "main",
                                 "index": 0
                             }
                         ]
                     ]
                 },
-                "Qdrant Search": {
+                "Search Gateway": {
                     "main": [
                         [
                             {
@@ -342,64 +332,20 @@ def create_n8n_workflows():
     return True
 
 def create_embedding_service():
-    """Create a simple embedding service for n8n."""
+    """Copy the batching embedding server next to the n8n deployment files."""
     print("\n🧠 Creating embedding service...")
     
-    embedding_service = {
-        "name": "embedding_service.py",
-        "content": '''#!/usr/bin/env python3
-"""
-Embedding Service for n8n Property Search
-
-This service generates embeddings for search queries to be used with Qdrant Cloud.
-"""
-
-from flask import Flask, request, jsonify
-from sentence_transformers import SentenceTransformer
-import os
-
-app = Flask(__name__)
-
-# Load the embedding model
-model = SentenceTransformer('all-MiniLM-L6-v2')
-
-@app.route('/generate-embedding', methods=['POST'])
-def generate_embedding():
-    """Generate embedding for a text query."""
-    try:
-        data = request.get_json()
-        text = data.get('text', '')
-        
-        if not text:
-            return jsonify({'error': 'No text provided'}), 400
-        
-        # Generate embedding
-        embedding = model.encode([text])[0].tolist()
-        
-        return jsonify({
-            'embedding': embedding,
-            'text': text,
-            'dimension': len(embedding)
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/health', methods=['GET'])
-def health():
-    """Health check endpoint."""
-    return jsonify({'status': 'healthy', 'model': 'all-MiniLM-L6-v2'})
-
-if __name__ == '__main__':
-    port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
-'''
-    }
+    # The server module is self-contained, so the Docker image only needs this one file
+    server_source = Path(__file__).parent.parent / "services" / "embedding_server.py"
+    if not server_source.exists():
+        print(f"❌ Embedding server not found: {server_source}")
+        return False
     
     with open("embedding_service.py", "w") as f:
-        f.write(embedding_service["content"])
+        f.write(server_source.read_text(encoding="utf-8"))
     
     print("✅ Created embedding service: embedding_service.py")
+    print("   Endpoints: /generate-embedding, /embed-batch, /health, /metrics")
     return True
 
 def create_n8n_environment_file():
@@ -460,6 +406,7 @@ services:
       - N8N_DATABASE_SQLITE_DATABASE=/home/node/.n8n/database.db
       - QDRANT_URL=${QDRANT_URL}
       - QDRANT_API_KEY=${QDRANT_API_KEY}
+      - SEARCH_GATEWAY_URL=${SEARCH_GATEWAY_URL:-http://host.docker.internal:5001}
     volumes:
       - n8n_data:/home/node/.n8n
       - ./n8n_workflows:/home/node/.n8n/workflows
@@ -701,7 +648,8 @@ def main():
     print("\n🎉 n8n integration setup completed successfully!")
     print("\nNext steps:")
     print("1. Start n8n with Docker: docker-compose -f docker-compose.n8n.yml up -d")
-    print("2. Access n8n at: http://localhost:5678")
+    print("2. Start the search gateway: cd src && python -m services.search_gateway")
+    print("   Access n8n at: http://localhost:5678")
     print("3. Import the workflow JSON files")
     print("4. Configure your webhooks and integrations")
     print("5. Test the property search workflows")
@@ -21,7 +21,16 @@ from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from fake_useragent import UserAgent
 import logging
+import sys
 from datetime import datetime
+from pathlib import Path
+
+try:
+    from services.columnar_catalogue import export_jsonl
+except ImportError:
+    # src/ is not on sys.path (script mode or the root package)
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from services.columnar_catalogue import export_jsonl
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -433,6 +442,16 @@ class PremiereSuitesFAQScraper:
         except Exception as e:
             logger.error(f"Error generating FAQ JSON Lines: {e}")
     
+    def generate_parquet(self, jsonl_filename: str = "premiere_suites_faq_data.jsonl",
+                         filename: str = "premiere_suites_faq_data.parquet"):
+        """Generate a columnar Parquet catalogue from the FAQ JSON Lines file - read single columns without parsing JSON"""
+        try:
+            export_jsonl(jsonl_filename, filename, "faq")
+            logger.info(f"FAQ Parquet catalogue generated successfully: {filename}")
+            
+        except Exception as e:
+            logger.error(f"Error generating FAQ Parquet catalogue: {e}")
+    
     def create_text_chunk(self, faq: FAQData, index: int) -> str:
         """Create optimized text chunk for vector embedding"""
         chunks = []
@@ -776,6 +795,7 @@ def main():
             scraper.generate_plain_text(faqs)
             scraper.generate_chunked_text(faqs)
             scraper.generate_jsonl(faqs)
+            scraper.generate_parquet()
             
             # Print summary
             print(f"\nFAQ Scraping completed successfully!")
@@ -802,6 +822,7 @@ def main():
             print(f"- premiere_suites_faq_data.txt (plain text)")
             print(f"- premiere_suites_faq_chunks.txt (chunked for embedding)")
             print(f"- premiere_suites_faq_data.jsonl (for vector database)")
+            print(f"- premiere_suites_faq_data.parquet (columnar catalogue)")
             
         else:
             print("No FAQs found. Please check the website structure.")
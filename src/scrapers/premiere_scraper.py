@@ -30,7 +30,17 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 import markdown
+import sys
 from datetime import datetime
+from pathlib import Path
+
+try:
+    from services.jsonl_loader import load_records
+except ImportError:
+    # src/ is not on sys.path (script mode or the root package)
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from services.jsonl_loader import load_records
+from services.columnar_catalogue import export_jsonl
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -766,6 +776,16 @@ class PremiereSuitesScraper:
         except Exception as e:
             logger.error(f"Error generating JSON Lines: {e}")
     
+    def generate_parquet(self, jsonl_filename: str = "premiere_suites_data.jsonl",
+                         filename: str = "premiere_suites_data.parquet"):
+        """Generate a columnar Parquet catalogue from the JSON Lines file - read single columns without parsing JSON"""
+        try:
+            export_jsonl(jsonl_filename, filename, "property")
+            logger.info(f"Parquet catalogue generated successfully: {filename}")
+            
+        except Exception as e:
+            logger.error(f"Error generating Parquet catalogue: {e}")
+    
     def create_text_chunk(self, prop: PropertyData, index: int) -> str:
         """Create optimized text chunk for vector embedding"""
         chunks = []
@@ -904,26 +924,8 @@ def load_property_data(file_path: str = "premiere_suites_data.jsonl") -> List[Di
     Returns:
         List of property dictionaries
     """
-    properties = []
-    
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                try:
-                    import json
-                    data = json.loads(line)
-                    if data.get("type") == "property":
-                        properties.append(data)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Error parsing line {line_num}: {e}")
-                    continue
-                    
-        logger.info(f"Loaded {len(properties)} property entries from {file_path}")
-        return properties
+        return load_records(file_path, "property")
         
     except FileNotFoundError:
         logger.error(f"Property data file not found: {file_path}")
@@ -947,6 +949,7 @@ def main():
             scraper.generate_pdf(properties)
             scraper.generate_markdown(properties)
             scraper.generate_jsonl(properties)
+            scraper.generate_parquet()
             scraper.generate_plain_text(properties)
             scraper.generate_chunked_text(properties)
             
@@ -961,6 +964,7 @@ def main():
             print(f"- premiere_suites_data.pdf (for vector database)")
             print(f"- premiere_suites_data.md (alternative format)")
             print(f"- premiere_suites_data.jsonl (for vector database)")
+            print(f"- premiere_suites_data.parquet (columnar catalogue)")
             print(f"- premiere_suites_data.txt (plain text)")
             print(f"- premiere_suites_chunks.txt (chunked for embedding)")
             
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Columnar Property and FAQ Catalogues
+
+Parquet / Arrow companion to the JSONL data files. The catalogue has one
+column per record field, real list columns for amenities, suite_features and
+tags, and an optional fixed-size "embedding" column (float32) tagged with the
+model that produced it. Readers load only the columns they ask for:
+
+- ".parquet" files are zstd-compressed and read with memory mapping
+- ".arrow" files are uncompressed Arrow IPC, memory mapped without a copy
+
+so stats such as cities, ratings and amenity counts come from a couple of
+columns instead of decoding every JSON object.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from .jsonl_loader import load_records
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+EMBEDDING_COLUMN = "embedding"
+
+PROPERTY_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("property_name", pa.string()),
+    ("city", pa.string()),
+    ("rating", pa.float64()),
+    ("room_type", pa.string()),
+    ("amenities", pa.list_(pa.string())),
+    ("description", pa.string()),
+    ("pet_friendly", pa.bool_()),
+    ("bedrooms", pa.int32()),
+    ("building_type", pa.string()),
+    ("suite_features", pa.list_(pa.string())),
+    ("source_url", pa.string()),
+    ("image_url", pa.string()),
+    ("price_range", pa.string()),
+    ("location_details", pa.string()),
+    ("pageContent", pa.string()),
+    ("text_chunk", pa.string()),
+])
+
+FAQ_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("question", pa.string()),
+    ("answer", pa.string()),
+    ("category", pa.string()),
+    ("tags", pa.list_(pa.string())),
+    ("source_url", pa.string()),
+    ("content", pa.string()),
+    ("text_chunk", pa.string()),
+])
+
+CATALOGUE_SCHEMAS = {"property": PROPERTY_SCHEMA, "faq": FAQ_SCHEMA}
+
+# Columns catalogue_stats reads for each record type
+STATS_COLUMNS = {
+    "property": ["city", "rating", "pet_friendly", "amenities"],
+    "faq": ["category", "tags"],
+}
+
+CATALOGUE_SUFFIXES = (".parquet", ".arrow", ".feather")
+
+def is_catalogue(path: str) -> bool:
+    """Whether the path names a .parquet or .arrow catalogue (rather than JSONL)."""
+    return Path(path).suffix.lower() in CATALOGUE_SUFFIXES
+
+def _cell(value: Any, field: pa.Field) -> Any:
+    """Coerce a JSONL value to the column type (ids to strings, missing lists to [])."""
+    if pa.types.is_list(field.type):
+        return list(value) if value else []
+    if value is None:
+        return None
+    if pa.types.is_string(field.type):
+        return value if isinstance(value, str) else str(value)
+    return value
+
+def records_to_table(records: Iterable[Dict[str, Any]],
+                     record_type: str,
+                     embeddings: Optional[np.ndarray] = None,
+                     embedding_model: Optional[str] = None) -> pa.Table:
+    """
+    Build a catalogue table from JSONL records.
+
+    Args:
+        records: "property" or "faq" records (other fields are dropped)
+        record_type: "property" or "faq"
+        embeddings: Optional (n_records, dim) matrix stored as the embedding column
+        embedding_model: Model that produced the embeddings (kept in the schema metadata)
+
+    Returns:
+        Arrow table with the catalogue schema
+    """
+    if record_type not in CATALOGUE_SCHEMAS:
+        raise ValueError(f"Unknown catalogue type: {record_type}")
+    schema = CATALOGUE_SCHEMAS[record_type]
+    records = list(records)
+
+    columns = [
+        pa.array([_cell(record.get(field.name), field) for record in records], type=field.type)
+        for field in schema
+    ]
+    metadata = {"record_type": record_type, "generated_on": datetime.now().isoformat()}
+
+    if embeddings is not None:
+        vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(records):
+            raise ValueError(f"Expected a ({len(records)}, dim) embedding matrix, got {vectors.shape}")
+        columns.append(pa.FixedSizeListArray.from_arrays(pa.array(vectors.reshape(-1)), vectors.shape[1]))
+        schema = schema.append(pa.field(EMBEDDING_COLUMN, pa.list_(pa.float32(), vectors.shape[1])))
+        metadata["embedding_model"] = embedding_model or ""
+
+    return pa.Table.from_arrays(columns, schema=schema.with_metadata(metadata))
+
+def write_catalogue(table: pa.Table, path: str) -> None:
+    """Write a catalogue table as .parquet (zstd) or .arrow (uncompressed IPC)."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".parquet":
+        pq.write_table(table, path, compression="zstd")
+    elif suffix in (".arrow", ".feather"):
+        with pa.OSFile(path, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"Unsupported catalogue format: {suffix}")
+    logger.info(f"Wrote {table.num_rows} catalogue rows to {path}")
+
+def read_catalogue(path: str, columns: Optional[List[str]] = None) -> pa.Table:
+    """
+    Read a catalogue with memory mapping.
+
+    Args:
+        path: .parquet or .arrow catalogue
+        columns: Columns to read (all if None)
+
+    Returns:
+        Arrow table
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".parquet":
+        return pq.read_table(path, columns=columns, memory_map=True)
+    if suffix in (".arrow", ".feather"):
+        table = ipc.open_file(pa.memory_map(path, "r")).read_all()
+        return table.select(columns) if columns is not None else table
+    raise ValueError(f"Unsupported catalogue format: {suffix}")
+
+def read_catalogue_schema(path: str) -> pa.Schema:
+    """Read only the schema (column names, types and metadata) of a catalogue."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".parquet":
+        return pq.read_schema(path, memory_map=True)
+    if suffix in (".arrow", ".feather"):
+        return ipc.open_file(pa.memory_map(path, "r")).schema
+    raise ValueError(f"Unsupported catalogue format: {suffix}")
+
+def catalogue_metadata(table: Union[pa.Table, pa.Schema]) -> Dict[str, str]:
+    """Schema metadata (record_type, generated_on, embedding_model) as strings."""
+    schema = table.schema if isinstance(table, pa.Table) else table
+    return {key.decode(): value.decode() for key, value in (schema.metadata or {}).items()}
+
+def catalogue_embeddings(table: pa.Table) -> np.ndarray:
+    """The embedding column as an (n_rows, dim) float32 matrix."""
+    if EMBEDDING_COLUMN not in table.column_names:
+        raise ValueError("Catalogue has no embedding column")
+    column = table.column(EMBEDDING_COLUMN).combine_chunks()
+    dim = column.type.list_size
+    return column.values.to_numpy(zero_copy_only=False).reshape(-1, dim)
+
+def catalogue_stats(table: pa.Table, top: int = 10) -> Dict[str, Any]:
+    """
+    Catalogue statistics computed on columns only.
+
+    Returns:
+        Dictionary with total plus, for properties, top_cities, cities_covered,
+        average_rating, pet_friendly_count and top_amenities, or for FAQs
+        categories and top_tags
+    """
+    def counts(column: pa.Array) -> List[Dict[str, Any]]:
+        pairs = [(item["values"].as_py(), item["counts"].as_py()) for item in pc.value_counts(column)]
+        pairs = [(value, count) for value, count in pairs if value is not None]
+        pairs.sort(key=lambda pair: (-pair[1], pair[0]))
+        return [{"value": value, "count": count} for value, count in pairs[:top]]
+
+    stats: Dict[str, Any] = {"total": table.num_rows}
+    names = table.column_names
+
+    if "city" in names:
+        stats["top_cities"] = counts(table.column("city").combine_chunks())
+        stats["cities_covered"] = pc.count_distinct(table.column("city")).as_py()
+    if "rating" in names:
+        average = pc.mean(table.column("rating")).as_py()
+        stats["average_rating"] = round(average, 2) if average is not None else None
+    if "pet_friendly" in names:
+        stats["pet_friendly_count"] = pc.sum(table.column("pet_friendly").cast(pa.int64())).as_py() or 0
+    if "amenities" in names:
+        stats["top_amenities"] = counts(pc.list_flatten(table.column("amenities").combine_chunks()))
+    if "category" in names:
+        stats["categories"] = counts(table.column("category").combine_chunks())
+    if "tags" in names:
+        stats["top_tags"] = counts(pc.list_flatten(table.column("tags").combine_chunks()))
+    return stats
+
+def export_jsonl(jsonl_path: str,
+                 output_path: str,
+                 record_type: str,
+                 embeddings: Optional[np.ndarray] = None,
+                 embedding_model: Optional[str] = None) -> pa.Table:
+    """
+    Convert the records of one type in a JSONL data file to a catalogue file.
+
+    Returns:
+        The written table
+    """
+    table = records_to_table(load_records(jsonl_path, record_type), record_type, embeddings, embedding_model)
+    write_catalogue(table, output_path)
+    return table
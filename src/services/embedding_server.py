@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Embedding Server for n8n and the Premiere Suites Concierge
+
+Async HTTP service that turns text into embeddings. Concurrent requests are
+collected for a few milliseconds and encoded together in a single model call
+(micro-batching), repeated texts are served from an LRU cache, and queue depth,
+batch sizes and latencies are exposed on /metrics.
+
+Endpoints:
+    POST /generate-embedding  {"text": "..."}          -> {"embedding": [...], ...}
+    POST /embed-batch         {"texts": ["...", ...]}  -> {"embeddings": [[...], ...], ...}
+    GET  /health
+    GET  /metrics
+
+This module is self-contained so it can also be copied next to a Dockerfile
+(see n8n_setup.create_embedding_service).
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class LRUCache:
+    """Bounded least-recently-used cache for text embeddings."""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[List[float]]:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: List[float]) -> None:
+        if self.max_size <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class EmbeddingBatcher:
+    """
+    Collects concurrent embedding requests into micro-batches.
+
+    Each call to embed() enqueues its texts; a single worker task drains the
+    queue, waiting at most max_wait_ms for more texts once the first arrives,
+    and runs one encode call per batch in a worker thread.
+    """
+
+    def __init__(self,
+                 encode_fn: Callable[[List[str]], Sequence[Any]],
+                 max_batch_size: int = 64,
+                 max_wait_ms: float = 5.0,
+                 cache_size: int = 10000,
+                 latency_window: int = 1000):
+        """
+        Args:
+            encode_fn: Blocking function mapping a list of texts to a list of vectors
+            max_batch_size: Maximum number of texts per encode call
+            max_wait_ms: How long to wait for more texts after the first one arrives
+            cache_size: LRU cache capacity (0 disables caching)
+            latency_window: Number of recent request latencies kept for percentiles
+        """
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.cache = LRUCache(cache_size)
+        self._queue: Optional["asyncio.Queue[Tuple[str, asyncio.Future]]"] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="encode")
+        self._worker: Optional[asyncio.Task] = None
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self.requests = 0
+        self.texts = 0
+        self.batches = 0
+        self.batched_texts = 0
+
+    def start(self) -> None:
+        """Start the batching worker on the running event loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None:
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the batching worker and release the encode thread."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._executor.shutdown(wait=False)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, serving cached vectors and batching the rest.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per input text, in order
+        """
+        self.start()
+        started = time.perf_counter()
+        self.requests += 1
+        self.texts += len(texts)
+
+        loop = asyncio.get_running_loop()
+        results: List[Any] = [None] * len(texts)
+        futures: Dict[int, asyncio.Future] = {}
+
+        for i, text in enumerate(texts):
+            cached = self.cache.get(text)
+            if cached is not None:
+                results[i] = cached
+                continue
+            if text not in self._inflight:
+                future = loop.create_future()
+                self._inflight[text] = future
+                self._queue.put_nowait((text, future))
+            # Identical texts from concurrent requests share one encode
+            futures[i] = self._inflight[text]
+
+        for i, future in futures.items():
+            results[i] = await asyncio.shield(future)
+
+        self._latencies.append(time.perf_counter() - started)
+        return results
+
+    async def _run(self) -> None:
+        """Drain the queue in micro-batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                vectors = await loop.run_in_executor(self._executor, self.encode_fn, texts)
+            except Exception as e:
+                logger.error(f"Error encoding batch of {len(texts)}: {e}")
+                for text, future in batch:
+                    self._inflight.pop(text, None)
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.batched_texts += len(texts)
+            for (text, future), vector in zip(batch, vectors):
+                vector = vector.tolist() if hasattr(vector, "tolist") else list(vector)
+                self.cache.put(text, vector)
+                self._inflight.pop(text, None)
+                if not future.done():
+                    future.set_result(vector)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue, cache, batching and latency metrics."""
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            index = min(len(latencies) - 1, int(round(p * (len(latencies) - 1))))
+            return round(latencies[index] * 1000, 3)
+
+        return {
+            "queue_depth": self.queue_depth,
+            "requests": self.requests,
+            "texts": self.texts,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched_texts / self.batches, 2) if self.batches else 0,
+            "cache_size": len(self.cache),
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+            "latency_ms_p50": percentile(0.50),
+            "latency_ms_p95": percentile(0.95),
+            "latency_ms_p99": percentile(0.99),
+        }
+
+def create_app(batcher: EmbeddingBatcher, model_name: str, max_batch_texts: int = 256) -> web.Application:
+    """
+    Build the aiohttp application around an embedding batcher.
+
+    Args:
+        batcher: Batcher used for every request
+        model_name: Model name reported by /health
+        max_batch_texts: Maximum number of texts accepted by /embed-batch
+
+    Returns:
+        aiohttp Application
+    """
+    async def generate_embedding(request: web.Request) -> web.Response:
+        """Generate embedding for a text query."""
+        try:
+            data = await request.json()
+        except Exception:
+            return web.json_response({'error': 'Invalid JSON body'}, status=400)
+
+        text = (data or {}).get('text', '')
+        if not text:
+            return web.json_response({'error': 'No text provided'}, status=400)
+
+        try:
+            embedding = (await batcher.embed([text]))[0]
+        except Exception as e:
+            return web.json_response({'error': str(e)}, status=500)
+
+        return web.json_response({
+            'embedding': embedding,
+            'text': text,
+            'dimension': len(embedding)
+        })
+
+    async def embed_batch(request: web.Request) -> web.Response:
+        """Generate embeddings for a list of texts."""
+        try:
+            data = await request.json()
+        except Exception:
+            return web.json_response({'error': 'Invalid JSON body'}, status=400)
+
+        texts = (data or {}).get('texts')
+        if not isinstance(texts, list) or not texts or not all(isinstance(t, str) and t for t in texts):
+            return web.json_response({'error': 'texts must be a non-empty list of strings'}, status=400)
+        if len(texts) > max_batch_texts:
+            return web.json_response({'error': f'At most {max_batch_texts} texts per request'}, status=413)
+
+        try:
+            embeddings = await batcher.embed(texts)
+        except Exception as e:
+            return web.json_response({'error': str(e)}, status=500)
+
+        return web.json_response({
+            'embeddings': embeddings,
+            'count': len(embeddings),
+            'dimension': len(embeddings[0])
+        })
+
+    async def health(request: web.Request) -> web.Response:
+        """Health check endpoint."""
+        return web.json_response({'status': 'healthy', 'model': model_name})
+
+    async def metrics(request: web.Request) -> web.Response:
+        """Queue depth, cache and latency metrics."""
+        return web.json_response(batcher.metrics())
+
+    async def on_startup(app: web.Application) -> None:
+        batcher.start()
+
+    async def on_cleanup(app: web.Application) -> None:
+        await batcher.stop()
+
+    app = web.Application()
+    app.router.add_post('/generate-embedding', generate_embedding)
+    app.router.add_post('/embed-batch', embed_batch)
+    app.router.add_get('/health', health)
+    app.router.add_get('/metrics', metrics)
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    return app
+
+def main():
+    """Run the embedding server."""
+    from sentence_transformers import SentenceTransformer
+
+    model_name = os.environ.get('EMBEDDING_MODEL', 'all-MiniLM-L6-v2')
+    logger.info(f"Loading embedding model: {model_name}")
+    model = SentenceTransformer(model_name)
+
+    def encode(texts: List[str]):
+        return model.encode(texts, batch_size=len(texts), show_progress_bar=False)
+
+    batcher = EmbeddingBatcher(
+        encode,
+        max_batch_size=int(os.environ.get('EMBEDDING_MAX_BATCH', 64)),
+        max_wait_ms=float(os.environ.get('EMBEDDING_MAX_WAIT_MS', 5)),
+        cache_size=int(os.environ.get('EMBEDDING_CACHE_SIZE', 10000))
+    )
+
+    port = int(os.environ.get('PORT', 5000))
+    web.run_app(create_app(batcher, model_name), host='0.0.0.0', port=port)
+
+if __name__ == '__main__':
+    main()
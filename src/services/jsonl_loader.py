@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Streaming JSONL Loader for Premiere Suites Data Files
+
+The scraped data files (premiere_suites_data.jsonl, premiere_suites_faq_data.jsonl)
+mix record types on one line each: a "metadata" header, a "summary" and the
+"property" or "faq" records. This module is the one place those files are
+read:
+
+- lines are read as bytes and decoded with orjson or msgspec when installed,
+  falling back to the standard json module
+- records are routed by "type", so callers stream only the records they need
+  (lines that cannot hold a requested type are skipped without decoding)
+- records can be validated against RECORD_SCHEMAS, warning about (or
+  rejecting) malformed lines instead of failing later during ingestion
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+RECORD_TYPES = ("metadata", "summary", "property", "faq")
+
+# Field -> (accepted types, required); None is accepted for optional fields
+RECORD_SCHEMAS: Dict[str, Dict[str, Tuple[tuple, bool]]] = {
+    "metadata": {
+        "generated_on": ((str,), False),
+        "source_url": ((str,), False),
+    },
+    "summary": {},
+    "property": {
+        "id": ((str, int), True),
+        "property_name": ((str,), True),
+        "city": ((str,), False),
+        "rating": ((int, float), False),
+        "bedrooms": ((int,), False),
+        "pet_friendly": ((bool,), False),
+        "amenities": ((list,), False),
+        "suite_features": ((list,), False),
+        "description": ((str,), False),
+    },
+    "faq": {
+        "question": ((str,), True),
+        "answer": ((str,), True),
+        "id": ((str, int), False),
+        "category": ((str,), False),
+        "tags": ((list,), False),
+    },
+}
+
+def _decoder() -> Tuple[str, Callable[[bytes], Any], tuple]:
+    """Fastest available JSON decoder, its name and the errors it raises."""
+    if orjson is not None:
+        return "orjson", orjson.loads, (orjson.JSONDecodeError,)
+    if msgspec is not None:
+        decoder = msgspec.json.Decoder()
+        return "msgspec", decoder.decode, (msgspec.DecodeError,)
+    return "json", json.loads, (json.JSONDecodeError, UnicodeDecodeError)
+
+DECODER_NAME, _decode, _DECODE_ERRORS = _decoder()
+
+def validate_record(record: Dict[str, Any]) -> List[str]:
+    """
+    Check a record against the schema for its type.
+
+    Args:
+        record: Decoded JSONL record
+
+    Returns:
+        Problems found (empty if the record is valid)
+    """
+    record_type = record.get("type")
+    if record_type not in RECORD_SCHEMAS:
+        return [f"unknown record type {record_type!r}"]
+
+    problems = []
+    for field_name, (types, required) in RECORD_SCHEMAS[record_type].items():
+        value = record.get(field_name)
+        if value is None:
+            if required:
+                problems.append(f"missing {field_name}")
+            continue
+        # bool is an int subclass; only accept it where bool is declared
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            problems.append(f"{field_name} should be {'/'.join(t.__name__ for t in types)}, "
+                            f"got {type(value).__name__}")
+    return problems
+
+def iter_records(file_path: str,
+                 types: Optional[Iterable[str]] = None,
+                 validate: bool = False,
+                 strict: bool = False) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Stream records from a JSONL file.
+
+    Args:
+        file_path: Path to the JSONL file
+        types: Record types to yield (all records if None)
+        validate: Check records against RECORD_SCHEMAS
+        strict: Raise ValueError on undecodable or invalid lines instead of
+            logging a warning and skipping them
+
+    Yields:
+        (line number, record) tuples
+    """
+    wanted = frozenset(types) if types is not None else None
+    # A record of a wanted type must contain its quoted type name somewhere on the line
+    needles = [f'"{record_type}"'.encode() for record_type in wanted] if wanted else None
+
+    with open(file_path, "rb") as file:
+        for line_num, line in enumerate(file, 1):
+            if needles is not None and b"\\u" not in line and not any(n in line for n in needles):
+                continue
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                record = _decode(line)
+            except _DECODE_ERRORS as e:
+                if strict:
+                    raise ValueError(f"{file_path}:{line_num}: invalid JSON: {e}") from e
+                logger.warning(f"Error parsing line {line_num}: {e}")
+                continue
+
+            if not isinstance(record, dict):
+                if strict:
+                    raise ValueError(f"{file_path}:{line_num}: expected an object")
+                logger.warning(f"Skipping line {line_num}: expected an object")
+                continue
+            if wanted is not None and record.get("type") not in wanted:
+                continue
+
+            if validate:
+                problems = validate_record(record)
+                if problems:
+                    if strict:
+                        raise ValueError(f"{file_path}:{line_num}: {'; '.join(problems)}")
+                    logger.warning(f"Skipping invalid record on line {line_num}: {'; '.join(problems)}")
+                    continue
+
+            yield line_num, record
+
+def iter_properties(file_path: str, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+    """Stream the "property" records of a JSONL file."""
+    for _, record in iter_records(file_path, types=("property",), **kwargs):
+        yield record
+
+def iter_faqs(file_path: str, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+    """Stream the "faq" records of a JSONL file."""
+    for _, record in iter_records(file_path, types=("faq",), **kwargs):
+        yield record
+
+def load_records(file_path: str, record_type: Optional[str] = None, **kwargs: Any) -> List[Dict[str, Any]]:
+    """
+    Load the records of one type (or all records) from a JSONL file.
+
+    Args:
+        file_path: Path to the JSONL file
+        record_type: "metadata", "summary", "property", "faq" or None for all
+        **kwargs: validate / strict, see iter_records
+
+    Returns:
+        List of record dictionaries
+    """
+    types = (record_type,) if record_type is not None else None
+    records = [record for _, record in iter_records(file_path, types=types, **kwargs)]
+    logger.info(f"Loaded {len(records)} {record_type or 'record'} entries from {file_path}")
+    return records
+
+def load_by_type(file_path: str, **kwargs: Any) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Read a JSONL file once and group its records by type.
+
+    Returns:
+        Dictionary with a list for every type in RECORD_TYPES, plus any other
+        types found in the file
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = {record_type: [] for record_type in RECORD_TYPES}
+    for _, record in iter_records(file_path, **kwargs):
+        grouped.setdefault(record.get("type"), []).append(record)
+    return grouped
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Token-Bucket Rate Limiting
+
+Smooth token buckets for upstream budgets (OpenAI embeddings, the LLM
+classifier, Qdrant) and per-session budgets. Tokens refill continuously at
+`rate` per second up to `capacity`, so a caller that runs out waits a fraction
+of a second instead of being rejected until the next fixed window.
+
+Every bucket offers a reject API (try_acquire), a blocking wait-or-reject API
+(acquire with a timeout) and the same for asyncio (acquire_async). Buckets
+for named upstreams are shared process-wide through get_bucket(), so every
+PremiereSuitesVectorDB instance draws from the same embedding budget.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Default upstream budgets: (requests per minute, burst capacity).
+# Override with RATE_LIMIT_<NAME>_PER_MINUTE and RATE_LIMIT_<NAME>_BURST.
+DEFAULT_BUDGETS: Dict[str, Tuple[float, float]] = {
+    "openai_embeddings": (3000, 100),
+    "classifier": (500, 20),
+    "qdrant": (6000, 200),
+}
+
+class RateLimitExceeded(Exception):
+    """Raised when a token could not be acquired within the allowed wait."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Rate limit exceeded for '{name}', retry in {retry_after:.2f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+class TokenBucket:
+    """Thread-safe token bucket with continuous refill."""
+
+    def __init__(self, rate: float, capacity: float, name: str = "bucket",
+                 tokens: Optional[float] = None, updated: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+            name: Label used in logs and errors
+            tokens: Initial tokens (defaults to a full bucket)
+            updated: time.time() of the last refill, when restoring saved state
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Token bucket rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self.name = name
+        self._tokens = capacity if tokens is None else min(capacity, tokens)
+        self._updated = time.time() if updated is None else updated
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.rejected = 0
+        self.waited = 0.0
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: Optional[float] = None,
+                   name: str = "bucket") -> "TokenBucket":
+        """Bucket allowing requests_per_minute on average with bursts of `burst` (default: one second's worth)."""
+        rate = requests_per_minute / 60.0
+        return cls(rate, burst if burst is not None else max(1.0, rate), name=name)
+
+    @classmethod
+    def from_state(cls, state: Optional[List[float]], rate: float, capacity: float,
+                   name: str = "bucket") -> "TokenBucket":
+        """Restore a bucket saved with state() (None gives a full bucket)."""
+        if not state:
+            return cls(rate, capacity, name=name)
+        return cls(rate, capacity, name=name, tokens=state[0], updated=state[1])
+
+    def state(self) -> List[float]:
+        """[tokens, updated] for storing the bucket outside the process (e.g. in a session record)."""
+        with self._lock:
+            self._refill(time.time())
+            return [round(self._tokens, 4), round(self._updated, 3)]
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill(time.time())
+            return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available right now."""
+        return self._reserve(tokens, max_wait=0.0) is not None
+
+    def time_until(self, tokens: float = 1.0) -> float:
+        """Seconds until `tokens` would be available."""
+        with self._lock:
+            self._refill(time.time())
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> None:
+        """
+        Take tokens, sleeping until they are available.
+
+        Args:
+            tokens: Tokens to take
+            timeout: Longest acceptable wait in seconds (None waits as long as needed)
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed the timeout
+        """
+        wait = self._reserve(tokens, timeout)
+        if wait is None:
+            raise RateLimitExceeded(self.name, self.time_until(tokens))
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0, timeout: Optional[float] = None) -> None:
+        """acquire() for coroutines; waits with asyncio.sleep instead of blocking the loop."""
+        wait = self._reserve(tokens, timeout)
+        if wait is None:
+            raise RateLimitExceeded(self.name, self.time_until(tokens))
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "tokens": round(self.tokens, 3),
+            "rate_per_minute": self.rate * 60,
+            "capacity": self.capacity,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "waited_seconds": round(self.waited, 3),
+        }
+
+    def _reserve(self, tokens: float, max_wait: Optional[float]) -> Optional[float]:
+        """
+        Reserve tokens, letting the balance go negative when the caller is
+        prepared to wait.
+
+        Returns:
+            Seconds the caller must wait, or None if that exceeds max_wait
+            (nothing is reserved then)
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot take {tokens} tokens from '{self.name}' (capacity {self.capacity})")
+
+        with self._lock:
+            self._refill(time.time())
+            wait = max(0.0, (tokens - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                self.rejected += 1
+                return None
+            self._tokens -= tokens
+            self.acquired += 1
+            self.waited += wait
+            return wait
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+def get_bucket(name: str) -> TokenBucket:
+    """
+    Process-wide bucket for a named upstream budget.
+
+    Budgets come from configure_budget(), then the RATE_LIMIT_<NAME>_PER_MINUTE
+    and RATE_LIMIT_<NAME>_BURST environment variables, then DEFAULT_BUDGETS.
+    """
+    with _buckets_lock:
+        if name not in _buckets:
+            per_minute, burst = DEFAULT_BUDGETS.get(name, (600, 10))
+            env_name = name.upper()
+            per_minute = float(os.getenv(f"RATE_LIMIT_{env_name}_PER_MINUTE", per_minute))
+            burst = float(os.getenv(f"RATE_LIMIT_{env_name}_BURST", burst))
+            _buckets[name] = TokenBucket.per_minute(per_minute, burst, name=name)
+        return _buckets[name]
+
+def configure_budget(name: str, requests_per_minute: float, burst: Optional[float] = None) -> TokenBucket:
+    """Replace the process-wide bucket for a named upstream budget."""
+    bucket = TokenBucket.per_minute(requests_per_minute, burst, name=name)
+    with _buckets_lock:
+        _buckets[name] = bucket
+    logger.info(f"Rate limit for '{name}': {requests_per_minute}/min, burst {bucket.capacity}")
+    return bucket
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Search Gateway for n8n and the Premiere Suites Concierge
+
+Accepts raw query text plus filters and returns formatted hits in one HTTP hop,
+instead of n8n calling the embedding service and then Qdrant /points/search
+with a serialized query vector. Internally the gateway:
+
+- micro-batches query embeddings across concurrent requests (EmbeddingBatcher)
+- answers small collections from the in-process exact index, and micro-batches
+  the other searches per collection into one query_batch_points call
+- projects payloads to the fields the caller needs
+- caches recent results for a short TTL
+
+Endpoints:
+    POST /search  {"query": "...", "collection": "faqs", "limit": 5,
+                   "filter": {"category": "Payment"}, "score_threshold": 0.75,
+                   "fields": ["question", "answer"]}
+    GET  /health
+    GET  /metrics
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import web
+from qdrant_client.http import models
+
+from vector_db.qdrant_setup import SERVICE_EXACT_SEARCH_MAX_POINTS, PremiereSuitesVectorDB
+from vector_db.filters import compile_filter
+from vector_db.property_facets import COMBINED_VECTOR
+from .embedding_server import EmbeddingBatcher, LRUCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Payload fields returned when the caller does not ask for specific ones
+DEFAULT_FIELDS = {
+    "properties": [
+        "property_id", "property_name", "city", "rating", "description",
+        "amenities", "pet_friendly", "bedrooms", "source_url", "image_url"
+    ],
+    "faqs": ["faq_id", "question", "answer", "category", "tags"],
+}
+
+class SearchBatcher:
+    """Collects concurrent searches and sends one query_batch_points call per collection."""
+
+    def __init__(self, vdbs: Dict[str, PremiereSuitesVectorDB], max_batch_size: int = 32,
+                 max_wait_ms: float = 3.0):
+        self.vdbs = vdbs
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional["asyncio.Queue[Tuple[str, models.QueryRequest, asyncio.Future]]"] = None
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="qdrant")
+        self._worker: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.searches = 0
+
+    def start(self) -> None:
+        """Start the batching worker on the running event loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None:
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the batching worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._executor.shutdown(wait=False)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def search(self, collection: str, request: models.QueryRequest) -> List[Any]:
+        """Queue one search and wait for its scored points."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((collection, request, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue in micro-batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            by_collection: Dict[str, List[Tuple[models.QueryRequest, asyncio.Future]]] = {}
+            for collection, request, future in batch:
+                by_collection.setdefault(collection, []).append((request, future))
+
+            await asyncio.gather(*(
+                self._search_collection(collection, items)
+                for collection, items in by_collection.items()
+            ))
+
+    async def _search_collection(self, collection: str,
+                                 items: List[Tuple[models.QueryRequest, asyncio.Future]]) -> None:
+        """Run one query_batch_points call and resolve the waiting requests."""
+        vdb = self.vdbs[collection]
+        requests = [request for request, _ in items]
+        loop = asyncio.get_running_loop()
+
+        try:
+            responses = await loop.run_in_executor(
+                self._executor,
+                lambda: vdb.client.query_batch_points(collection_name=vdb.collection_name, requests=requests)
+            )
+        except Exception as e:
+            logger.error(f"Error in batched search on '{collection}': {e}")
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.searches += len(items)
+        for (_, future), response in zip(items, responses):
+            if not future.done():
+                future.set_result(response.points)
+
+class SearchGateway:
+    """Embed-and-search front end over one PremiereSuitesVectorDB per collection."""
+
+    def __init__(self, vdbs: Dict[str, PremiereSuitesVectorDB], cache_size: int = 5000,
+                 cache_ttl: float = 300.0, max_wait_ms: float = 3.0):
+        """
+        Args:
+            vdbs: Vector databases keyed by the collection alias used in requests
+            cache_size: Number of result sets kept in the LRU cache (0 disables it)
+            cache_ttl: Seconds a cached result set stays valid
+            max_wait_ms: Micro-batching window for embeddings and searches
+        """
+        if not vdbs:
+            raise ValueError("SearchGateway requires at least one vector database")
+
+        self.vdbs = vdbs
+        self.cache_ttl = cache_ttl
+        self.results_cache = LRUCache(cache_size)
+        # Queries skip the on-disk embedding store, which is meant for documents
+        embedder = next(iter(vdbs.values()))
+        self.embedder = EmbeddingBatcher(embedder.generate_query_embeddings, max_wait_ms=max_wait_ms)
+        self.searcher = SearchBatcher(vdbs, max_wait_ms=max_wait_ms)
+
+    async def search(self, query: str, collection: str, limit: int = 5,
+                     filter_dict: Optional[Dict[str, Any]] = None,
+                     score_threshold: Optional[float] = None,
+                     fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Search a collection with raw query text.
+
+        Args:
+            query: Query text
+            collection: Collection alias (e.g. "properties" or "faqs")
+            limit: Maximum number of hits
+            filter_dict: Mongo-like filter on payload fields (see vector_db.filters)
+            score_threshold: Minimum similarity score
+            fields: Payload fields to return (defaults per collection)
+
+        Returns:
+            List of hits with score, id and the projected payload fields
+        """
+        if collection not in self.vdbs:
+            raise ValueError(f"Unknown collection: {collection}")
+
+        fields = fields or DEFAULT_FIELDS.get(collection)
+        cache_key = json.dumps(
+            [collection, query, limit, filter_dict, score_threshold, fields],
+            sort_keys=True, default=str
+        )
+        cached = self.results_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        query_filter = compile_filter(filter_dict)
+        vector = (await self.embedder.embed([query]))[0]
+        # Loading or refreshing the exact index scrolls Qdrant, so keep it off the loop
+        exact_index = await asyncio.get_running_loop().run_in_executor(
+            None, self.vdbs[collection].get_exact_index
+        )
+        points = exact_index.try_search(vector, limit=limit, filter_dict=filter_dict,
+                                        score_threshold=score_threshold) if exact_index else None
+        if points is None:
+            request = models.QueryRequest(
+                query=vector,
+                using=COMBINED_VECTOR or None,
+                filter=query_filter,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=fields if fields else True
+            )
+            points = await self.searcher.search(collection, request)
+
+        hits = []
+        for point in points:
+            payload = point.payload or {}
+            if fields:
+                # The exact index holds whole payloads
+                payload = {key: payload[key] for key in fields if key in payload}
+            hits.append(dict(payload, score=point.score, id=point.id))
+        self.results_cache.put(cache_key, (time.monotonic() + self.cache_ttl, hits))
+        return hits
+
+    def metrics(self) -> Dict[str, Any]:
+        """Embedding, search and cache metrics."""
+        return {
+            "embedding": self.embedder.metrics(),
+            "search_queue_depth": self.searcher.queue_depth,
+            "search_batches": self.searcher.batches,
+            "searches": self.searcher.searches,
+            "result_cache_size": len(self.results_cache),
+            "result_cache_hits": self.results_cache.hits,
+            "result_cache_misses": self.results_cache.misses,
+        }
+
+    async def close(self) -> None:
+        await self.embedder.stop()
+        await self.searcher.stop()
+
+def create_app(gateway: SearchGateway) -> web.Application:
+    """Build the aiohttp application around a search gateway."""
+
+    async def search(request: web.Request) -> web.Response:
+        """Embed the query and return formatted hits."""
+        started = time.perf_counter()
+        try:
+            data = await request.json()
+        except Exception:
+            return web.json_response({'error': 'Invalid JSON body'}, status=400)
+
+        query = (data or {}).get('query', '')
+        if not query:
+            return web.json_response({'error': 'No query provided'}, status=400)
+
+        try:
+            hits = await gateway.search(
+                query=query,
+                collection=data.get('collection', 'properties'),
+                limit=int(data.get('limit', 5)),
+                filter_dict=data.get('filter'),
+                score_threshold=data.get('score_threshold'),
+                fields=data.get('fields')
+            )
+        except ValueError as e:
+            return web.json_response({'error': str(e)}, status=400)
+        except Exception as e:
+            logger.error(f"Error in gateway search: {e}")
+            return web.json_response({'error': str(e)}, status=500)
+
+        return web.json_response({
+            'query': query,
+            'results': hits,
+            'total_found': len(hits),
+            'took_ms': round((time.perf_counter() - started) * 1000, 3)
+        })
+
+    async def health(request: web.Request) -> web.Response:
+        """Health check endpoint."""
+        return web.json_response({'status': 'healthy', 'collections': sorted(gateway.vdbs)})
+
+    async def metrics(request: web.Request) -> web.Response:
+        return web.json_response(gateway.metrics())
+
+    async def on_cleanup(app: web.Application) -> None:
+        await gateway.close()
+
+    app = web.Application()
+    app.router.add_post('/search', search)
+    app.router.add_get('/health', health)
+    app.router.add_get('/metrics', metrics)
+    app.on_cleanup.append(on_cleanup)
+    return app
+
+def main():
+    """Run the search gateway."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # python-dotenv not installed, continue without it
+
+    qdrant_url = os.getenv("QDRANT_URL")
+    qdrant_api_key = os.getenv("QDRANT_API_KEY")
+    use_cloud = bool(qdrant_url and qdrant_api_key)
+
+    vdbs = {
+        alias: PremiereSuitesVectorDB(
+            qdrant_url=qdrant_url,
+            qdrant_api_key=qdrant_api_key,
+            collection_name=collection_name,
+            use_cloud=use_cloud,
+            exact_search_max_points=int(os.getenv("EXACT_SEARCH_MAX_POINTS", SERVICE_EXACT_SEARCH_MAX_POINTS))
+        )
+        for alias, collection_name in [
+            ("properties", os.getenv("PROPERTY_COLLECTION", "premiere_suites_properties")),
+            ("faqs", os.getenv("FAQ_COLLECTION", "premiere_suites_faqs")),
+        ]
+    }
+
+    gateway = SearchGateway(vdbs, cache_ttl=float(os.getenv("SEARCH_CACHE_TTL", 300)))
+    port = int(os.environ.get('PORT', 5001))
+    web.run_app(create_app(gateway), host='0.0.0.0', port=port)
+
+if __name__ == '__main__':
+    main()
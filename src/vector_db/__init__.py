@@ -1,4 +1,5 @@
 # Vector Database Module
 from .qdrant_setup import PremiereSuitesVectorDB
+from .async_qdrant_setup import AsyncPremiereSuitesVectorDB
 
-__all__ = ['PremiereSuitesVectorDB']
+__all__ = ['PremiereSuitesVectorDB', 'AsyncPremiereSuitesVectorDB']
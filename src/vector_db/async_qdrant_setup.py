@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Asyncio Qdrant Vector Database for Premiere Suites Property Data
+
+Async counterpart of PremiereSuitesVectorDB built on AsyncQdrantClient, so a
+single serving process can keep many searches in flight. Embedding runs in a
+shared thread pool to keep the event loop free, and clients are shared per
+Qdrant endpoint so every instance reuses the same HTTP connection pool.
+"""
+
+import os
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+import openai
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, VectorParams, PointStruct, OptimizersConfigDiff
+from qdrant_client.http import models
+
+from .qdrant_setup import (
+    OPENAI_EMBEDDING_BATCH_SIZE, load_embedding_model, build_property_filter,
+    build_property_payload, format_property_result
+)
+from .schema import get_collection_schema
+from .embedding_store import EmbeddingStore, open_embedding_store
+from .bulk_upload import DEFAULT_UPLOAD_BATCH_SIZE, async_upload_columns
+# Importing qdrant_setup puts src/ on sys.path when needed
+from services.rate_limit import TokenBucket, get_bucket
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class AsyncPremiereSuitesVectorDB:
+    """Asyncio vector database manager for Premiere Suites property data."""
+
+    # One client (and connection pool) per Qdrant endpoint, shared by all instances
+    _clients: Dict[Tuple[Any, ...], AsyncQdrantClient] = {}
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self,
+                 qdrant_url: Optional[str] = None,
+                 qdrant_api_key: Optional[str] = None,
+                 qdrant_host: str = "localhost",
+                 qdrant_port: int = 6333,
+                 collection_name: str = "premiere_suites_properties",
+                 embedding_model: Optional[str] = None,
+                 use_cloud: bool = False,
+                 payload_schema: Optional[Dict[str, models.PayloadSchemaType]] = None,
+                 max_embedding_workers: int = 4,
+                 embedding_rate_limit: Optional[TokenBucket] = None,
+                 embedding_store: Optional[EmbeddingStore] = None):
+        """
+        Initialize the async vector database manager.
+
+        Args:
+            qdrant_url: Qdrant Cloud URL (e.g., "https://your-cluster.qdrant.io")
+            qdrant_api_key: Qdrant Cloud API key
+            qdrant_host: Qdrant server host (for local instances)
+            qdrant_port: Qdrant server port (for local instances)
+            collection_name: Name of the collection to store properties
+            embedding_model: Sentence transformer or OpenAI model to use for embeddings
+            use_cloud: Whether to use Qdrant Cloud (if True, qdrant_url and qdrant_api_key are required)
+            payload_schema: Filterable payload fields and their index types
+            max_embedding_workers: Size of the shared embedding thread pool
+            embedding_rate_limit: Token bucket for OpenAI embedding requests (defaults to
+                the process-wide "openai_embeddings" budget)
+            embedding_store: On-disk store that prepare_columns reuses vectors from
+                (defaults to the EMBEDDING_STORE_DIR store for the model, if set)
+        """
+        self.collection_name = collection_name
+        self.embedding_rate_limit = embedding_rate_limit or get_bucket("openai_embeddings")
+        self.payload_schema = payload_schema or get_collection_schema(collection_name)
+        self.embedding_model = embedding_model or os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2") or "all-MiniLM-L6-v2"
+
+        # Shared Qdrant client
+        if use_cloud:
+            if not qdrant_url or not qdrant_api_key:
+                raise ValueError("Qdrant Cloud requires both qdrant_url and qdrant_api_key")
+            client_key = ("cloud", qdrant_url, qdrant_api_key)
+        else:
+            client_key = ("local", qdrant_host, qdrant_port)
+
+        if client_key not in self._clients:
+            if use_cloud:
+                logger.info(f"Connecting to Qdrant Cloud (async): {qdrant_url}")
+                self._clients[client_key] = AsyncQdrantClient(url=qdrant_url, api_key=qdrant_api_key)
+            else:
+                logger.info(f"Connecting to local Qdrant (async): {qdrant_host}:{qdrant_port}")
+                self._clients[client_key] = AsyncQdrantClient(host=qdrant_host, port=qdrant_port)
+        self.client = self._clients[client_key]
+
+        # Embedding model (shared per process by load_embedding_model)
+        self.model, self.use_openai, self.vector_size = load_embedding_model(self.embedding_model)
+        self.openai_model = self.embedding_model if self.use_openai else None
+        if embedding_store is None:
+            embedding_store = open_embedding_store(self.embedding_model)
+        self.embedding_store = embedding_store
+
+        if AsyncPremiereSuitesVectorDB._executor is None:
+            AsyncPremiereSuitesVectorDB._executor = ThreadPoolExecutor(
+                max_workers=max_embedding_workers,
+                thread_name_prefix="embedding"
+            )
+
+        logger.info(f"Vector dimension: {self.vector_size}")
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close every shared client and the embedding thread pool."""
+        for client in cls._clients.values():
+            await client.close()
+        cls._clients.clear()
+
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False)
+            cls._executor = None
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Blocking embedding call (one OpenAI request), run inside the thread pool."""
+        if self.use_openai:
+            response = openai.embeddings.create(input=texts, model=self.openai_model)
+            return np.array([item.embedding for item in response.data], dtype=np.float32)
+        return self.model.encode(texts, show_progress_bar=False)
+
+    async def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for a list of texts without blocking the event loop.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Numpy array of embeddings
+        """
+        logger.info(f"Generating embeddings for {len(texts)} texts")
+        loop = asyncio.get_running_loop()
+        try:
+            if self.use_openai:
+                # One request and one rate-limit token per batch of inputs
+                embeddings = []
+                for start in range(0, len(texts), OPENAI_EMBEDDING_BATCH_SIZE):
+                    await self.embedding_rate_limit.acquire_async()
+                    embeddings.append(await loop.run_in_executor(
+                        self._executor, self._encode, texts[start:start + OPENAI_EMBEDDING_BATCH_SIZE]
+                    ))
+                return np.concatenate(embeddings) if embeddings else np.empty((0, self.vector_size), dtype=np.float32)
+            return await loop.run_in_executor(self._executor, self._encode, texts)
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {e}")
+            raise
+
+    async def generate_document_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Embeddings for documents, reusing vectors from the embedding store.
+
+        Only texts the store does not hold yet are embedded; query embeddings
+        go through generate_embeddings and are never stored.
+        """
+        if self.embedding_store is None:
+            return await self.generate_embeddings(texts)
+
+        rows = self.embedding_store.rows(texts)
+        missing = list(dict.fromkeys(text for text, row in zip(texts, rows) if row < 0))
+        if missing:
+            self.embedding_store.add(missing, await self.generate_embeddings(missing))
+        return self.embedding_store.get(texts)
+
+    async def generate_query_embedding(self, query: str) -> List[float]:
+        """
+        Generate embedding for a single query text.
+
+        Args:
+            query: Query text to embed
+
+        Returns:
+            List of embedding values
+        """
+        embeddings = await self.generate_embeddings([query])
+        return embeddings[0].tolist()
+
+    async def create_collection(self, recreate: bool = False) -> None:
+        """
+        Create the collection for storing property data.
+
+        Args:
+            recreate: Whether to recreate the collection if it exists
+        """
+        try:
+            collections = await self.client.get_collections()
+            collection_exists = any(col.name == self.collection_name for col in collections.collections)
+
+            if collection_exists and recreate:
+                logger.info(f"Recreating collection: {self.collection_name}")
+                await self.client.delete_collection(self.collection_name)
+                collection_exists = False
+
+            if not collection_exists:
+                logger.info(f"Creating collection: {self.collection_name}")
+                await self.client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config=VectorParams(
+                        size=self.vector_size,
+                        distance=Distance.COSINE,
+                        on_disk=True
+                    ),
+                    optimizers_config=OptimizersConfigDiff(
+                        memmap_threshold=10000,
+                        default_segment_number=2
+                    )
+                )
+                await self._create_indexes()
+                logger.info(f"Collection '{self.collection_name}' created successfully")
+            else:
+                logger.info(f"Collection '{self.collection_name}' already exists")
+
+        except Exception as e:
+            logger.error(f"Error creating collection: {e}")
+            raise
+
+    async def _create_indexes(self, key_prefix: str = "") -> None:
+        """Create payload indexes for every filterable field in the payload schema."""
+        async def create_index(field_name: str, field_schema: models.PayloadSchemaType) -> bool:
+            try:
+                await self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=f"{key_prefix}{field_name}",
+                    field_schema=field_schema
+                )
+                return True
+            except Exception as e:
+                logger.warning(f"Error creating index on '{key_prefix}{field_name}' (may already exist): {e}")
+                return False
+
+        created = await asyncio.gather(*(
+            create_index(field_name, field_schema)
+            for field_name, field_schema in self.payload_schema.items()
+        ))
+        logger.info(f"Payload indexes created: {sum(created)}/{len(self.payload_schema)}")
+
+    async def prepare_columns(self, properties: List[Dict[str, Any]]) -> Tuple[List[int], np.ndarray, List[Dict[str, Any]]]:
+        """
+        Prepare property data as columns (ids, float32 embedding matrix, payloads).
+
+        Args:
+            properties: List of property dictionaries
+
+        Returns:
+            Tuple of (point ids, embedding matrix, payloads)
+        """
+        texts = [prop.get("text_chunk", "") for prop in properties]
+        embeddings = np.ascontiguousarray(await self.generate_document_embeddings(texts), dtype=np.float32)
+        payloads = [build_property_payload(prop) for prop in properties]
+
+        logger.info(f"Prepared {len(payloads)} points for upload")
+        return list(range(len(properties))), embeddings, payloads
+
+    async def upload_vectors(self, ids: List[Any], vectors: np.ndarray,
+                             payloads: Optional[List[Dict[str, Any]]] = None,
+                             batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE, max_concurrency: int = 4) -> None:
+        """
+        Upload points from columns as concurrent columnar batches.
+
+        Args:
+            ids: Point id per vector
+            vectors: Embedding matrix
+            payloads: Optional payload per vector
+            batch_size: Number of points per batch
+            max_concurrency: Maximum number of batches in flight
+        """
+        await async_upload_columns(self.client, self.collection_name, ids, vectors, payloads,
+                                   batch_size=batch_size, max_concurrency=max_concurrency)
+        logger.info("Data insertion completed successfully")
+
+    async def ingest_properties(self, properties: List[Dict[str, Any]],
+                                batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE, max_concurrency: int = 4) -> None:
+        """
+        Embed and upload properties through the columnar bulk path.
+
+        Args:
+            properties: List of property dictionaries
+            batch_size: Number of points per batch
+            max_concurrency: Maximum number of batches in flight
+        """
+        ids, vectors, payloads = await self.prepare_columns(properties)
+        await self.upload_vectors(ids, vectors, payloads, batch_size=batch_size, max_concurrency=max_concurrency)
+
+    async def insert_data(self, points: List[PointStruct], batch_size: int = 100,
+                          max_concurrency: int = 4) -> None:
+        """
+        Insert data into the collection with concurrent batch upserts.
+
+        Args:
+            points: List of PointStruct objects
+            batch_size: Number of points to insert per batch
+            max_concurrency: Maximum number of batches in flight
+        """
+        total_batches = (len(points) + batch_size - 1) // batch_size
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def upsert_batch(batch_number: int, batch: List[PointStruct]) -> None:
+            async with semaphore:
+                await self.client.upsert(collection_name=self.collection_name, points=batch)
+                logger.info(f"Inserted batch {batch_number}/{total_batches}")
+
+        try:
+            logger.info(f"Inserting {len(points)} points in batches of {batch_size}")
+            await asyncio.gather(*(
+                upsert_batch(i // batch_size + 1, points[i:i + batch_size])
+                for i in range(0, len(points), batch_size)
+            ))
+            logger.info("Data insertion completed successfully")
+
+        except Exception as e:
+            logger.error(f"Error inserting data: {e}")
+            raise
+
+    async def search_properties(self,
+                                query: str,
+                                limit: int = 10,
+                                city: Optional[str] = None,
+                                min_rating: Optional[float] = None,
+                                pet_friendly: Optional[bool] = None,
+                                bedrooms: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search for properties using semantic similarity and filters.
+
+        Args:
+            query: Search query text
+            limit: Maximum number of results to return
+            city: Filter by city
+            min_rating: Minimum rating filter
+            pet_friendly: Pet friendly filter
+            bedrooms: Number of bedrooms filter
+
+        Returns:
+            List of search results with scores
+        """
+        try:
+            query_embedding = await self.generate_query_embedding(query)
+
+            response = await self.client.query_points(
+                collection_name=self.collection_name,
+                query=query_embedding,
+                limit=limit,
+                query_filter=build_property_filter(city, min_rating, pet_friendly, bedrooms),
+                with_payload=True
+            )
+
+            return [format_property_result(result) for result in response.points]
+
+        except Exception as e:
+            logger.error(f"Error searching properties: {e}")
+            raise
+
+    async def get_collection_info(self) -> Dict[str, Any]:
+        """
+        Get information about the collection.
+
+        Returns:
+            Dictionary with collection information
+        """
+        try:
+            info = await self.client.get_collection(self.collection_name)
+            return {
+                "name": self.collection_name,
+                # Clients >= 1.17 no longer report vectors_count; there is one vector per point
+                "vectors_count": info.points_count,
+                "points_count": info.points_count,
+                "segments_count": info.segments_count,
+                "vector_size": info.config.params.vectors.size,
+                "distance": info.config.params.vectors.distance,
+                "on_disk": info.config.params.vectors.on_disk
+            }
+        except Exception as e:
+            logger.error(f"Error getting collection info: {e}")
+            raise
+
+async def main():
+    """Run a batch of concurrent searches against the property collection."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # python-dotenv not installed, continue without it
+
+    qdrant_url = os.getenv("QDRANT_URL")
+    qdrant_api_key = os.getenv("QDRANT_API_KEY")
+    vdb = AsyncPremiereSuitesVectorDB(
+        qdrant_url=qdrant_url,
+        qdrant_api_key=qdrant_api_key,
+        use_cloud=bool(qdrant_url and qdrant_api_key)
+    )
+
+    queries = [
+        "luxury apartment with pool and gym",
+        "pet friendly suite in Toronto",
+        "two bedroom apartment near downtown",
+    ]
+
+    try:
+        all_results = await asyncio.gather(*(vdb.search_properties(query, limit=3) for query in queries))
+        for query, results in zip(queries, all_results):
+            logger.info(f"Query: {query}")
+            for i, result in enumerate(results, 1):
+                logger.info(f"  {i}. {result['property_name']} ({result['city']}) - Score: {result['score']:.4f}")
+    finally:
+        await AsyncPremiereSuitesVectorDB.close_all()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Columnar Bulk Upload
+
+Uploads points as three columns (ids, one float32 embedding matrix, payloads)
+instead of a list of PointStruct objects. The matrix stays a single contiguous
+array - or a memory-mapped view of the embedding store - and is only turned
+into wire format one batch at a time by the client's uploader, so a full
+re-index never holds a Python float object per vector component.
+
+Hybrid collections also take a column of sparse vectors, and facet-enabled
+collections a matrix per named dense vector; both are uploaded next to the
+unnamed dense vector.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+import numpy as np
+from qdrant_client.http import models
+
+try:
+    from .sparse_encoder import SPARSE_VECTOR_NAME
+except ImportError:
+    # Running as a script or imported as a top-level module
+    from sparse_encoder import SPARSE_VECTOR_NAME
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_UPLOAD_BATCH_SIZE = 256
+
+def as_vector_matrix(vectors: Any) -> np.ndarray:
+    """
+    Vectors as a C-contiguous float32 matrix (no copy if they already are one).
+
+    Args:
+        vectors: Embedding matrix or list of equally sized vectors
+
+    Returns:
+        Matrix of shape (n, dimension)
+    """
+    matrix = np.asarray(vectors)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a (n, dim) vector matrix, got shape {matrix.shape}")
+    if matrix.dtype != np.float32 or not matrix.flags.c_contiguous:
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    return matrix
+
+def _check_columns(ids: Sequence[Any], matrix: np.ndarray,
+                   payloads: Optional[Sequence[Dict[str, Any]]],
+                   sparse_vectors: Optional[Sequence[models.SparseVector]] = None,
+                   named_vectors: Optional[Dict[str, np.ndarray]] = None) -> None:
+    """Make sure the columns describe the same points."""
+    if len(ids) != len(matrix):
+        raise ValueError(f"Got {len(ids)} ids for {len(matrix)} vectors")
+    if payloads is not None and len(payloads) != len(matrix):
+        raise ValueError(f"Got {len(payloads)} payloads for {len(matrix)} vectors")
+    if sparse_vectors is not None and len(sparse_vectors) != len(matrix):
+        raise ValueError(f"Got {len(sparse_vectors)} sparse vectors for {len(matrix)} vectors")
+    for name, named in (named_vectors or {}).items():
+        if len(named) != len(matrix):
+            raise ValueError(f"Got {len(named)} '{name}' vectors for {len(matrix)} vectors")
+
+def _named_matrices(named_vectors: Optional[Dict[str, Any]]) -> Optional[Dict[str, np.ndarray]]:
+    """Named vector columns as float32 matrices."""
+    if not named_vectors:
+        return None
+    return {name: as_vector_matrix(vectors) for name, vectors in named_vectors.items()}
+
+def _point_batch(ids: Sequence[Any], matrix: np.ndarray,
+                 payloads: Optional[Sequence[Dict[str, Any]]], start: int, end: int,
+                 sparse_vectors: Optional[Sequence[models.SparseVector]] = None,
+                 sparse_name: str = SPARSE_VECTOR_NAME,
+                 named_vectors: Optional[Dict[str, np.ndarray]] = None) -> models.Batch:
+    """One columnar Batch for rows start:end (converts only that slice)."""
+    vectors: Any = matrix[start:end].tolist()
+    if sparse_vectors is not None or named_vectors:
+        vectors = {"": vectors}
+        for name, named in (named_vectors or {}).items():
+            vectors[name] = named[start:end].tolist()
+        if sparse_vectors is not None:
+            vectors[sparse_name] = list(sparse_vectors[start:end])
+    return models.Batch(
+        ids=list(ids[start:end]),
+        vectors=vectors,
+        payloads=list(payloads[start:end]) if payloads is not None else None
+    )
+
+def _named_rows(matrix: np.ndarray, sparse_vectors: Optional[Sequence[models.SparseVector]],
+                sparse_name: str, named_vectors: Optional[Dict[str, np.ndarray]]) -> Iterator[Dict[str, Any]]:
+    """Every vector of each point, converted one row at a time."""
+    for row in range(len(matrix)):
+        vectors: Dict[str, Any] = {"": matrix[row].tolist()}
+        for name, named in (named_vectors or {}).items():
+            vectors[name] = named[row].tolist()
+        if sparse_vectors is not None:
+            vectors[sparse_name] = sparse_vectors[row]
+        yield vectors
+
+def iter_point_batches(ids: Sequence[Any], vectors: Any,
+                       payloads: Optional[Sequence[Dict[str, Any]]] = None,
+                       batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE,
+                       sparse_vectors: Optional[Sequence[models.SparseVector]] = None,
+                       sparse_name: str = SPARSE_VECTOR_NAME,
+                       named_vectors: Optional[Dict[str, Any]] = None) -> Iterator[models.Batch]:
+    """
+    Split the columns into columnar Batch objects.
+
+    Each batch converts only its own slice of the matrix, so at most one
+    batch of vectors exists as Python lists at a time.
+
+    Args:
+        ids: Point id per vector
+        vectors: Embedding matrix
+        payloads: Optional payload per vector
+        batch_size: Points per batch
+        sparse_vectors: Optional sparse vector per point (hybrid collections)
+        sparse_name: Name of the sparse vector
+        named_vectors: Optional matrix per named dense vector (facet collections)
+
+    Yields:
+        models.Batch for consecutive slices of the columns
+    """
+    matrix = as_vector_matrix(vectors)
+    named_vectors = _named_matrices(named_vectors)
+    _check_columns(ids, matrix, payloads, sparse_vectors, named_vectors)
+
+    for start in range(0, len(matrix), batch_size):
+        yield _point_batch(ids, matrix, payloads, start, start + batch_size,
+                           sparse_vectors, sparse_name, named_vectors)
+
+def upload_columns(client: Any, collection_name: str, ids: Sequence[Any], vectors: Any,
+                   payloads: Optional[Sequence[Dict[str, Any]]] = None,
+                   batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE, parallel: int = 1,
+                   sparse_vectors: Optional[Sequence[models.SparseVector]] = None,
+                   sparse_name: str = SPARSE_VECTOR_NAME,
+                   named_vectors: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Upload points to a collection through the client's columnar uploader.
+
+    Args:
+        client: QdrantClient (REST or gRPC)
+        collection_name: Target collection
+        ids: Point id per vector
+        vectors: Embedding matrix (numpy array, memmap or list of vectors)
+        payloads: Optional payload per vector
+        batch_size: Points per request
+        parallel: Number of upload workers
+        sparse_vectors: Optional sparse vector per point (hybrid collections)
+        sparse_name: Name of the sparse vector
+        named_vectors: Optional matrix per named dense vector (facet collections)
+
+    Returns:
+        Number of points uploaded
+    """
+    if len(ids) == 0:
+        return 0
+    matrix = as_vector_matrix(vectors)
+    named_vectors = _named_matrices(named_vectors)
+    _check_columns(ids, matrix, payloads, sparse_vectors, named_vectors)
+
+    try:
+        logger.info(f"Uploading {len(matrix)} points to {collection_name} in batches of {batch_size}")
+        client.upload_collection(
+            collection_name=collection_name,
+            vectors=matrix if sparse_vectors is None and not named_vectors
+            else _named_rows(matrix, sparse_vectors, sparse_name, named_vectors),
+            payload=payloads,
+            ids=ids,
+            batch_size=batch_size,
+            parallel=parallel,
+            wait=True
+        )
+        return len(matrix)
+    except Exception as e:
+        logger.error(f"Error uploading points to {collection_name}: {e}")
+        raise
+
+async def async_upload_columns(client: Any, collection_name: str, ids: Sequence[Any], vectors: Any,
+                               payloads: Optional[Sequence[Dict[str, Any]]] = None,
+                               batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE,
+                               max_concurrency: int = 4,
+                               sparse_vectors: Optional[Sequence[models.SparseVector]] = None,
+                               sparse_name: str = SPARSE_VECTOR_NAME,
+                               named_vectors: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Upsert points as columnar batches with an AsyncQdrantClient.
+
+    Batches are built lazily, so only the batches in flight hold converted
+    vectors.
+
+    Args:
+        client: AsyncQdrantClient
+        collection_name: Target collection
+        ids: Point id per vector
+        vectors: Embedding matrix
+        payloads: Optional payload per vector
+        batch_size: Points per request
+        max_concurrency: Maximum number of batches in flight
+        sparse_vectors: Optional sparse vector per point (hybrid collections)
+        sparse_name: Name of the sparse vector
+        named_vectors: Optional matrix per named dense vector (facet collections)
+
+    Returns:
+        Number of points uploaded
+    """
+    if len(ids) == 0:
+        return 0
+    matrix = as_vector_matrix(vectors)
+    named_vectors = _named_matrices(named_vectors)
+    _check_columns(ids, matrix, payloads, sparse_vectors, named_vectors)
+    total_batches = (len(matrix) + batch_size - 1) // batch_size
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def upsert_batch(batch_number: int, start: int) -> None:
+        async with semaphore:
+            batch = _point_batch(ids, matrix, payloads, start, start + batch_size,
+                                 sparse_vectors, sparse_name, named_vectors)
+            await client.upsert(collection_name=collection_name, points=batch)
+            logger.info(f"Inserted batch {batch_number}/{total_batches}")
+
+    try:
+        logger.info(f"Uploading {len(matrix)} points to {collection_name} in batches of {batch_size}")
+        await asyncio.gather(*(
+            upsert_batch(start // batch_size + 1, start)
+            for start in range(0, len(matrix), batch_size)
+        ))
+        return len(matrix)
+    except Exception as e:
+        logger.error(f"Error uploading points to {collection_name}: {e}")
+        raise
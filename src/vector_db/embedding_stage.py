@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Batched Embedding Stage for Collection Rebuilds
+
+One embedding stage shared by every collection a rebuild writes: the model is
+loaded once per run, texts are encoded in batches rather than one call per
+record, repeated texts are encoded once, vectors already in the embedding
+store (EMBEDDING_STORE_DIR) are reused, and progress and throughput are
+logged as chunks complete.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import openai
+
+from .qdrant_setup import OPENAI_EMBEDDING_BATCH_SIZE, load_embedding_model
+from .embedding_store import EmbeddingStore, open_embedding_store
+# Importing qdrant_setup puts src/ on sys.path when needed
+from services.rate_limit import TokenBucket, get_bucket
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class EmbeddingStage:
+    """Encodes texts for a rebuild with one model load and batched calls."""
+
+    def __init__(self,
+                 model_name: Optional[str] = None,
+                 batch_size: int = 64,
+                 chunk_size: int = 1024,
+                 embedding_store: Optional[EmbeddingStore] = None,
+                 use_store: bool = True,
+                 embedding_rate_limit: Optional[TokenBucket] = None):
+        """
+        Args:
+            model_name: Sentence transformer or OpenAI model (defaults to EMBEDDING_MODEL)
+            batch_size: Texts per model forward pass
+            chunk_size: Texts per progress update
+            embedding_store: On-disk store to reuse vectors from (defaults to the
+                EMBEDDING_STORE_DIR store for the model, if set)
+            use_store: Set to False to always re-embed
+            embedding_rate_limit: Token bucket for OpenAI embedding requests
+        """
+        self.model_name = model_name or os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2") or "all-MiniLM-L6-v2"
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.embedding_rate_limit = embedding_rate_limit or get_bucket("openai_embeddings")
+
+        started = time.perf_counter()
+        self.model, self.use_openai, self.vector_size = load_embedding_model(self.model_name)
+        self.load_seconds = time.perf_counter() - started
+
+        if embedding_store is None and use_store:
+            embedding_store = open_embedding_store(self.model_name)
+        self.embedding_store = embedding_store
+
+        # Per-label counters, filled by encode()
+        self._metrics: Dict[str, Dict[str, Any]] = {}
+        # Collections rebuilt in parallel share the model; encodes run one at a time
+        self._lock = threading.Lock()
+
+    def encode(self, texts: Sequence[str], label: str = "texts") -> np.ndarray:
+        """
+        Embed texts, encoding each distinct text not in the store once.
+
+        Args:
+            texts: Texts to embed
+            label: Name the progress and metrics are reported under
+
+        Returns:
+            C-contiguous float32 matrix of shape (len(texts), vector_size)
+        """
+        texts = list(texts)
+        metrics = self._metrics.setdefault(label, {"texts": 0, "encoded": 0, "reused": 0, "seconds": 0.0})
+        started = time.perf_counter()
+        encoded_before = metrics["encoded"]
+
+        if not texts:
+            return np.empty((0, self.vector_size), dtype=np.float32)
+
+        with self._lock:
+            if self.embedding_store is not None:
+                vectors = self.embedding_store.embed(texts, lambda missing: self._encode_chunks(missing, label))
+            else:
+                unique = list(dict.fromkeys(texts))
+                unique_vectors = self._encode_chunks(unique, label)
+                if len(unique) == len(texts):
+                    vectors = unique_vectors
+                else:
+                    rows = {text: row for row, text in enumerate(unique)}
+                    vectors = unique_vectors[[rows[text] for text in texts]]
+
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        metrics["texts"] += len(texts)
+        metrics["reused"] += len(texts) - (metrics["encoded"] - encoded_before)
+        metrics["seconds"] += elapsed
+        logger.info(f"{label}: {len(texts)} vectors in {elapsed:.2f}s "
+                    f"({metrics['encoded'] - encoded_before} encoded, {len(texts) / elapsed:.0f} texts/s)")
+        return np.ascontiguousarray(vectors, dtype=np.float32)
+
+    def _encode_chunks(self, texts: List[str], label: str) -> np.ndarray:
+        """Encode texts chunk by chunk, logging progress and throughput."""
+        matrix = np.empty((len(texts), self.vector_size), dtype=np.float32)
+        started = time.perf_counter()
+
+        for start in range(0, len(texts), self.chunk_size):
+            chunk = texts[start:start + self.chunk_size]
+            matrix[start:start + len(chunk)] = self._encode_batch(chunk)
+            done = start + len(chunk)
+            self._metrics[label]["encoded"] += len(chunk)
+            rate = done / max(time.perf_counter() - started, 1e-9)
+            logger.info(f"{label}: encoded {done}/{len(texts)} ({rate:.0f} texts/s)")
+        return matrix
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """One chunk through the model (batched forward passes or OpenAI requests)."""
+        if not self.use_openai:
+            return self.model.encode(texts, batch_size=self.batch_size, convert_to_numpy=True,
+                                     show_progress_bar=False)
+
+        embeddings = []
+        for start in range(0, len(texts), OPENAI_EMBEDDING_BATCH_SIZE):
+            try:
+                self.embedding_rate_limit.acquire()
+                response = openai.embeddings.create(
+                    input=texts[start:start + OPENAI_EMBEDDING_BATCH_SIZE],
+                    model=self.model_name
+                )
+                embeddings.extend(item.embedding for item in response.data)
+            except Exception as e:
+                logger.error(f"Error generating OpenAI embedding: {e}")
+                raise
+        return np.array(embeddings, dtype=np.float32)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Model load time and per-label text, encode, reuse and throughput counters."""
+        return {
+            "model": self.model_name,
+            "load_seconds": round(self.load_seconds, 3),
+            "store": self.embedding_store is not None,
+            "labels": {
+                label: dict(counters, seconds=round(counters["seconds"], 3),
+                            texts_per_second=round(counters["texts"] / counters["seconds"], 1) if counters["seconds"] else None)
+                for label, counters in self._metrics.items()
+            },
+        }
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Memory-Mapped Embedding Store
+
+Persists embeddings on disk so re-indexing, quantisation experiments, offline
+recall evaluation and the in-process exact index can reuse vectors instead of
+re-embedding every text. Each embedding model gets its own directory:
+
+    <root>/<model>/vectors.npy   float32 or float16 matrix, memory mapped
+    <root>/<model>/hashes.bin    SHA-256 of the embedded text, 32 bytes per row
+    <root>/<model>/ids.jsonl     [row, id] per point / record id assignment
+    <root>/<model>/meta.json     model, dimension, dtype and row count
+
+Rows are looked up by content hash, so a changed text gets a new row and an
+unchanged text is never embedded twice for the same model.
+
+Adding texts only appends to the hash and id files, so an add costs the
+size of the new rows, not of the store. meta.json is written last and its
+row count is what a reader trusts; anything appended past it by an
+interrupted add is dropped when the store is opened again.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SUPPORTED_DTYPES = ("float32", "float16")
+
+# Bytes per row in hashes.bin
+HASH_SIZE = 32
+
+def content_hash(text: str) -> bytes:
+    """SHA-256 digest of a text, the key embeddings are stored under."""
+    return hashlib.sha256((text or "").encode("utf-8")).digest()
+
+def _atomic_write(path: Path, write: Callable[[Any], None], mode: str = "w") -> None:
+    """Write a file through a temporary file so readers never see half of it."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, mode) as f:
+        write(f)
+    os.replace(tmp, path)
+
+class EmbeddingStore:
+    """Append-only, memory-mapped embedding matrix for one model."""
+
+    def __init__(self, root: str, model_name: str, dimension: Optional[int] = None,
+                 dtype: str = "float32", initial_capacity: int = 1024):
+        """
+        Args:
+            root: Directory holding one sub-directory per model
+            model_name: Embedding model the vectors come from
+            dimension: Vector size (read from an existing store, otherwise
+                taken from the first vectors added)
+            dtype: "float32" or "float16" storage
+            initial_capacity: Rows allocated when the matrix file is created
+        """
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported embedding dtype: {dtype} (use one of {SUPPORTED_DTYPES})")
+
+        self.model_name = model_name
+        self.directory = Path(root) / re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.initial_capacity = initial_capacity
+        self._lock = threading.Lock()
+
+        self.dtype = dtype
+        self.dimension = dimension
+        self.count = 0
+        self._matrix: Optional[np.memmap] = None
+        self._hashes: List[bytes] = []
+        self._ids: List[Any] = []
+        self._rows: Dict[bytes, int] = {}
+        self._id_log_lines = 0
+
+        meta_path = self.directory / "meta.json"
+        if meta_path.exists():
+            self._open(json.loads(meta_path.read_text(encoding="utf-8")))
+
+    def _open(self, meta: Dict[str, Any]) -> None:
+        """Map an existing store."""
+        if meta["model"] != self.model_name:
+            raise ValueError(f"Store at {self.directory} holds {meta['model']} embeddings, not {self.model_name}")
+        if self.dimension is not None and self.dimension != meta["dimension"]:
+            raise ValueError(f"Store dimension is {meta['dimension']}, expected {self.dimension}")
+
+        self.dimension = meta["dimension"]
+        self.dtype = meta["dtype"]
+        self.count = meta["count"]
+        self._matrix = np.load(self.directory / "vectors.npy", mmap_mode="r+")
+
+        # Drop hashes appended by an add that did not reach meta.json
+        hashes_path = self.directory / "hashes.bin"
+        raw = hashes_path.read_bytes()
+        if len(raw) < self.count * HASH_SIZE:
+            raise ValueError(f"Store at {self.directory} is missing hashes for {self.count} rows")
+        if len(raw) > self.count * HASH_SIZE:
+            os.truncate(hashes_path, self.count * HASH_SIZE)
+        self._hashes = [raw[i * HASH_SIZE:(i + 1) * HASH_SIZE] for i in range(self.count)]
+        self._rows = {digest: row for row, digest in enumerate(self._hashes)}
+
+        # Replay the id log (last assignment wins), compacting it if it has stale lines
+        self._ids = [None] * self.count
+        ids_path = self.directory / "ids.jsonl"
+        lines = ids_path.read_text(encoding="utf-8").splitlines() if ids_path.exists() else []
+        stale = False
+        for line in lines:
+            try:
+                row, point_id = json.loads(line)
+            except ValueError:
+                stale = True
+                continue
+            if row < self.count:
+                self._ids[row] = point_id
+            else:
+                stale = True
+        self._id_log_lines = len(lines)
+        if stale:
+            self._compact_ids()
+        logger.info(f"Opened embedding store {self.directory} ({self.count} x {self.dimension} {self.dtype})")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, text: str) -> bool:
+        return content_hash(text) in self._rows
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """All stored vectors as a (count, dimension) memory-mapped view (no copy)."""
+        if self._matrix is None:
+            return np.empty((0, self.dimension or 0), dtype=self.dtype)
+        return self._matrix[:self.count]
+
+    @property
+    def ids(self) -> List[Any]:
+        """Id of every row (None where no id was given)."""
+        return list(self._ids)
+
+    def rows(self, texts: Sequence[str]) -> np.ndarray:
+        """Row of every text, -1 where it is not stored."""
+        return np.array([self._rows.get(content_hash(text), -1) for text in texts], dtype=np.int64)
+
+    def get(self, texts: Sequence[str]) -> Optional[np.ndarray]:
+        """Stored vectors for texts as float32, or None if any text is missing."""
+        rows = self.rows(texts)
+        if (rows < 0).any():
+            return None
+        return np.asarray(self.vectors[rows], dtype=np.float32)
+
+    def add(self, texts: Sequence[str], vectors: Any, ids: Optional[Sequence[Any]] = None) -> np.ndarray:
+        """
+        Store vectors for texts, skipping texts that are already stored.
+
+        Args:
+            texts: Texts the vectors were computed from
+            vectors: Matrix of shape (len(texts), dimension)
+            ids: Optional id per text (point id, property id, ...)
+
+        Returns:
+            Row of every text
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or len(matrix) != len(texts):
+            raise ValueError(f"Expected a ({len(texts)}, dim) matrix, got {matrix.shape}")
+        if ids is not None and len(ids) != len(texts):
+            raise ValueError(f"Got {len(texts)} texts but {len(ids)} ids")
+
+        with self._lock:
+            if self.dimension is None:
+                self.dimension = matrix.shape[1]
+            elif matrix.shape[1] != self.dimension:
+                raise ValueError(f"Vectors have dimension {matrix.shape[1]}, store has {self.dimension}")
+
+            rows = np.empty(len(texts), dtype=np.int64)
+            pending: Dict[bytes, int] = {}
+            new_vectors = []
+            for i, text in enumerate(texts):
+                digest = content_hash(text)
+                row = self._rows.get(digest, pending.get(digest))
+                if row is None:
+                    row = pending[digest] = self.count + len(new_vectors)
+                    new_vectors.append(i)
+                rows[i] = row
+
+            if new_vectors:
+                self._reserve(self.count + len(new_vectors))
+                self._matrix[self.count:self.count + len(new_vectors)] = matrix[new_vectors]
+                self._hashes.extend(pending)
+                self._ids.extend([None] * len(pending))
+                self._rows.update(pending)
+            id_updates = []
+            if ids is not None:
+                for row, point_id in zip(rows, ids):
+                    if point_id is not None and self._ids[row] != point_id:
+                        self._ids[row] = point_id
+                        id_updates.append((int(row), point_id))
+            if new_vectors or id_updates:
+                self._flush(list(pending), id_updates)
+        return rows
+
+    def embed(self, texts: Sequence[str], embed_fn: Callable[[List[str]], Any],
+              ids: Optional[Sequence[Any]] = None) -> np.ndarray:
+        """
+        Vectors for texts, calling embed_fn only for texts not stored yet.
+
+        Args:
+            texts: Texts to embed
+            embed_fn: Function embedding a list of texts into a (n, dimension) matrix
+            ids: Optional id per text
+
+        Returns:
+            float32 matrix of shape (len(texts), dimension)
+        """
+        texts = list(texts)
+        missing = list(dict.fromkeys(text for text, row in zip(texts, self.rows(texts)) if row < 0))
+
+        if missing:
+            logger.info(f"Embedding {len(missing)} of {len(texts)} texts ({len(texts) - len(missing)} stored)")
+            self.add(missing, embed_fn(missing))
+
+        vectors = self.get(texts)
+        if ids is not None:
+            self.add(texts, vectors, ids=ids)
+        return vectors
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix file (doubling) so it can hold at least rows rows."""
+        capacity = 0 if self._matrix is None else len(self._matrix)
+        if rows <= capacity:
+            return
+
+        new_capacity = max(rows, capacity * 2, self.initial_capacity)
+        path = self.directory / "vectors.npy"
+        tmp = path.with_name("vectors.tmp.npy")
+        grown = np.lib.format.open_memmap(tmp, mode="w+", dtype=self.dtype, shape=(new_capacity, self.dimension))
+        if self.count:
+            grown[:self.count] = self._matrix[:self.count]
+        grown.flush()
+        del grown
+        self._matrix = None
+        os.replace(tmp, path)
+        self._matrix = np.load(path, mmap_mode="r+")
+
+    def _flush(self, new_hashes: List[bytes], id_updates: List[Any]) -> None:
+        """
+        Persist an add: append the new rows' hashes and id assignments, then
+        commit the new row count to meta.json.
+        """
+        if new_hashes:
+            self._matrix.flush()
+            with open(self.directory / "hashes.bin", "ab") as f:
+                f.write(b"".join(new_hashes))
+        if id_updates:
+            with open(self.directory / "ids.jsonl", "a", encoding="utf-8") as f:
+                f.writelines(json.dumps([row, point_id]) + "\n" for row, point_id in id_updates)
+            self._id_log_lines += len(id_updates)
+
+        self.count += len(new_hashes)
+        if new_hashes:
+            meta = {"model": self.model_name, "dimension": self.dimension, "dtype": self.dtype, "count": self.count}
+            _atomic_write(self.directory / "meta.json", lambda f: json.dump(meta, f))
+
+        # Rewrite the id log once reassignments make it much longer than the store
+        if self._id_log_lines > 2 * max(self.count, self.initial_capacity):
+            self._compact_ids()
+
+    def _compact_ids(self) -> None:
+        """Rewrite the id log with one line per row that has an id."""
+        lines = [json.dumps([row, point_id]) + "\n" for row, point_id in enumerate(self._ids) if point_id is not None]
+        _atomic_write(self.directory / "ids.jsonl", lambda f: f.writelines(lines))
+        self._id_log_lines = len(lines)
+
+    def stats(self) -> Dict[str, Any]:
+        """Row count, dimension, dtype and bytes used by the vectors."""
+        itemsize = np.dtype(self.dtype).itemsize
+        return {
+            "model": self.model_name,
+            "count": self.count,
+            "dimension": self.dimension,
+            "dtype": self.dtype,
+            "vector_bytes": self.count * (self.dimension or 0) * itemsize,
+        }
+
+def open_embedding_store(model_name: str, root: Optional[str] = None,
+                         dtype: Optional[str] = None) -> Optional[EmbeddingStore]:
+    """
+    Open the embedding store configured by the environment.
+
+    Args:
+        model_name: Embedding model
+        root: Store directory (defaults to EMBEDDING_STORE_DIR)
+        dtype: Storage dtype (defaults to EMBEDDING_STORE_DTYPE or float32)
+
+    Returns:
+        EmbeddingStore, or None when no directory is configured
+    """
+    root = root or os.getenv("EMBEDDING_STORE_DIR")
+    if not root:
+        return None
+    return EmbeddingStore(root, model_name, dtype=dtype or os.getenv("EMBEDDING_STORE_DTYPE", "float32"))
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+In-Process Exact Search for Small Collections
+
+The FAQ and property collections hold tens of points, so a network round-trip
+to Qdrant dominates search latency. ExactSearchIndex loads every vector and a
+projected payload into one contiguous, L2-normalised float32 matrix and answers
+top-k queries with a single matrix-vector product. Payload filters use the same
+Mongo-like syntax as vector_db.filters and are evaluated as boolean masks;
+equality filters look rows up in a per-field index of payload values.
+"""
+
+import time
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+from qdrant_client.http import models
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+RANGE_OPERATORS = {"$gt": np.greater, "$gte": np.greater_equal, "$lt": np.less, "$lte": np.less_equal}
+
+class ExactSearchIndex:
+    """Brute-force cosine index over a snapshot of a Qdrant collection."""
+
+    def __init__(self, ids: List[Any], vectors: np.ndarray, payloads: List[Dict[str, Any]],
+                 version: int = 0):
+        """
+        Args:
+            ids: Point IDs, one per row
+            vectors: Matrix of shape (len(ids), dimension)
+            payloads: Payload dictionaries, one per row
+            version: Collection version the snapshot was taken at
+        """
+        self.ids = list(ids)
+        self.payloads = payloads
+        self.version = version
+        self.loaded_at = time.monotonic()
+
+        matrix = np.ascontiguousarray(vectors, dtype=np.float32).reshape(len(self.ids), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix = matrix / norms
+
+        self._columns: Dict[str, np.ndarray] = {}
+        self._numeric_columns: Dict[str, np.ndarray] = {}
+        self._value_rows: Dict[str, Dict[Any, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def load(cls, client: Any, collection_name: str,
+             with_payload: Union[bool, List[str]] = True,
+             vector_name: Optional[str] = None,
+             version: int = 0, page_size: int = 256) -> "ExactSearchIndex":
+        """
+        Snapshot a collection by scrolling every page.
+
+        Args:
+            client: QdrantClient
+            collection_name: Collection to load
+            with_payload: Payload fields to keep (True for all)
+            vector_name: Named vector to load, for collections with several
+                ("" for the unnamed vector)
+            version: Collection version to record on the snapshot
+            page_size: Points per scroll request
+
+        Returns:
+            ExactSearchIndex
+        """
+        ids: List[Any] = []
+        vectors: List[Any] = []
+        payloads: List[Dict[str, Any]] = []
+        offset = None
+
+        while True:
+            points, offset = client.scroll(
+                collection_name=collection_name,
+                limit=page_size,
+                offset=offset,
+                with_payload=with_payload,
+                with_vectors=[vector_name] if vector_name is not None else True
+            )
+            for point in points:
+                vector = point.vector
+                if vector_name is not None and isinstance(vector, dict):
+                    # A single requested vector may also come back unwrapped
+                    vector = vector[vector_name]
+                ids.append(point.id)
+                vectors.append(vector)
+                payloads.append(point.payload or {})
+            if offset is None:
+                break
+
+        logger.info(f"Loaded {len(ids)} points from '{collection_name}' into the exact search index")
+        matrix = np.asarray(vectors, dtype=np.float32) if vectors else np.zeros((0, 0), dtype=np.float32)
+        return cls(ids, matrix, payloads, version)
+
+    def search(self, query_vector: Any, limit: int = 10,
+               filter_dict: Optional[Dict[str, Any]] = None,
+               score_threshold: Optional[float] = None) -> List[models.ScoredPoint]:
+        """
+        Exact top-k cosine search.
+
+        Args:
+            query_vector: Query embedding
+            limit: Maximum number of results
+            filter_dict: Mongo-like payload filter ($eq, $ne, $in, $nin, $gt, $gte, $lt, $lte)
+            score_threshold: Minimum score
+
+        Returns:
+            List of ScoredPoint, best first, shaped like Qdrant search results
+        """
+        if not self.ids or limit <= 0:
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+
+        scores = self.matrix @ query
+        if filter_dict:
+            scores = np.where(self._mask(filter_dict), scores, -np.inf)
+        if score_threshold is not None:
+            scores = np.where(scores >= score_threshold, scores, -np.inf)
+
+        candidates = min(limit, len(scores))
+        top = np.argpartition(-scores, candidates - 1)[:candidates]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [
+            models.ScoredPoint(id=self.ids[i], version=0, score=float(scores[i]), payload=self.payloads[i])
+            for i in top
+            if np.isfinite(scores[i])
+        ]
+
+    def try_search(self, query_vector: Any, limit: int = 10,
+                   filter_dict: Optional[Dict[str, Any]] = None,
+                   score_threshold: Optional[float] = None) -> Optional[List[models.ScoredPoint]]:
+        """
+        Like search(), but None when the filter uses operators the index does not
+        evaluate ($and, $or, $not), so the caller can search in Qdrant instead.
+        """
+        try:
+            return self.search(query_vector, limit=limit, filter_dict=filter_dict, score_threshold=score_threshold)
+        except ValueError as e:
+            logger.debug(f"Exact search skipped: {e}")
+            return None
+
+    def _mask(self, filter_dict: Dict[str, Any]) -> np.ndarray:
+        """Boolean row mask for a filter dictionary."""
+        mask = np.ones(len(self.ids), dtype=bool)
+
+        for key, condition in filter_dict.items():
+            if key.startswith("$"):
+                raise ValueError(f"Unsupported filter operator for exact search: {key}")
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+
+            for operator, operand in condition.items():
+                if operator in ("$eq", "$in"):
+                    mask &= self._match(key, operand if operator == "$in" else [operand])
+                elif operator in ("$ne", "$nin"):
+                    mask &= ~self._match(key, operand if operator == "$nin" else [operand])
+                elif operator in RANGE_OPERATORS:
+                    column = self._numeric_column(key)
+                    with np.errstate(invalid="ignore"):
+                        mask &= RANGE_OPERATORS[operator](column, operand)
+                else:
+                    raise ValueError(f"Unsupported operator '{operator}' for field '{key}'")
+
+        return mask
+
+    def _column(self, key: str) -> np.ndarray:
+        """Payload values for a (possibly dotted) key as an object array."""
+        if key not in self._columns:
+            column = np.empty(len(self.payloads), dtype=object)
+            for i, payload in enumerate(self.payloads):
+                value: Any = payload
+                for part in key.split("."):
+                    value = value.get(part) if isinstance(value, dict) else None
+                column[i] = value
+            self._columns[key] = column
+        return self._columns[key]
+
+    def _numeric_column(self, key: str) -> np.ndarray:
+        """Payload values for a key as floats, NaN where missing or non-numeric."""
+        if key not in self._numeric_columns:
+            self._numeric_columns[key] = np.array([
+                float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan
+                for value in self._column(key)
+            ], dtype=np.float64)
+        return self._numeric_columns[key]
+
+    def _rows_by_value(self, key: str) -> Dict[Any, np.ndarray]:
+        """Row indices per payload value of a key; list values index each element."""
+        if key not in self._value_rows:
+            rows: Dict[Any, List[int]] = defaultdict(list)
+            for i, value in enumerate(self._column(key)):
+                for item in value if isinstance(value, list) else [value]:
+                    try:
+                        rows[item].append(i)
+                    except TypeError:
+                        pass  # unhashable values (nested objects) never match
+            self._value_rows[key] = {value: np.unique(indices) for value, indices in rows.items()}
+        return self._value_rows[key]
+
+    def _match(self, key: str, values: List[Any]) -> np.ndarray:
+        """Rows whose value (or any element of a list value) is in values."""
+        rows_by_value = self._rows_by_value(key)
+        mask = np.zeros(len(self.ids), dtype=bool)
+        for value in values:
+            try:
+                rows = rows_by_value.get(value)
+            except TypeError:
+                continue
+            if rows is not None:
+                mask[rows] = True
+        return mask
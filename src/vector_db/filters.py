@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Filter Compiler for Qdrant Searches
+
+Translates the Mongo-like filter dictionaries used by the LangChain integrations
+(e.g. {"rating": {"$gte": 4.0}, "city": "Toronto"}) into qdrant_client Filter
+objects, so that filtering runs inside Qdrant against the payload indexes
+instead of being dropped or applied client-side.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from qdrant_client.http import models
+
+RANGE_OPERATORS = {"$gt": "gt", "$gte": "gte", "$lt": "lt", "$lte": "lte"}
+MATCH_OPERATORS = {"$eq", "$ne", "$in", "$nin"}
+LOGICAL_OPERATORS = {"$and", "$or", "$not"}
+
+
+def compile_filter(filter_dict: Optional[Dict[str, Any]],
+                   key_prefix: str = "") -> Optional[models.Filter]:
+    """
+    Compile a Mongo-like filter dictionary into a Qdrant filter.
+
+    Supported syntax:
+        {"city": "Toronto"}                       equality
+        {"rating": {"$gte": 4.0, "$lt": 5}}      range ($gt, $gte, $lt, $lte)
+        {"city": {"$in": ["Toronto", "Ottawa"]}}  membership ($in, $nin)
+        {"bedrooms": {"$ne": 0}}                  negation ($eq, $ne)
+        {"location": {"city": "Toronto"}}         nested keys (location.city)
+        {"$and": [...]}, {"$or": [...]}, {"$not": {...}}
+
+    Args:
+        filter_dict: Filter dictionary, or None
+        key_prefix: Prefix applied to every payload key (e.g. "metadata." for
+            documents stored through LangChain)
+
+    Returns:
+        Qdrant Filter, or None if the dictionary is empty
+
+    Raises:
+        ValueError: If the dictionary uses an unsupported operator, an empty
+            logical operand, or values Qdrant cannot match exactly (match
+            values must be strings, integers or booleans; use a range for floats)
+    """
+    if not filter_dict:
+        return None
+
+    must: List[Any] = []
+    must_not: List[Any] = []
+    _compile_clauses(filter_dict, key_prefix, must, must_not)
+
+    return models.Filter(must=must or None, must_not=must_not or None)
+
+
+def _compile_clauses(filter_dict: Dict[str, Any], key_prefix: str,
+                     must: List[Any], must_not: List[Any]) -> None:
+    """Append the conditions of one filter level to the must/must_not lists."""
+    for key, value in filter_dict.items():
+        if key == "$and":
+            must.extend(_compile_subfilters(key, value, key_prefix))
+        elif key == "$or":
+            must.append(models.Filter(should=_compile_subfilters(key, value, key_prefix)))
+        elif key == "$not":
+            if not isinstance(value, dict) or not value:
+                raise ValueError("$not expects a non-empty filter dictionary")
+            must_not.append(compile_filter(value, key_prefix))
+        elif key.startswith("$"):
+            raise ValueError(f"Unsupported filter operator: {key}")
+        elif isinstance(value, dict) and not _is_operator_dict(value):
+            # Nested metadata keys: {"location": {"city": ...}} -> location.city
+            _compile_clauses(value, f"{key_prefix}{key}.", must, must_not)
+        else:
+            _compile_field(f"{key_prefix}{key}", value, must, must_not)
+
+
+def _compile_subfilters(operator: str, value: Any, key_prefix: str) -> List[models.Filter]:
+    """Compile the list operand of $and/$or."""
+    if not isinstance(value, list) or not value or not all(isinstance(item, dict) and item for item in value):
+        raise ValueError(f"{operator} expects a non-empty list of non-empty filter dictionaries")
+    return [compile_filter(item, key_prefix) for item in value]
+
+
+def _is_operator_dict(value: Dict[str, Any]) -> bool:
+    """Whether a dictionary holds field operators rather than nested keys."""
+    return bool(value) and all(key.startswith("$") for key in value)
+
+
+def _compile_field(key: str, value: Any, must: List[Any], must_not: List[Any]) -> None:
+    """Compile the condition(s) for a single payload field."""
+    if not isinstance(value, dict):
+        must.append(_match_condition(key, value))
+        return
+
+    range_args = {}
+    for operator, operand in value.items():
+        if operator in RANGE_OPERATORS:
+            range_args[RANGE_OPERATORS[operator]] = operand
+        elif operator == "$eq":
+            must.append(_match_condition(key, operand))
+        elif operator == "$ne":
+            must_not.append(_match_condition(key, operand))
+        elif operator == "$in":
+            must.append(_match_any(key, operand, operator))
+        elif operator == "$nin":
+            must_not.append(_match_any(key, operand, operator))
+        else:
+            raise ValueError(f"Unsupported operator '{operator}' for field '{key}'")
+
+    if range_args:
+        must.append(models.FieldCondition(key=key, range=models.Range(**range_args)))
+
+
+def _match_condition(key: str, value: Any) -> models.FieldCondition:
+    """Build an exact-match condition; list values match any element."""
+    if isinstance(value, (list, tuple, set)):
+        return _match_any(key, value, "$in")
+    if not isinstance(value, (str, int)):
+        raise ValueError(f"Cannot match '{key}' exactly on {type(value).__name__} value {value!r}")
+    return models.FieldCondition(key=key, match=models.MatchValue(value=value))
+
+
+def _match_any(key: str, values: Any, operator: str) -> models.FieldCondition:
+    """Build a match-any condition; the values must be all strings or all integers."""
+    if not isinstance(values, (list, tuple, set)):
+        raise ValueError(f"{operator} on '{key}' expects a list of values")
+    values = list(values)
+    if not (all(isinstance(item, str) for item in values)
+            or all(isinstance(item, int) and not isinstance(item, bool) for item in values)):
+        raise ValueError(f"{operator} on '{key}' expects only strings or only integers, got {values!r}")
+    return models.FieldCondition(key=key, match=models.MatchAny(any=values))
@@ -5,6 +5,10 @@ LangChain FAQ Integration with Qdrant Vector Database
 This module provides LangChain integration for FAQ data in the Premiere Suites project,
 allowing you to use both direct Qdrant operations and LangChain's higher-level abstractions
 for FAQ search and retrieval.
+
+Searches run with query_points through PremiereSuitesVectorDB rather than the
+langchain_community Qdrant store, whose QdrantClient.search call was removed
+in qdrant-client 1.17 (see langchain_qdrant_integration.scored_documents).
 """
 
 import os
@@ -19,6 +23,9 @@ from langchain.text_splitter import RecursiveCharacterTextSplitter
 from qdrant_client import QdrantClient
 
 from .qdrant_setup import PremiereSuitesVectorDB
+from .filters import compile_filter
+from .langchain_qdrant_integration import scored_documents
+from services.jsonl_loader import iter_records
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -106,6 +113,9 @@ class LangChainFAQIntegration:
     def create_collection(self, recreate: bool = False) -> None:
         """Create the Qdrant collection for FAQs."""
         self.vdb.create_collection(recreate=recreate)
+        
+        # LangChain filters resolve category/tags under the metadata payload key
+        self.vdb._create_indexes(key_prefix=f"{self.langchain_store.metadata_payload_key}.")
     
     def add_faq_documents(self, documents: List[Document], batch_size: int = 50) -> None:
         """
@@ -145,7 +155,6 @@ class LangChainFAQIntegration:
         """
         Add documents manually to Qdrant with custom field names (content instead of page_content).
         """
-        from qdrant_client.models import PointStruct
         from datetime import datetime
         import uuid
         
@@ -153,9 +162,10 @@ class LangChainFAQIntegration:
         texts = [doc.page_content for doc in documents]
         embeddings = self.vdb.generate_embeddings(texts)
         
-        # Create points with custom field structure
-        points = []
-        for i, (doc, embedding) in enumerate(zip(documents, embeddings)):
+        # Collect ids and payloads with the custom field structure
+        ids = []
+        payloads = []
+        for i, doc in enumerate(documents):
             # Generate a unique ID for this point
             point_id = str(uuid.uuid4())
             
@@ -175,24 +185,13 @@ class LangChainFAQIntegration:
                 "ingested_at": datetime.now().isoformat()
             }
             
-            point = PointStruct(
-                id=point_id,
-                vector=embedding.tolist(),
-                payload=payload
-            )
-            points.append(point)
+            ids.append(point_id)
+            payloads.append(payload)
         
-        # Insert points in batches
-        for i in range(0, len(points), batch_size):
-            batch = points[i:i + batch_size]
-            self.vdb.client.upsert(
-                collection_name=self.collection_name,
-                wait=True,
-                points=batch
-            )
-            logger.info(f"Added batch {i//batch_size + 1}/{(len(points) + batch_size - 1)//batch_size}")
-        
-        logger.info(f"Successfully added {len(points)} documents with custom content field")
+        # Upload the embedding matrix as is, batch by batch
+        self.vdb.upload_vectors(ids, embeddings, payloads, batch_size=batch_size,
+                                texts=[doc.page_content for doc in documents])
+        logger.info(f"Successfully added {len(ids)} documents with custom content field")
     
     def add_faq_texts(self, questions: List[str], answers: List[str], 
                      metadatas: Optional[List[Dict[str, Any]]] = None,
@@ -232,6 +231,7 @@ class LangChainFAQIntegration:
             
             logger.info(f"Adding {len(texts)} FAQ texts using LangChain")
             self.langchain_store.add_texts(texts, metadatas=metadatas, ids=ids)
+            self.vdb.mark_collection_changed()
             logger.info("FAQ text addition completed successfully")
             
         except Exception as e:
@@ -265,24 +265,10 @@ class LangChainFAQIntegration:
             if category:
                 filter_dict["category"] = category
             
-            # Perform search
-            results = self.langchain_store.similarity_search(
-                query=query,
-                k=k,
-                filter=filter_dict if filter_dict else None,
-                **kwargs
-            )
-            
-            # Filter by minimum score if needed
-            if min_score > 0:
-                # Get scores for filtering
-                scored_results = self.langchain_store.similarity_search_with_score(
-                    query=query,
-                    k=k,
-                    filter=filter_dict if filter_dict else None,
-                    **kwargs
-                )
-                results = [doc for doc, score in scored_results if score >= min_score]
+            # Single scored search; the score threshold is applied by Qdrant so the
+            # query is embedded and searched exactly once
+            scored_results = self._search_with_score(query, k, filter_dict, min_score, **kwargs)
+            results = [doc for doc, score in scored_results]
             
             logger.info(f"Found {len(results)} FAQ results")
             return results
@@ -318,24 +304,37 @@ class LangChainFAQIntegration:
             if category:
                 filter_dict["category"] = category
             
-            # Perform search
-            results = self.langchain_store.similarity_search_with_score(
-                query=query,
-                k=k,
-                filter=filter_dict if filter_dict else None,
-                **kwargs
-            )
-            
-            # Filter by minimum score
-            filtered_results = [(doc, score) for doc, score in results if score >= min_score]
+            # Perform search with the score threshold pushed down to Qdrant
+            results = self._search_with_score(query, k, filter_dict, min_score, **kwargs)
             
-            logger.info(f"Found {len(filtered_results)} FAQ results")
-            return filtered_results
+            logger.info(f"Found {len(results)} FAQ results")
+            return results
             
         except Exception as e:
             logger.error(f"Error in FAQ search with scores: {e}")
             raise
     
+    def _search_with_score(self, query: str, k: int, filter_dict: Dict[str, Any],
+                           min_score: float, **kwargs) -> List[tuple[Document, float]]:
+        """
+        Scored search with LangChain filter keys (resolved under the metadata payload key).
+        
+        min_score is pushed down to Qdrant as the score threshold and checked
+        again here, so search_faqs and search_faqs_with_score return the same
+        documents.
+        """
+        results = scored_documents(
+            self.vdb,
+            self.langchain_store,
+            self.embeddings.embed_query(query),
+            k,
+            query_filter=compile_filter(filter_dict, key_prefix=f"{self.langchain_store.metadata_payload_key}."),
+            score_threshold=min_score if min_score > 0 else None,
+            **kwargs
+        )
+        # Guard against search paths that ignore score_threshold
+        return [(doc, score) for doc, score in results if score >= min_score]
+    
     def load_faq_documents_from_jsonl(self, file_path: str) -> List[Document]:
         """
         Load FAQ documents from JSONL file and convert to LangChain Document format.
@@ -349,68 +348,54 @@ class LangChainFAQIntegration:
         documents = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
+            for line_num, data in iter_records(file_path, types=("faq",)):
+                # Create LangChain Document
+                # Combine question and answer for better search
+                content = f"Q: {data.get('question', '')}\nA: {data.get('answer', '')}"
+                
+                # Ensure we have the required properties
+                faq_id = data.get("id")
+                if faq_id is None:
+                    # If no ID exists, use line number as fallback
+                    faq_id = line_num
+                elif isinstance(faq_id, str):
+                    # Convert string IDs like "faq_001" to integers
                     try:
-                        import json
-                        data = json.loads(line)
-                        
-                        if data.get("type") == "faq":
-                            # Create LangChain Document
-                            # Combine question and answer for better search
-                            content = f"Q: {data.get('question', '')}\nA: {data.get('answer', '')}"
-                            
-                            # Ensure we have the required properties
-                            faq_id = data.get("id")
-                            if faq_id is None:
-                                # If no ID exists, use line number as fallback
-                                faq_id = line_num
-                            elif isinstance(faq_id, str):
-                                # Convert string IDs like "faq_001" to integers
-                                try:
-                                    # Extract number from string ID (e.g., "faq_001" -> 1, "FQ_1" -> 1)
-                                    if faq_id.startswith("faq_"):
-                                        faq_id = int(faq_id.replace("faq_", ""))
-                                    elif faq_id.startswith("FQ_"):
-                                        faq_id = int(faq_id.replace("FQ_", ""))
-                                    else:
-                                        # Try to convert directly to int, fallback to hash
-                                        faq_id = int(faq_id)
-                                except (ValueError, AttributeError):
-                                    # If conversion fails, use hash of the string as fallback
-                                    faq_id = abs(hash(faq_id)) % (2**63)  # Ensure it's a positive integer
-                            elif not isinstance(faq_id, int):
-                                # Convert other types to integer
-                                faq_id = abs(hash(str(faq_id))) % (2**63)
-                            
-                            # Create metadata object - ensure it's not empty
-                            metadata = {
-                                "faq_id": faq_id,
-                                "question": data.get("question", ""),
-                                "answer": data.get("answer", ""),
-                                "category": data.get("category", ""),
-                                "tags": data.get("tags", []),
-                                "source_url": data.get("source_url", ""),
-                                "text_chunk": data.get("text_chunk", "")
-                            }
-                            
-                            # Ensure pageContent is not empty
-                            if not content.strip():
-                                content = f"FAQ ID: {faq_id}"
-                            
-                            doc = Document(
-                                page_content=content,
-                                metadata=metadata
-                            )
-                            documents.append(doc)
-                            
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Error parsing line {line_num}: {e}")
-                        continue
+                        # Extract number from string ID (e.g., "faq_001" -> 1, "FQ_1" -> 1)
+                        if faq_id.startswith("faq_"):
+                            faq_id = int(faq_id.replace("faq_", ""))
+                        elif faq_id.startswith("FQ_"):
+                            faq_id = int(faq_id.replace("FQ_", ""))
+                        else:
+                            # Try to convert directly to int, fallback to hash
+                            faq_id = int(faq_id)
+                    except (ValueError, AttributeError):
+                        # If conversion fails, use hash of the string as fallback
+                        faq_id = abs(hash(faq_id)) % (2**63)  # Ensure it's a positive integer
+                elif not isinstance(faq_id, int):
+                    # Convert other types to integer
+                    faq_id = abs(hash(str(faq_id))) % (2**63)
+                
+                # Create metadata object - ensure it's not empty
+                metadata = {
+                    "faq_id": faq_id,
+                    "question": data.get("question", ""),
+                    "answer": data.get("answer", ""),
+                    "category": data.get("category", ""),
+                    "tags": data.get("tags", []),
+                    "source_url": data.get("source_url", ""),
+                    "text_chunk": data.get("text_chunk", "")
+                }
+                
+                # Ensure pageContent is not empty
+                if not content.strip():
+                    content = f"FAQ ID: {faq_id}"
+                
+                doc = Document(
+                    page_content=content,
+                    metadata=metadata
+                )
+                documents.append(doc)
             
             logger.info(f"Loaded {len(documents)} FAQ documents from {file_path}")
             return documents
@@ -479,21 +464,8 @@ class LangChainFAQIntegration:
             List of category names
         """
         try:
-            # Get all points from the collection
-            points = self.vdb.client.scroll(
-                collection_name=self.collection_name,
-                limit=10000,  # Adjust based on your data size
-                with_payload=True
-            )[0]
-            
-            # Extract unique categories
-            categories = set()
-            for point in points:
-                category = point.payload.get("category")
-                if category:
-                    categories.add(category)
-            
-            return sorted(list(categories))
+            counts = self.vdb.get_facet_counts("category")
+            return sorted(category for category in counts if category)
             
         except Exception as e:
             logger.error(f"Error getting FAQ categories: {e}")
@@ -507,21 +479,8 @@ class LangChainFAQIntegration:
             List of tag names
         """
         try:
-            # Get all points from the collection
-            points = self.vdb.client.scroll(
-                collection_name=self.collection_name,
-                limit=10000,  # Adjust based on your data size
-                with_payload=True
-            )[0]
-            
-            # Extract unique tags
-            tags = set()
-            for point in points:
-                point_tags = point.payload.get("tags", [])
-                if isinstance(point_tags, list):
-                    tags.update(point_tags)
-            
-            return sorted(list(tags))
+            counts = self.vdb.get_facet_counts("tags")
+            return sorted(tag for tag in counts if tag)
             
         except Exception as e:
             logger.error(f"Error getting FAQ tags: {e}")
@@ -534,6 +493,7 @@ class LangChainFAQIntegration:
     def delete_collection(self) -> None:
         """Delete the FAQ collection."""
         self.vdb.client.delete_collection(self.collection_name)
+        self.vdb.mark_collection_changed()
         logger.info(f"FAQ collection '{self.collection_name}' deleted")
 
 def main():
@@ -4,11 +4,16 @@ LangChain Integration with Qdrant Vector Database
 
 This module provides LangChain integration for the Premiere Suites Qdrant setup,
 allowing you to use both direct Qdrant operations and LangChain's higher-level abstractions.
+
+Searches do not go through the langchain_community Qdrant store, which calls
+QdrantClient.search (removed in qdrant-client 1.17): they run with
+query_points through PremiereSuitesVectorDB and the hits are turned into
+Documents the way the store does it.
 """
 
 import os
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 
 from langchain_community.vectorstores import Qdrant
@@ -16,13 +21,48 @@ from langchain_community.embeddings import OpenAIEmbeddings, HuggingFaceEmbeddin
 from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from qdrant_client import QdrantClient
+from qdrant_client.http import models
 
 from .qdrant_setup import PremiereSuitesVectorDB
+from .filters import compile_filter
+from services.jsonl_loader import iter_properties
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def scored_documents(vdb: PremiereSuitesVectorDB,
+                     store: Qdrant,
+                     query_embedding: List[float],
+                     k: int,
+                     query_filter: Optional[models.Filter] = None,
+                     score_threshold: Optional[float] = None,
+                     **kwargs) -> List[Tuple[Document, float]]:
+    """
+    Search a LangChain store's collection and return scored Documents.
+    
+    Args:
+        vdb: Vector database for the store's collection
+        store: LangChain Qdrant store (for its content and metadata payload keys)
+        query_embedding: Query embedding from the store's embeddings
+        k: Number of results to return
+        query_filter: Qdrant filter on the store's payload layout
+        score_threshold: Minimum similarity score
+        **kwargs: Additional dense_query parameters
+        
+    Returns:
+        List of (Document, score) tuples, most similar first
+    """
+    points = vdb.dense_query(query_embedding, limit=k, query_filter=query_filter,
+                             score_threshold=score_threshold, **kwargs)
+    results = []
+    for point in points:
+        payload = point.payload or {}
+        document = Document(page_content=payload.get(store.content_payload_key) or "",
+                            metadata=payload.get(store.metadata_payload_key) or {})
+        results.append((document, point.score))
+    return results
+
 class LangChainQdrantIntegration:
     """
     LangChain integration with Qdrant for Premiere Suites data.
@@ -101,6 +141,9 @@ class LangChainQdrantIntegration:
     def create_collection(self, recreate: bool = False) -> None:
         """Create the Qdrant collection."""
         self.vdb.create_collection(recreate=recreate)
+        
+        # LangChain stores metadata under a nested key; index the same fields there
+        self.vdb._create_indexes(key_prefix=f"{self.langchain_store.metadata_payload_key}.")
     
     def add_documents(self, documents: List[Document], batch_size: int = 100) -> None:
         """
@@ -154,7 +197,7 @@ class LangChainQdrantIntegration:
             query: Search query
             k: Number of results to return
             filter: Optional filter dictionary
-            **kwargs: Additional search parameters
+            **kwargs: Additional search parameters (score_threshold, see dense_query)
             
         Returns:
             List of LangChain Document objects
@@ -165,12 +208,11 @@ class LangChainQdrantIntegration:
             # Convert filter to Qdrant format if needed
             qdrant_filter = self._convert_filter_to_qdrant(filter) if filter else None
             
-            results = self.langchain_store.similarity_search(
-                query=query,
-                k=k,
-                filter=qdrant_filter,
-                **kwargs
-            )
+            results = [
+                doc for doc, _ in scored_documents(self.vdb, self.langchain_store,
+                                                   self.embeddings.embed_query(query), k,
+                                                   query_filter=qdrant_filter, **kwargs)
+            ]
             
             logger.info(f"Found {len(results)} results")
             return results
@@ -191,7 +233,7 @@ class LangChainQdrantIntegration:
             query: Search query
             k: Number of results to return
             filter: Optional filter dictionary
-            **kwargs: Additional search parameters
+            **kwargs: Additional search parameters (score_threshold, see dense_query)
             
         Returns:
             List of tuples containing (Document, score)
@@ -202,12 +244,8 @@ class LangChainQdrantIntegration:
             # Convert filter to Qdrant format if needed
             qdrant_filter = self._convert_filter_to_qdrant(filter) if filter else None
             
-            results = self.langchain_store.similarity_search_with_score(
-                query=query,
-                k=k,
-                filter=qdrant_filter,
-                **kwargs
-            )
+            results = scored_documents(self.vdb, self.langchain_store, self.embeddings.embed_query(query), k,
+                                       query_filter=qdrant_filter, **kwargs)
             
             logger.info(f"Found {len(results)} results")
             return results
@@ -216,19 +254,20 @@ class LangChainQdrantIntegration:
             logger.error(f"Error in similarity search with scores: {e}")
             raise
     
-    def _convert_filter_to_qdrant(self, filter_dict: Dict[str, Any]) -> Dict[str, Any]:
+    def _convert_filter_to_qdrant(self, filter_dict: Dict[str, Any]) -> Optional[models.Filter]:
         """
         Convert LangChain filter format to Qdrant format.
         
+        Keys are resolved under the LangChain metadata payload key so the
+        resulting conditions hit the payload indexes on those fields.
+        
         Args:
-            filter_dict: LangChain filter dictionary
+            filter_dict: Mongo-like filter dictionary (see filters.compile_filter)
             
         Returns:
-            Qdrant filter dictionary
+            Qdrant Filter object
         """
-        # This is a simple conversion - you might need to extend this
-        # based on your specific filter requirements
-        return filter_dict
+        return compile_filter(filter_dict, key_prefix=f"{self.langchain_store.metadata_payload_key}.")
     
     def load_documents_from_jsonl(self, file_path: str) -> List[Document]:
         """
@@ -243,43 +282,29 @@ class LangChainQdrantIntegration:
         documents = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    try:
-                        import json
-                        data = json.loads(line)
-                        
-                        if data.get("type") == "property":
-                            # Create LangChain Document
-                            doc = Document(
-                                page_content=data.get("text_chunk", ""),
-                                metadata={
-                                    "property_id": data.get("id"),
-                                    "property_name": data.get("property_name"),
-                                    "city": data.get("city"),
-                                    "rating": data.get("rating"),
-                                    "room_type": data.get("room_type"),
-                                    "amenities": data.get("amenities", []),
-                                    "description": data.get("description"),
-                                    "pet_friendly": data.get("pet_friendly"),
-                                    "bedrooms": data.get("bedrooms"),
-                                    "building_type": data.get("building_type"),
-                                    "suite_features": data.get("suite_features", []),
-                                    "source_url": data.get("source_url"),
-                                    "image_url": data.get("image_url"),
-                                    "price_range": data.get("price_range"),
-                                    "location_details": data.get("location_details")
-                                }
-                            )
-                            documents.append(doc)
-                            
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Error parsing line {line_num}: {e}")
-                        continue
+            for data in iter_properties(file_path):
+                # Create LangChain Document
+                doc = Document(
+                    page_content=data.get("text_chunk", ""),
+                    metadata={
+                        "property_id": data.get("id"),
+                        "property_name": data.get("property_name"),
+                        "city": data.get("city"),
+                        "rating": data.get("rating"),
+                        "room_type": data.get("room_type"),
+                        "amenities": data.get("amenities", []),
+                        "description": data.get("description"),
+                        "pet_friendly": data.get("pet_friendly"),
+                        "bedrooms": data.get("bedrooms"),
+                        "building_type": data.get("building_type"),
+                        "suite_features": data.get("suite_features", []),
+                        "source_url": data.get("source_url"),
+                        "image_url": data.get("image_url"),
+                        "price_range": data.get("price_range"),
+                        "location_details": data.get("location_details")
+                    }
+                )
+                documents.append(doc)
             
             logger.info(f"Loaded {len(documents)} documents from {file_path}")
             return documents
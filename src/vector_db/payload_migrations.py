@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Bulk Payload Migrations for Premiere Suites Collections
+
+Applies a payload fix to every point in a Qdrant collection. A migration is a
+function from a point's payload to its new payload (or None when nothing
+changes); run_migration scrolls the whole collection page by page, diffs old
+and new payloads key by key, and writes the differences with
+batch_update_points (set for new or changed keys, delete for removed ones),
+several batches in flight at a time.
+
+After each page is written the scroll offset is saved to an optional JSON
+checkpoint, so an interrupted migration resumes where it stopped instead of
+rescanning. A dry run computes the same diff and writes nothing.
+"""
+
+import os
+import json
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_BATCH_SIZE = 256
+
+# Points whose diff is kept in the report, for dry-run review
+DEFAULT_SAMPLE_SIZE = 5
+
+PayloadMigration = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+def fill_faq_content(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Set an empty or missing 'content' from the FAQ question and answer, or
+    "FAQ ID: <faq_id>" for FAQs with neither. Payloads with none of these
+    fields are left unchanged (the point id is not visible to migrations).
+    """
+    if payload.get("content"):
+        return None
+    question = payload.get("question", "")
+    answer = payload.get("answer", "")
+    if question and answer:
+        content = f"Q: {question}\nA: {answer}"
+    elif question:
+        content = f"Q: {question}"
+    elif answer:
+        content = f"A: {answer}"
+    elif payload.get("faq_id") is not None:
+        content = f"FAQ ID: {payload['faq_id']}"
+    else:
+        return None
+    return {**payload, "content": content}
+
+def text_chunk_to_content(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Rename 'text_chunk' to 'content', at the top level and in 'metadata'."""
+    updated = dict(payload)
+    changed = False
+    if "text_chunk" in updated:
+        updated["content"] = updated.pop("text_chunk")
+        changed = True
+    metadata = updated.get("metadata")
+    if isinstance(metadata, dict) and "text_chunk" in metadata:
+        metadata = dict(metadata)
+        metadata["content"] = metadata.pop("text_chunk")
+        updated["metadata"] = metadata
+        changed = True
+    return updated if changed else None
+
+# Built-in migrations by name
+MIGRATIONS: Dict[str, PayloadMigration] = {
+    "fill-faq-content": fill_faq_content,
+    "text-chunk-to-content": text_chunk_to_content,
+}
+
+def payload_diff(old: Dict[str, Any], new: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Top-level keys to set and to delete to turn one payload into another.
+
+    Returns:
+        (keys with new or changed values, keys no longer present)
+    """
+    set_keys = {key: value for key, value in new.items() if key not in old or old[key] != value}
+    deleted = [key for key in old if key not in new]
+    return set_keys, deleted
+
+def diff_operations(point_id: Any, set_keys: Dict[str, Any], deleted: List[str]) -> List[Any]:
+    """Payload update operations for one point's diff."""
+    operations: List[Any] = []
+    if set_keys:
+        operations.append(models.SetPayloadOperation(
+            set_payload=models.SetPayload(payload=set_keys, points=[point_id])
+        ))
+    if deleted:
+        operations.append(models.DeletePayloadOperation(
+            delete_payload=models.DeletePayload(keys=deleted, points=[point_id])
+        ))
+    return operations
+
+def load_checkpoint(path: str, collection_name: str, migration_name: str) -> Optional[Dict[str, Any]]:
+    """Saved progress for this collection and migration, or None to start from the beginning."""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        checkpoint = json.load(f)
+    if checkpoint.get("collection") != collection_name or checkpoint.get("migration") != migration_name:
+        raise ValueError(f"Checkpoint {path} belongs to {checkpoint.get('migration')} on "
+                         f"{checkpoint.get('collection')}, not {migration_name} on {collection_name}")
+    return checkpoint
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    """Write progress atomically, so an interrupted save never leaves a truncated file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+def run_migration(client: QdrantClient,
+                  collection_name: str,
+                  migration: PayloadMigration,
+                  migration_name: Optional[str] = None,
+                  dry_run: bool = False,
+                  page_size: int = DEFAULT_PAGE_SIZE,
+                  batch_size: int = DEFAULT_BATCH_SIZE,
+                  max_concurrency: int = 4,
+                  checkpoint_path: Optional[str] = None,
+                  sample_size: int = DEFAULT_SAMPLE_SIZE) -> Dict[str, Any]:
+    """
+    Apply a payload migration to every point in a collection.
+
+    Args:
+        client: Qdrant client
+        collection_name: Collection to migrate
+        migration: Function from a payload to its new payload, or None if unchanged
+        migration_name: Name stored in the checkpoint (defaults to the function name)
+        dry_run: Compute and report the diff without writing
+        page_size: Points per scroll request
+        batch_size: Points per batch_update_points request
+        max_concurrency: Update requests in flight at once
+        checkpoint_path: JSON file to save progress to and resume from (not used for dry runs)
+        sample_size: Number of point diffs kept in the report
+
+    Returns:
+        Report with scanned, changed and written point counts, per-key change
+        counts, sample diffs and throughput
+    """
+    if page_size < 1 or batch_size < 1 or max_concurrency < 1:
+        raise ValueError("page_size, batch_size and max_concurrency must be at least 1")
+    migration_name = migration_name or getattr(migration, "__name__", "migration")
+    if dry_run:
+        checkpoint_path = None
+
+    checkpoint = load_checkpoint(checkpoint_path, collection_name, migration_name) or {}
+    if checkpoint.get("done"):
+        logger.info(f"{migration_name} already completed on {collection_name} (checkpoint {checkpoint_path})")
+    offset = checkpoint.get("offset")
+    report: Dict[str, Any] = {
+        "collection": collection_name,
+        "migration": migration_name,
+        "dry_run": dry_run,
+        "resumed": bool(checkpoint),
+        "scanned": checkpoint.get("scanned", 0),
+        "changed": checkpoint.get("changed", 0),
+        "written": checkpoint.get("written", 0),
+        "keys_set": dict(checkpoint.get("keys_set", {})),
+        "keys_deleted": dict(checkpoint.get("keys_deleted", {})),
+        "samples": [],
+    }
+    resumed_at = report["scanned"]
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        while not checkpoint.get("done"):
+            points, next_offset = client.scroll(
+                collection_name=collection_name,
+                limit=page_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False
+            )
+
+            batches: List[List[Any]] = []
+            batch: List[Any] = []
+            batch_points = 0
+            for point in points:
+                report["scanned"] += 1
+                old = point.payload or {}
+                new = migration(dict(old))
+                if new is None:
+                    continue
+                set_keys, deleted = payload_diff(old, new)
+                if not set_keys and not deleted:
+                    continue
+
+                report["changed"] += 1
+                for key in set_keys:
+                    report["keys_set"][key] = report["keys_set"].get(key, 0) + 1
+                for key in deleted:
+                    report["keys_deleted"][key] = report["keys_deleted"].get(key, 0) + 1
+                if len(report["samples"]) < sample_size:
+                    report["samples"].append({
+                        "id": point.id,
+                        "set": {key: {"old": old.get(key), "new": value} for key, value in set_keys.items()},
+                        "deleted": deleted,
+                    })
+
+                batch.extend(diff_operations(point.id, set_keys, deleted))
+                batch_points += 1
+                if batch_points == batch_size:
+                    batches.append(batch)
+                    batch, batch_points = [], 0
+            if batch:
+                batches.append(batch)
+
+            if not dry_run and batches:
+                # Wait for the whole page before moving the checkpoint past it
+                futures = [
+                    executor.submit(client.batch_update_points, collection_name=collection_name,
+                                    update_operations=operations, wait=True)
+                    for operations in batches
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except Exception as e:
+                    logger.error(f"Error migrating {collection_name} at offset {offset}: {e}")
+                    raise
+                report["written"] = report["changed"]
+
+            offset = next_offset
+            if checkpoint_path:
+                checkpoint = {
+                    "collection": collection_name,
+                    "migration": migration_name,
+                    "offset": offset,
+                    "done": offset is None,
+                    **{key: report[key] for key in ("scanned", "changed", "written", "keys_set", "keys_deleted")},
+                }
+                save_checkpoint(checkpoint_path, checkpoint)
+            logger.info(f"{migration_name} on {collection_name}: scanned {report['scanned']}, "
+                        f"{report['changed']} to change")
+            if offset is None:
+                break
+
+    elapsed = time.perf_counter() - started
+    report["seconds"] = round(elapsed, 3)
+    report["points_per_second"] = round((report["scanned"] - resumed_at) / elapsed, 1) if elapsed > 0 else None
+    return report
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Property Facet Vectors and Query Planning
+
+A property's text chunk mixes its name, location, amenities and features in
+one embedding, so a query about one aspect ("gym and parking") is compared
+with all of them. Facet-enabled property collections store one named vector
+per facet next to the combined (unnamed) vector:
+
+    name         property name, building type and city
+    amenities    amenities and suite features
+    description  the property description
+
+Each facet embeds a short text. At query time plan_facets looks at the query
+terms and weights the vectors to search: amenity terms favour the amenities
+vector, property name terms the name vector, and the remaining terms the
+description. The combined vector is always searched, and the weighted result
+lists are fused with RRF in one Qdrant query.
+"""
+
+from typing import Any, Dict, Iterable, Set
+
+try:
+    from .sparse_encoder import tokenize
+except ImportError:
+    # Running as a script or imported as a top-level module
+    from sparse_encoder import tokenize
+
+# Named vectors of facet-enabled property collections (the combined vector stays unnamed)
+PROPERTY_FACETS = ("name", "amenities", "description")
+
+# Name of the combined vector in named-vector requests
+COMBINED_VECTOR = ""
+
+# Amenity terms recognised even before the collection's own amenities are known
+DEFAULT_AMENITY_TERMS = frozenset(tokenize(
+    "gym fitness pool parking garage wifi internet laundry washer dryer dishwasher kitchen "
+    "balcony patio terrace rooftop concierge security elevator pet pets dog cat furnished "
+    "air conditioning heating fireplace bbq sauna spa storage bike workspace"
+))
+
+# Words in property names that say nothing about which property is meant
+GENERIC_NAME_TERMS = frozenset(tokenize(
+    "suite suites residence residences apartment apartments tower towers building place "
+    "house lofts loft premiere condo condos street avenue"
+))
+
+def facet_texts(record: Dict[str, Any], fallback: str = "") -> Dict[str, str]:
+    """
+    Text embedded for each facet of a property record or payload.
+
+    Args:
+        record: Property record or stored payload
+        fallback: Text for facets the property has no data for (e.g. its text chunk)
+
+    Returns:
+        Mapping of facet name to text
+    """
+    name_parts = [record.get("property_name"), record.get("building_type"), record.get("city")]
+    amenities = list(record.get("amenities") or []) + list(record.get("suite_features") or [])
+    texts = {
+        "name": ", ".join(str(part) for part in name_parts if part),
+        "amenities": ", ".join(str(item) for item in amenities),
+        "description": record.get("description") or "",
+    }
+    return {facet: text if text.strip() else fallback for facet, text in texts.items()}
+
+def vocabulary(values: Iterable[Any], exclude: Iterable[str] = ()) -> Set[str]:
+    """Query terms that point at a facet, from the values stored in it."""
+    excluded = set(exclude)
+    return {term for value in values if value for term in tokenize(str(value)) if term not in excluded}
+
+def plan_facets(query: str, amenity_terms: Iterable[str] = DEFAULT_AMENITY_TERMS,
+                name_terms: Iterable[str] = ()) -> Dict[str, float]:
+    """
+    Weights of the vectors to search for a query.
+
+    The combined vector always has weight 1. A facet gets a weight when some
+    query terms belong to it, growing with the share of such terms (up to 2),
+    so "gym and parking" leans on the amenities vector while "quiet place near
+    the park with a gym" mostly uses the description and combined vectors.
+
+    Args:
+        query: Search query text
+        amenity_terms: Terms that name amenities
+        name_terms: Terms that occur in property names
+
+    Returns:
+        Mapping of vector name (COMBINED_VECTOR or a facet) to RRF weight
+    """
+    terms = tokenize(query)
+    weights = {COMBINED_VECTOR: 1.0}
+    if not terms:
+        return weights
+
+    amenity_terms = set(amenity_terms)
+    name_terms = set(name_terms) - amenity_terms
+    amenity_hits = [term for term in terms if term in amenity_terms]
+    name_hits = [term for term in terms if term in name_terms]
+    other_share = 1 - (len(amenity_hits) + len(name_hits)) / len(terms)
+
+    if amenity_hits:
+        weights["amenities"] = 2 * len(amenity_hits) / len(terms)
+    if name_hits:
+        weights["name"] = 2 * len(name_hits) / len(terms)
+    if other_share > 0 and (amenity_hits or name_hits):
+        weights["description"] = other_share
+    return weights
@@ -7,27 +7,193 @@ property listings with semantic search capabilities.
 Supports both Qdrant Cloud and local Qdrant instances.
 """
 
-import json
 import os
+import sys
+import time
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from qdrant_client import QdrantClient
 import openai
 from qdrant_client.models import (
-    Distance, VectorParams, PointStruct, 
-    FieldCondition, MatchValue, Filter,
-    CreateCollection, OptimizersConfigDiff
+    Distance, VectorParams, PointStruct, Filter,
+    OptimizersConfigDiff
 )
 from qdrant_client.http import models
 
+try:
+    from .schema import get_collection_schema, filter_keys, find_unindexed_fields
+    from .filters import compile_filter
+    from .exact_index import ExactSearchIndex
+    from .embedding_store import EmbeddingStore, open_embedding_store
+    from .bulk_upload import DEFAULT_UPLOAD_BATCH_SIZE, upload_columns
+    from .sparse_encoder import SPARSE_VECTOR_NAME, BM25Encoder
+    from .property_facets import (
+        COMBINED_VECTOR, DEFAULT_AMENITY_TERMS, GENERIC_NAME_TERMS, PROPERTY_FACETS,
+        facet_texts, plan_facets, vocabulary
+    )
+except ImportError:
+    # Running as a script or imported as a top-level module
+    from schema import get_collection_schema, filter_keys, find_unindexed_fields
+    from filters import compile_filter
+    from exact_index import ExactSearchIndex
+    from embedding_store import EmbeddingStore, open_embedding_store
+    from bulk_upload import DEFAULT_UPLOAD_BATCH_SIZE, upload_columns
+    from sparse_encoder import SPARSE_VECTOR_NAME, BM25Encoder
+    from property_facets import (
+        COMBINED_VECTOR, DEFAULT_AMENITY_TERMS, GENERIC_NAME_TERMS, PROPERTY_FACETS,
+        facet_texts, plan_facets, vocabulary
+    )
+
+try:
+    from services.rate_limit import TokenBucket, get_bucket
+    from services.jsonl_loader import iter_properties
+except ImportError:
+    # src/ is not on sys.path (script mode or the root package)
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from services.rate_limit import TokenBucket, get_bucket
+    from services.jsonl_loader import iter_properties
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Inputs per OpenAI embeddings request
+OPENAI_EMBEDDING_BATCH_SIZE = 100
+
+# Largest collection the search services (concierge server, search gateway)
+# answer from the in-process exact index; EXACT_SEARCH_MAX_POINTS overrides it
+SERVICE_EXACT_SEARCH_MAX_POINTS = 2000
+
+# Embedding backends already loaded in this process, keyed by model name
+_embedding_models: Dict[str, Any] = {}
+
+# Per-collection content versions, bumped on every ingest in this process so
+# caches built from a collection know when to refresh
+_collection_versions: Dict[str, int] = {}
+
+def get_collection_version(collection_name: str) -> int:
+    """Current content version of a collection in this process."""
+    return _collection_versions.get(collection_name, 0)
+
+def bump_collection_version(collection_name: str) -> int:
+    """Record that a collection's contents changed and return the new version."""
+    _collection_versions[collection_name] = get_collection_version(collection_name) + 1
+    return _collection_versions[collection_name]
+
+def load_embedding_model(embedding_model: str):
+    """
+    Load the embedding backend for a model name.
+    
+    Sentence transformer models are loaded once per process and shared by every
+    vector database instance that uses them.
+    
+    Args:
+        embedding_model: OpenAI model name (text-embedding-*) or sentence transformer name
+        
+    Returns:
+        Tuple of (SentenceTransformer or None, use_openai, vector_size)
+    """
+    logger.info(f"Loading embedding model: {embedding_model}")
+    
+    # Check if it's an OpenAI model
+    if embedding_model.startswith('text-embedding-'):
+        # Use OpenAI embeddings
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+        if not openai_api_key:
+            raise ValueError("OPENAI_API_KEY environment variable is required for OpenAI embedding models")
+        
+        openai.api_key = openai_api_key
+        
+        # text-embedding-3-large has 3072 dimensions; 3-small and older models have 1536
+        if embedding_model == "text-embedding-3-large":
+            return None, True, 3072
+        return None, True, 1536
+    
+    # Use sentence transformers
+    if embedding_model not in _embedding_models:
+        _embedding_models[embedding_model] = SentenceTransformer(embedding_model)
+    model = _embedding_models[embedding_model]
+    return model, False, model.get_sentence_embedding_dimension()
+
+def property_filter_dict(city: Optional[str] = None,
+                         min_rating: Optional[float] = None,
+                         pet_friendly: Optional[bool] = None,
+                         bedrooms: Optional[int] = None) -> Dict[str, Any]:
+    """Mongo-like filter dictionary for the standard property search parameters."""
+    filter_dict: Dict[str, Any] = {}
+    
+    if city:
+        filter_dict["city"] = city
+    
+    if min_rating is not None:
+        filter_dict["rating"] = {"$gte": min_rating}
+    
+    if pet_friendly is not None:
+        filter_dict["pet_friendly"] = pet_friendly
+    
+    if bedrooms is not None:
+        filter_dict["bedrooms"] = bedrooms
+    
+    return filter_dict
+
+def build_property_filter(city: Optional[str] = None,
+                          min_rating: Optional[float] = None,
+                          pet_friendly: Optional[bool] = None,
+                          bedrooms: Optional[int] = None) -> Optional[Filter]:
+    """Build the Qdrant filter for the standard property search parameters."""
+    return compile_filter(property_filter_dict(city, min_rating, pet_friendly, bedrooms))
+
+def build_property_payload(prop: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the stored payload for a property record."""
+    return {
+        "property_id": prop.get("id"),
+        "property_name": prop.get("property_name"),
+        "city": prop.get("city"),
+        "rating": prop.get("rating"),
+        "room_type": prop.get("room_type"),
+        "amenities": prop.get("amenities", []),
+        "description": prop.get("description"),
+        "pet_friendly": prop.get("pet_friendly"),
+        "bedrooms": prop.get("bedrooms"),
+        "building_type": prop.get("building_type"),
+        "suite_features": prop.get("suite_features", []),
+        "source_url": prop.get("source_url"),
+        "image_url": prop.get("image_url"),
+        "text_chunk": prop.get("text_chunk"),
+        "price_range": prop.get("price_range"),
+        "location_details": prop.get("location_details"),
+        "ingested_at": datetime.now().isoformat()
+    }
+
+def payload_text(payload: Dict[str, Any]) -> str:
+    """Text of a stored point: its content, text chunk, or FAQ question and answer."""
+    for key in ("content", "text_chunk"):
+        text = payload.get(key) or ""
+        if text.strip():
+            return text
+    return f"{payload.get('question', '')}\n{payload.get('answer', '')}"
+
+def format_property_result(result: Any) -> Dict[str, Any]:
+    """Format a scored Qdrant point as a property search result."""
+    return {
+        "score": result.score,
+        "property_id": result.payload.get("property_id"),
+        "property_name": result.payload.get("property_name"),
+        "city": result.payload.get("city"),
+        "rating": result.payload.get("rating"),
+        "description": result.payload.get("description"),
+        "amenities": result.payload.get("amenities", []),
+        "pet_friendly": result.payload.get("pet_friendly"),
+        "bedrooms": result.payload.get("bedrooms"),
+        "source_url": result.payload.get("source_url"),
+        "image_url": result.payload.get("image_url")
+    }
+
 class PremiereSuitesVectorDB:
     """Vector database manager for Premiere Suites property data."""
     
@@ -38,7 +204,14 @@ class PremiereSuitesVectorDB:
                  qdrant_port: int = 6333,
                  collection_name: str = "premiere_suites_properties",
                  embedding_model: Optional[str] = None,
-                 use_cloud: bool = False):
+                 use_cloud: bool = False,
+                 payload_schema: Optional[Dict[str, models.PayloadSchemaType]] = None,
+                 exact_search_max_points: Optional[int] = None,
+                 exact_search_refresh: float = 300.0,
+                 embedding_rate_limit: Optional[TokenBucket] = None,
+                 embedding_store: Optional[EmbeddingStore] = None,
+                 hybrid: Optional[bool] = None,
+                 facet_vectors: Optional[bool] = None):
         """
         Initialize the vector database manager.
         
@@ -50,8 +223,42 @@ class PremiereSuitesVectorDB:
             collection_name: Name of the collection to store properties
             embedding_model: Sentence transformer model to use for embeddings
             use_cloud: Whether to use Qdrant Cloud (if True, qdrant_url and qdrant_api_key are required)
+            payload_schema: Filterable payload fields and their index types
+                (defaults to the schema registered for the collection)
+            exact_search_max_points: Serve dense searches from an in-process exact index when
+                the collection has at most this many points (0 disables; defaults to the
+                EXACT_SEARCH_MAX_POINTS environment variable, or 0)
+            exact_search_refresh: Seconds before the in-process index is reloaded from Qdrant
+            embedding_rate_limit: Token bucket for OpenAI embedding requests (defaults to
+                the process-wide "openai_embeddings" budget)
+            embedding_store: On-disk store that generate_embeddings reuses vectors from
+                (defaults to the EMBEDDING_STORE_DIR store for the model, if set)
+            hybrid: Store a BM25 sparse vector next to the dense one and search both,
+                fused with RRF (defaults to the HYBRID_SEARCH environment variable)
+            facet_vectors: Store name, amenities and description vectors per property
+                and let searches weight them by query (defaults to the
+                PROPERTY_FACET_VECTORS environment variable)
         """
         self.collection_name = collection_name
+        self.embedding_rate_limit = embedding_rate_limit or get_bucket("openai_embeddings")
+        self.payload_schema = payload_schema or get_collection_schema(collection_name)
+        if exact_search_max_points is None:
+            exact_search_max_points = int(os.getenv("EXACT_SEARCH_MAX_POINTS", "0"))
+        self.exact_search_max_points = exact_search_max_points
+        self.exact_search_refresh = exact_search_refresh
+        self._exact_index: Optional[ExactSearchIndex] = None
+        self._exact_index_checked: Optional[tuple] = None
+        
+        # Hybrid sparse + dense retrieval
+        if hybrid is None:
+            hybrid = os.getenv("HYBRID_SEARCH", "").lower() in ("1", "true", "yes")
+        self.hybrid = hybrid
+        self.sparse_encoder = BM25Encoder()
+        
+        # Named vector per property facet
+        if facet_vectors is None:
+            facet_vectors = os.getenv("PROPERTY_FACET_VECTORS", "").lower() in ("1", "true", "yes")
+        self.facet_vectors = facet_vectors
         
         # Get embedding model from environment or use default
         if embedding_model is None:
@@ -74,35 +281,18 @@ class PremiereSuitesVectorDB:
             self.client = QdrantClient(host=qdrant_host, port=qdrant_port)
         
         # Initialize embedding model
-        logger.info(f"Loading embedding model: {self.embedding_model}")
-        
-        # Check if it's an OpenAI model
-        if self.embedding_model.startswith('text-embedding-'):
-            # Use OpenAI embeddings
-            openai_api_key = os.getenv("OPENAI_API_KEY")
-            if not openai_api_key:
-                raise ValueError("OPENAI_API_KEY environment variable is required for OpenAI embedding models")
-            
-            openai.api_key = openai_api_key
-            self.model = None
-            self.use_openai = True
-            self.openai_model = embedding_model
-            
-            # OpenAI text-embedding-3-small has 1536 dimensions
-            if embedding_model == "text-embedding-3-small":
-                self.vector_size = 1536
-            elif embedding_model == "text-embedding-3-large":
-                self.vector_size = 3072
-            else:
-                # Default to 1536 for other OpenAI models
-                self.vector_size = 1536
-        else:
-            # Use sentence transformers
-            self.model = SentenceTransformer(embedding_model)
-            self.vector_size = self.model.get_sentence_embedding_dimension()
-            self.use_openai = False
+        self.model, self.use_openai, self.vector_size = load_embedding_model(self.embedding_model)
+        self.openai_model = self.embedding_model if self.use_openai else None
         
         logger.info(f"Vector dimension: {self.vector_size}")
+        
+        # Persisted embeddings for this model, keyed by content hash
+        if embedding_store is None:
+            embedding_store = open_embedding_store(self.embedding_model)
+        self.embedding_store = embedding_store
+        
+        # Facet counts per payload field, valid until the next ingest
+        self._facet_cache: Dict[str, Dict[Any, int]] = {}
     
     def create_collection(self, recreate: bool = False) -> None:
         """
@@ -119,19 +309,31 @@ class PremiereSuitesVectorDB:
             if collection_exists and recreate:
                 logger.info(f"Recreating collection: {self.collection_name}")
                 self.client.delete_collection(self.collection_name)
+                self.mark_collection_changed()
                 collection_exists = False
             
             if not collection_exists:
                 logger.info(f"Creating collection: {self.collection_name}")
                 
+                vectors_config = VectorParams(
+                    size=self.vector_size,
+                    distance=Distance.COSINE,
+                    on_disk=True  # Store vectors on disk for large datasets
+                )
+                if self.facet_vectors:
+                    # Facet vectors are named; the combined vector keeps the default name
+                    vectors_config = {
+                        name: vectors_config for name in (COMBINED_VECTOR,) + PROPERTY_FACETS
+                    }
+                
                 # Create collection with optimized settings
                 self.client.create_collection(
                     collection_name=self.collection_name,
-                    vectors_config=VectorParams(
-                        size=self.vector_size,
-                        distance=Distance.COSINE,
-                        on_disk=True  # Store vectors on disk for large datasets
-                    ),
+                    vectors_config=vectors_config,
+                    sparse_vectors_config={
+                        # Qdrant keeps the IDF statistics for the BM25 weights
+                        SPARSE_VECTOR_NAME: models.SparseVectorParams(modifier=models.Modifier.IDF)
+                    } if self.hybrid else None,
                     optimizers_config=OptimizersConfigDiff(
                         memmap_threshold=10000,  # Use memory mapping for collections > 10k points
                         default_segment_number=2
@@ -148,76 +350,73 @@ class PremiereSuitesVectorDB:
             logger.error(f"Error creating collection: {e}")
             raise
     
-    def _create_indexes(self) -> None:
-        """Create payload indexes for efficient filtering."""
-        try:
-            # Index for city filtering
-            self.client.create_payload_index(
-                collection_name=self.collection_name,
-                field_name="city",
-                field_schema=models.PayloadFieldSchema.KEYWORD
-            )
-            
-            # Index for rating filtering
-            self.client.create_payload_index(
-                collection_name=self.collection_name,
-                field_name="rating",
-                field_schema=models.PayloadFieldSchema.FLOAT
-            )
-            
-            # Index for pet_friendly filtering
-            self.client.create_payload_index(
-                collection_name=self.collection_name,
-                field_name="pet_friendly",
-                field_schema=models.PayloadFieldSchema.BOOL
-            )
-            
-            # Index for bedrooms filtering
-            self.client.create_payload_index(
-                collection_name=self.collection_name,
-                field_name="bedrooms",
-                field_schema=models.PayloadFieldSchema.INTEGER
-            )
-            
-            # Index for room_type filtering
-            self.client.create_payload_index(
-                collection_name=self.collection_name,
-                field_name="room_type",
-                field_schema=models.PayloadFieldSchema.KEYWORD
-            )
-            
-            logger.info("Payload indexes created successfully")
+    def _create_indexes(self, key_prefix: str = "") -> None:
+        """
+        Create payload indexes for every filterable field in the payload schema.
+        
+        Args:
+            key_prefix: Prefix for nested payloads (e.g. "metadata." for LangChain documents)
+        """
+        created = 0
+        for field_name, field_schema in self.payload_schema.items():
+            try:
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=f"{key_prefix}{field_name}",
+                    field_schema=field_schema
+                )
+                created += 1
+            except Exception as e:
+                logger.warning(f"Error creating index on '{key_prefix}{field_name}' (may already exist): {e}")
+        
+        logger.info(f"Payload indexes created: {created}/{len(self.payload_schema)}")
+    
+    def audit_payload_indexes(self, filters: Optional[List[Filter]] = None,
+                              key_prefix: str = "") -> Dict[str, Any]:
+        """
+        Report filterable fields that would be evaluated without a payload index.
+        
+        Args:
+            filters: Optional Qdrant filters whose keys should also be checked
+            key_prefix: Prefix for nested payloads (e.g. "metadata.")
             
-        except Exception as e:
-            logger.warning(f"Error creating indexes (some may already exist): {e}")
+        Returns:
+            Dictionary with the indexed fields, schema fields lacking an index
+            and filter fields lacking an index
+        """
+        info = self.client.get_collection(self.collection_name)
+        indexed_fields = sorted((info.payload_schema or {}).keys())
+        
+        schema_fields = [f"{key_prefix}{field_name}" for field_name in self.payload_schema]
+        used_fields = set()
+        for query_filter in filters or []:
+            used_fields.update(filter_keys(query_filter))
+        
+        report = {
+            "collection": self.collection_name,
+            "indexed_fields": indexed_fields,
+            "missing_schema_indexes": find_unindexed_fields(schema_fields, indexed_fields),
+            "unindexed_filter_fields": find_unindexed_fields(used_fields, indexed_fields)
+        }
+        
+        for field_name in report["unindexed_filter_fields"]:
+            logger.warning(f"Filter on '{field_name}' in '{self.collection_name}' runs without a payload index")
+        
+        return report
     
-    def load_data_from_jsonl(self, file_path: str) -> List[Dict[str, Any]]:
+    def load_data_from_jsonl(self, file_path: str, validate: bool = False) -> List[Dict[str, Any]]:
         """
         Load property data from JSONL file.
         
         Args:
             file_path: Path to the JSONL file
+            validate: Skip property records that do not match the loader schema
             
         Returns:
             List of property dictionaries
         """
-        properties = []
-        
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    try:
-                        data = json.loads(line)
-                        if data.get("type") == "property":
-                            properties.append(data)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Error parsing line {line_num}: {e}")
-                        continue
-            
+            properties = list(iter_properties(file_path, validate=validate))
             logger.info(f"Loaded {len(properties)} properties from {file_path}")
             return properties
             
@@ -228,28 +427,96 @@ class PremiereSuitesVectorDB:
             logger.error(f"Error loading data: {e}")
             raise
     
+    def load_catalogue(self, file_path: str, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Load property data from a JSONL file or a columnar catalogue.
+        
+        Args:
+            file_path: JSONL data file, or .parquet / .arrow catalogue
+            columns: Catalogue columns to read (defaults to the property fields,
+                without the embedding column; ignored for JSONL)
+        
+        Returns:
+            List of property dictionaries
+        """
+        from services.columnar_catalogue import PROPERTY_SCHEMA, is_catalogue, read_catalogue
+        
+        if not is_catalogue(file_path):
+            return self.load_data_from_jsonl(file_path)
+        
+        try:
+            table = read_catalogue(file_path, columns=columns or PROPERTY_SCHEMA.names)
+            properties = table.to_pylist()
+            logger.info(f"Loaded {len(properties)} properties from {file_path}")
+            return properties
+        
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}")
+            raise
+        except Exception as e:
+            logger.error(f"Error loading catalogue: {e}")
+            raise
+    
+    def load_catalogue_embeddings(self, file_path: str) -> Optional[np.ndarray]:
+        """
+        Read the precomputed embeddings of a catalogue, if they fit this collection.
+        
+        Args:
+            file_path: JSONL data file, or .parquet / .arrow catalogue
+        
+        Returns:
+            Float32 embedding matrix, or None for JSONL files, catalogues without an
+            embedding column and embeddings from another model
+        """
+        from services.columnar_catalogue import (
+            EMBEDDING_COLUMN, catalogue_embeddings, catalogue_metadata, is_catalogue, read_catalogue, read_catalogue_schema
+        )
+        
+        if not is_catalogue(file_path):
+            return None
+        
+        schema = read_catalogue_schema(file_path)
+        if EMBEDDING_COLUMN not in schema.names:
+            return None
+        model = catalogue_metadata(schema).get("embedding_model")
+        if model != self.embedding_model or schema.field(EMBEDDING_COLUMN).type.list_size != self.vector_size:
+            logger.info(f"Catalogue embeddings from '{model}' do not match {self.embedding_model}, re-embedding")
+            return None
+        
+        return catalogue_embeddings(read_catalogue(file_path, columns=[EMBEDDING_COLUMN]))
+    
     def generate_embeddings(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for a list of texts.
         
+        Texts already in the embedding store (same model, same content) are
+        read from it instead of being embedded again.
+        
         Args:
             texts: List of text strings to embed
             
         Returns:
             Numpy array of embeddings
         """
+        if self.embedding_store is not None:
+            return self.embedding_store.embed(texts, self._compute_embeddings)
+        return self._compute_embeddings(texts)
+    
+    def _compute_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Embed texts with the configured model (no store lookup)."""
         logger.info(f"Generating embeddings for {len(texts)} texts")
         
         if self.use_openai:
-            # Use OpenAI embeddings
+            # Use OpenAI embeddings, one request per batch of inputs
             embeddings = []
-            for text in texts:
+            for start in range(0, len(texts), OPENAI_EMBEDDING_BATCH_SIZE):
                 try:
+                    self.embedding_rate_limit.acquire()
                     response = openai.embeddings.create(
-                        input=text,
+                        input=texts[start:start + OPENAI_EMBEDDING_BATCH_SIZE],
                         model=self.openai_model
                     )
-                    embeddings.append(response.data[0].embedding)
+                    embeddings.extend(item.embedding for item in response.data)
                 except Exception as e:
                     logger.error(f"Error generating OpenAI embedding: {e}")
                     raise
@@ -260,6 +527,21 @@ class PremiereSuitesVectorDB:
             embeddings = self.model.encode(texts, show_progress_bar=True)
             return embeddings
     
+    def generate_query_embeddings(self, queries: List[str]) -> np.ndarray:
+        """
+        Embed several query texts, bypassing the embedding store.
+        
+        Queries are one-off texts; storing them would grow the document store
+        with every search.
+        
+        Args:
+            queries: Query texts to embed
+            
+        Returns:
+            Numpy array of embeddings
+        """
+        return self._compute_embeddings(queries)
+    
     def generate_query_embedding(self, query: str) -> List[float]:
         """
         Generate embedding for a single query text.
@@ -273,6 +555,7 @@ class PremiereSuitesVectorDB:
         if self.use_openai:
             # Use OpenAI embeddings
             try:
+                self.embedding_rate_limit.acquire()
                 response = openai.embeddings.create(
                     input=query,
                     model=self.openai_model
@@ -286,52 +569,127 @@ class PremiereSuitesVectorDB:
             embedding = self.model.encode([query])[0]
             return embedding.tolist()
     
-    def prepare_points(self, properties: List[Dict[str, Any]]) -> List[PointStruct]:
+    def prepare_columns(self, properties: List[Dict[str, Any]]) -> Tuple[List[int], np.ndarray, List[Dict[str, Any]]]:
         """
-        Prepare property data for insertion into Qdrant.
+        Prepare property data as columns for a bulk upload.
+        
+        The embeddings stay one float32 matrix instead of being converted
+        to a list per point.
         
         Args:
             properties: List of property dictionaries
             
         Returns:
-            List of PointStruct objects
+            Tuple of (point ids, embedding matrix, payloads)
         """
-        # Extract text chunks for embedding
         texts = [prop.get("text_chunk", "") for prop in properties]
+        embeddings = np.ascontiguousarray(self.generate_embeddings(texts), dtype=np.float32)
+        payloads = [build_property_payload(prop) for prop in properties]
         
-        # Generate embeddings
-        embeddings = self.generate_embeddings(texts)
-        
-        # Create points
-        points = []
-        for i, prop in enumerate(properties):
-            point = PointStruct(
-                id=i,  # Using index as ID, you might want to use a unique identifier
-                vector=embeddings[i].tolist(),
-                payload={
-                    "property_id": prop.get("id"),
-                    "property_name": prop.get("property_name"),
-                    "city": prop.get("city"),
-                    "rating": prop.get("rating"),
-                    "room_type": prop.get("room_type"),
-                    "amenities": prop.get("amenities", []),
-                    "description": prop.get("description"),
-                    "pet_friendly": prop.get("pet_friendly"),
-                    "bedrooms": prop.get("bedrooms"),
-                    "building_type": prop.get("building_type"),
-                    "suite_features": prop.get("suite_features", []),
-                    "source_url": prop.get("source_url"),
-                    "image_url": prop.get("image_url"),
-                    "text_chunk": prop.get("text_chunk"),
-                    "price_range": prop.get("price_range"),
-                    "location_details": prop.get("location_details"),
-                    "ingested_at": datetime.now().isoformat()
-                }
-            )
-            points.append(point)
+        logger.info(f"Prepared {len(payloads)} points for upload")
+        return list(range(len(properties))), embeddings, payloads
+    
+    def embed_facets(self, records: List[Dict[str, Any]],
+                     fallback_texts: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Embed the name, amenities and description facets of properties.
+        
+        Args:
+            records: Property records or payloads
+            fallback_texts: Text per property for facets it has no data for
+            
+        Returns:
+            Mapping of facet name to float32 embedding matrix
+        """
+        fallback_texts = fallback_texts or [payload_text(record) for record in records]
+        texts = [facet_texts(record, fallback) for record, fallback in zip(records, fallback_texts)]
+        return {
+            facet: np.ascontiguousarray(self.generate_embeddings([text[facet] for text in texts]), dtype=np.float32)
+            for facet in PROPERTY_FACETS
+        }
+    
+    def upload_vectors(self, ids: List[Any], vectors: np.ndarray, payloads: Optional[List[Dict[str, Any]]] = None,
+                       batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE, parallel: int = 1,
+                       texts: Optional[List[str]] = None,
+                       facet_vectors: Optional[Dict[str, np.ndarray]] = None) -> None:
+        """
+        Upload points to the collection from columns.
+        
+        Args:
+            ids: Point id per vector
+            vectors: Embedding matrix (numpy array or memory-mapped view)
+            payloads: Optional payload per vector
+            batch_size: Number of points per request
+            parallel: Number of upload workers
+            texts: Text per point for the sparse vectors of a hybrid collection
+                (defaults to the text of each payload)
+            facet_vectors: Matrix per facet for a facet collection (embedded from
+                the payloads when not given)
+        """
+        sparse_vectors = None
+        if self.hybrid:
+            if texts is None:
+                if payloads is None:
+                    raise ValueError("Hybrid collections need texts or payloads to build sparse vectors from")
+                texts = [payload_text(payload) for payload in payloads]
+            sparse_vectors = self.sparse_encoder.encode_documents(texts)
+        
+        if self.facet_vectors and facet_vectors is None:
+            if payloads is None:
+                raise ValueError("Facet collections need payloads or facet vectors")
+            facet_vectors = self.embed_facets(payloads, texts)
+        
+        upload_columns(self.client, self.collection_name, ids, vectors, payloads,
+                       batch_size=batch_size, parallel=parallel, sparse_vectors=sparse_vectors,
+                       named_vectors=facet_vectors if self.facet_vectors else None)
+        self.mark_collection_changed()
+        logger.info("Data insertion completed successfully")
+    
+    def ingest_properties(self, properties: List[Dict[str, Any]],
+                          batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE, parallel: int = 1) -> None:
+        """
+        Embed and upload properties through the columnar bulk path.
+        
+        Args:
+            properties: List of property dictionaries
+            batch_size: Number of points per request
+            parallel: Number of upload workers
+        """
+        ids, vectors, payloads = self.prepare_columns(properties)
+        self.upload_vectors(ids, vectors, payloads, batch_size=batch_size, parallel=parallel,
+                            texts=[prop.get("text_chunk", "") for prop in properties])
+    
+    def ingest_catalogue(self, file_path: str,
+                         batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE, parallel: int = 1) -> int:
+        """
+        Upload the properties of a JSONL file or columnar catalogue.
+        
+        A catalogue with an embedding column from this collection's model is
+        uploaded with those vectors instead of embedding the texts again.
+        
+        Args:
+            file_path: JSONL data file, or .parquet / .arrow catalogue
+            batch_size: Number of points per request
+            parallel: Number of upload workers
+            
+        Returns:
+            Number of properties uploaded
+        """
+        properties = self.load_catalogue(file_path)
+        if not properties:
+            return 0
         
-        logger.info(f"Prepared {len(points)} points for insertion")
-        return points
+        vectors = self.load_catalogue_embeddings(file_path)
+        if vectors is None:
+            self.ingest_properties(properties, batch_size=batch_size, parallel=parallel)
+            return len(properties)
+        
+        logger.info(f"Using {len(vectors)} precomputed embeddings from {file_path}")
+        self.upload_vectors(list(range(len(properties))), vectors,
+                            [build_property_payload(prop) for prop in properties],
+                            batch_size=batch_size, parallel=parallel,
+                            texts=[prop.get("text_chunk") or "" for prop in properties])
+        return len(properties)
     
     def insert_data(self, points: List[PointStruct], batch_size: int = 100) -> None:
         """
@@ -353,6 +711,7 @@ class PremiereSuitesVectorDB:
                 )
                 logger.info(f"Inserted batch {i//batch_size + 1}/{(total_points + batch_size - 1)//batch_size}")
             
+            self.mark_collection_changed()
             logger.info("Data insertion completed successfully")
             
         except Exception as e:
@@ -365,7 +724,11 @@ class PremiereSuitesVectorDB:
                          city: Optional[str] = None,
                          min_rating: Optional[float] = None,
                          pet_friendly: Optional[bool] = None,
-                         bedrooms: Optional[int] = None) -> List[Dict[str, Any]]:
+                         bedrooms: Optional[int] = None,
+                         hybrid: Optional[bool] = None,
+                         reranker: Optional[Any] = None,
+                         rerank_candidates: Optional[int] = None,
+                         facets: Optional[bool] = None) -> List[Dict[str, Any]]:
         """
         Search for properties using semantic similarity and filters.
         
@@ -376,62 +739,344 @@ class PremiereSuitesVectorDB:
             min_rating: Minimum rating filter
             pet_friendly: Pet friendly filter
             bedrooms: Number of bedrooms filter
+            hybrid: Fuse dense and BM25 results (defaults to the instance setting);
+                scores are then RRF scores rather than similarities
+            reranker: Optional CrossEncoderReranker that rescores the candidates
+            rerank_candidates: Candidates fetched for the reranker (default: 4 * limit)
+            facets: Weight the name, amenities and description vectors by query
+                (defaults to the instance setting); scores are then RRF scores
             
         Returns:
             List of search results with scores
         """
         try:
             # Generate query embedding
-            query_embedding = self.model.encode([query])[0].tolist()
+            query_embedding = self.generate_query_embedding(query)
             
             # Build filter
-            filter_conditions = []
+            filter_dict = property_filter_dict(city, min_rating, pet_friendly, bedrooms)
+            
+            # Fetch extra candidates when a reranker picks the final results
+            final_limit = limit
+            if reranker is not None:
+                limit = rerank_candidates or 4 * limit
+            
+            # Plan which vectors to search
+            use_hybrid = self.hybrid if hybrid is None else hybrid
+            use_facets = self.facet_vectors if facets is None else facets
+            vector_weights = self.plan_facets(query) if use_facets else {COMBINED_VECTOR: 1.0}
+            fused = use_hybrid or len(vector_weights) > 1
+            
+            # Perform search (dense searches of small collections run in-process)
+            if fused:
+                search_results = self.fused_query(query, vector_weights, limit=limit,
+                                                  query_filter=compile_filter(filter_dict),
+                                                  query_embedding=query_embedding,
+                                                  sparse_weight=1.0 if use_hybrid else None)
+            else:
+                search_results = self.dense_query(query_embedding, limit=limit, filter_dict=filter_dict)
+            
+            # Format results
+            results = [format_property_result(result) for result in search_results]
+            
+            if reranker is not None:
+                # Imported here so plain searches do not load sentence-transformers
+                try:
+                    from .reranker import property_document_text
+                except ImportError:
+                    from reranker import property_document_text
+                results = reranker.rerank(query, results, text_for=property_document_text,
+                                          id_key="property_id", limit=final_limit)
+            
+            return results
             
-            if city:
-                filter_conditions.append(FieldCondition(key="city", match=MatchValue(value=city)))
+        except Exception as e:
+            logger.error(f"Error searching properties: {e}")
+            raise
+    
+    def dense_query(self,
+                    query_embedding: List[float],
+                    limit: int = 10,
+                    query_filter: Optional[Filter] = None,
+                    score_threshold: Optional[float] = None,
+                    vector_name: str = COMBINED_VECTOR,
+                    with_payload: Any = True,
+                    filter_dict: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        Nearest neighbours of a query embedding in one dense vector.
+        
+        Searches of the combined vector are answered by the in-process exact
+        index when the collection is small enough (see get_exact_index).
+        
+        Args:
+            query_embedding: Dense query embedding
+            limit: Maximum number of results to return
+            query_filter: Qdrant filter
+            score_threshold: Minimum similarity score
+            vector_name: Vector to search (COMBINED_VECTOR or a facet)
+            with_payload: Payload to return (True or a list of keys)
+            filter_dict: Mongo-like filter (see vector_db.filters), used instead of
+                query_filter; unlike it, the exact index can evaluate it
             
-            if min_rating is not None:
-                filter_conditions.append(FieldCondition(key="rating", range=models.Range(gte=min_rating)))
+        Returns:
+            Scored points, most similar first
+        """
+        # Compiled even for the exact index, so invalid filters fail the same way
+        compiled_filter = query_filter if query_filter is not None else compile_filter(filter_dict)
+        if query_filter is None and vector_name == COMBINED_VECTOR:
+            exact_index = self.get_exact_index()
+            points = exact_index.try_search(query_embedding, limit=limit, filter_dict=filter_dict,
+                                            score_threshold=score_threshold) if exact_index else None
+            if points is not None:
+                if isinstance(with_payload, list):
+                    for point in points:
+                        point.payload = {key: point.payload[key] for key in with_payload if key in point.payload}
+                return points
+        
+        response = self.client.query_points(
+            collection_name=self.collection_name,
+            query=query_embedding,
+            using=vector_name or None,
+            query_filter=compiled_filter,
+            limit=limit,
+            score_threshold=score_threshold,
+            with_payload=with_payload
+        )
+        return response.points
+    
+    def hybrid_query(self,
+                     query: str,
+                     limit: int = 10,
+                     query_filter: Optional[Filter] = None,
+                     score_threshold: Optional[float] = None,
+                     prefetch_limit: Optional[int] = None,
+                     query_embedding: Optional[List[float]] = None) -> List[Any]:
+        """
+        Dense and BM25 search fused with reciprocal rank fusion in one Qdrant query.
+        
+        Args:
+            query: Search query text
+            limit: Maximum number of results to return
+            query_filter: Filter applied to both candidate lists
+            score_threshold: Minimum dense similarity for a dense candidate
+                (sparse candidates are kept on exact term matches alone)
+            prefetch_limit: Candidates per vector (defaults to 2 * limit)
+            query_embedding: Precomputed dense query embedding
             
-            if pet_friendly is not None:
-                filter_conditions.append(FieldCondition(key="pet_friendly", match=MatchValue(value=pet_friendly)))
+        Returns:
+            Scored points ordered by fused score
+        """
+        return self.fused_query(query, {COMBINED_VECTOR: 1.0}, limit=limit, query_filter=query_filter,
+                                score_threshold=score_threshold, prefetch_limit=prefetch_limit,
+                                query_embedding=query_embedding, sparse_weight=1.0)
+    
+    def fused_query(self,
+                    query: str,
+                    vector_weights: Dict[str, float],
+                    limit: int = 10,
+                    query_filter: Optional[Filter] = None,
+                    score_threshold: Optional[float] = None,
+                    prefetch_limit: Optional[int] = None,
+                    query_embedding: Optional[List[float]] = None,
+                    sparse_weight: Optional[float] = None) -> List[Any]:
+        """
+        Search several vectors with one query embedding and fuse the results with weighted RRF.
+        
+        Args:
+            query: Search query text
+            vector_weights: RRF weight per dense vector (COMBINED_VECTOR or a facet)
+            limit: Maximum number of results to return
+            query_filter: Filter applied to every candidate list
+            score_threshold: Minimum dense similarity for a dense candidate
+            prefetch_limit: Candidates per vector (defaults to 2 * limit)
+            query_embedding: Precomputed dense query embedding
+            sparse_weight: Also search the BM25 vector with this weight
             
-            if bedrooms is not None:
-                filter_conditions.append(FieldCondition(key="bedrooms", match=MatchValue(value=bedrooms)))
+        Returns:
+            Scored points ordered by fused score
+        """
+        if query_embedding is None:
+            query_embedding = self.generate_query_embedding(query)
+        prefetch_limit = prefetch_limit or 2 * limit
+        
+        prefetch = []
+        weights = []
+        for name, weight in vector_weights.items():
+            prefetch.append(models.Prefetch(query=query_embedding, using=name or None, filter=query_filter,
+                                            limit=prefetch_limit, score_threshold=score_threshold))
+            weights.append(weight)
+        if sparse_weight:
+            sparse_query = self.sparse_encoder.encode_query(query)
+            if sparse_query.indices:
+                prefetch.append(models.Prefetch(query=sparse_query, using=SPARSE_VECTOR_NAME,
+                                                filter=query_filter, limit=prefetch_limit))
+                weights.append(sparse_weight)
+        
+        if all(weight == 1.0 for weight in weights):
+            fusion = models.FusionQuery(fusion=models.Fusion.RRF)
+        else:
+            fusion = models.RrfQuery(rrf=models.Rrf(weights=weights))
+        
+        response = self.client.query_points(
+            collection_name=self.collection_name,
+            prefetch=prefetch,
+            query=fusion,
+            limit=limit,
+            with_payload=True
+        )
+        return response.points
+    
+    def plan_facets(self, query: str) -> Dict[str, float]:
+        """
+        Vector weights for a property query, using the collection's own
+        amenities and property names as the planner vocabulary.
+        
+        Args:
+            query: Search query text
             
-            search_filter = Filter(must=filter_conditions) if filter_conditions else None
+        Returns:
+            Mapping of vector name to RRF weight (see property_facets.plan_facets)
+        """
+        try:
+            amenity_terms = DEFAULT_AMENITY_TERMS | vocabulary(self.get_facet_counts("amenities"))
+            cities = vocabulary(self.get_facet_counts("city"))
+            name_terms = vocabulary(self.get_facet_counts("property_name"),
+                                    exclude=GENERIC_NAME_TERMS | cities)
+        except Exception as e:
+            logger.warning(f"Facet vocabulary unavailable, planning with the default terms: {e}")
+            amenity_terms, name_terms = DEFAULT_AMENITY_TERMS, set()
+        
+        weights = plan_facets(query, amenity_terms, name_terms)
+        logger.debug(f"Facet plan for '{query}': {weights}")
+        return weights
+    
+    def get_facet_counts(self, field_name: str, limit: int = 1000,
+                         use_cache: bool = True) -> Dict[Any, int]:
+        """
+        Count the distinct values of a payload field across the collection.
+        
+        Uses Qdrant's facet API, which is answered from the keyword payload index
+        without transferring payloads. Servers or clients without facet support,
+        and fields with more distinct values than the facet limit, fall back to
+        a paginated scroll that only fetches the requested field, so the counts
+        are always complete. Results are cached until the next ingest.
+        
+        Args:
+            field_name: Payload field to aggregate (list fields count each element)
+            limit: Distinct values requested from the facet API before falling
+                back to a full scroll
+            use_cache: Whether to serve a previously computed result
             
-            # Perform search
-            search_results = self.client.search(
+        Returns:
+            Dictionary mapping each value to the number of points containing it
+        """
+        if use_cache and field_name in self._facet_cache:
+            return dict(self._facet_cache[field_name])
+        
+        try:
+            response = self.client.facet(
                 collection_name=self.collection_name,
-                query_vector=query_embedding,
+                key=field_name,
                 limit=limit,
-                query_filter=search_filter,
-                with_payload=True
+                exact=True
+            )
+            counts = {hit.value: hit.count for hit in response.hits}
+            if len(counts) >= limit:
+                # The facet API may have cut off values; count them all instead
+                logger.info(f"Facet '{field_name}' has at least {limit} values, counting them with scroll")
+                counts = self._scroll_facet_counts(field_name)
+        except Exception as e:
+            logger.info(f"Facet API unavailable for '{field_name}', falling back to scroll: {e}")
+            counts = self._scroll_facet_counts(field_name)
+        
+        self._facet_cache[field_name] = counts
+        return dict(counts)
+    
+    def _scroll_facet_counts(self, field_name: str, page_size: int = 1000) -> Dict[Any, int]:
+        """Aggregate a payload field by scrolling every page of the collection."""
+        counts: Dict[Any, int] = {}
+        offset = None
+        
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=page_size,
+                offset=offset,
+                with_payload=[field_name],
+                with_vectors=False
             )
             
-            # Format results
-            results = []
-            for result in search_results:
-                results.append({
-                    "score": result.score,
-                    "property_id": result.payload.get("property_id"),
-                    "property_name": result.payload.get("property_name"),
-                    "city": result.payload.get("city"),
-                    "rating": result.payload.get("rating"),
-                    "description": result.payload.get("description"),
-                    "amenities": result.payload.get("amenities", []),
-                    "pet_friendly": result.payload.get("pet_friendly"),
-                    "bedrooms": result.payload.get("bedrooms"),
-                    "source_url": result.payload.get("source_url"),
-                    "image_url": result.payload.get("image_url")
-                })
+            for point in points:
+                value = (point.payload or {}).get(field_name)
+                values = value if isinstance(value, list) else [value]
+                for item in values:
+                    if item is None or item == "":
+                        continue
+                    counts[item] = counts.get(item, 0) + 1
             
-            return results
+            if offset is None:
+                break
+        
+        return counts
+    
+    def invalidate_facet_cache(self) -> None:
+        """Drop cached facet counts after the collection contents change."""
+        self._facet_cache.clear()
+    
+    def mark_collection_changed(self) -> None:
+        """Invalidate facet counts and bump the collection version after an ingest."""
+        self.invalidate_facet_cache()
+        bump_collection_version(self.collection_name)
+    
+    def get_exact_index(self) -> Optional[ExactSearchIndex]:
+        """
+        Get the in-process exact search index, loading or refreshing it as needed.
+        
+        The index is reloaded when the collection version changes (an ingest in
+        this process) or after exact_search_refresh seconds, and keeps whole
+        payloads so it can return any collection's result fields. Collections
+        larger than exact_search_max_points are searched in Qdrant instead.
+        
+        Returns:
+            ExactSearchIndex, or None if exact search is disabled or the collection is too large
+        """
+        if self.exact_search_max_points <= 0:
+            return None
+        
+        version = get_collection_version(self.collection_name)
+        index = self._exact_index
+        if index is not None and index.version == version \
+                and time.monotonic() - index.loaded_at < self.exact_search_refresh:
+            return index
+        
+        # Avoid re-counting a too-large collection on every search
+        if self._exact_index_checked is not None:
+            checked_version, checked_at = self._exact_index_checked
+            if checked_version == version and time.monotonic() - checked_at < self.exact_search_refresh:
+                return None
+        
+        try:
+            count = self.client.count(collection_name=self.collection_name, exact=True).count
+            if count > self.exact_search_max_points:
+                logger.info(f"Collection '{self.collection_name}' has {count} points, using Qdrant search")
+                self._exact_index = None
+                self._exact_index_checked = (version, time.monotonic())
+                return None
+            
+            self._exact_index = ExactSearchIndex.load(
+                self.client,
+                self.collection_name,
+                with_payload=True,
+                vector_name=COMBINED_VECTOR if self.hybrid or self.facet_vectors else None,
+                version=version
+            )
+            self._exact_index_checked = None
+            return self._exact_index
             
         except Exception as e:
-            logger.error(f"Error searching properties: {e}")
-            raise
+            logger.warning(f"Exact search index unavailable, using Qdrant search: {e}")
+            self._exact_index = None
+            return None
     
     def get_collection_info(self) -> Dict[str, Any]:
         """
@@ -442,18 +1087,48 @@ class PremiereSuitesVectorDB:
         """
         try:
             info = self.client.get_collection(self.collection_name)
+            vectors = info.config.params.vectors
+            if isinstance(vectors, dict):
+                vectors = vectors[COMBINED_VECTOR]
             return {
                 "name": self.collection_name,  # Use the collection name we know
-                "vectors_count": info.vectors_count,
+                # Clients >= 1.17 no longer report vectors_count; there is one combined vector per point
+                "vectors_count": info.points_count,
                 "points_count": info.points_count,
                 "segments_count": info.segments_count,
-                "vector_size": info.config.params.vectors.size,
-                "distance": info.config.params.vectors.distance,
-                "on_disk": info.config.params.vectors.on_disk
+                "vector_size": vectors.size,
+                "distance": vectors.distance,
+                "on_disk": vectors.on_disk
             }
         except Exception as e:
             logger.error(f"Error getting collection info: {e}")
             raise
+    
+    def get_collection_stats(self, file_path: str, top: int = 10) -> Dict[str, Any]:
+        """
+        Property statistics for the data the collection is loaded from.
+        
+        Catalogues are read column by column, so only city, rating,
+        pet_friendly and amenities are decoded.
+        
+        Args:
+            file_path: JSONL data file, or .parquet / .arrow catalogue
+            top: Number of cities and amenities to report
+        
+        Returns:
+            Catalogue statistics (see catalogue_stats) plus the collection's points_count
+        """
+        from services.columnar_catalogue import STATS_COLUMNS, catalogue_stats, is_catalogue, read_catalogue, records_to_table
+        
+        columns = STATS_COLUMNS["property"]
+        if is_catalogue(file_path):
+            table = read_catalogue(file_path, columns=columns)
+        else:
+            table = records_to_table(self.load_data_from_jsonl(file_path), "property").select(columns)
+        
+        stats = catalogue_stats(table, top=top)
+        stats["points_count"] = self.client.count(self.collection_name, exact=True).count
+        return stats
 
 def main():
     """Main function to set up the vector database."""
@@ -485,22 +1160,19 @@ def main():
         # Create collection
         vdb.create_collection(recreate=True)
         
-        # Load data
-        properties = vdb.load_data_from_jsonl("premiere_suites_data.jsonl")
+        # Prefer the columnar catalogue the scraper writes next to the JSONL file
+        data_file = next((path for path in ("premiere_suites_data.parquet", "premiere_suites_data.jsonl")
+                          if Path(path).exists()), "premiere_suites_data.jsonl")
         
-        if not properties:
+        # Embed (or reuse catalogue embeddings) and upload the properties as columns
+        if not vdb.ingest_catalogue(data_file):
             logger.error("No properties found in the data file")
             return
         
-        # Prepare points
-        points = vdb.prepare_points(properties)
-        
-        # Insert data
-        vdb.insert_data(points)
-        
         # Get collection info
         info = vdb.get_collection_info()
         logger.info(f"Collection info: {info}")
+        logger.info(f"Collection stats: {vdb.get_collection_stats(data_file)}")
         
         # Test search
         logger.info("Testing search functionality...")
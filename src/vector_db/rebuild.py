@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Collection Rebuilds for Premiere Suites
+
+One rebuild path for the property and FAQ collections on top of
+PremiereSuitesVectorDB. Every point gets the same payload layout:
+
+    record fields    top level, read by the direct Qdrant searches and indexed
+    id               source record id
+    record_type      "property" or "faq"
+    content          the embedded text
+    metadata         the record fields again, for LangChain's metadata filters
+    content_hash     hash of model, text and fields, used by incremental runs
+    text_hash        hash of model and text, to tell payload-only changes apart
+    ingested_at      when the point was written
+
+Point ids are derived from the record type and id, so a record keeps its point
+across rebuilds. A full rebuild drops and recreates the collection; an
+incremental rebuild compares hashes with the stored points: records with new
+text are embedded and upserted, records whose fields changed but whose text did
+not get a payload update without re-embedding, and points whose record is gone
+are deleted.
+Collections are rebuilt in parallel with one shared embedding stage, and each
+rebuild reports throughput for its load, embed, upsert, payload and delete
+stages.
+"""
+
+import json
+import time
+import uuid
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from qdrant_client.http import models
+
+from .qdrant_setup import PremiereSuitesVectorDB, build_property_payload
+from .property_facets import PROPERTY_FACETS, facet_texts
+from .bulk_upload import DEFAULT_UPLOAD_BATCH_SIZE
+from .embedding_stage import EmbeddingStage
+# Importing qdrant_setup puts src/ on sys.path when needed
+from services.jsonl_loader import load_records
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PROPERTY_COLLECTION = "premiere_suites_properties"
+FAQ_COLLECTION = "premiere_suites_faqs"
+DEFAULT_PROPERTY_FILE = "data/processed/premiere_suites_data.jsonl"
+DEFAULT_FAQ_FILE = "data/processed/premiere_suites_faq_data.jsonl"
+
+# Namespace for the deterministic point ids (uuid5 of "<record_type>:<record id>")
+POINT_ID_NAMESPACE = uuid.UUID("5f0c8a52-3c51-4d7e-9a0e-7d3f2b8e41c6")
+
+# Payload keys left out of the content hash because they change on every run
+_UNHASHED_KEYS = ("ingested_at", "content_hash", "text_hash")
+
+def point_id(record_type: str, record_key: Any) -> str:
+    """Stable point id for a record."""
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{record_type}:{record_key}"))
+
+def property_text(record: Dict[str, Any]) -> str:
+    """Text embedded for a property: its text chunk, page content, or a summary of its fields."""
+    for key in ("text_chunk", "pageContent"):
+        text = record.get(key) or ""
+        if text.strip():
+            return text
+
+    text_parts = []
+    if record.get("property_name"):
+        text_parts.append(f"Property: {record['property_name']}")
+    if record.get("description"):
+        text_parts.append(f"Description: {record['description']}")
+    if record.get("amenities"):
+        text_parts.append(f"Amenities: {', '.join(record['amenities'])}")
+    if record.get("city"):
+        text_parts.append(f"Location: {record['city']}")
+    return " | ".join(text_parts) if text_parts else f"Property {record.get('id', 'Unknown')}"
+
+def faq_text(record: Dict[str, Any]) -> str:
+    """Text embedded for an FAQ entry: its content, text chunk, or question and answer."""
+    for key in ("content", "text_chunk"):
+        text = record.get(key) or ""
+        if text.strip():
+            return text
+    return f"Q: {record.get('question', '')}\nA: {record.get('answer', '')}"
+
+def property_payload(record: Dict[str, Any], text: str) -> Dict[str, Any]:
+    """Payload stored for a property."""
+    fields = build_property_payload(record)
+    ingested_at = fields.pop("ingested_at")
+    metadata = {key: value for key, value in fields.items() if key != "text_chunk"}
+    return {**fields, "id": record.get("id"), "record_type": "property", "content": text,
+            "metadata": metadata, "ingested_at": ingested_at}
+
+def faq_payload(record: Dict[str, Any], text: str) -> Dict[str, Any]:
+    """Payload stored for an FAQ entry."""
+    fields = {
+        "faq_id": record.get("id"),
+        "question": record.get("question", ""),
+        "answer": record.get("answer", ""),
+        "category": record.get("category", ""),
+        "tags": record.get("tags", []),
+        "source_url": record.get("source_url", ""),
+    }
+    return {**fields, "id": record.get("id"), "record_type": "faq", "content": text,
+            "metadata": dict(fields), "ingested_at": datetime.now().isoformat()}
+
+# Text and payload builder per record type
+RECORD_BUILDERS = {
+    "property": (property_text, property_payload),
+    "faq": (faq_text, faq_payload),
+}
+
+def content_hash(payload: Dict[str, Any], model_name: str) -> str:
+    """Hash of everything a point is built from (model, text and fields)."""
+    stable = {key: value for key, value in payload.items() if key not in _UNHASHED_KEYS}
+    data = json.dumps([model_name, stable], sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+def text_hash(text: str, model_name: str) -> str:
+    """Hash of what a vector is computed from (model and text)."""
+    return hashlib.sha256(f"{model_name}\n{text}".encode("utf-8")).hexdigest()
+
+def build_points(records: List[Dict[str, Any]], record_type: str,
+                 model_name: str) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """
+    Text and payload of every point for a set of records.
+
+    Args:
+        records: Source records of one type
+        record_type: "property" or "faq"
+        model_name: Embedding model (part of the content hash)
+
+    Returns:
+        Mapping of point id to (text, payload); a repeated record id keeps the last record
+    """
+    if record_type not in RECORD_BUILDERS:
+        raise ValueError(f"Unknown record type: {record_type} (use one of {sorted(RECORD_BUILDERS)})")
+    text_for, payload_for = RECORD_BUILDERS[record_type]
+
+    points: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    for record in records:
+        text = text_for(record)
+        record_key = record.get("id")
+        if record_key is None:
+            record_key = "sha1:" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+        payload = payload_for(record, text)
+        payload["content_hash"] = content_hash(payload, model_name)
+        payload["text_hash"] = text_hash(text, model_name)
+        points[point_id(record_type, record_key)] = (text, payload)
+    return points
+
+def stored_hashes(vdb: PremiereSuitesVectorDB,
+                  page_size: int = 1000) -> Dict[Any, Tuple[Optional[str], Optional[str]]]:
+    """(content hash, text hash) of every point in the collection (None where a point has none)."""
+    hashes: Dict[Any, Tuple[Optional[str], Optional[str]]] = {}
+    offset = None
+    while True:
+        points, offset = vdb.client.scroll(
+            collection_name=vdb.collection_name,
+            limit=page_size,
+            offset=offset,
+            with_payload=["content_hash", "text_hash"],
+            with_vectors=False
+        )
+        for point in points:
+            payload = point.payload or {}
+            hashes[point.id] = (payload.get("content_hash"), payload.get("text_hash"))
+        if offset is None:
+            return hashes
+
+def overwrite_payloads(vdb: PremiereSuitesVectorDB, payloads: Dict[Any, Dict[str, Any]],
+                       batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE) -> None:
+    """Replace the payload of existing points, batch_size points per request, keeping their vectors."""
+    items = list(payloads.items())
+    for start in range(0, len(items), batch_size):
+        vdb.client.batch_update_points(
+            collection_name=vdb.collection_name,
+            update_operations=[
+                models.OverwritePayloadOperation(
+                    overwrite_payload=models.SetPayload(payload=payload, points=[pid])
+                )
+                for pid, payload in items[start:start + batch_size]
+            ],
+            wait=True
+        )
+    if items:
+        vdb.mark_collection_changed()
+
+def _stage(count: int, seconds: float) -> Dict[str, Any]:
+    """Item count, duration and throughput of one rebuild stage."""
+    return {
+        "items": count,
+        "seconds": round(seconds, 3),
+        "items_per_second": round(count / seconds, 1) if seconds > 0 else None,
+    }
+
+def rebuild_collection(vdb: PremiereSuitesVectorDB, record_type: str, file_path: str,
+                       stage: EmbeddingStage, incremental: bool = False,
+                       batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE, parallel: int = 1) -> Dict[str, Any]:
+    """
+    Rebuild one collection from a JSONL data file.
+
+    Args:
+        vdb: Vector database for the collection
+        record_type: "property" or "faq"
+        file_path: JSONL data file
+        stage: Shared embedding stage
+        incremental: Only embed records with new text, update the payload of
+            records whose fields changed and delete removed ones, instead of
+            dropping and recreating the collection
+        batch_size: Points per upload request
+        parallel: Upload workers
+
+    Returns:
+        Report with point counts and per-stage throughput
+    """
+    report: Dict[str, Any] = {
+        "collection": vdb.collection_name,
+        "record_type": record_type,
+        "mode": "incremental" if incremental else "full",
+        "stages": {},
+    }
+
+    started = time.perf_counter()
+    records = load_records(file_path, record_type)
+    points = build_points(records, record_type, stage.model_name)
+    report["stages"]["load"] = _stage(len(records), time.perf_counter() - started)
+
+    vdb.create_collection(recreate=not incremental)
+    # Index the metadata copy as well so LangChain filters do not scan
+    vdb._create_indexes(key_prefix="metadata.")
+
+    # Facet vectors are embedded from payload fields, so any change re-embeds
+    facets = record_type == "property" and vdb.facet_vectors
+    removed: List[Any] = []
+    payload_only: Dict[str, Dict[str, Any]] = {}
+    if incremental:
+        stored = stored_hashes(vdb)
+        changed = []
+        for pid, (_, payload) in points.items():
+            stored_content, stored_text = stored.get(pid, (None, None))
+            if stored_content == payload["content_hash"]:
+                continue
+            if stored_text == payload["text_hash"] and not facets:
+                payload_only[pid] = payload
+            else:
+                changed.append(pid)
+        removed = [pid for pid in stored if pid not in points]
+    else:
+        changed = list(points)
+
+    started = time.perf_counter()
+    vectors = stage.encode([points[pid][0] for pid in changed], label=record_type)
+    facet_vectors = None
+    if facets:
+        texts = [facet_texts(points[pid][1], points[pid][0]) for pid in changed]
+        facet_vectors = {
+            facet: stage.encode([text[facet] for text in texts], label=f"{record_type}:{facet}")
+            for facet in PROPERTY_FACETS
+        }
+    report["stages"]["embed"] = _stage(len(changed), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    if changed:
+        vdb.upload_vectors(changed, vectors, [points[pid][1] for pid in changed],
+                           batch_size=batch_size, parallel=parallel,
+                           texts=[points[pid][0] for pid in changed], facet_vectors=facet_vectors)
+    report["stages"]["upsert"] = _stage(len(changed), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    overwrite_payloads(vdb, payload_only, batch_size=batch_size)
+    report["stages"]["payload"] = _stage(len(payload_only), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    if removed:
+        vdb.client.delete(
+            collection_name=vdb.collection_name,
+            points_selector=models.PointIdsList(points=removed),
+            wait=True
+        )
+        vdb.mark_collection_changed()
+    report["stages"]["delete"] = _stage(len(removed), time.perf_counter() - started)
+
+    report.update({
+        "records": len(records),
+        "points": len(points),
+        "upserted": len(changed),
+        "payload_updated": len(payload_only),
+        "unchanged": len(points) - len(changed) - len(payload_only),
+        "deleted": len(removed),
+    })
+    logger.info(f"Rebuilt {vdb.collection_name} ({report['mode']}): {report['upserted']} upserted, "
+                f"{report['payload_updated']} payload updates, {report['unchanged']} unchanged, "
+                f"{report['deleted']} deleted")
+    return report
+
+def rebuild_collections(targets: List[Tuple[PremiereSuitesVectorDB, str, str]], stage: EmbeddingStage,
+                        incremental: bool = False, concurrent: bool = True,
+                        batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE, parallel: int = 1) -> List[Dict[str, Any]]:
+    """
+    Rebuild several collections, in parallel unless concurrent is False.
+
+    Encoding is serialised by the shared stage, so one collection's upload
+    and deletes overlap with the other's embedding.
+
+    Args:
+        targets: (vector database, record type, data file) per collection
+        stage: Shared embedding stage
+        incremental: Diff against the stored points instead of recreating
+        concurrent: Rebuild the collections at the same time
+        batch_size: Points per upload request
+        parallel: Upload workers per collection
+
+    Returns:
+        One report per target, in order
+    """
+    def run(target: Tuple[PremiereSuitesVectorDB, str, str]) -> Dict[str, Any]:
+        vdb, record_type, file_path = target
+        return rebuild_collection(vdb, record_type, file_path, stage, incremental=incremental,
+                                  batch_size=batch_size, parallel=parallel)
+
+    if not concurrent or len(targets) < 2:
+        return [run(target) for target in targets]
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        return list(executor.map(run, targets))
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Cross-Encoder Reranking for FAQ and Property Search
+
+A bi-encoder search ranks candidates by comparing two independently computed
+embeddings; a cross-encoder reads the query and a candidate together and is
+far better at telling the right FAQ from a near miss. CrossEncoderReranker
+rescores the top-N candidates of a search with a small CPU cross-encoder in
+one batched call and reorders them.
+
+Scores are cached per (query, document id), so repeated queries and
+candidates shared between overlapping searches are not scored twice. The
+cache is cleared with invalidate() when the collection changes.
+"""
+
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sentence_transformers import CrossEncoder
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_RERANK_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+# Cross-encoders already loaded in this process, keyed by model name
+_cross_encoders: Dict[str, Any] = {}
+
+def load_cross_encoder(model_name: str) -> Any:
+    """Load a cross-encoder once per process, on the CPU."""
+    if model_name not in _cross_encoders:
+        logger.info(f"Loading cross-encoder: {model_name}")
+        _cross_encoders[model_name] = CrossEncoder(model_name, device="cpu")
+    return _cross_encoders[model_name]
+
+def faq_document_text(result: Dict[str, Any]) -> str:
+    """Text of an FAQ search result that the cross-encoder reads."""
+    return f"{result.get('question') or ''}\n{result.get('answer') or ''}".strip()
+
+def property_document_text(result: Dict[str, Any]) -> str:
+    """Text of a property search result that the cross-encoder reads."""
+    parts = [result.get("property_name"), result.get("city"), result.get("description")]
+    if result.get("amenities"):
+        parts.append(f"Amenities: {', '.join(result['amenities'])}")
+    return " | ".join(part for part in parts if part)
+
+class CrossEncoderReranker:
+    """Rescores search results with a cross-encoder, caching scores per (query, document id)."""
+
+    def __init__(self, model_name: str = DEFAULT_RERANK_MODEL, batch_size: int = 32,
+                 max_cache_entries: int = 10000, model: Optional[Any] = None):
+        """
+        Args:
+            model_name: Sentence-transformers cross-encoder to load
+            batch_size: Query/document pairs per forward pass
+            max_cache_entries: Cached scores kept before the oldest are dropped
+            model: Preloaded cross-encoder (anything with predict(pairs, batch_size=...))
+        """
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_cache_entries = max_cache_entries
+        self.model = model if model is not None else load_cross_encoder(model_name)
+        self._scores: "OrderedDict[Tuple[str, Any], float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.seconds = 0.0
+
+    def score(self, query: str, documents: List[Tuple[Any, str]]) -> List[float]:
+        """
+        Cross-encoder score of each document for a query.
+
+        Args:
+            query: Search query
+            documents: (document id, text) pairs; a None id is never cached
+
+        Returns:
+            One score per document, higher is more relevant
+        """
+        scores: List[Optional[float]] = []
+        missing: List[int] = []
+        for position, (doc_id, _) in enumerate(documents):
+            key = (query, doc_id)
+            if doc_id is not None and key in self._scores:
+                self._scores.move_to_end(key)
+                scores.append(self._scores[key])
+                self.hits += 1
+            else:
+                scores.append(None)
+                missing.append(position)
+
+        if missing:
+            started = time.perf_counter()
+            predicted = self.model.predict([(query, documents[position][1]) for position in missing],
+                                           batch_size=self.batch_size)
+            self.seconds += time.perf_counter() - started
+            self.misses += len(missing)
+            for position, value in zip(missing, predicted):
+                scores[position] = float(value)
+                doc_id = documents[position][0]
+                if doc_id is not None:
+                    self._scores[(query, doc_id)] = float(value)
+            while len(self._scores) > self.max_cache_entries:
+                self._scores.popitem(last=False)
+
+        return scores
+
+    def rerank(self, query: str, results: List[Dict[str, Any]],
+               text_for: Callable[[Dict[str, Any]], str] = faq_document_text,
+               id_key: str = "faq_id", limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Reorder search results by cross-encoder score.
+
+        Args:
+            query: Search query
+            results: Formatted search results (dictionaries)
+            text_for: Text of a result for the cross-encoder
+            id_key: Result key holding the document id used in the score cache
+            limit: Number of results to keep (default: all)
+
+        Returns:
+            Results with a "rerank_score" key, best first; "score" keeps the search score
+        """
+        if not results:
+            return []
+        scores = self.score(query, [(result.get(id_key), text_for(result)) for result in results])
+        reranked = [dict(result, rerank_score=score) for result, score in zip(results, scores)]
+        reranked.sort(key=lambda result: result["rerank_score"], reverse=True)
+        return reranked[:limit] if limit is not None else reranked
+
+    def invalidate(self) -> None:
+        """Drop cached scores, e.g. after the collection was re-ingested."""
+        self._scores.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "cached_scores": len(self._scores),
+            "hits": self.hits,
+            "misses": self.misses,
+            "seconds": round(self.seconds, 3),
+        }
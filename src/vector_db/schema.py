@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Payload Index Schemas for Premiere Suites Collections
+
+Declares the filterable payload fields of each collection and their index
+types. Index creation in PremiereSuitesVectorDB is driven by these schemas,
+and the audit helpers report filters that would run without an index (and
+therefore force a full scan in Qdrant).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from qdrant_client.http import models
+
+PROPERTY_PAYLOAD_SCHEMA: Dict[str, models.PayloadSchemaType] = {
+    "city": models.PayloadSchemaType.KEYWORD,
+    "rating": models.PayloadSchemaType.FLOAT,
+    "pet_friendly": models.PayloadSchemaType.BOOL,
+    "bedrooms": models.PayloadSchemaType.INTEGER,
+    "room_type": models.PayloadSchemaType.KEYWORD,
+    # Faceted by plan_facets to build the planner vocabulary
+    "amenities": models.PayloadSchemaType.KEYWORD,
+    "property_name": models.PayloadSchemaType.KEYWORD,
+}
+
+FAQ_PAYLOAD_SCHEMA: Dict[str, models.PayloadSchemaType] = {
+    "category": models.PayloadSchemaType.KEYWORD,
+    "tags": models.PayloadSchemaType.KEYWORD,
+}
+
+COLLECTION_SCHEMAS: Dict[str, Dict[str, models.PayloadSchemaType]] = {
+    "premiere_suites_properties": PROPERTY_PAYLOAD_SCHEMA,
+    "premiere_suites_faqs": FAQ_PAYLOAD_SCHEMA,
+}
+
+
+def get_collection_schema(collection_name: str) -> Dict[str, models.PayloadSchemaType]:
+    """
+    Get the payload index schema for a collection.
+
+    Collections not listed in COLLECTION_SCHEMAS (e.g. test collections) are
+    matched by name: anything containing "faq" uses the FAQ schema, everything
+    else the property schema.
+
+    Args:
+        collection_name: Name of the Qdrant collection
+
+    Returns:
+        Mapping of payload field name to index type
+    """
+    if collection_name in COLLECTION_SCHEMAS:
+        return dict(COLLECTION_SCHEMAS[collection_name])
+    if "faq" in collection_name.lower():
+        return dict(FAQ_PAYLOAD_SCHEMA)
+    return dict(PROPERTY_PAYLOAD_SCHEMA)
+
+
+def filter_keys(query_filter: Optional[Any]) -> List[str]:
+    """
+    Collect every payload key referenced by a Qdrant filter.
+
+    Args:
+        query_filter: models.Filter (possibly nested), or None
+
+    Returns:
+        Sorted list of distinct payload keys
+    """
+    keys = set()
+    pending = [query_filter] if query_filter is not None else []
+
+    while pending:
+        current = pending.pop()
+        if isinstance(current, models.Filter):
+            for clause in (current.must, current.should, current.must_not):
+                if clause is None:
+                    continue
+                pending.extend(clause if isinstance(clause, list) else [clause])
+        elif isinstance(current, models.FieldCondition):
+            keys.add(current.key)
+
+    return sorted(keys)
+
+
+def find_unindexed_fields(fields: Iterable[str], indexed_fields: Iterable[str]) -> List[str]:
+    """
+    Report filter fields that have no payload index.
+
+    Args:
+        fields: Payload keys used in filters
+        indexed_fields: Payload keys that have an index in the collection
+
+    Returns:
+        Sorted list of fields that would be filtered with a full scan
+    """
+    indexed = set(indexed_fields)
+    return sorted(set(fields) - indexed)
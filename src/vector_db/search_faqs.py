@@ -10,7 +10,13 @@ import os
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
-from qdrant_setup import PremiereSuitesVectorDB
+try:
+    from .qdrant_setup import PremiereSuitesVectorDB
+    from .filters import compile_filter
+except ImportError:
+    # Running as a script
+    from qdrant_setup import PremiereSuitesVectorDB
+    from filters import compile_filter
 
 # Load environment variables from .env file
 load_dotenv()
@@ -23,7 +29,10 @@ def search_faqs(vdb: PremiereSuitesVectorDB,
                 query: str, 
                 limit: int = 5,
                 category: Optional[str] = None,
-                min_score: float = 0.5) -> List[Dict[str, Any]]:
+                min_score: float = 0.5,
+                hybrid: Optional[bool] = None,
+                reranker: Optional[Any] = None,
+                rerank_candidates: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Search for FAQs using semantic similarity.
     
@@ -32,33 +41,38 @@ def search_faqs(vdb: PremiereSuitesVectorDB,
         query: Search query
         limit: Maximum number of results
         category: Filter by category
-        min_score: Minimum similarity score
+        min_score: Minimum similarity score (for hybrid search, of the dense candidates)
+        hybrid: Fuse dense and BM25 results so exact terms ("WI-FI", "parking")
+            rank well (defaults to the vector database setting)
+        reranker: Optional CrossEncoderReranker that rescores the candidates
+        rerank_candidates: Candidates fetched for the reranker (default: 4 * limit)
         
     Returns:
         List of search results
     """
     try:
         # Build filter if category is specified
-        filter_condition = None
-        if category:
-            from qdrant_client.models import FieldCondition, MatchValue, Filter
-            filter_condition = Filter(
-                must=[
-                    FieldCondition(
-                        key="category",
-                        match=MatchValue(value=category)
-                    )
-                ]
-            )
+        filter_dict = {"category": category} if category else None
+        
+        # Fetch extra candidates when a reranker picks the final results
+        search_limit = (rerank_candidates or 4 * limit) if reranker is not None else limit
         
         # Perform search
-        results = vdb.client.search(
-            collection_name=vdb.collection_name,
-            query_vector=vdb.generate_query_embedding(query),
-            limit=limit,
-            query_filter=filter_condition,
-            score_threshold=min_score
-        )
+        if vdb.hybrid if hybrid is None else hybrid:
+            results = vdb.hybrid_query(
+                query,
+                limit=search_limit,
+                query_filter=compile_filter(filter_dict),
+                score_threshold=min_score
+            )
+        else:
+            # Small FAQ collections are searched in-process (see exact_search_max_points)
+            results = vdb.dense_query(
+                vdb.generate_query_embedding(query),
+                limit=search_limit,
+                filter_dict=filter_dict,
+                score_threshold=min_score
+            )
         
         # Format results
         formatted_results = []
@@ -72,6 +86,9 @@ def search_faqs(vdb: PremiereSuitesVectorDB,
                 "tags": result.payload.get("tags", [])
             })
         
+        if reranker is not None:
+            formatted_results = reranker.rerank(query, formatted_results, limit=limit)
+        
         return formatted_results
         
     except Exception as e:
@@ -184,6 +201,8 @@ def main():
                        help="Run example searches instead of interactive mode")
     parser.add_argument("--query", help="Run a single search query")
     parser.add_argument("--limit", type=int, default=5, help="Number of results (default: 5)")
+    parser.add_argument("--hybrid", action="store_true",
+                       help="Fuse dense and BM25 keyword results (the collection must be built with hybrid enabled)")
     
     args = parser.parse_args()
     
@@ -218,13 +237,15 @@ def main():
                 qdrant_api_key=qdrant_api_key,
                 collection_name=args.collection,
                 embedding_model=os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
-                use_cloud=True
+                use_cloud=True,
+                hybrid=args.hybrid or None
             )
         else:
             print("✅ Using local Qdrant instance")
             vdb = PremiereSuitesVectorDB(
                 collection_name=args.collection,
-                embedding_model=os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+                embedding_model=os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
+                hybrid=args.hybrid or None
             )
         
         # Check if collection exists
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Semantic Answer Cache for the Concierge FAQ Path
+
+Most concierge FAQ traffic is paraphrases of the same few dozen questions.
+SemanticAnswerCache keeps recent query embeddings with the FAQ answer they
+resolved to and serves a new query straight from memory when it is a
+near-duplicate (cosine similarity above a threshold). Exact repeats of a
+normalised query are answered without computing an embedding at all.
+
+CachedFAQAnswerer wraps a PremiereSuitesVectorDB for the FAQ collection and
+mirrors the concierge flow: embed, search with score_threshold 0.75, return the
+top answer. The cache is dropped whenever the FAQ collection is re-ingested.
+With a cross-encoder reranker, candidates below the score threshold but above
+a lower candidate threshold are rescored, and a confident reranked top FAQ is
+answered locally instead of falling through to the LLM classifier.
+
+The cross-encoder confidence threshold is on the model's own score scale
+(logits or sigmoid probabilities, depending on its activation), so it should
+be calibrated with calibrate_rerank_threshold() on labelled queries held out
+from any other tuning (scripts/calibrate_rerank_threshold.py).
+"""
+
+import re
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .qdrant_setup import PremiereSuitesVectorDB, get_collection_version
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.]+$")
+
+def normalize_query(query: str) -> str:
+    """Normalise a query for exact-repeat lookups (case, whitespace, trailing punctuation)."""
+    return _TRAILING_PUNCTUATION.sub("", _WHITESPACE.sub(" ", query.strip().lower()))
+
+class SemanticAnswerCache:
+    """
+    Fixed-size cache of (query embedding, answer) pairs with cosine lookup.
+
+    Embeddings are stored L2-normalised in one contiguous float32 matrix, so a
+    lookup is a single matrix-vector product over the live entries. When full,
+    the oldest entry is overwritten.
+    """
+
+    def __init__(self, dimension: int, threshold: float = 0.92, max_entries: int = 1024,
+                 ttl: Optional[float] = 3600.0):
+        """
+        Args:
+            dimension: Embedding dimension
+            threshold: Minimum cosine similarity for a semantic hit
+            max_entries: Maximum number of cached queries
+            ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        self.dimension = dimension
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._vectors = np.zeros((max_entries, dimension), dtype=np.float32)
+        self._answers: List[Optional[Dict[str, Any]]] = [None] * max_entries
+        self._expires = np.full(max_entries, -np.inf)
+        self._texts: "OrderedDict[str, int]" = OrderedDict()
+        self._slot_texts: Dict[int, List[str]] = {}
+        self._next_slot = 0
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._expires > time.monotonic()))
+
+    def get_by_text(self, query: str) -> Optional[Dict[str, Any]]:
+        """Answer for an exact (normalised) repeat of a cached query, without embedding."""
+        slot = self._texts.get(normalize_query(query))
+        if slot is None or self._expires[slot] <= time.monotonic():
+            return None
+        self.hits += 1
+        return self._answers[slot]
+
+    def get(self, query_vector: Any, query: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Answer for the most similar cached query above the threshold.
+
+        Args:
+            query_vector: Query embedding
+            query: Query text; on a hit it is remembered so an exact repeat
+                skips the embedding next time
+
+        Returns:
+            Cached answer dictionary, or None on a miss
+        """
+        vector = self._normalize(query_vector)
+        scores = self._vectors @ vector
+        scores[self._expires <= time.monotonic()] = -np.inf
+
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.semantic_hits += 1
+        if query is not None:
+            self._add_text(query, best)
+        return self._answers[best]
+
+    def put(self, query: str, query_vector: Any, answer: Dict[str, Any]) -> None:
+        """Cache the answer a query resolved to."""
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.max_entries
+
+        # Drop the text keys of the entry being overwritten
+        for text in self._slot_texts.pop(slot, []):
+            if self._texts.get(text) == slot:
+                del self._texts[text]
+
+        self._vectors[slot] = self._normalize(query_vector)
+        self._answers[slot] = answer
+        self._expires[slot] = time.monotonic() + self.ttl if self.ttl is not None else np.inf
+        self._add_text(query, slot)
+
+    def invalidate(self) -> None:
+        """Drop every cached answer."""
+        self._vectors.fill(0.0)
+        self._answers = [None] * self.max_entries
+        self._expires.fill(-np.inf)
+        self._texts.clear()
+        self._slot_texts.clear()
+        self._next_slot = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
+
+    def _add_text(self, query: str, slot: int) -> None:
+        """Map a normalised query text to a cache slot, bounding the number of aliases."""
+        text = normalize_query(query)
+        self._texts[text] = slot
+        self._texts.move_to_end(text)
+        self._slot_texts.setdefault(slot, []).append(text)
+        while len(self._texts) > 4 * self.max_entries:
+            self._texts.popitem(last=False)
+
+    def _normalize(self, vector: Any) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(array)
+        return array / norm if norm > 0 else array
+
+class CachedFAQAnswerer:
+    """Resolves concierge FAQ messages to a single answer, through the semantic cache."""
+
+    def __init__(self, vdb: PremiereSuitesVectorDB, score_threshold: float = 0.75,
+                 cache_threshold: float = 0.92, max_entries: int = 1024,
+                 ttl: Optional[float] = 3600.0, reranker: Optional[Any] = None,
+                 rerank_candidates: int = 10, candidate_threshold: float = 0.5,
+                 rerank_threshold: float = 0.5):
+        """
+        Args:
+            vdb: Vector database for the FAQ collection
+            score_threshold: Minimum Qdrant score for an FAQ to count as the answer
+            cache_threshold: Minimum cosine similarity between queries for a cache hit
+            max_entries: Maximum number of cached queries
+            ttl: Seconds a cached answer stays valid (None for no expiry)
+            reranker: Optional CrossEncoderReranker for the top candidates
+            rerank_candidates: Candidates fetched for the reranker
+            candidate_threshold: Minimum Qdrant score for a candidate to be reranked
+            rerank_threshold: Minimum cross-encoder score for the reranked top FAQ
+                to count as the answer. The default 0.5 is the decision boundary of
+                a sigmoid-activated cross-encoder (sentence-transformers' default for
+                single-score models such as ms-marco-MiniLM-L-6-v2), not a tuned
+                value; use calibrate_rerank_threshold() for a deployment
+        """
+        self.vdb = vdb
+        self.score_threshold = score_threshold
+        self.reranker = reranker
+        self.rerank_candidates = rerank_candidates
+        self.candidate_threshold = candidate_threshold
+        self.rerank_threshold = rerank_threshold
+        self.cache = SemanticAnswerCache(vdb.vector_size, cache_threshold, max_entries, ttl)
+        self._version = get_collection_version(vdb.collection_name)
+
+    def answer(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the FAQ answer for a message.
+
+        Args:
+            query: User message
+
+        Returns:
+            Dictionary with score, faq_id, question, answer, category and a
+            "cached" flag, or None if no FAQ scores above the threshold
+        """
+        self._check_version()
+
+        cached = self.cache.get_by_text(query)
+        if cached is not None:
+            return dict(cached, cached=True)
+
+        query_vector = self.vdb.generate_query_embedding(query)
+        cached = self.cache.get(query_vector, query)
+        if cached is not None:
+            return dict(cached, cached=True)
+
+        if self.reranker is None:
+            results = self.vdb.dense_query(
+                query_vector,
+                limit=1,
+                score_threshold=self.score_threshold,
+                with_payload=["faq_id", "question", "answer", "category"]
+            )
+            if not results:
+                return None
+            answer = self._format(results[0])
+        else:
+            answer = self._rerank_answer(query, query_vector)
+            if answer is None:
+                return None
+
+        self.cache.put(query, query_vector, answer)
+        return dict(answer, cached=False)
+
+    def _rerank_answer(self, query: str, query_vector: Any) -> Optional[Dict[str, Any]]:
+        """
+        Top FAQ after reranking the candidates.
+
+        The reranked top FAQ is the answer when the cross-encoder is confident;
+        otherwise the search top is, as without a reranker, if it clears
+        score_threshold.
+        """
+        top, search_top = self.reranked_top(query, query_vector)
+        if top is None:
+            return None
+        if top["rerank_score"] >= self.rerank_threshold:
+            return top
+        if search_top.score >= self.score_threshold:
+            return self._format(search_top)
+        return None
+
+    def reranked_top(self, query: str, query_vector: Any) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """Reranked top candidate and the search top, or (None, None) without candidates."""
+        results = self.vdb.dense_query(
+            query_vector,
+            limit=self.rerank_candidates,
+            score_threshold=min(self.candidate_threshold, self.score_threshold),
+            with_payload=["faq_id", "question", "answer", "category"]
+        )
+        if not results:
+            return None, None
+        return self.reranker.rerank(query, [self._format(result) for result in results], limit=1)[0], results[0]
+
+    def calibrate_rerank_threshold(self, queries: Sequence[str], faq_ids: Sequence[Any],
+                                   target_precision: float = 0.95) -> float:
+        """
+        Set rerank_threshold from labelled queries.
+
+        The threshold becomes the lowest cross-encoder score at which the
+        reranked answers to the queries are still correct at target_precision,
+        so it follows the score scale of whichever model is loaded.
+
+        Args:
+            queries: User messages, held out from any other tuning
+            faq_ids: Correct FAQ id for each message (None if no FAQ answers it)
+            target_precision: Fraction of reranked answers that must be correct
+
+        Returns:
+            The calibrated threshold (inf if no threshold reaches the target)
+        """
+        if self.reranker is None:
+            raise ValueError("CachedFAQAnswerer has no reranker to calibrate")
+        if len(queries) != len(faq_ids):
+            raise ValueError("queries and faq_ids must have the same length")
+
+        scores, correct = [], []
+        for query, faq_id in zip(queries, faq_ids):
+            top, _ = self.reranked_top(query, self.vdb.generate_query_embedding(query))
+            if top is not None:
+                scores.append(top["rerank_score"])
+                correct.append(faq_id is not None and top["faq_id"] == faq_id)
+
+        self.rerank_threshold = self._calibrate(np.asarray(scores, dtype=np.float64),
+                                                np.asarray(correct, dtype=bool), target_precision)
+        logger.info(f"Calibrated rerank threshold {self.rerank_threshold:.4f} on {len(queries)} queries "
+                    f"({len(scores)} with candidates)")
+        return self.rerank_threshold
+
+    @staticmethod
+    def _calibrate(scores: np.ndarray, correct: np.ndarray, target_precision: float) -> float:
+        """
+        Score threshold that answers the most queries while the answered ones
+        still reach target_precision. The threshold sits halfway to the next,
+        less confident query.
+        """
+        if len(scores) == 0:
+            return float("inf")
+        order = np.argsort(-scores, kind="stable")
+        precision = np.cumsum(correct[order]) / np.arange(1, len(order) + 1)
+
+        confident = np.nonzero(precision >= target_precision)[0]
+        if len(confident) == 0:
+            return float("inf")
+        last = confident[-1]
+        if last + 1 == len(order):
+            return float(scores[order[last]])
+        return float((scores[order[last]] + scores[order[last + 1]]) / 2)
+
+    def _format(self, result: Any) -> Dict[str, Any]:
+        return {
+            "score": result.score,
+            "faq_id": result.payload.get("faq_id"),
+            "question": result.payload.get("question"),
+            "answer": result.payload.get("answer"),
+            "category": result.payload.get("category"),
+        }
+
+    def invalidate(self) -> None:
+        """Drop cached answers, e.g. after the FAQ collection was re-ingested elsewhere."""
+        self.cache.invalidate()
+        if self.reranker is not None:
+            self.reranker.invalidate()
+        self._version = get_collection_version(self.vdb.collection_name)
+
+    def _check_version(self) -> None:
+        """Invalidate when the FAQ collection was re-ingested in this process."""
+        if get_collection_version(self.vdb.collection_name) != self._version:
+            logger.info(f"FAQ collection '{self.vdb.collection_name}' changed, clearing answer cache")
+            self.invalidate()
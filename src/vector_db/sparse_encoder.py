@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Local BM25 Sparse Vectors for Hybrid Search
+
+Dense embeddings blur exact terms: "WI-FI", "parking" or a property name can
+rank below loosely related text. BM25Encoder turns text into a sparse vector
+of term weights, computed locally with no model, which Qdrant stores next to
+the dense vector and searches with an inverted index.
+
+Documents carry the BM25 term-frequency part of the score; queries carry a
+weight of 1 per term. The collection's sparse vector uses Qdrant's IDF
+modifier, so inverse document frequencies are kept up to date by the server
+as points are added and removed, and query scores are full BM25.
+"""
+
+import re
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List
+
+from qdrant_client.http import models
+
+# Name of the sparse vector in hybrid collections (the dense vector stays unnamed)
+SPARSE_VECTOR_NAME = "bm25"
+
+# Words and numbers; hyphens and apostrophes inside a word are kept so "wi-fi" stays one term
+_TOKEN = re.compile(r"[a-z0-9]+(?:['\-][a-z0-9]+)*")
+
+STOPWORDS = frozenset("""
+a an and are as at be but by can do does for from has have how i if in is it its
+me my of on or our so than that the their them there these they this to was we
+what when where which who will with you your
+""".split())
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercased terms of a text, without stopwords.
+
+    Hyphens and apostrophes are dropped inside words ("Wi-Fi" and "wifi" are
+    the same term) and a plural "s" is stripped ("suites" matches "suite").
+    """
+    terms = []
+    for match in _TOKEN.findall(text.lower()):
+        term = match.replace("-", "").replace("'", "")
+        if term in STOPWORDS:
+            continue
+        if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+            term = term[:-1]
+        terms.append(term)
+    return terms
+
+def term_index(term: str) -> int:
+    """Stable sparse index of a term (the same in every process, unlike hash())."""
+    return zlib.crc32(term.encode("utf-8"))
+
+def _sparse_vector(weights: Dict[int, float]) -> models.SparseVector:
+    indices = sorted(weights)
+    return models.SparseVector(indices=indices, values=[weights[index] for index in indices])
+
+class BM25Encoder:
+    """Encodes documents and queries as BM25 sparse vectors."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, avg_length: float = 64.0):
+        """
+        Args:
+            k1: Term-frequency saturation
+            b: Document length normalisation
+            avg_length: Typical document length in terms (FAQ entries and
+                property chunks are short)
+        """
+        self.k1 = k1
+        self.b = b
+        self.avg_length = avg_length
+
+    def encode_document(self, text: str) -> models.SparseVector:
+        """BM25 term-frequency weights of a document."""
+        counts = Counter(term_index(term) for term in tokenize(text))
+        length_norm = 1 - self.b + self.b * sum(counts.values()) / self.avg_length
+        return _sparse_vector({
+            index: tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+            for index, tf in counts.items()
+        })
+
+    def encode_documents(self, texts: Iterable[str]) -> List[models.SparseVector]:
+        """BM25 term-frequency weights of several documents."""
+        return [self.encode_document(text) for text in texts]
+
+    def encode_query(self, text: str) -> models.SparseVector:
+        """Unit weight per distinct query term (IDF is applied by Qdrant)."""
+        return _sparse_vector({term_index(term): 1.0 for term in tokenize(text)})
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the asyncio property vector database
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+pytest.importorskip("sentence_transformers")
+
+from qdrant_client import AsyncQdrantClient
+
+from services.rate_limit import TokenBucket
+from vector_db import async_qdrant_setup
+from vector_db.async_qdrant_setup import AsyncPremiereSuitesVectorDB
+from vector_db.embedding_store import EmbeddingStore
+
+PROPERTIES = [
+    {"id": "1", "property_name": "Maple Tower", "city": "Toronto", "rating": 4.8, "text_chunk": "pool and gym"},
+    {"id": "2", "property_name": "Harbour Suites", "city": "Vancouver", "rating": 4.2, "text_chunk": "quiet harbour view"},
+    {"id": "3", "property_name": "Bay Lofts", "city": "Toronto", "rating": 4.5, "text_chunk": "quiet gym lofts"},
+]
+
+
+class KeywordModel:
+    """Embeds texts by which of a few keywords they mention, recording every text."""
+
+    KEYWORDS = ("gym", "pool", "quiet")
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        return np.array([[0.1] + [float(word in text) for word in self.KEYWORDS] for text in texts])
+
+
+@pytest.fixture
+def make_vdb(monkeypatch):
+    def make(model, use_openai=False, **kwargs):
+        monkeypatch.setattr(async_qdrant_setup, "load_embedding_model",
+                            lambda name: (model, use_openai, 4))
+        vdb = AsyncPremiereSuitesVectorDB(collection_name="test_async_properties",
+                                          embedding_model="fake-model", **kwargs)
+        vdb.client = AsyncQdrantClient(":memory:")
+        return vdb
+
+    yield make
+    asyncio.run(AsyncPremiereSuitesVectorDB.close_all())
+
+
+def test_ingest_and_filtered_search(make_vdb, tmp_path):
+    model = KeywordModel()
+    store = EmbeddingStore(str(tmp_path), "fake-model")
+    vdb = make_vdb(model, embedding_store=store)
+
+    async def run():
+        await vdb.create_collection()
+        await vdb.ingest_properties(PROPERTIES)
+        await vdb.ingest_properties(PROPERTIES)
+        return await asyncio.gather(
+            vdb.search_properties("pool", limit=1),
+            vdb.search_properties("gym", limit=3, city="Toronto", min_rating=4.6),
+            vdb.get_collection_info()
+        )
+
+    pool, toronto, info = asyncio.run(run())
+
+    assert pool[0]["property_name"] == "Maple Tower"
+    assert [result["property_name"] for result in toronto] == ["Maple Tower"]
+    assert info["points_count"] == 3 and info["vector_size"] == 4
+    # The second ingest is served from the store; queries are embedded but never stored
+    assert model.encoded.count("pool and gym") == 1
+    assert len(store) == 3
+
+
+def test_openai_embeddings_are_batched_per_request(make_vdb, monkeypatch):
+    requests = []
+
+    def create(input, model):
+        requests.append(list(input))
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(text)), 0.0, 0.0, 1.0]) for text in input])
+
+    monkeypatch.setattr(async_qdrant_setup, "openai", SimpleNamespace(embeddings=SimpleNamespace(create=create)))
+    monkeypatch.setattr(async_qdrant_setup, "OPENAI_EMBEDDING_BATCH_SIZE", 2)
+    bucket = TokenBucket(rate=1000.0, capacity=1000.0)
+    vdb = make_vdb(None, use_openai=True, embedding_rate_limit=bucket)
+
+    embeddings = asyncio.run(vdb.generate_embeddings(["a", "bb", "ccc", "dddd", "eeeee"]))
+
+    assert [len(batch) for batch in requests] == [2, 2, 1]
+    assert bucket.acquired == 3
+    assert embeddings[:, 0].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar bulk upload
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from vector_db.bulk_upload import as_vector_matrix, async_upload_columns, iter_point_batches, upload_columns
+
+VECTORS = np.arange(20, dtype=np.float64).reshape(5, 4) + 1
+PAYLOADS = [{"city": city} for city in ("Toronto", "Calgary", "Toronto", "Ottawa", "Vancouver")]
+
+
+def test_matrix_is_contiguous_float32_without_needless_copies():
+    matrix = np.ones((3, 4), dtype=np.float32)
+
+    assert as_vector_matrix(matrix) is matrix
+    converted = as_vector_matrix(VECTORS[:, ::2])
+    assert converted.dtype == np.float32
+    assert converted.flags.c_contiguous
+    with pytest.raises(ValueError):
+        as_vector_matrix([1.0, 2.0])
+
+
+def test_batches_slice_the_columns():
+    batches = list(iter_point_batches(list(range(5)), VECTORS, PAYLOADS, batch_size=2))
+
+    assert [batch.ids for batch in batches] == [[0, 1], [2, 3], [4]]
+    assert batches[2].vectors == [[17.0, 18.0, 19.0, 20.0]]
+    assert batches[1].payloads == PAYLOADS[2:4]
+    with pytest.raises(ValueError):
+        list(iter_point_batches([0, 1], VECTORS))
+
+
+def test_upload_columns_round_trip():
+    client = QdrantClient(":memory:")
+    client.create_collection("bulk", vectors_config=VectorParams(size=4, distance=Distance.DOT))
+
+    uploaded = upload_columns(client, "bulk", [10, 11, 12, 13, 14], VECTORS, PAYLOADS, batch_size=2)
+    point = client.retrieve("bulk", ids=[14], with_vectors=True)[0]
+
+    assert uploaded == 5
+    assert client.count("bulk", exact=True).count == 5
+    assert point.payload == {"city": "Vancouver"}
+    assert point.vector == pytest.approx(VECTORS[4].tolist())
+    assert upload_columns(client, "bulk", [], []) == 0
+
+
+def test_async_upload_columns():
+    async def run():
+        client = AsyncQdrantClient(":memory:")
+        await client.create_collection("bulk", vectors_config=VectorParams(size=4, distance=Distance.DOT))
+        uploaded = await async_upload_columns(client, "bulk", list(range(5)), VECTORS, PAYLOADS,
+                                              batch_size=2, max_concurrency=2)
+        return uploaded, (await client.count("bulk", exact=True)).count
+
+    assert asyncio.run(run()) == (5, 5)
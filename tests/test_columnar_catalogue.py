@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar (Parquet / Arrow) catalogues
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pyarrow")
+
+from services.columnar_catalogue import (
+    catalogue_embeddings, catalogue_metadata, catalogue_stats, read_catalogue, records_to_table, write_catalogue
+)
+
+PROPERTIES = [
+    {"type": "property", "id": "p1", "property_name": "Yorkville", "city": "Toronto", "rating": 4.5,
+     "amenities": ["WiFi", "Gym"], "pet_friendly": True, "bedrooms": 1},
+    {"type": "property", "id": 2, "property_name": "Beltline", "city": "Calgary", "rating": 4.0,
+     "amenities": ["WiFi"], "pet_friendly": False, "bedrooms": 2, "unknown_field": "dropped"},
+    {"type": "property", "id": "p3", "property_name": "Harbour", "city": "Toronto", "rating": None,
+     "pet_friendly": True},
+]
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_round_trip_with_embeddings(tmp_path, suffix):
+    embeddings = np.arange(12, dtype=np.float64).reshape(3, 4)
+    path = str(tmp_path / f"properties{suffix}")
+    write_catalogue(records_to_table(PROPERTIES, "property", embeddings, "all-MiniLM-L6-v2"), path)
+
+    table = read_catalogue(path)
+
+    assert table.column("id").to_pylist() == ["p1", "2", "p3"]
+    assert table.column("amenities").to_pylist() == [["WiFi", "Gym"], ["WiFi"], []]
+    assert "unknown_field" not in table.column_names
+    assert catalogue_metadata(table)["embedding_model"] == "all-MiniLM-L6-v2"
+    vectors = catalogue_embeddings(table)
+    assert vectors.dtype == np.float32
+    assert np.array_equal(vectors, embeddings.astype(np.float32))
+
+
+def test_stats_from_selected_columns(tmp_path):
+    path = str(tmp_path / "properties.parquet")
+    write_catalogue(records_to_table(PROPERTIES, "property"), path)
+
+    table = read_catalogue(path, columns=["city", "rating", "pet_friendly", "amenities"])
+    stats = catalogue_stats(table)
+
+    assert table.column_names == ["city", "rating", "pet_friendly", "amenities"]
+    assert stats["cities_covered"] == 2
+    assert stats["top_cities"][0] == {"value": "Toronto", "count": 2}
+    assert stats["average_rating"] == 4.25
+    assert stats["pet_friendly_count"] == 2
+    assert stats["top_amenities"] == [{"value": "WiFi", "count": 2}, {"value": "Gym", "count": 1}]
+
+
+def test_faq_tags_and_invalid_input(tmp_path):
+    faqs = [{"type": "faq", "id": "faq_001", "question": "Parking?", "answer": "Yes.", "tags": ["parking"]}]
+    table = records_to_table(faqs, "faq")
+
+    assert catalogue_stats(table)["top_tags"] == [{"value": "parking", "count": 1}]
+    with pytest.raises(ValueError):
+        records_to_table(faqs, "summary")
+    with pytest.raises(ValueError):
+        records_to_table(faqs, "faq", embeddings=np.zeros((2, 4)))
+    with pytest.raises(ValueError):
+        write_catalogue(table, str(tmp_path / "faqs.csv"))
+
+
+def test_vector_db_ingests_catalogue_embeddings_and_reports_stats(tmp_path, monkeypatch):
+    pytest.importorskip("qdrant_client")
+    from qdrant_client import QdrantClient
+    from vector_db import qdrant_setup
+
+    # No model: ingestion has to use the catalogue's embedding column
+    monkeypatch.setattr(qdrant_setup, "load_embedding_model", lambda name: (None, False, 4))
+    vdb = qdrant_setup.PremiereSuitesVectorDB(collection_name="test_catalogue_properties", embedding_model="fake-model")
+    vdb.client = QdrantClient(":memory:")
+    vdb.create_collection()
+    path = str(tmp_path / "properties.parquet")
+    embeddings = np.eye(3, 4, dtype=np.float32)
+    write_catalogue(records_to_table(PROPERTIES, "property", embeddings, "fake-model"), path)
+
+    assert "embedding" not in vdb.load_catalogue(path)[0]
+    assert vdb.ingest_catalogue(path) == 3
+    stats = vdb.get_collection_stats(path)
+
+    assert stats["points_count"] == 3
+    assert stats["top_cities"][0] == {"value": "Toronto", "count": 2}
+    assert [point.id for point in vdb.dense_query([0.0, 1.0, 0.0, 0.0], limit=1)] == [1]
+
+    other = str(tmp_path / "other.parquet")
+    write_catalogue(records_to_table(PROPERTIES, "property", embeddings, "other-model"), other)
+    assert vdb.load_catalogue_embeddings(other) is None
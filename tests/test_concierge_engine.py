@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the Python concierge engine
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from concierge.engine import (
+    ConciergeEngine, ConversationState, DONE_REPLY, QUALIFY_MODE,
+    parse_arrival_date, parse_budget, parse_length_nights
+)
+from services.rate_limit import TokenBucket
+
+
+def run(engine, *messages, session_id="s1"):
+    return [engine.handle(message, session_id) for message in messages][-1]
+
+
+def test_parsers_match_workflow_rules():
+    assert parse_arrival_date("25/12/2025") == "2025-12-25"
+    assert parse_arrival_date("12-25-2025") == "2025-12-25"
+    assert parse_arrival_date("03.04.2025") == "2025-04-03"
+    assert parse_arrival_date("31/31/2025") is None
+    assert parse_length_nights("3 months") == 90
+    assert parse_length_nights("10 nights") == 10
+    assert parse_budget("$2,500 per month") == {"budget_value": 2500.0, "budget_type": "monthly"}
+    assert parse_budget("150", length_nights=10)["budget_type"] == "nightly"
+    assert parse_budget("no idea") is None
+
+
+def test_full_qualification_flow():
+    engine = ConciergeEngine(flood_max_messages=100)
+
+    first = engine.handle("I'd like to book a suite", "s1")
+    assert first["mode"] == QUALIFY_MODE
+    assert first["reply"] == "Thanks! May I have your name?"
+
+    assert engine.handle("Jane Doe", "s1")["reply"] == "Thanks! What’s your email address?"
+    assert "valid email" in engine.handle("not-an-email", "s1")["reply"]
+    engine.handle("jane@example.com", "s1")
+    picker = engine.handle("Toronto", "s1")
+    assert picker["action"]["type"] == "open_date_picker"
+
+    result = run(engine, "01/09/2025", "3 months", "2", "yes", "no", "3000 monthly", "")
+    state = engine.get_state("s1")
+
+    assert result["reply"] == DONE_REPLY
+    assert state.lead.city == "Toronto"
+    assert state.lead.arrival_iso == "2025-09-01"
+    assert state.lead.length_nights == 90
+    assert state.lead.pets is True and state.lead.parking is False
+    assert state.qualified is True
+    assert ConversationState.from_dict(state.to_dict()) == state
+
+
+def test_short_stay_is_disqualified():
+    engine = ConciergeEngine(flood_max_messages=100)
+
+    result = run(engine, "book an apartment", "Sam", "sam@example.com", "Ottawa", "01/09/2025", "5 nights")
+
+    assert "shorter than our minimum" in result["reply"]
+    assert engine.get_state("s1").qualified is False
+    assert engine.get_state("s1").stage == "done"
+
+
+def test_faq_answer_is_verbatim_and_misses_use_classifier():
+    answerer = MagicMock()
+    answerer.answer.side_effect = [{"answer": "Check-in is at 3pm."}, None, None]
+    classifier = MagicMock(side_effect=[True, False])
+    engine = ConciergeEngine(faq_answerer=answerer, classifier=classifier)
+
+    assert engine.handle("When is check-in?", "s2")["reply"] == "Check-in is at 3pm."
+    assert "follow up" in engine.handle("Is there a gym?", "s2")["reply"]
+    assert engine.handle("What is the capital of France?", "s2")["reply"] == "Thanks! I’m sorry, I don’t know."
+
+
+def test_flood_gate_and_upstream_limit():
+    engine = ConciergeEngine(
+        flood_max_messages=2,
+        knowledge_base_limit=TokenBucket(rate=0.01, capacity=1),
+        upstream_max_wait=0.0
+    )
+
+    assert not engine.handle("hello", "s3").get("rate_limited")
+    assert not engine.handle("hello", "s3").get("rate_limited")
+    assert engine.handle("hello", "s3").get("rate_limited")
+    assert engine.handle("hello", "s4").get("rate_limited") is None
+
+    engine.faq_answerer = MagicMock(answer=MagicMock(return_value=None))
+    assert engine.handle("hi", "s5").get("rate_limited") is None
+    assert "high number of requests" in engine.handle("hi", "s6")["reply"]
+    assert engine.faq_answerer.answer.call_count == 1
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the concierge answer parsers
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from concierge.parsing import (
+    parse_answers, parse_arrival_date, parse_arrival_dates, parse_budget, parse_budgets,
+    parse_length_nights, parse_lengths_nights
+)
+
+MESSAGES = [
+    "25/12/2025", " 03.04.2025 ", "12-25-2025", "31/31/2025", "3 MONTHS", "10 nights",
+    "2m", "$2,500 per month", "90 a Night", "CAD 3,200/mo", "flexible", "", None,
+]
+
+
+def test_single_message_parsers():
+    assert parse_arrival_date(" 03.04.2025 ") == "2025-04-03"
+    assert parse_arrival_date("02/29/2024") == "2024-02-29"
+    assert parse_arrival_date("2/30/2024") is None
+    assert parse_length_nights("3 MONTHS") == 90
+    assert parse_length_nights("2m") == 60
+    assert parse_budget("90 a Night") == {"budget_value": 90.0, "budget_type": "nightly"}
+    assert parse_budget("1800", length_nights=60)["budget_type"] == "monthly"
+    assert parse_budget("1.2.3") is None
+
+
+def test_batch_api_matches_single_message_parsers():
+    lengths = [5, 60] * 6 + [None]
+
+    assert parse_arrival_dates(MESSAGES) == [parse_arrival_date(m) for m in MESSAGES]
+    assert parse_lengths_nights(MESSAGES) == [parse_length_nights(m) for m in MESSAGES]
+    assert parse_budgets(MESSAGES, lengths) == [parse_budget(m, n) for m, n in zip(MESSAGES, lengths)]
+
+
+def test_batch_budgets_are_not_shared_between_rows():
+    budgets = parse_budgets(["1800", "1800"])
+    budgets[0]["budget_value"] = 0
+
+    assert budgets[1]["budget_value"] == 1800.0
+
+
+def test_parse_answers_for_lead_records():
+    parsed = parse_answers([
+        {"arrival_raw": "1/9/2026", "length_raw": "2 months", "budget_raw": "1800"},
+        {"length_raw": "soon"},
+    ])
+
+    assert parsed[0] == {
+        "arrival_iso": "2026-09-01", "length_nights": 60, "budget_value": 1800.0, "budget_type": "monthly"
+    }
+    assert parsed[1] == {"arrival_iso": "", "length_nights": None, "budget_value": None, "budget_type": ""}
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Tests for the concierge session stores
+"""
+
+import sys
+import time
+import fnmatch
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from concierge.engine import ConciergeEngine
+from concierge.sessions import (
+    InMemorySessionStore, RedisSessionStore, SQLiteSessionStore, WatchError, create_session_store
+)
+from concierge.state import ConversationState, Lead, decode_state, encode_state
+from services.rate_limit import TokenBucket
+
+
+class FakeRedis:
+    """Minimal in-process stand-in for redis.Redis (get / set with px / delete / scan_iter / pipeline)."""
+
+    def __init__(self):
+        self.data = {}
+        self.versions = {}
+        self.last_px = None
+
+    def get(self, key):
+        value, expires = self.data.get(key, (None, None))
+        if expires is not None and expires <= time.time():
+            self.delete(key)
+            return None
+        return value
+
+    def set(self, key, value, px=None):
+        self.last_px = px
+        self.data[key] = (value.encode("utf-8"), time.time() + px / 1000 if px else None)
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def delete(self, key):
+        self.data.pop(key, None)
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def scan_iter(self, match="*"):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match) and self.get(key) is not None]
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """WATCH / MULTI / EXEC on FakeRedis: EXEC fails if a watched key changed."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.watched = {}
+        self.queued = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.watched, self.queued = {}, []
+
+    def watch(self, key):
+        self.watched[key] = self.redis.versions.get(key, 0)
+
+    def unwatch(self):
+        self.watched = {}
+
+    def get(self, key):
+        return self.redis.get(key)
+
+    def multi(self):
+        self.queued = []
+
+    def set(self, key, value, px=None):
+        self.queued.append((key, value, px))
+
+    def execute(self):
+        if any(self.redis.versions.get(key, 0) != version for key, version in self.watched.items()):
+            raise WatchError("watched key changed")
+        for key, value, px in self.queued:
+            self.redis.set(key, value, px=px)
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemorySessionStore(ttl=60)
+    if request.param == "sqlite":
+        return SQLiteSessionStore(str(tmp_path / "sessions.db"), ttl=60)
+    return RedisSessionStore(FakeRedis(), ttl=60)
+
+
+def test_compact_state_round_trip():
+    state = ConversationState(mode="QUALIFY_MODE", stage="ask_city",
+                              lead=Lead(name="Jane", email="jane@example.com", pets=False))
+
+    encoded = encode_state(state)
+
+    assert encode_state(ConversationState()) == {}
+    assert encoded == {"mode": "QUALIFY_MODE", "stage": "ask_city",
+                       "lead": {"name": "Jane", "email": "jane@example.com", "pets": False}}
+    assert decode_state(encoded) == state
+
+
+def test_store_get_set_delete(store):
+    store.set("a", {"state": {"stage": "ask_email"}})
+
+    assert store.get("a") == {"state": {"stage": "ask_email"}}
+    assert store.get("missing") is None
+    assert len(store) == 1
+
+    store.delete("a")
+    assert store.get("a") is None
+
+
+def test_update_reapplies_change_after_concurrent_write(store):
+    calls = []
+
+    def increment(record):
+        calls.append(record.get("count", 0))
+        if len(calls) == 1:
+            # Another worker writes between this update's read and its write
+            store.update("a", lambda other: other.update(count=other.get("count", 0) + 10))
+        record["count"] = record.get("count", 0) + 1
+        return record["count"]
+
+    assert store.update("a", increment) == 11
+    assert calls == [0, 10]
+    assert store.get("a") == {"count": 11}
+
+
+def test_redis_ttl_is_set_in_milliseconds():
+    redis = FakeRedis()
+    store = RedisSessionStore(redis, ttl=0.5)
+
+    store.set("a", {})
+    assert redis.last_px == 500
+
+    store.ttl = 0.0001
+    store.update("a", lambda record: record.update(seen=True))
+    assert redis.last_px == 1
+
+
+def test_expired_sessions_are_dropped():
+    memory = InMemorySessionStore(ttl=0.01)
+    memory.set("a", {})
+    time.sleep(0.02)
+
+    assert memory.get("a") is None
+    assert memory.evict_expired() == 0
+
+    sqlite = SQLiteSessionStore(":memory:", ttl=-1)
+    sqlite.set("a", {})
+    assert sqlite.get("a") is None
+    assert sqlite.evict_expired() == 1
+
+
+def test_memory_store_evicts_least_recently_used():
+    store = InMemorySessionStore(max_sessions=2)
+    store.set("a", {})
+    store.set("b", {})
+    store.get("a")
+    store.set("c", {})
+
+    assert store.get("b") is None
+    assert store.get("a") == {} and store.get("c") == {}
+
+
+def test_conversation_continues_on_another_engine(tmp_path):
+    path = str(tmp_path / "shared.db")
+    first = ConciergeEngine(store=SQLiteSessionStore(path))
+    second = ConciergeEngine(store=SQLiteSessionStore(path))
+
+    first.handle("I want to book an apartment", "s1")
+    first.handle("Jane", "s1")
+    reply = second.handle("jane@example.com", "s1")
+
+    assert reply["reply"] == "Thanks! Which city would you like to stay in?"
+    assert second.get_state("s1").lead.email == "jane@example.com"
+
+
+def test_concurrent_turns_share_flood_budget(tmp_path):
+    # One engine and store connection per thread, like separate worker processes
+    path = str(tmp_path / "shared.db")
+    engines = [ConciergeEngine(store=SQLiteSessionStore(path), flood_max_messages=5, flood_window=3600)
+               for _ in range(8)]
+    replies = []
+    threads = [threading.Thread(target=lambda engine=engine: replies.append(engine.handle("hello", "s1")))
+               for engine in engines]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not any(reply.get("error") for reply in replies)
+    assert sum(bool(reply.get("rate_limited")) for reply in replies) == 3
+
+
+class ConflictingStore(InMemorySessionStore):
+    """Another worker writes each session once, between an update's read and its write."""
+
+    def __init__(self):
+        super().__init__()
+        self.conflicts = 0
+
+    def _swap(self, session_id, expected, value):
+        if not self.conflicts:
+            self.conflicts += 1
+            self.set(session_id, {"state": {"mode": "FAQ_MODE"}})
+        return super()._swap(session_id, expected, value)
+
+
+def test_conflicting_turn_calls_upstream_once():
+    store = ConflictingStore()
+    answerer = MagicMock(answer=MagicMock(return_value=None))
+    classifier = MagicMock(return_value=True)
+    engine = ConciergeEngine(faq_answerer=answerer, classifier=classifier, store=store,
+                             knowledge_base_limit=TokenBucket(rate=1.0, capacity=10))
+
+    reply = engine.handle("Is there a gym?", "s1")
+
+    assert store.conflicts == 1
+    assert "follow up" in reply["reply"]
+    answerer.answer.assert_called_once_with("Is there a gym?")
+    classifier.assert_called_once_with("Is there a gym?")
+    assert engine.knowledge_base_limit.acquired == 1
+
+
+def test_create_session_store_from_url(tmp_path):
+    assert isinstance(create_session_store(None), InMemorySessionStore)
+    assert isinstance(create_session_store(f"sqlite:///{tmp_path / 'x.db'}"), SQLiteSessionStore)
+    with pytest.raises(ValueError):
+        create_session_store("mongodb://localhost")
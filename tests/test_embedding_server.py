@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the micro-batching embedding server
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("aiohttp")
+
+from services.embedding_server import EmbeddingBatcher, LRUCache
+
+
+class RecordingEncoder:
+    """Fake model that records each encode call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_concurrent_requests_share_one_encode_call():
+    encoder = RecordingEncoder()
+
+    async def run():
+        batcher = EmbeddingBatcher(encoder, max_batch_size=64, max_wait_ms=20)
+        try:
+            return await asyncio.gather(*(batcher.embed([f"query {i % 4}"]) for i in range(32)))
+        finally:
+            await batcher.stop()
+
+    results = asyncio.run(run())
+
+    assert len(encoder.calls) == 1
+    assert sorted(encoder.calls[0]) == ["query 0", "query 1", "query 2", "query 3"]
+    assert results[0] == [[7.0, 1.0]]
+
+
+def test_cached_texts_skip_the_model():
+    encoder = RecordingEncoder()
+
+    async def run():
+        batcher = EmbeddingBatcher(encoder, max_wait_ms=1)
+        try:
+            await batcher.embed(["parking", "wifi"])
+            second = await batcher.embed(["wifi", "pets", "parking"])
+            return second, batcher.metrics()
+        finally:
+            await batcher.stop()
+
+    second, metrics = asyncio.run(run())
+
+    assert encoder.calls[-1] == ["pets"]
+    assert second == [[4.0, 1.0], [4.0, 1.0], [7.0, 1.0]]
+    assert metrics["cache_hits"] == 2
+    assert metrics["queue_depth"] == 0
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    cache.get("a")
+    cache.put("c", [3.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1.0]
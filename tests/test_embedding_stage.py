@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched embedding stage used by collection rebuilds
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+
+from vector_db import embedding_stage
+from vector_db.embedding_stage import EmbeddingStage
+from vector_db.embedding_store import EmbeddingStore
+
+
+class FakeModel:
+    """Sentence-transformer stand-in that records every encode call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, show_progress_bar=False):
+        self.calls.append(list(texts))
+        return np.array([[len(text), 1.0] for text in texts])
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = FakeModel()
+    monkeypatch.setattr(embedding_stage, "load_embedding_model", lambda name: (fake, False, 2))
+    return fake
+
+
+def test_batches_and_deduplicates(model):
+    stage = EmbeddingStage("all-MiniLM-L6-v2", chunk_size=2, use_store=False)
+
+    vectors = stage.encode(["a", "bb", "a", "ccc"], label="faqs")
+
+    assert model.calls == [["a", "bb"], ["ccc"]]
+    assert vectors.dtype == np.float32 and vectors.flags.c_contiguous
+    assert vectors[:, 0].tolist() == [1.0, 2.0, 1.0, 3.0]
+    counters = stage.metrics()["labels"]["faqs"]
+    assert (counters["texts"], counters["encoded"], counters["reused"]) == (4, 3, 1)
+
+
+def test_reuses_the_embedding_store(model, tmp_path):
+    store = EmbeddingStore(str(tmp_path), "all-MiniLM-L6-v2")
+    EmbeddingStage("all-MiniLM-L6-v2", embedding_store=store).encode(["a", "bb"])
+
+    stage = EmbeddingStage("all-MiniLM-L6-v2", embedding_store=store)
+    vectors = stage.encode(["bb", "dddd"], label="properties")
+
+    assert model.calls == [["a", "bb"], ["dddd"]]
+    assert vectors[:, 0].tolist() == [2.0, 4.0]
+    assert stage.metrics()["labels"]["properties"]["reused"] == 1
+    assert stage.encode([]).shape == (0, 2)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped embedding store
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+
+from vector_db.embedding_store import EmbeddingStore
+
+
+class CountingEmbedder:
+    """Deterministic embeddings that record which texts were embedded."""
+
+    def __init__(self):
+        self.embedded = []
+
+    def __call__(self, texts):
+        self.embedded.extend(texts)
+        return np.array([[len(text), text.count("a"), 1.0] for text in texts])
+
+
+def test_only_new_texts_are_embedded(tmp_path):
+    store = EmbeddingStore(str(tmp_path), "all-MiniLM-L6-v2")
+    embedder = CountingEmbedder()
+
+    first = store.embed(["alpha", "beta"], embedder)
+    second = store.embed(["beta", "gamma", "gamma"], embedder)
+
+    assert embedder.embedded == ["alpha", "beta", "gamma"]
+    assert first.dtype == np.float32
+    assert np.array_equal(second[0], first[1])
+    assert np.array_equal(second[1], second[2])
+    assert len(store) == 3
+
+
+def test_store_persists_and_grows(tmp_path):
+    store = EmbeddingStore(str(tmp_path), "text-embedding-3-small", initial_capacity=2)
+    texts = [f"text {i}" for i in range(5)]
+    store.add(texts, np.arange(15).reshape(5, 3), ids=[10, 11, 12, 13, 14])
+
+    reopened = EmbeddingStore(str(tmp_path), "text-embedding-3-small")
+
+    assert len(reopened) == 5
+    assert isinstance(reopened.vectors, np.memmap)
+    assert reopened.ids == [10, 11, 12, 13, 14]
+    assert np.array_equal(reopened.get(["text 4"]), [[12.0, 13.0, 14.0]])
+    assert reopened.get(["unknown"]) is None
+    assert "text 0" in reopened
+
+
+def test_float16_storage_and_validation(tmp_path):
+    store = EmbeddingStore(str(tmp_path), "all-MiniLM-L6-v2", dtype="float16")
+    store.add(["a"], [[0.5, 0.25]])
+
+    assert store.vectors.dtype == np.float16
+    assert store.get(["a"]).dtype == np.float32
+    assert store.stats()["vector_bytes"] == 4
+    with pytest.raises(ValueError):
+        store.add(["b"], [[1.0, 2.0, 3.0]])
+    with pytest.raises(ValueError):
+        EmbeddingStore(str(tmp_path), "all-MiniLM-L6-v2", dtype="int8")
+
+
+def test_adds_append_and_interrupted_adds_are_dropped(tmp_path):
+    store = EmbeddingStore(str(tmp_path), "all-MiniLM-L6-v2")
+    store.add(["a", "b"], [[1.0, 0.0], [0.0, 1.0]], ids=[1, 2])
+    store.add(["a", "b"], [[1.0, 0.0], [0.0, 1.0]], ids=[1, 2])
+    store.add(["c"], [[1.0, 1.0]], ids=[3])
+
+    directory = store.directory
+    assert (directory / "hashes.bin").stat().st_size == 3 * 32
+    # Unchanged ids are not logged again
+    assert len((directory / "ids.jsonl").read_text().splitlines()) == 3
+
+    # An add that wrote its hashes and ids but not meta.json
+    with open(directory / "hashes.bin", "ab") as f:
+        f.write(b"x" * 32)
+    with open(directory / "ids.jsonl", "a") as f:
+        f.write('[3, 4]\n[1, "half')
+
+    reopened = EmbeddingStore(str(tmp_path), "all-MiniLM-L6-v2")
+
+    assert len(reopened) == 3
+    assert reopened.ids == [1, 2, 3]
+    assert (directory / "hashes.bin").stat().st_size == 3 * 32
+    reopened.add(["d"], [[2.0, 0.0]], ids=[4])
+    assert EmbeddingStore(str(tmp_path), "all-MiniLM-L6-v2").ids == [1, 2, 3, 4]
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-process exact search index
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+
+from vector_db import qdrant_setup
+from vector_db.exact_index import ExactSearchIndex
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+
+
+def make_index():
+    return ExactSearchIndex(
+        ids=[1, 2, 3, 4],
+        vectors=np.array([[1, 0], [0.9, 0.1], [0, 1], [0.7, 0.7]], dtype=np.float32),
+        payloads=[
+            {"city": "Toronto", "rating": 4.8, "pet_friendly": True, "tags": ["parking"]},
+            {"city": "Ottawa", "rating": 3.9, "pet_friendly": False, "tags": []},
+            {"city": "Toronto", "rating": 4.1, "pet_friendly": True, "tags": ["pool", "parking"]},
+            {"city": "Vancouver", "rating": None, "pet_friendly": True},
+        ],
+    )
+
+
+def test_top_k_matches_cosine_order():
+    results = make_index().search([2.0, 0.0], limit=3)
+
+    assert [point.id for point in results] == [1, 2, 4]
+    assert results[0].score == pytest.approx(1.0)
+
+
+def test_filters_are_applied_before_ranking():
+    index = make_index()
+
+    toronto = index.search([1.0, 0.0], limit=5, filter_dict={"city": "Toronto", "rating": {"$gte": 4.5}})
+    parking = index.search([0.0, 1.0], limit=5, filter_dict={"tags": "parking"})
+    not_ottawa = index.search([1.0, 0.0], limit=5, filter_dict={"city": {"$nin": ["Ottawa"]}})
+
+    assert [point.id for point in toronto] == [1]
+    assert [point.id for point in parking] == [3, 1]
+    assert 2 not in [point.id for point in not_ottawa]
+
+
+def test_load_scrolls_every_page():
+    client = MagicMock()
+    client.scroll.side_effect = [
+        ([SimpleNamespace(id=1, vector=[1.0, 0.0], payload={"city": "Toronto"})], 1),
+        ([SimpleNamespace(id=2, vector=[0.0, 1.0], payload=None)], None),
+    ]
+
+    index = ExactSearchIndex.load(client, "test_properties", with_payload=["city"], version=3)
+
+    assert len(index) == 2
+    assert index.version == 3
+    assert index.search([0.0, 1.0], limit=1)[0].id == 2
+
+
+def test_unsupported_filters_fall_back():
+    index = make_index()
+
+    assert index.try_search([1.0, 0.0], filter_dict={"$or": [{"city": "Ottawa"}]}) is None
+    assert [point.id for point in index.try_search([1.0, 0.0], limit=1, filter_dict={"city": "Ottawa"})] == [2]
+
+
+def test_small_collection_is_searched_in_process(monkeypatch):
+    monkeypatch.setenv("EXACT_SEARCH_MAX_POINTS", "10")
+    monkeypatch.setattr(qdrant_setup, "load_embedding_model", lambda name: (None, False, 2))
+    vdb = PremiereSuitesVectorDB(collection_name="test_exact_faqs", embedding_model="fake-model")
+    vdb.client = QdrantClient(":memory:")
+    vdb.create_collection()
+    vdb.upload_vectors([1, 2], np.array([[1.0, 0.0], [0.0, 1.0]]), [
+        {"faq_id": 1, "question": "Is there a gym?", "category": "Amenities"},
+        {"faq_id": 2, "question": "How do I pay?", "category": "Payment"},
+    ])
+    query_points = MagicMock(wraps=vdb.client.query_points)
+    monkeypatch.setattr(vdb.client, "query_points", query_points)
+
+    payment = vdb.dense_query([1.0, 0.1], limit=2, filter_dict={"category": "Payment"}, with_payload=["question"])
+    either = vdb.dense_query([1.0, 0.1], limit=2, filter_dict={"$or": [{"category": "Payment"}, {"faq_id": 1}]})
+
+    assert vdb.exact_search_max_points == 10
+    assert [(point.id, point.payload) for point in payment] == [(2, {"question": "How do I pay?"})]
+    # Only the $or filter, which the index does not evaluate, reached Qdrant
+    assert query_points.call_count == 1
+    assert [point.id for point in either] == [1, 2]
+    with pytest.raises(ValueError):
+        vdb.dense_query([1.0, 0.0], filter_dict={"rating": 4.5})
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for payload facet aggregation in PremiereSuitesVectorDB
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("qdrant_client")
+pytest.importorskip("sentence_transformers")
+
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+
+
+def make_vdb(client):
+    vdb = PremiereSuitesVectorDB.__new__(PremiereSuitesVectorDB)
+    vdb.client = client
+    vdb.collection_name = "test_faqs"
+    vdb._facet_cache = {}
+    return vdb
+
+
+def test_facet_api_result_is_cached_until_ingest():
+    client = MagicMock()
+    client.facet.return_value = SimpleNamespace(hits=[
+        SimpleNamespace(value="Payment", count=4),
+        SimpleNamespace(value="Reservations", count=7),
+    ])
+    vdb = make_vdb(client)
+
+    assert vdb.get_facet_counts("category") == {"Payment": 4, "Reservations": 7}
+    vdb.get_facet_counts("category")
+    assert client.facet.call_count == 1
+
+    vdb.invalidate_facet_cache()
+    vdb.get_facet_counts("category")
+    assert client.facet.call_count == 2
+
+
+def test_scroll_fallback_reads_every_page():
+    client = MagicMock()
+    client.facet.side_effect = AttributeError("facet")
+    pages = [
+        ([SimpleNamespace(payload={"tags": ["parking", "pets"]})], "next"),
+        ([SimpleNamespace(payload={"tags": ["parking"]}), SimpleNamespace(payload={})], None),
+    ]
+    client.scroll.side_effect = pages
+    vdb = make_vdb(client)
+
+    assert vdb.get_facet_counts("tags") == {"parking": 2, "pets": 1}
+    assert client.scroll.call_count == 2
+    assert client.scroll.call_args_list[1].kwargs["offset"] == "next"
+    assert client.scroll.call_args_list[0].kwargs["with_payload"] == ["tags"]
+
+
+def test_facet_limit_falls_back_to_complete_scroll():
+    client = MagicMock()
+    client.facet.return_value = SimpleNamespace(hits=[
+        SimpleNamespace(value="Toronto", count=2),
+        SimpleNamespace(value="Ottawa", count=1),
+    ])
+    client.scroll.return_value = (
+        [SimpleNamespace(payload={"city": city}) for city in ["Toronto", "Toronto", "Ottawa", "Calgary"]],
+        None
+    )
+    vdb = make_vdb(client)
+
+    assert vdb.get_facet_counts("city", limit=2) == {"Toronto": 2, "Ottawa": 1, "Calgary": 1}
+    assert vdb.get_facet_counts("city", limit=2) == {"Toronto": 2, "Ottawa": 1, "Calgary": 1}
+    assert client.facet.call_count == 1 and client.scroll.call_count == 1
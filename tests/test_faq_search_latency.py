@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Latency regression tests for LangChainFAQIntegration.search_faqs
+
+Every FAQ lookup must embed the query once and hit Qdrant once, with the
+minimum score applied by Qdrant rather than by a second client-side search.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("langchain_community")
+pytest.importorskip("qdrant_client")
+
+from langchain_community.vectorstores import Qdrant
+from langchain_core.embeddings import Embeddings
+from qdrant_client import QdrantClient
+
+from vector_db import qdrant_setup
+from vector_db.langchain_faq_integration import LangChainFAQIntegration
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds texts by which of a few keywords they mention, counting query embeddings."""
+
+    KEYWORDS = ("book", "pets", "parking")
+
+    def __init__(self):
+        self.queries = 0
+
+    def embed_documents(self, texts):
+        return [[0.1] + [float(word in text.lower()) for word in self.KEYWORDS] for text in texts]
+
+    def embed_query(self, text):
+        self.queries += 1
+        return self.embed_documents([text])[0]
+
+
+@pytest.fixture
+def integration(monkeypatch):
+    monkeypatch.setattr(qdrant_setup, "load_embedding_model", lambda name: (None, False, 4))
+    integration = LangChainFAQIntegration.__new__(LangChainFAQIntegration)
+    integration.collection_name = "test_faqs"
+    integration.vdb = PremiereSuitesVectorDB(collection_name="test_faqs", embedding_model="fake-model")
+    integration.vdb.client = QdrantClient(":memory:")
+    integration.embeddings = KeywordEmbeddings()
+    integration.langchain_store = Qdrant(client=integration.vdb.client, collection_name="test_faqs",
+                                         embeddings=integration.embeddings)
+    integration.create_collection()
+    integration.add_faq_texts(
+        ["How do I book a suite?", "Do you allow pets?", "Can I book parking?"],
+        ["Online or by phone.", "Yes, pets are welcome.", "Yes, parking can be booked."],
+        metadatas=[{"faq_id": 1, "category": "Reservations"}, {"faq_id": 2, "category": "Policies"},
+                   {"faq_id": 3, "category": "Reservations"}],
+        ids=[1, 2, 3]
+    )
+    integration.query_points = MagicMock(wraps=integration.vdb.client.query_points)
+    monkeypatch.setattr(integration.vdb.client, "query_points", integration.query_points)
+    return integration
+
+
+def test_search_faqs_embeds_and_searches_once(integration):
+    """Default min_score must not trigger a second search."""
+    results = integration.search_faqs("Do you allow pets?", k=2)
+
+    assert integration.embeddings.queries == 1
+    assert integration.query_points.call_count == 1
+    assert integration.query_points.call_args.kwargs["score_threshold"] == 0.5
+    assert [doc.metadata["faq_id"] for doc in results] == [2]
+    assert results[0].page_content == "Q: Do you allow pets?\nA: Yes, pets are welcome."
+
+
+def test_search_faqs_zero_min_score_disables_threshold(integration):
+    results = integration.search_faqs("Do you allow pets?", k=3, min_score=0, category="Reservations")
+
+    assert integration.query_points.call_count == 1
+    assert integration.query_points.call_args.kwargs["score_threshold"] is None
+    assert sorted(doc.metadata["faq_id"] for doc in results) == [1, 3]
+
+
+def test_search_faqs_with_score_pushes_threshold_down(integration):
+    results = integration.search_faqs_with_score("Where do I book parking?", k=3, min_score=0.8)
+
+    assert integration.embeddings.queries == 1
+    assert integration.query_points.call_count == 1
+    assert integration.query_points.call_args.kwargs["score_threshold"] == 0.8
+    assert [doc.metadata["faq_id"] for doc, _ in results] == [3]
+    assert results[0][1] == pytest.approx(1.0)
+
+
+def test_both_searches_apply_min_score_when_the_threshold_is_ignored(integration, monkeypatch):
+    dense_query = integration.vdb.dense_query
+    monkeypatch.setattr(integration.vdb, "dense_query",
+                        lambda *args, score_threshold=None, **kwargs: dense_query(*args, **kwargs))
+
+    documents = integration.search_faqs("Where do I book parking?", k=3, min_score=0.8)
+    scored = integration.search_faqs_with_score("Where do I book parking?", k=3, min_score=0.8)
+
+    assert [doc.metadata["faq_id"] for doc in documents] == [3]
+    assert [doc.metadata["faq_id"] for doc, _ in scored] == [3]
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the Mongo-like filter to Qdrant Filter compiler
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client.http import models
+from vector_db.filters import compile_filter
+
+
+def test_empty_filter_compiles_to_none():
+    assert compile_filter({}) is None
+    assert compile_filter(None) is None
+
+
+def test_rating_gte_becomes_range_condition():
+    result = compile_filter({"rating": {"$gte": 4.0}}, key_prefix="metadata.")
+
+    assert result.must == [
+        models.FieldCondition(key="metadata.rating", range=models.Range(gte=4.0))
+    ]
+
+
+def test_equality_membership_and_negation():
+    result = compile_filter({
+        "city": "Toronto",
+        "room_type": {"$in": ["studio", "1br"]},
+        "bedrooms": {"$ne": 0},
+    })
+
+    assert models.FieldCondition(key="city", match=models.MatchValue(value="Toronto")) in result.must
+    assert models.FieldCondition(
+        key="room_type", match=models.MatchAny(any=["studio", "1br"])
+    ) in result.must
+    assert result.must_not == [
+        models.FieldCondition(key="bedrooms", match=models.MatchValue(value=0))
+    ]
+
+
+def test_nested_keys_and_logical_operators():
+    result = compile_filter({
+        "location": {"city": "Ottawa"},
+        "$or": [{"pet_friendly": True}, {"rating": {"$gt": 4.5}}],
+        "$not": {"building_type": "house"},
+    })
+
+    assert models.FieldCondition(
+        key="location.city", match=models.MatchValue(value="Ottawa")
+    ) in result.must
+    or_filter = [c for c in result.must if isinstance(c, models.Filter)][0]
+    assert len(or_filter.should) == 2
+    assert result.must_not[0].must == [
+        models.FieldCondition(key="building_type", match=models.MatchValue(value="house"))
+    ]
+
+
+def test_unknown_operator_raises():
+    with pytest.raises(ValueError):
+        compile_filter({"rating": {"$regex": "4.*"}})
+
+
+@pytest.mark.parametrize("filter_dict", [
+    {"$not": {}},
+    {"$or": []},
+    {"$or": [{}]},
+    {"$and": [{"city": "Toronto"}, {}]},
+    {"rating": {"$in": [4.5, 5.0]}},
+    {"city": {"$nin": ["Toronto", 3]}},
+    {"city": {"$in": "Toronto"}},
+    {"rating": 4.5},
+])
+def test_invalid_operands_raise_value_error(filter_dict):
+    with pytest.raises(ValueError):
+        compile_filter(filter_dict)
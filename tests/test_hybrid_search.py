@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for hybrid sparse + dense retrieval
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+
+from vector_db import qdrant_setup
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+from vector_db.search_faqs import search_faqs
+from vector_db.sparse_encoder import BM25Encoder, term_index, tokenize
+
+FAQS = [
+    {"question": "Is there WiFi in the suites?", "answer": "Every suite has high-speed internet.", "category": "Amenities"},
+    {"question": "Can I bring my dog?", "answer": "Pets are welcome in most buildings.", "category": "Pets"},
+    {"question": "Is parking available?", "answer": "Underground parking is available.", "category": "Amenities"},
+    {"question": "When is check-in?", "answer": "Check-in starts at 4 pm.", "category": "Booking"},
+]
+
+
+class ConstantModel:
+    """Embeds every text the same way, so only the sparse vectors tell FAQs apart."""
+
+    def encode(self, texts, **kwargs):
+        return np.ones((len(texts), 3))
+
+
+@pytest.fixture
+def vdb(monkeypatch):
+    monkeypatch.setattr(qdrant_setup, "load_embedding_model", lambda name: (ConstantModel(), False, 3))
+    vdb = PremiereSuitesVectorDB(collection_name="test_faqs", embedding_model="fake-model", hybrid=True)
+    vdb.client = QdrantClient(":memory:")
+    vdb.create_collection()
+    payloads = [dict(faq, faq_id=i) for i, faq in enumerate(FAQS)]
+    vdb.upload_vectors(list(range(len(FAQS))), np.ones((len(FAQS), 3)), payloads)
+    return vdb
+
+
+def test_tokenize_normalises_terms():
+    assert tokenize("Is there WI-FI in the Suites?") == ["wifi", "suite"]
+    assert tokenize("Wi-Fi") == tokenize("wifi")
+    assert tokenize("the and of") == []
+
+
+def test_bm25_weights_saturate_with_term_frequency():
+    encoder = BM25Encoder()
+    once = encoder.encode_document("parking")
+    three = encoder.encode_document("parking parking parking")
+    query = encoder.encode_query("Parking? parking")
+
+    assert once.indices == three.indices == query.indices == [term_index("parking")]
+    assert once.values[0] < three.values[0] < encoder.k1 + 1
+    assert query.values == [1.0]
+
+
+def test_hybrid_search_ranks_exact_terms_first(vdb):
+    assert search_faqs(vdb, "WI-FI", limit=2)[0]["question"] == "Is there WiFi in the suites?"
+    assert search_faqs(vdb, "parking", limit=1)[0]["faq_id"] == 2
+    results = search_faqs(vdb, "parking", limit=3, category="Booking")
+    assert [result["category"] for result in results] == ["Booking"]
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared streaming JSONL loader
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services import jsonl_loader
+from services.jsonl_loader import iter_faqs, iter_records, load_by_type, load_records, validate_record
+
+RECORDS = [
+    {"type": "metadata", "generated_on": "2025-08-20", "total_properties": 1},
+    {"type": "summary", "cities_covered": 1},
+    {"type": "property", "id": "prop_1", "property_name": "Yorkville Suites", "city": "Toronto",
+     "rating": 4.5, "bedrooms": 2, "pet_friendly": True, "amenities": ["WiFi"]},
+    {"type": "faq", "id": "faq_001", "question": "Is parking included?", "answer": "Yes.", "tags": ["parking"]},
+    {"type": "faq", "question": "Pets?", "answer": "Pet friendly suites are available."},
+]
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.jsonl"
+    lines = [json.dumps(record) for record in RECORDS]
+    lines.insert(3, "{not json")
+    lines.insert(1, "")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_records_are_routed_by_type(data_file):
+    grouped = load_by_type(data_file)
+
+    assert [len(grouped[t]) for t in ("metadata", "summary", "property", "faq")] == [1, 1, 1, 2]
+    assert load_records(data_file, "property")[0]["property_name"] == "Yorkville Suites"
+    assert [faq["question"] for faq in iter_faqs(data_file)] == ["Is parking included?", "Pets?"]
+
+
+def test_line_numbers_and_bad_lines(data_file):
+    line_numbers = [line_num for line_num, _ in iter_records(data_file, types=("faq",))]
+
+    assert line_numbers == [6, 7]
+    with pytest.raises(ValueError, match=":5: invalid JSON"):
+        list(iter_records(data_file, strict=True))
+
+
+def test_schema_validation(tmp_path):
+    assert validate_record(RECORDS[2]) == []
+    assert validate_record({"type": "faq", "question": "Q?"}) == ["missing answer"]
+    assert validate_record({"type": "property", "id": "p", "property_name": "x", "bedrooms": True}) == [
+        "bedrooms should be int, got bool"
+    ]
+
+    path = tmp_path / "faqs.jsonl"
+    path.write_text(json.dumps({"type": "faq", "question": "Q?"}) + "\n" + json.dumps(RECORDS[3]) + "\n")
+    assert len(load_records(str(path), "faq", validate=True)) == 1
+    with pytest.raises(ValueError, match="missing answer"):
+        load_records(str(path), "faq", validate=True, strict=True)
+
+
+def test_standard_library_fallback(data_file, monkeypatch):
+    monkeypatch.setattr(jsonl_loader, "_decode", json.loads)
+    monkeypatch.setattr(jsonl_loader, "_DECODE_ERRORS", (json.JSONDecodeError, UnicodeDecodeError))
+
+    assert len(load_records(data_file, "faq")) == 2
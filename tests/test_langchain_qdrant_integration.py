@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for LangChain property searches against an in-memory Qdrant
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("langchain_community")
+pytest.importorskip("qdrant_client")
+
+from langchain_community.vectorstores import Qdrant
+from langchain_core.embeddings import Embeddings
+from qdrant_client import QdrantClient
+
+from vector_db import qdrant_setup
+from vector_db.langchain_qdrant_integration import LangChainQdrantIntegration
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds texts by which of a few keywords they mention."""
+
+    KEYWORDS = ("gym", "pool", "quiet")
+
+    def embed_documents(self, texts):
+        return [[0.1] + [float(word in text.lower()) for word in self.KEYWORDS] for text in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+def test_property_search_runs_on_query_points(monkeypatch):
+    monkeypatch.setattr(qdrant_setup, "load_embedding_model", lambda name: (None, False, 4))
+    integration = LangChainQdrantIntegration.__new__(LangChainQdrantIntegration)
+    integration.collection_name = "test_properties"
+    integration.vdb = PremiereSuitesVectorDB(collection_name="test_properties", embedding_model="fake-model")
+    integration.vdb.client = QdrantClient(":memory:")
+    integration.embeddings = KeywordEmbeddings()
+    integration.langchain_store = Qdrant(client=integration.vdb.client, collection_name="test_properties",
+                                         embeddings=integration.embeddings)
+    integration.create_collection()
+    integration.add_texts(
+        ["Suites with a gym", "Quiet lofts with a gym", "Harbour view pool"],
+        metadatas=[{"property_id": "1", "property_name": "Maple Tower", "city": "Toronto", "rating": 4.8},
+                   {"property_id": "2", "property_name": "Bay Lofts", "city": "Toronto", "rating": 4.2},
+                   {"property_id": "3", "property_name": "Harbour Suites", "city": "Vancouver", "rating": 4.5}]
+    )
+
+    documents = integration.similarity_search("pool", k=1)
+    results = integration.search_properties_langchain("gym", limit=3, city="Toronto", min_rating=4.5)
+
+    assert [doc.page_content for doc in documents] == ["Harbour view pool"]
+    assert [result["property_name"] for result in results] == ["Maple Tower"]
+    assert results[0]["score"] == pytest.approx(1.0)
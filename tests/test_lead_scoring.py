@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk lead qualification
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pd = pytest.importorskip("pandas")
+
+from concierge.engine import parse_budget, parse_length_nights, qualify_lead, join_reasons
+from concierge.lead_scoring import rescore_file, score_leads
+from concierge.state import Lead
+
+RAW_LEADS = [
+    {"email": "a@example.com", "length_raw": "3 months", "budget_raw": "$2,500 per month"},
+    {"email": "b@example.com", "length_raw": "5 nights", "budget_raw": "60 nightly"},
+    {"email": "c@example.com", "length_raw": "2m", "budget_raw": "1200"},
+    {"email": "d@example.com", "length_raw": "14 nights", "budget_raw": "120"},
+    {"email": "e@example.com", "length_raw": "", "budget_raw": "not sure"},
+]
+
+
+def engine_result(row):
+    """Qualification of one lead through the concierge engine's parser and filter."""
+    lead = Lead(length_raw=row["length_raw"], budget_raw=row["budget_raw"])
+    lead.length_nights = parse_length_nights(lead.length_raw)
+    budget = parse_budget(lead.budget_raw, lead.length_nights)
+    if budget:
+        lead.budget_value, lead.budget_type = budget["budget_value"], budget["budget_type"]
+    issues = qualify_lead(lead)
+    return not issues, join_reasons(issues) if issues else ""
+
+
+def test_matches_engine_rules_row_by_row():
+    scored = score_leads(pd.DataFrame(RAW_LEADS))
+
+    for row, (_, result) in zip(RAW_LEADS, scored.iterrows()):
+        assert (result["qualified"], result["reason"]) == engine_result(row)
+
+    assert scored["length_nights"].tolist()[:4] == [90, 5, 60, 14]
+    assert scored["budget_type"].tolist()[:4] == ["monthly", "nightly", "monthly", "nightly"]
+
+
+def test_existing_values_are_kept_and_thresholds_can_change():
+    leads = pd.DataFrame([
+        {"length_nights": 30, "budget_value": 1800.0, "budget_type": "monthly"},
+        {"length_nights": 60, "budget_value": 2100.0, "budget_type": "monthly"},
+    ])
+
+    scored = score_leads(leads, min_monthly_budget=2000)
+
+    assert scored["qualified"].tolist() == [False, True]
+    assert scored["reason"][0] == "your monthly budget is below our minimum"
+
+
+def test_rescore_file_in_chunks(tmp_path):
+    source = tmp_path / "leads.csv"
+    output = tmp_path / "scored.jsonl"
+    pd.DataFrame(RAW_LEADS * 3).to_csv(source, index=False)
+
+    totals = rescore_file(str(source), str(output), chunk_size=4)
+    written = pd.read_json(output, lines=True)
+
+    assert totals == {"total": 15, "qualified": 9, "disqualified": 6}
+    assert len(written) == 15
+    assert written["qualified"].sum() == 9
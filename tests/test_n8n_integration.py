@@ -60,9 +60,8 @@ def test_faq_search():
         for query in test_queries:
             print(f"\n   🔍 Testing query: '{query}'")
             try:
-                results = vdb.client.search(
-                    collection_name=vdb.collection_name,
-                    query_vector=vdb.generate_query_embedding(query),
+                results = vdb.dense_query(
+                    vdb.generate_query_embedding(query),
                     limit=3,
                     score_threshold=0.5
                 )
@@ -83,9 +82,8 @@ def test_faq_search():
         
         for threshold in [0.3, 0.5, 0.7, 0.8]:
             try:
-                results = vdb.client.search(
-                    collection_name=vdb.collection_name,
-                    query_vector=vdb.generate_query_embedding(query),
+                results = vdb.dense_query(
+                    vdb.generate_query_embedding(query),
                     limit=3,
                     score_threshold=threshold
                 )
@@ -41,9 +41,8 @@ def simulate_n8n_workflow():
         for threshold in thresholds:
             print(f"\n   Testing threshold: {threshold}")
             try:
-                results = vdb.client.search(
-                    collection_name=vdb.collection_name,
-                    query_vector=vdb.generate_query_embedding(test_query),
+                results = vdb.dense_query(
+                    vdb.generate_query_embedding(test_query),
                     limit=5,
                     score_threshold=threshold
                 )
@@ -63,9 +62,8 @@ def simulate_n8n_workflow():
         print("   Using: scoreThreshold=0.5, topK=5")
         
         try:
-            results = vdb.client.search(
-                collection_name=vdb.collection_name,
-                query_vector=vdb.generate_query_embedding(test_query),
+            results = vdb.dense_query(
+                vdb.generate_query_embedding(test_query),
                 limit=5,
                 score_threshold=0.5
             )
@@ -86,9 +84,8 @@ def simulate_n8n_workflow():
         print("   Using: scoreThreshold=0.3, topK=5")
         
         try:
-            results = vdb.client.search(
-                collection_name=vdb.collection_name,
-                query_vector=vdb.generate_query_embedding(test_query),
+            results = vdb.dense_query(
+                vdb.generate_query_embedding(test_query),
                 limit=5,
                 score_threshold=0.3
             )
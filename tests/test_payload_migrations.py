@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulk payload migrations
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from vector_db.payload_migrations import fill_faq_content, run_migration, text_chunk_to_content
+
+
+def make_collection(count):
+    client = QdrantClient(":memory:")
+    client.create_collection("faqs", vectors_config=VectorParams(size=2, distance=Distance.DOT))
+    client.upsert("faqs", points=[
+        PointStruct(id=i, vector=[1.0, float(i)], payload={
+            "question": f"Question {i}?", "answer": f"Answer {i}.", "content": "" if i % 2 else f"kept {i}",
+            "text_chunk": f"chunk {i}", "metadata": {"text_chunk": f"chunk {i}"},
+        })
+        for i in range(count)
+    ])
+    return client
+
+
+def test_dry_run_scans_past_the_first_page_and_writes_nothing():
+    client = make_collection(250)
+
+    report = run_migration(client, "faqs", fill_faq_content, dry_run=True, page_size=100)
+
+    assert (report["scanned"], report["changed"], report["written"]) == (250, 125, 0)
+    assert report["keys_set"] == {"content": 125}
+    assert report["samples"][0]["set"]["content"] == {"old": "", "new": "Q: Question 1?\nA: Answer 1."}
+    assert client.retrieve("faqs", ids=[1])[0].payload["content"] == ""
+
+
+def test_migration_sets_and_deletes_keys_in_batches():
+    client = make_collection(30)
+
+    report = run_migration(client, "faqs", text_chunk_to_content, page_size=8, batch_size=3, max_concurrency=2)
+    payload = client.retrieve("faqs", ids=[7])[0].payload
+
+    assert report["written"] == 30
+    assert report["keys_deleted"] == {"text_chunk": 30}
+    assert "text_chunk" not in payload
+    assert payload["content"] == "chunk 7"
+    assert payload["metadata"] == {"content": "chunk 7"}
+    assert run_migration(client, "faqs", text_chunk_to_content)["changed"] == 0
+
+
+def test_resume_from_checkpoint(tmp_path):
+    client = make_collection(40)
+    checkpoint = str(tmp_path / "checkpoint.json")
+    calls = []
+
+    def failing(payload):
+        calls.append(payload["question"])
+        if len(calls) == 25:
+            raise RuntimeError("interrupted")
+        return fill_faq_content(payload)
+
+    with pytest.raises(RuntimeError):
+        run_migration(client, "faqs", failing, migration_name="fill", page_size=10, checkpoint_path=checkpoint)
+    calls.clear()
+
+    report = run_migration(client, "faqs", fill_faq_content, migration_name="fill", page_size=10,
+                           checkpoint_path=checkpoint)
+
+    assert report["resumed"] and report["scanned"] == 40
+    assert report["written"] == 20
+    assert all(point.payload["content"] for point in client.scroll("faqs", limit=100)[0])
+    with pytest.raises(ValueError):
+        run_migration(client, "faqs", fill_faq_content, migration_name="other", checkpoint_path=checkpoint)
+
+
+def test_fill_faq_content_falls_back_to_the_faq_id():
+    assert fill_faq_content({"answer": "Yes."})["content"] == "A: Yes."
+    assert fill_faq_content({"question": "", "faq_id": 7})["content"] == "FAQ ID: 7"
+    assert fill_faq_content({"question": ""}) is None
+    assert fill_faq_content({"content": "kept", "faq_id": 7}) is None
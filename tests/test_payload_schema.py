@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for the declarative payload index schemas and the index audit helpers
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client.http import models
+from vector_db.filters import compile_filter
+from vector_db.schema import (
+    FAQ_PAYLOAD_SCHEMA, PROPERTY_PAYLOAD_SCHEMA,
+    get_collection_schema, filter_keys, find_unindexed_fields
+)
+
+
+def test_faq_collections_index_category_and_tags():
+    schema = get_collection_schema("premiere_suites_faqs")
+
+    assert schema == FAQ_PAYLOAD_SCHEMA
+    assert schema["tags"] == models.PayloadSchemaType.KEYWORD
+    assert get_collection_schema("test_faqs") == FAQ_PAYLOAD_SCHEMA
+    assert get_collection_schema("test_properties") == PROPERTY_PAYLOAD_SCHEMA
+
+
+def test_property_facet_fields_have_keyword_indexes():
+    # plan_facets counts these with the facet API, which needs a keyword index
+    for field_name in ("amenities", "city", "property_name"):
+        assert PROPERTY_PAYLOAD_SCHEMA[field_name] == models.PayloadSchemaType.KEYWORD
+
+
+def test_audit_reports_unindexed_filter_fields():
+    query_filter = compile_filter({
+        "category": "Payment",
+        "$or": [{"tags": "deposit"}, {"source_url": {"$ne": ""}}],
+    })
+
+    keys = filter_keys(query_filter)
+
+    assert keys == ["category", "source_url", "tags"]
+    assert find_unindexed_fields(keys, FAQ_PAYLOAD_SCHEMA) == ["source_url"]
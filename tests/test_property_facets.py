@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for property facet vectors and the facet query planner
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+
+from vector_db import qdrant_setup
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+from vector_db.property_facets import COMBINED_VECTOR, facet_texts, plan_facets
+
+PROPERTIES = [
+    {"id": "1", "property_name": "Maple Tower", "city": "Toronto", "amenities": ["Pool"],
+     "description": "Busy downtown tower", "text_chunk": "Furnished suites with gym access"},
+    {"id": "2", "property_name": "Harbour Suites", "city": "Vancouver", "amenities": ["Gym", "Parking"],
+     "description": "Quiet street near the park", "text_chunk": "Furnished suites with gym access"},
+]
+
+
+class KeywordModel:
+    """Embeds texts by which of a few keywords they mention."""
+
+    KEYWORDS = ("gym", "pool", "quiet")
+
+    def encode(self, texts, **kwargs):
+        return np.array([[1.0] + [float(word in text.lower()) for word in self.KEYWORDS] for text in texts])
+
+
+@pytest.fixture
+def vdb(monkeypatch):
+    monkeypatch.setattr(qdrant_setup, "load_embedding_model", lambda name: (KeywordModel(), False, 4))
+    vdb = PremiereSuitesVectorDB(collection_name="test_properties", embedding_model="fake-model",
+                                 facet_vectors=True)
+    vdb.client = QdrantClient(":memory:")
+    vdb.create_collection()
+    vdb.ingest_properties(PROPERTIES)
+    return vdb
+
+
+def test_plan_facets_weights_by_query_terms():
+    assert plan_facets("") == {COMBINED_VECTOR: 1.0}
+    assert plan_facets("somewhere nice to stay") == {COMBINED_VECTOR: 1.0}
+    assert plan_facets("gym and parking") == {COMBINED_VECTOR: 1.0, "amenities": 2.0}
+
+    weights = plan_facets("Maple Tower with a pool downtown", name_terms={"maple", "tower"})
+    assert weights["name"] == 1.0
+    assert weights["amenities"] == 0.5
+    assert weights["description"] == 0.25
+
+
+def test_facet_texts_fall_back_for_missing_fields():
+    texts = facet_texts({"property_name": "Maple Tower", "city": "Toronto",
+                         "amenities": ["Pool"], "suite_features": ["Balcony"]}, fallback="chunk")
+    assert texts == {"name": "Maple Tower, Toronto", "amenities": "Pool, Balcony", "description": "chunk"}
+
+
+def test_facet_search_uses_amenity_vector(vdb):
+    # The combined vectors are identical, so only the amenities vector separates the two
+    assert vdb.plan_facets("gym") == {COMBINED_VECTOR: 1.0, "amenities": 2.0}
+    results = vdb.search_properties("gym", limit=2)
+    assert [result["property_name"] for result in results] == ["Harbour Suites", "Maple Tower"]
+
+    # Collection values extend the planner vocabulary; generic words and cities do not
+    weights = vdb.plan_facets("Maple Tower in Toronto")
+    assert weights["name"] == pytest.approx(2 / 3)
+
+
+def test_dense_search_uses_combined_vector(vdb):
+    results = vdb.search_properties("gym", limit=2, facets=False)
+    assert {result["property_name"] for result in results} == {"Harbour Suites", "Maple Tower"}
+    assert vdb.get_collection_info()["vector_size"] == 4
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the token-bucket rate limiter
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.rate_limit import RateLimitExceeded, TokenBucket, configure_budget, get_bucket
+
+
+def test_burst_then_reject():
+    bucket = TokenBucket(rate=1.0, capacity=3)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+    assert bucket.rejected == 1
+    assert 0.9 < bucket.time_until() <= 1.0
+
+
+def test_refill_is_continuous():
+    bucket = TokenBucket(rate=50.0, capacity=1)
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    time.sleep(0.03)
+    assert bucket.try_acquire()
+
+
+def test_acquire_waits_or_raises():
+    bucket = TokenBucket(rate=20.0, capacity=1)
+    bucket.acquire()
+
+    started = time.perf_counter()
+    bucket.acquire(timeout=1.0)
+    assert time.perf_counter() - started >= 0.04
+
+    with pytest.raises(RateLimitExceeded) as error:
+        bucket.acquire(timeout=0.0)
+    assert error.value.retry_after > 0
+
+
+def test_async_acquire_spaces_out_callers():
+    bucket = TokenBucket(rate=100.0, capacity=1)
+
+    async def run():
+        started = time.perf_counter()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+        return time.perf_counter() - started
+
+    assert asyncio.run(run()) >= 0.035
+    assert bucket.acquired == 5
+
+
+def test_state_round_trip_keeps_balance():
+    bucket = TokenBucket(rate=0.001, capacity=2)
+    bucket.try_acquire()
+    bucket.try_acquire()
+
+    restored = TokenBucket.from_state(bucket.state(), rate=0.001, capacity=2)
+
+    assert not restored.try_acquire()
+    assert TokenBucket.from_state(None, rate=0.001, capacity=2).try_acquire()
+
+
+def test_named_budgets_are_shared():
+    configure_budget("test_upstream", requests_per_minute=60, burst=5)
+
+    assert get_bucket("test_upstream") is get_bucket("test_upstream")
+    assert get_bucket("test_upstream").capacity == 5
+    assert get_bucket("test_upstream").rate == pytest.approx(1.0)
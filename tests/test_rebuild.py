@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the unified collection rebuild
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+
+from vector_db import embedding_stage, qdrant_setup
+from vector_db.embedding_stage import EmbeddingStage
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+from vector_db.rebuild import build_points, point_id, rebuild_collection, rebuild_collections
+
+
+class FakeModel:
+    """Three-dimensional embeddings that record every encoded text."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, show_progress_bar=False):
+        self.encoded.extend(texts)
+        return np.array([[len(text), text.count("a") + 1, 1.0] for text in texts])
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = FakeModel()
+    for module in (qdrant_setup, embedding_stage):
+        monkeypatch.setattr(module, "load_embedding_model", lambda name: (fake, False, 3))
+    return fake
+
+
+def make_vdb(client, collection_name):
+    vdb = PremiereSuitesVectorDB(collection_name=collection_name, embedding_model="fake-model")
+    vdb.client = client
+    return vdb
+
+
+def write_jsonl(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    return str(path)
+
+
+PROPERTIES = [
+    {"type": "property", "id": "prop_1", "property_name": "Yorkville", "city": "Toronto", "rating": 4.5,
+     "text_chunk": "Yorkville suite with a gym"},
+    {"type": "property", "id": "prop_2", "property_name": "Beltline", "city": "Calgary", "rating": 4.0,
+     "description": "Bright loft"},
+]
+FAQS = [
+    {"type": "faq", "id": "faq_001", "question": "Parking?", "answer": "Yes.", "category": "Amenities"},
+    {"type": "faq", "id": "faq_002", "question": "Pets?", "answer": "Up to two.", "category": "Pets"},
+]
+
+
+def test_payloads_share_one_layout():
+    properties = build_points(PROPERTIES, "property", "fake-model")
+    faqs = build_points(FAQS, "faq", "fake-model")
+
+    text, payload = properties[point_id("property", "prop_2")]
+    assert text == "Property: Beltline | Description: Bright loft | Location: Calgary"
+    assert payload["city"] == "Calgary" and payload["metadata"]["city"] == "Calgary"
+    assert faqs[point_id("faq", "faq_001")][0] == "Q: Parking?\nA: Yes."
+    for _, payload in list(properties.values()) + list(faqs.values()):
+        assert {"id", "record_type", "content", "metadata", "content_hash", "ingested_at"} <= set(payload)
+    with pytest.raises(ValueError):
+        build_points(FAQS, "summary", "fake-model")
+
+
+def test_full_then_incremental_rebuild(model, tmp_path):
+    client = QdrantClient(":memory:")
+    stage = EmbeddingStage("fake-model", use_store=False)
+    properties = make_vdb(client, "test_properties")
+    faqs = make_vdb(client, "test_faqs")
+    property_file = write_jsonl(tmp_path / "properties.jsonl", PROPERTIES)
+    faq_file = write_jsonl(tmp_path / "faqs.jsonl", FAQS)
+
+    reports = rebuild_collections([(properties, "property", property_file), (faqs, "faq", faq_file)], stage)
+
+    assert [report["upserted"] for report in reports] == [2, 2]
+    assert client.count("test_faqs", exact=True).count == 2
+    assert set(reports[0]["stages"]) == {"load", "embed", "upsert", "payload", "delete"}
+
+    changed = [dict(PROPERTIES[0], rating=4.8),
+               {"type": "property", "id": "prop_3", "property_name": "Harbour", "city": "Halifax"}]
+    write_jsonl(tmp_path / "properties.jsonl", changed)
+    model.encoded.clear()
+
+    report = rebuild_collection(properties, "property", property_file, stage, incremental=True)
+
+    # Only the new record is embedded; the rating change is a payload update
+    assert (report["upserted"], report["payload_updated"], report["deleted"]) == (1, 1, 1)
+    assert model.encoded == ["Property: Harbour | Location: Halifax"]
+    stored = client.retrieve("test_properties", ids=[point_id("property", "prop_1")])[0]
+    assert stored.payload["rating"] == 4.8
+    assert client.count("test_properties", exact=True).count == 2
+
+    again = rebuild_collection(properties, "property", property_file, stage, incremental=True)
+    assert (again["upserted"], again["payload_updated"], again["unchanged"]) == (0, 0, 2)
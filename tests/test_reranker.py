@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the cross-encoder reranking stage
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+pytest.importorskip("sentence_transformers")
+
+from qdrant_client import QdrantClient
+
+from vector_db import qdrant_setup
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+from vector_db.reranker import CrossEncoderReranker, property_document_text
+from vector_db.semantic_cache import CachedFAQAnswerer
+
+
+class OverlapCrossEncoder:
+    """Scores a pair by the share of query words found in the document."""
+
+    def __init__(self):
+        self.pairs = []
+
+    def predict(self, pairs, batch_size=32):
+        self.pairs.extend(pairs)
+        return [len(set(q.lower().split()) & set(d.lower().split())) / len(q.split()) for q, d in pairs]
+
+
+class QueueModel:
+    """Returns the queued embeddings in order, one per encoded text."""
+
+    def __init__(self, vectors):
+        self.vectors = list(vectors)
+
+    def encode(self, texts, **kwargs):
+        return np.array([self.vectors.pop(0) for _ in texts])
+
+
+FAQS = [
+    {"score": 0.71, "faq_id": 1, "question": "Is there a gym?", "answer": "Most buildings have a fitness room."},
+    {"score": 0.69, "faq_id": 2, "question": "Do you allow pets?", "answer": "dogs and cats are welcome"},
+]
+
+
+def test_rerank_orders_by_cross_encoder_and_caches_scores():
+    model = OverlapCrossEncoder()
+    reranker = CrossEncoderReranker(model=model)
+
+    first = reranker.rerank("are dogs welcome", FAQS, limit=1)
+    again = reranker.rerank("are dogs welcome", FAQS)
+
+    assert first[0]["faq_id"] == 2 and first[0]["score"] == 0.69
+    assert [result["faq_id"] for result in again] == [2, 1]
+    assert len(model.pairs) == 2
+    assert reranker.stats()["hits"] == 2
+    reranker.invalidate()
+    reranker.rerank("are dogs welcome", FAQS)
+    assert len(model.pairs) == 4
+
+
+def test_property_text_includes_amenities():
+    text = property_document_text({"property_name": "Yorkville", "city": "Toronto", "amenities": ["Gym", "Pool"]})
+    assert text == "Yorkville | Toronto | Amenities: Gym, Pool"
+
+
+def make_faq_db(monkeypatch, query_vectors):
+    monkeypatch.setattr(qdrant_setup, "load_embedding_model", lambda name: (QueueModel(query_vectors), False, 2))
+    vdb = PremiereSuitesVectorDB(collection_name="test_rerank_faqs", embedding_model="fake-model")
+    vdb.client = QdrantClient(":memory:")
+    vdb.create_collection()
+    # Both FAQs score just below the 0.75 answer threshold for a [1, 0] query
+    vectors = np.array([[faq["score"], np.sqrt(1 - faq["score"] ** 2)] for faq in FAQS])
+    vdb.upload_vectors([faq["faq_id"] for faq in FAQS], vectors, [dict(faq) for faq in FAQS])
+    return vdb
+
+
+def test_answerer_keeps_confident_borderline_answers_local(monkeypatch):
+    vdb = make_faq_db(monkeypatch, [[1.0, 0.0], [0.0, 1.0]])
+    query_points = MagicMock(wraps=vdb.client.query_points)
+    monkeypatch.setattr(vdb.client, "query_points", query_points)
+    answerer = CachedFAQAnswerer(vdb, reranker=CrossEncoderReranker(model=OverlapCrossEncoder()))
+
+    answer = answerer.answer("are dogs welcome")
+
+    assert answer["faq_id"] == 2 and answer["rerank_score"] == 1.0
+    assert answerer.answer("what about parking") is None
+    assert query_points.call_args.kwargs["limit"] == 10
+
+
+def test_rerank_threshold_is_calibrated_on_labelled_queries(monkeypatch):
+    vdb = make_faq_db(monkeypatch, [[1.0, 0.0]] * 4)
+    answerer = CachedFAQAnswerer(vdb, reranker=CrossEncoderReranker(model=OverlapCrossEncoder()))
+
+    # Overlap scores of the reranked tops: 1.0 and 0.75 are right, 2/3 and 0.4 are wrong
+    threshold = answerer.calibrate_rerank_threshold(
+        ["are dogs welcome", "is there a gym", "are cats allowed", "do you have a pool"],
+        [2, 1, None, None]
+    )
+
+    assert threshold == pytest.approx((0.75 + 2 / 3) / 2)
+    assert answerer.rerank_threshold == threshold
+    with pytest.raises(ValueError):
+        CachedFAQAnswerer(vdb).calibrate_rerank_threshold(["gym"], [1])
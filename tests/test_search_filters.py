@@ -79,9 +79,8 @@ def test_search_filters():
             
             # Test without filters
             print("   Testing without filters:")
-            results = vdb.client.search(
-                collection_name=vdb.collection_name,
-                query_vector=vdb.generate_query_embedding(test_case['query']),
+            results = vdb.dense_query(
+                vdb.generate_query_embedding(test_case['query']),
                 limit=3,
                 score_threshold=0.3
             )
@@ -109,9 +108,8 @@ def test_search_filters():
                     ]
                 )
                 
-                filtered_results = vdb.client.search(
-                    collection_name=vdb.collection_name,
-                    query_vector=vdb.generate_query_embedding(test_case['query']),
+                filtered_results = vdb.dense_query(
+                    vdb.generate_query_embedding(test_case['query']),
                     limit=3,
                     score_threshold=0.2,
                     query_filter=filter_condition
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the search gateway's batched searches and HTTP handler
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+pytest.importorskip("aiohttp")
+
+from aiohttp import test_utils
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from services.search_gateway import SearchBatcher, SearchGateway, create_app
+from vector_db import qdrant_setup
+from vector_db.embedding_store import EmbeddingStore
+from vector_db.qdrant_setup import PremiereSuitesVectorDB
+
+FAQS = [
+    {"faq_id": 1, "question": "Is there a gym?", "answer": "Yes, on the ground floor.", "category": "Amenities"},
+    {"faq_id": 2, "question": "Can I park?", "answer": "Underground parking.", "category": "Amenities"},
+    {"faq_id": 3, "question": "How do I pay?", "answer": "By credit card.", "category": "Payment"},
+]
+
+
+class KeywordModel:
+    """Embeds texts by which of a few keywords they mention, recording every text."""
+
+    KEYWORDS = ("gym", "park", "pay")
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        return np.array([[0.1] + [float(word in text.lower()) for word in self.KEYWORDS] for text in texts])
+
+
+@pytest.fixture
+def vdb(monkeypatch, tmp_path):
+    model = KeywordModel()
+    monkeypatch.setattr(qdrant_setup, "load_embedding_model", lambda name: (model, False, 4))
+    # A hybrid collection has a named sparse vector next to the unnamed dense one
+    vdb = PremiereSuitesVectorDB(collection_name="test_gateway_faqs", embedding_model="fake-model",
+                                 hybrid=True, embedding_store=EmbeddingStore(str(tmp_path), "fake-model"))
+    vdb.client = QdrantClient(":memory:")
+    vdb.create_collection()
+    texts = [f"{faq['question']} {faq['answer']}" for faq in FAQS]
+    vdb.upload_vectors([faq["faq_id"] for faq in FAQS], model.encode(texts), [dict(faq) for faq in FAQS],
+                       texts=texts)
+    model.encoded.clear()
+    return vdb
+
+
+def test_concurrent_searches_share_one_batch(vdb):
+    def request(vector, category=None):
+        return models.QueryRequest(
+            query=vector, limit=1, with_payload=["faq_id"],
+            filter=models.Filter(must=[models.FieldCondition(key="category", match=models.MatchValue(value=category))])
+            if category else None
+        )
+
+    async def run():
+        batcher = SearchBatcher({"faqs": vdb}, max_wait_ms=20)
+        try:
+            return await asyncio.gather(
+                batcher.search("faqs", request([0.1, 1.0, 0.0, 0.0])),
+                batcher.search("faqs", request([0.1, 0.0, 1.0, 0.0])),
+                batcher.search("faqs", request([0.1, 1.0, 0.0, 0.0], category="Payment")),
+            ), batcher.batches
+        finally:
+            await batcher.stop()
+
+    (gym, park, payment), batches = asyncio.run(run())
+
+    assert batches == 1
+    assert [gym[0].payload["faq_id"], park[0].payload["faq_id"], payment[0].payload["faq_id"]] == [1, 2, 3]
+
+
+def test_search_endpoint(vdb):
+    gateway = SearchGateway({"faqs": vdb}, max_wait_ms=1)
+
+    async def run():
+        async with test_utils.TestClient(test_utils.TestServer(create_app(gateway))) as client:
+            found = await client.post("/search", json={"query": "gym hours", "collection": "faqs", "limit": 1,
+                                                       "fields": ["question"]})
+            filtered = await client.post("/search", json={"query": "gym", "collection": "faqs",
+                                                          "filter": {"category": "Payment"}})
+            missing = await client.post("/search", json={"collection": "faqs"})
+            unknown = await client.post("/search", json={"query": "gym", "collection": "rooms"})
+            invalid = await client.post("/search", data="not json")
+            health = await client.get("/health")
+            return (await found.json(), await filtered.json(), missing.status, unknown.status,
+                    invalid.status, await health.json())
+
+    found, filtered, missing, unknown, invalid, health = asyncio.run(run())
+
+    assert [(hit["id"], hit["question"]) for hit in found["results"]] == [(1, "Is there a gym?")]
+    assert set(found["results"][0]) == {"id", "question", "score"}
+    assert [hit["faq_id"] for hit in filtered["results"]] == [3]
+    assert (missing, unknown, invalid) == (400, 400, 400)
+    assert health["collections"] == ["faqs"]
+    # Query embeddings are not written to the document embedding store
+    assert len(vdb.embedding_store) == 0
+    assert vdb.model.encoded == ["gym hours", "gym"]
+
+
+def test_small_collections_are_searched_in_process(vdb):
+    vdb.exact_search_max_points = 10
+    gateway = SearchGateway({"faqs": vdb}, max_wait_ms=1)
+
+    async def run():
+        try:
+            return (await gateway.search("gym", "faqs", limit=1, fields=["question"]),
+                    await gateway.search("pay", "faqs", filter_dict={"$or": [{"category": "Payment"}]}))
+        finally:
+            await gateway.close()
+
+    gym, payment = asyncio.run(run())
+
+    assert [(hit["id"], hit["question"]) for hit in gym] == [(1, "Is there a gym?")]
+    assert set(gym[0]) == {"id", "question", "score"}
+    assert [hit["faq_id"] for hit in payment] == [3]
+    # Only the $or filter, which the exact index does not evaluate, went to Qdrant
+    assert gateway.searcher.searches == 1
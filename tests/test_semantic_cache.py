@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the concierge FAQ semantic answer cache
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+pytest.importorskip("sentence_transformers")
+
+from qdrant_client import QdrantClient
+
+from vector_db import qdrant_setup
+from vector_db.qdrant_setup import PremiereSuitesVectorDB, bump_collection_version
+from vector_db.semantic_cache import CachedFAQAnswerer, SemanticAnswerCache
+
+
+class QueueModel:
+    """Returns the queued embeddings in order, one per encoded text."""
+
+    def __init__(self, vectors):
+        self.vectors = list(vectors)
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return np.array([self.vectors.pop(0) for _ in texts])
+
+
+def test_near_duplicate_query_is_served_from_cache():
+    cache = SemanticAnswerCache(dimension=3, threshold=0.95, max_entries=4)
+    cache.put("Do you allow pets?", [1.0, 0.0, 0.0], {"faq_id": 7})
+
+    assert cache.get([0.99, 0.05, 0.0]) == {"faq_id": 7}
+    assert cache.get([0.0, 1.0, 0.0]) is None
+    assert cache.get_by_text("  do you allow PETS ") == {"faq_id": 7}
+
+
+def test_oldest_entry_is_overwritten_when_full():
+    cache = SemanticAnswerCache(dimension=2, threshold=0.99, max_entries=2)
+    cache.put("a", [1.0, 0.0], {"faq_id": 1})
+    cache.put("b", [0.0, 1.0], {"faq_id": 2})
+    cache.put("c", [0.7, 0.7], {"faq_id": 3})
+
+    assert cache.get_by_text("a") is None
+    assert cache.get([1.0, 0.0]) is None
+    assert cache.get_by_text("b") == {"faq_id": 2}
+
+
+def test_answerer_skips_qdrant_on_paraphrase_and_resets_on_ingest(monkeypatch):
+    model = QueueModel([[1.0, 0.0], [0.98, 0.1], [1.0, 0.0]])
+    monkeypatch.setattr(qdrant_setup, "load_embedding_model", lambda name: (model, False, 2))
+    vdb = PremiereSuitesVectorDB(collection_name="test_semantic_faqs", embedding_model="fake-model")
+    vdb.client = QdrantClient(":memory:")
+    vdb.create_collection()
+    vdb.upload_vectors([4, 5], np.array([[1.0, 0.0], [0.0, 1.0]]), [
+        {"faq_id": 4, "question": "Pets?", "answer": "Yes", "category": "Rules"},
+        {"faq_id": 5, "question": "Parking?", "answer": "Underground", "category": "Amenities"},
+    ])
+    query_points = MagicMock(wraps=vdb.client.query_points)
+    monkeypatch.setattr(vdb.client, "query_points", query_points)
+    answerer = CachedFAQAnswerer(vdb, cache_threshold=0.95)
+
+    first = answerer.answer("Do you allow pets?")
+    second = answerer.answer("Are pets allowed?")
+    third = answerer.answer("are pets allowed")
+
+    assert first["faq_id"] == 4 and first["answer"] == "Yes"
+    assert first["cached"] is False and second["cached"] is True and third["cached"] is True
+    assert query_points.call_count == 1
+    assert len(model.calls) == 2
+
+    bump_collection_version("test_semantic_faqs")
+    answerer.answer("Do you allow pets?")
+    assert query_points.call_count == 2
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the local related-to-stay classifier
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+
+from concierge.classifier import StayClassifier
+from concierge.engine import ConciergeEngine, FAQ_FOLLOW_UP_REPLY
+from services.rate_limit import RateLimitExceeded
+
+VOCABULARY = ["book", "suite", "parking", "pets", "weather", "joke", "poem", "movie", "hello"]
+
+
+class KeywordEmbedder:
+    """Bag-of-keywords embeddings, enough to separate the two classes."""
+
+    def generate_query_embeddings(self, texts):
+        return np.array([self.generate_query_embedding(text) for text in texts])
+
+    def generate_query_embedding(self, text):
+        words = text.lower().split()
+        return [float(words.count(word)) + 0.01 for word in VOCABULARY]
+
+
+TRAINING = [
+    ("book a suite", True), ("suite with parking", True), ("pets in the suite", True),
+    ("parking for pets", True), ("weather today", False), ("tell a joke", False),
+    ("write a poem", False), ("good movie", False),
+]
+
+
+def make_classifier(fallback=None):
+    texts, labels = zip(*TRAINING)
+    return StayClassifier(KeywordEmbedder(), fallback=fallback).fit(texts, labels, target_accuracy=1.0)
+
+
+def test_confident_messages_are_decided_locally():
+    fallback = MagicMock(return_value=False)
+    classifier = make_classifier(fallback)
+
+    assert classifier("can I book a suite") is True
+    assert classifier("tell me a joke") is False
+    assert fallback.call_count == 0
+    assert classifier.stats()["local_decisions"] == 2
+
+
+def test_ambiguous_messages_are_escalated():
+    fallback = MagicMock(return_value=True)
+    classifier = make_classifier(fallback)
+
+    assert classifier.predict_local("hello there") is None
+    assert classifier("hello there") is True
+    fallback.assert_called_once_with("hello there")
+    assert classifier.stats()["escalations"] == 1
+
+
+def test_save_and_load_round_trip(tmp_path):
+    classifier = make_classifier()
+    path = str(tmp_path / "stay.npz")
+    classifier.save(path)
+
+    loaded = StayClassifier.load(path, KeywordEmbedder())
+
+    assert loaded.threshold == pytest.approx(classifier.threshold)
+    assert loaded("parking for my suite") is True
+
+
+def test_engine_reports_busy_when_escalation_is_rate_limited():
+    classifier = make_classifier(fallback=MagicMock(side_effect=RateLimitExceeded("classifier", 2.0)))
+    engine = ConciergeEngine(classifier=classifier)
+
+    assert FAQ_FOLLOW_UP_REPLY in engine.handle("is there parking for pets", "s1")["reply"]
+    assert engine.handle("hello there", "s1")["rate_limited"] is True